@@ -1,36 +1,29 @@
 """
 domolibrary2 - A Python library for interacting with Domo APIs.
-"""
-
-import sys
-from pathlib import Path
-
-from .utils.logging import get_colored_logger
-
-get_colored_logger(set_as_global=True)  # Sets as dc_logger global logger
 
+Subpackages are imported on first attribute access (PEP 562), so
+``import domolibrary2`` stays cheap for short-lived scripts; heavy dependencies
+(pandas, bs4, sqlglot, dc_logger) load only with the modules that use them.
+"""
 
-# Always read version from pyproject.toml to ensure sync
-try:
-    if sys.version_info >= (3, 11):
-        import tomllib
-    else:
-        import tomli as tomllib
-
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomllib.load(f)
-            __version__ = pyproject_data["project"]["version"]
-    else:
-        # Fallback to installed package metadata
-        import importlib.metadata
+import importlib
+import importlib.metadata
 
-        __version__ = importlib.metadata.version("domolibrary2")
-except Exception:
-    __version__ = "unknown"
+_SUBMODULES = {
+    "auth",
+    "base",
+    "classes",
+    "client",
+    "integrations",
+    "routes",
+    "utils",
+}
 
-from .base import entities, exceptions  # noqa: E402
+# kept at the top level for backwards compatibility
+_SUBMODULE_ALIASES = {
+    "exceptions": "base.exceptions",
+    "entities": "base.entities",
+}
 
 # Define what gets imported with "from domolibrary2 import *"
 __all__ = [
@@ -43,3 +36,31 @@ __all__ = [
     # "routes",
     # "utils",
 ]
+
+
+def _get_version() -> str:
+    try:
+        return importlib.metadata.version("domolibrary2")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        version = globals()["__version__"] = _get_version()
+        return version
+
+    if name in _SUBMODULES or name in _SUBMODULE_ALIASES:
+        module = importlib.import_module(
+            f".{_SUBMODULE_ALIASES.get(name, name)}", __name__
+        )
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | _SUBMODULES | set(_SUBMODULE_ALIASES) | {"__version__"}
+    )
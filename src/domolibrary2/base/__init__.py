@@ -8,6 +8,7 @@ Modules:
 - base: Foundational classes and enhanced enums
 - entities: Core Domo entity classes and managers
 - relationships: Relationship system for entity interactions
+- records: Lightweight columnar records for high-volume listings
 
 The design provides a consistent interface across all Domo entity types
 while supporting advanced features like lineage tracking and relationships.
@@ -30,6 +31,9 @@ from .entities_federated import (
     DomoPublishedEntity,
 )
 
+# Import lightweight listing records
+from .records import DomoRecord, DomoRecord_Batch
+
 # Import relationship system
 from .relationships import (
     DomoRelationship,
@@ -52,4 +56,7 @@ __all__ = [
     # Relationships
     "DomoRelationship",
     "DomoRelationshipController",
+    # Records
+    "DomoRecord",
+    "DomoRecord_Batch",
 ]
@@ -0,0 +1,207 @@
+"""Lightweight records for high-volume entity listings.
+
+``DomoRecord_Batch`` stores listed fields column by column; each row is a
+``DomoRecord`` view that can be promoted to a full entity with ``to_entity``
+(no API call) or ``get_entity`` (fetches the complete entity).  Entities opt in
+by declaring ``record_fields``.
+
+Example:
+    >>> batch = await DomoUsers(auth=auth).get(return_records=True)
+    >>> batch.to_dataframe()
+    >>> batch[0].email_address
+    >>> domo_user = await batch[0].get_entity()
+"""
+
+__all__ = ["DomoRecord", "DomoRecord_Batch"]
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ..auth.base import DomoAuth
+from ..utils import chunk_execution as dmce
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _normalize_fields(fields: dict) -> dict[str, tuple[str, ...]]:
+    return {
+        name: (keys,) if isinstance(keys, str) else tuple(keys)
+        for name, keys in fields.items()
+    }
+
+
+def _get_value(obj: dict, keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        value = obj.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+class DomoRecord:
+    """One row of a ``DomoRecord_Batch``; a view onto the batch, not a copy."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: "DomoRecord_Batch", index: int):
+        self.batch = batch
+        self.index = index
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for names that are not set slots; an unset slot or a dunder
+        # probed by copy / pickle must not look itself up through ``batch``
+        if name in DomoRecord.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+
+        batch = object.__getattribute__(self, "batch")
+        try:
+            column = batch.columns[name]
+        except KeyError:
+            raise AttributeError(
+                f"{batch.entity_cls.__name__} record has no field {name!r}"
+            ) from None
+        return column[object.__getattribute__(self, "index")]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DomoRecord):
+            return (
+                self.batch.entity_cls is other.batch.entity_cls
+                and self.to_dict() == other.to_dict()
+            )
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self.batch.entity_cls, self.id))
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value!r}" for name, value in self.to_dict().items()
+        )
+        return f"{self.batch.entity_cls.__name__}_Record({values})"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: column[self.index] for name, column in self.batch.columns.items()}
+
+    def to_entity(self):
+        return self.batch.to_entity(self.index)
+
+    async def get_entity(self, **kwargs):
+        return await self.batch.get_entity(self.index, **kwargs)
+
+
+@dataclass
+class DomoRecord_Batch:  # noqa: N801
+    """Columnar listing of one entity type, holding only ``fields``.
+
+    Args:
+        entity_cls: Entity class rows are promoted to
+        auth: Auth used for promotion
+        fields: ``{field name: (api keys, ...)}`` read from each API object
+        columns: ``{field name: values}``, one list per field, all the same length
+    """
+
+    entity_cls: type
+    auth: DomoAuth = field(repr=False)
+    fields: dict[str, tuple[str, ...]] = field(repr=False)
+    columns: dict[str, list] = field(repr=False)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        entity_cls: type,
+        auth: DomoAuth,
+        obj_ls: list[dict],
+        fields: Optional[dict] = None,
+    ) -> "DomoRecord_Batch":
+        """Read ``fields`` (default ``entity_cls.record_fields``) out of API objects."""
+        fields = _normalize_fields(fields or entity_cls.record_fields)
+
+        columns = {
+            name: (
+                [obj.get(keys[0]) for obj in obj_ls]
+                if len(keys) == 1
+                else [_get_value(obj, keys) for obj in obj_ls]
+            )
+            for name, keys in fields.items()
+        }
+
+        # entities store ids as strings
+        if "id" in columns:
+            columns["id"] = [
+                str(value) if value is not None else None for value in columns["id"]
+            ]
+
+        return cls(entity_cls=entity_cls, auth=auth, fields=fields, columns=columns)
+
+    def __repr__(self) -> str:
+        return f"DomoRecord_Batch({self.entity_cls.__name__}, n_records={len(self)})"
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def __iter__(self) -> Iterator[DomoRecord]:
+        return (DomoRecord(self, index) for index in range(len(self)))
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[DomoRecord, "DomoRecord_Batch"]:
+        if isinstance(index, slice):
+            return DomoRecord_Batch(
+                entity_cls=self.entity_cls,
+                auth=self.auth,
+                fields=self.fields,
+                columns={name: column[index] for name, column in self.columns.items()},
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        return DomoRecord(self, index)
+
+    def extend(self, other: "DomoRecord_Batch") -> "DomoRecord_Batch":
+        """Append the rows of another batch of the same entity and fields."""
+        if other.entity_cls is not self.entity_cls or other.fields != self.fields:
+            raise ValueError("can only extend with a batch of the same entity fields")
+
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        return self
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """One row per record, one column per field."""
+        import pandas as pd
+
+        return pd.DataFrame(self.columns, columns=list(self.fields))
+
+    def to_entity(self, index: int):
+        """Partial entity built from the listed fields; no API call is made."""
+        obj = {
+            keys[0]: self.columns[name][index]
+            for name, keys in self.fields.items()
+            if self.columns[name][index] is not None
+        }
+        return self.entity_cls.from_dict(auth=self.auth, obj=obj)
+
+    def to_entities(self) -> list:
+        return [self.to_entity(index) for index in range(len(self))]
+
+    async def get_entity(self, index: int, **kwargs):
+        """Complete entity, fetched by id."""
+        return await self.entity_cls.get_entity_by_id(
+            entity_id=self.columns["id"][index], auth=self.auth, **kwargs
+        )
+
+    async def get_entities(
+        self, indexes: Optional[list[int]] = None, max_concurrency: int = 10, **kwargs
+    ) -> list:
+        """Fetch complete entities for ``indexes`` (all rows by default)."""
+        indexes = range(len(self)) if indexes is None else indexes
+
+        return await dmce.gather_with_concurrency(
+            *[self.get_entity(index, **kwargs) for index in indexes],
+            n=max_concurrency,
+        )
@@ -5,9 +5,12 @@ to resolve import dependencies within the DomoAccount package.
 """
 
 from dataclasses import dataclass, field
+from typing import Any
 
 import httpx
 
+from ...auth import DomoAuth
+from ...base import exceptions as dmde
 from ...client.response import ResponseGetData
 from ...routes import account as account_routes
 from ...routes.account import (
@@ -15,7 +18,6 @@ from ...routes.account import (
     ShareAccount_AccessLevel,
     ShareAccount_V1_AccessLevel,
 )
-from ...utils import chunk_execution as dmce
 from ..subentity.access import AccessRelationship, DomoAccess
 
 
@@ -80,7 +82,7 @@ class Account_AccessRelationship(AccessRelationship):
         access_level,
         suppress_no_results_error: bool = True,
     ):
-        from ...routes.group.exceptions import SearchGroupNotFoundError
+        from ...routes.group import Group_GET_Error
         from ..DomoGroup.core import DomoGroup
 
         try:
@@ -90,7 +92,7 @@ class Account_AccessRelationship(AccessRelationship):
                 relationship_type=access_level,
                 parent_entity=parent_entity,
             )
-        except SearchGroupNotFoundError:
+        except Group_GET_Error:
             if suppress_no_results_error:
                 # Group no longer exists, return None
                 return None
@@ -117,6 +119,143 @@ class Account_AccessRelationship(AccessRelationship):
         else:
             raise ValueError(f"Unknown entity_type: {entity_type}")
 
+    @classmethod
+    def from_access_list(
+        cls,
+        parent_entity,
+        access_ls: list[dict],
+        entity_resolver: "Account_AccessEntityResolver",
+        suppress_no_results_error: bool = True,
+    ) -> list["Account_AccessRelationship"]:
+        """build relationships from an access list already resolved by `entity_resolver`"""
+        relationships = []
+
+        for obj in access_ls:
+            entity = entity_resolver.get_entity(
+                entity_type=obj["type"],
+                entity_id=obj["id"],
+                suppress_no_results_error=suppress_no_results_error,
+            )
+
+            if entity is None:  # user / group no longer exists
+                continue
+
+            relationships.append(
+                cls(
+                    entity=entity,
+                    relationship_type=obj["accessLevel"],
+                    parent_entity=parent_entity,
+                )
+            )
+
+        return relationships
+
+
+class Account_AccessEntity_NotFound(dmde.ClassError):
+    def __init__(self, cls_instance, entity_type, entity_id):
+        super().__init__(
+            cls_instance=cls_instance,
+            entity_id=entity_id,
+            message=f"{entity_type} {entity_id} from the account access list no longer exists",
+        )
+
+
+@dataclass
+class Account_AccessEntityResolver:
+    """Resolves the users and groups of many account access lists in bulk.
+
+    Users are fetched with chunked `search_users_by_id` (1000 ids per request) and
+    groups with one `get_all_groups` listing, instead of one `get_by_id` call per
+    shared entity.  Resolved entities are cached, so one resolver can be reused
+    across every account in an audit.
+    """
+
+    auth: DomoAuth = field(repr=False)
+    users: dict[str, Any] = field(default_factory=dict, repr=False)  # DomoUser
+    groups: dict[str, Any] = field(default_factory=dict, repr=False)  # DomoGroup
+
+    is_groups_loaded: bool = False
+
+    _missing_user_ids: set[str] = field(default_factory=set, repr=False)
+
+    async def resolve(
+        self,
+        access_ls: list[dict],
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ):
+        """fetch every user and group referenced by `access_ls` that isn't cached yet"""
+        from ...routes import (
+            group as group_routes,
+            user as user_routes,
+        )
+        from ..DomoGroup.core import DomoGroup
+        from ..DomoUser import DomoUser
+
+        user_ids = {
+            str(obj["id"])
+            for obj in access_ls
+            if obj["type"] == "USER"
+            and str(obj["id"]) not in self.users
+            and str(obj["id"]) not in self._missing_user_ids
+        }
+
+        is_needs_groups = not self.is_groups_loaded and any(
+            obj["type"] == "GROUP" for obj in access_ls
+        )
+
+        if user_ids:
+            res = await user_routes.search_users_by_id(
+                user_ids=sorted(user_ids),
+                auth=self.auth,
+                suppress_no_results_error=True,
+                debug_api=debug_api,
+                session=session,
+                parent_class=self.__class__.__name__,
+            )
+
+            for domo_user in [
+                DomoUser.from_dict(auth=self.auth, obj=obj) for obj in res.response
+            ]:
+                self.users[domo_user.id] = domo_user
+
+            self._missing_user_ids.update(user_ids - set(self.users))
+
+        if is_needs_groups:
+            res = await group_routes.get_all_groups(
+                auth=self.auth, debug_api=debug_api, session=session
+            )
+
+            for obj in res.response:
+                domo_group = DomoGroup.from_dict(auth=self.auth, obj=obj)
+                self.groups[str(domo_group.id)] = domo_group
+
+            self.is_groups_loaded = True
+
+        return self
+
+    def get_entity(
+        self, entity_type: str, entity_id: str, suppress_no_results_error: bool = True
+    ):
+        """return a resolved DomoUser / DomoGroup (None if deleted and suppressed)"""
+        from ...routes.user.exceptions import SearchUserNotFoundError
+
+        if entity_type == "USER":
+            entity = self.users.get(str(entity_id))
+            if entity is None and not suppress_no_results_error:
+                raise SearchUserNotFoundError(search_criteria=f"user_id: {entity_id}")
+            return entity
+
+        if entity_type == "GROUP":
+            entity = self.groups.get(str(entity_id))
+            if entity is None and not suppress_no_results_error:
+                raise Account_AccessEntity_NotFound(
+                    cls_instance=self, entity_type=entity_type, entity_id=entity_id
+                )
+            return entity
+
+        raise ValueError(f"Unknown entity_type: {entity_type}")
+
 
 @dataclass
 class DomoAccess_Account(DomoAccess):
@@ -149,6 +288,7 @@ class DomoAccess_Account(DomoAccess):
         session: httpx.AsyncClient = None,
         debug_num_stacks_to_drop=2,
         suppress_no_results_error: bool = True,
+        entity_resolver: Account_AccessEntityResolver = None,
     ):
         """Get account access list.
 
@@ -158,6 +298,7 @@ class DomoAccess_Account(DomoAccess):
             session: HTTP client session
             debug_num_stacks_to_drop: Stack frames to drop for debugging
             suppress_no_results_error: If True, skip users/groups that don't exist; if False, raise error
+            entity_resolver: Shared resolver to reuse user/group lookups across accounts
 
         Returns:
             List of Account_AccessRelationship objects
@@ -175,24 +316,52 @@ class DomoAccess_Account(DomoAccess):
         if return_raw:
             return res
 
-        self.relationships = [
-            rel
-            for rel in await dmce.gather_with_concurrency(
-                *[
-                    Account_AccessRelationship.from_entity_id(
-                        parent_entity=self.parent,
-                        entity_id=obj["id"],
-                        auth=self.auth,
-                        access_level=obj["accessLevel"],
-                        entity_type=obj["type"],
-                        suppress_no_results_error=suppress_no_results_error,
-                    )
-                    for obj in res.response
-                ],
-                n=10,
-            )
-            if rel is not None  # Filter out users/groups that no longer exist
-        ]
+        return await self._relationships_from_access_list(
+            access_ls=res.response,
+            entity_resolver=entity_resolver,
+            suppress_no_results_error=suppress_no_results_error,
+            debug_api=debug_api,
+            session=session,
+        )
+
+    async def _get_access_list(
+        self,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+        debug_num_stacks_to_drop=2,
+    ) -> list[dict]:
+        """raw access list entries (`id`, `type`, `accessLevel`) without entity lookups"""
+        res = await account_routes.get_account_accesslist(
+            auth=self.auth,
+            account_id=self.parent_id,
+            debug_api=debug_api,
+            session=session,
+            debug_num_stacks_to_drop=debug_num_stacks_to_drop,
+        )
+        return res.response
+
+    async def _relationships_from_access_list(
+        self,
+        access_ls: list[dict],
+        entity_resolver: Account_AccessEntityResolver = None,
+        suppress_no_results_error: bool = True,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ) -> list[Account_AccessRelationship]:
+        entity_resolver = entity_resolver or Account_AccessEntityResolver(
+            auth=self.auth
+        )
+
+        await entity_resolver.resolve(
+            access_ls=access_ls, debug_api=debug_api, session=session
+        )
+
+        self.relationships = Account_AccessRelationship.from_access_list(
+            parent_entity=self.parent,
+            access_ls=access_ls,
+            entity_resolver=entity_resolver,
+            suppress_no_results_error=suppress_no_results_error,
+        )
 
         return self.relationships
 
@@ -382,6 +551,21 @@ class DomoAccess_Account(DomoAccess):
 class DomoAccess_OAuth(DomoAccess_Account):
     share_enum: ShareAccount = field(repr=False, default=ShareAccount_AccessLevel)
 
+    async def _get_access_list(
+        self,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+        debug_num_stacks_to_drop=2,
+    ) -> list[dict]:
+        res = await account_routes.get_oauth_account_accesslist(
+            auth=self.auth,
+            account_id=self.parent_id,
+            debug_api=debug_api,
+            session=session,
+            debug_num_stacks_to_drop=debug_num_stacks_to_drop,
+        )
+        return res.response
+
     async def get(
         self,
         debug_api: bool = False,
@@ -389,6 +573,7 @@ class DomoAccess_OAuth(DomoAccess_Account):
         session: httpx.AsyncClient = None,
         debug_num_stacks_to_drop=2,
         suppress_no_results_error: bool = True,
+        entity_resolver: Account_AccessEntityResolver = None,
     ):
         """Get OAuth account access list.
 
@@ -398,6 +583,7 @@ class DomoAccess_OAuth(DomoAccess_Account):
             session: HTTP client session
             debug_num_stacks_to_drop: Stack frames to drop for debugging
             suppress_no_results_error: If True, skip users/groups that don't exist; if False, raise error
+            entity_resolver: Shared resolver to reuse user/group lookups across accounts
 
         Returns:
             List of Account_AccessRelationship objects
@@ -414,27 +600,13 @@ class DomoAccess_OAuth(DomoAccess_Account):
         if return_raw:
             return res
 
-        # Process response and filter out deleted users/groups
-        self.relationships = [
-            rel
-            for rel in await dmce.gather_with_concurrency(
-                *[
-                    Account_AccessRelationship.from_entity_id(
-                        parent_entity=self.parent,
-                        entity_id=obj["id"],
-                        auth=self.auth,
-                        access_level=obj["accessLevel"],
-                        entity_type=obj["type"],
-                        suppress_no_results_error=suppress_no_results_error,
-                    )
-                    for obj in res.response
-                ],
-                n=10,
-            )
-            if rel is not None  # Filter out users/groups that no longer exist
-        ]
-
-        return self.relationships
+        return await self._relationships_from_access_list(
+            access_ls=res.response,
+            entity_resolver=entity_resolver,
+            suppress_no_results_error=suppress_no_results_error,
+            debug_api=debug_api,
+            session=session,
+        )
 
     async def add_share(
         self,
@@ -585,4 +757,10 @@ class DomoAccess_OAuth(DomoAccess_Account):
         return await self.get(debug_api=debug_api, session=session)
 
 
-__all__ = ["DomoAccess_Account", "DomoAccess_OAuth", "Account_AccessRelationship"]
+__all__ = [
+    "DomoAccess_Account",
+    "DomoAccess_OAuth",
+    "Account_AccessRelationship",
+    "Account_AccessEntityResolver",
+    "Account_AccessEntity_NotFound",
+]
@@ -74,6 +74,9 @@ class DomoAccount_Default(DomoEntity):
     Config: DomoAccount_Config = field(repr=False, default=None, compare=False)
     Access: DomoAccess_Account = field(repr=False, default=None, compare=False)
 
+    # False for accounts built from a listing until get_config() runs
+    is_config_loaded: bool = field(repr=False, default=False, compare=False)
+
     def __eq__(self, other):
         if not isinstance(other, DomoAccount_Default):
             return False
@@ -275,9 +278,34 @@ class DomoAccount_Default(DomoEntity):
             debug_num_stacks_to_drop=debug_num_stacks_to_drop + 1,
             is_suppress_no_config=is_suppress_no_config,
         )
+        acc.is_config_loaded = True
 
         return acc
 
+    async def get_config(
+        self,
+        is_suppress_no_config: bool = True,
+        is_force_refresh: bool = False,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ) -> DomoAccount_Config:
+        """return the account config, retrieving it on first access
+
+        accounts built from a listing (`DomoAccounts.get_accounts_accountsapi(is_hydrate_config=False)`)
+        carry metadata only; the config request is deferred to here
+        """
+        if self.is_config_loaded and not is_force_refresh:
+            return self.Config
+
+        await self._get_config(
+            session=session,
+            debug_api=debug_api,
+            is_suppress_no_config=is_suppress_no_config,
+        )
+        self.is_config_loaded = True
+
+        return self.Config
+
     @classmethod
     async def get_entity_by_id(cls, entity_id, **kwargs):
         """Alias for get_by_id"""
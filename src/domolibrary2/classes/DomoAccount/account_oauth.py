@@ -232,6 +232,7 @@ class DomoAccount_OAuth(DomoAccount_Default):
             debug_num_stacks_to_drop=debug_num_stacks_to_drop + 1,
             is_suppress_no_config=is_suppress_no_config,
         )
+        acc.is_config_loaded = True
 
         return acc
 
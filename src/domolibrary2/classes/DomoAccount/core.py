@@ -1,7 +1,7 @@
 __all__ = ["DomoAccount", "DomoAccounts_NoAccount", "DomoAccounts"]
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 
@@ -63,6 +63,9 @@ class DomoAccounts(DomoManager):
     accounts: list[DomoAccount] = None
     oauths: list[DomoAccount_OAuth] = None
 
+    # {account id: exception} for configs that failed to load in hydrate_configs
+    config_errors: dict = field(default_factory=dict, repr=False)
+
     async def get_accounts_accountsapi(
         self,
         debug_api: bool = False,
@@ -70,7 +73,15 @@ class DomoAccounts(DomoManager):
         return_raw: bool = False,
         is_use_default_account_class: bool = True,
         debug_num_stacks_to_drop: int = 2,
+        is_hydrate_config: bool = True,
+        max_concurrency: int = 60,
     ):
+        """list accounts with the v1 accounts api
+
+        accounts are built from the list payload (name, provider type, owners).
+        with `is_hydrate_config = False` no per-account requests are made; configs
+        load on `account.get_config()` or `hydrate_configs()`
+        """
         res = await account_routes.get_accounts(
             auth=self.auth,
             debug_api=debug_api,
@@ -81,25 +92,100 @@ class DomoAccounts(DomoManager):
         if return_raw:
             return res
 
-        if len(res.response) == 0:
-            self.accounts = []
-            return self.accounts
+        self.accounts = [
+            DomoAccount.from_dict(
+                obj=obj,
+                auth=self.auth,
+                is_admin_summary=False,
+                is_use_default_class=is_use_default_account_class,
+            )
+            for obj in res.response
+        ]
 
-        self.accounts = await dmce.gather_with_concurrency(
-            n=60,
-            *[
-                DomoAccount.get_by_id(
-                    account_id=obj.get("id"),
+        if is_hydrate_config:
+            await self.hydrate_configs(
+                accounts=self.accounts,
+                max_concurrency=max_concurrency,
+                debug_api=debug_api,
+                session=session,
+            )
+
+        return self.accounts
+
+    async def hydrate_configs(
+        self,
+        accounts: list[DomoAccount] = None,
+        max_concurrency: int = 20,
+        is_suppress_no_config: bool = True,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ) -> list[DomoAccount]:
+        """retrieve configs for accounts that haven't loaded one, at most `max_concurrency` at a time
+
+        a failed config request does not stop the others; it is recorded in
+        `self.config_errors` by account id and the account stays unloaded
+        """
+        accounts = self.accounts if accounts is None else accounts
+
+        async def _get_config(account):
+            try:
+                await account.get_config(
+                    is_suppress_no_config=is_suppress_no_config,
                     debug_api=debug_api,
                     session=session,
-                    auth=self.auth,
-                    is_use_default_account_class=is_use_default_account_class,
                 )
-                for obj in res.response
+            except Exception as e:
+                self.config_errors[account.id] = e
+            else:
+                self.config_errors.pop(account.id, None)
+
+        await dmce.gather_with_concurrency(
+            *[
+                _get_config(account)
+                for account in accounts or []
+                if not account.is_config_loaded
             ],
+            n=max_concurrency,
         )
 
-        return self.accounts
+        return accounts
+
+    async def iter_accounts(
+        self,
+        batch_size: int = 50,
+        is_hydrate_config: bool = False,
+        max_concurrency: int = 20,
+        is_use_default_account_class: bool = True,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ):
+        """async iterator over the account listing
+
+        with `is_hydrate_config = True` configs are retrieved one batch at a time,
+        so the first accounts are available before the whole instance is hydrated
+
+        Example:
+            >>> async for account in DomoAccounts(auth=auth).iter_accounts():
+            ...     print(account.name, account.data_provider_type)
+        """
+        accounts = self.accounts or await self.get_accounts_accountsapi(
+            is_hydrate_config=False,
+            is_use_default_account_class=is_use_default_account_class,
+            debug_api=debug_api,
+            session=session,
+        )
+
+        for account_batch in dmce.chunk_list(accounts, batch_size):
+            if is_hydrate_config:
+                await self.hydrate_configs(
+                    accounts=account_batch,
+                    max_concurrency=max_concurrency,
+                    debug_api=debug_api,
+                    session=session,
+                )
+
+            for account in account_batch:
+                yield account
 
     async def get_accounts_queryapi(
         self,
@@ -202,6 +288,57 @@ class DomoAccounts(DomoManager):
 
         return self.oauths
 
+    async def get_access(
+        self,
+        accounts: list[DomoAccount] = None,
+        max_concurrency: int = 20,
+        suppress_no_results_error: bool = True,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ) -> dict[str, list]:
+        """retrieve the access list of many accounts with one bulk user / group lookup
+
+        access lists are fetched concurrently, then every shared user and group is
+        resolved once through a shared `Account_AccessEntityResolver`; each
+        account's `Access.relationships` is populated in place
+
+        Returns:
+            dict of account id -> list of Account_AccessRelationship
+        """
+        from .access import Account_AccessEntityResolver, Account_AccessRelationship
+
+        if accounts is None:
+            accounts = self.accounts or await self.get(
+                debug_api=debug_api, session=session
+            )
+
+        access_ls_ls = await dmce.gather_with_concurrency(
+            *[
+                account.Access._get_access_list(debug_api=debug_api, session=session)
+                for account in accounts
+            ],
+            n=max_concurrency,
+        )
+
+        entity_resolver = Account_AccessEntityResolver(auth=self.auth)
+        await entity_resolver.resolve(
+            access_ls=[obj for access_ls in access_ls_ls for obj in access_ls],
+            debug_api=debug_api,
+            session=session,
+        )
+
+        account_access = {}
+        for account, access_ls in zip(accounts, access_ls_ls):
+            account.Access.relationships = Account_AccessRelationship.from_access_list(
+                parent_entity=account,
+                access_ls=access_ls,
+                entity_resolver=entity_resolver,
+                suppress_no_results_error=suppress_no_results_error,
+            )
+            account_access[account.id] = account.Access.relationships
+
+        return account_access
+
     async def search_by_name(
         self,
         account_name: str,
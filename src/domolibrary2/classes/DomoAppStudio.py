@@ -34,7 +34,7 @@ class DomoAppStudio(DomoEntity_w_Lineage):
     async def _from_content_stacks_v3(cls, page_obj, auth: DomoAuth = None):
         dd = page_obj
         if isinstance(page_obj, dict):
-            dd = util_dd.DictDot(page_obj)
+            dd = util_dd.LazyDictDot(page_obj)
 
         aps = cls(
             id=int(dd.dataAppId),
@@ -129,7 +129,7 @@ class DomoAppStudio(DomoEntity_w_Lineage):
         dd = appstudio_obj
 
         if isinstance(appstudio_obj, dict):
-            dd = util_dd.DictDot(appstudio_obj)
+            dd = util_dd.LazyDictDot(appstudio_obj)
 
         aps = cls(
             id=int(dd.id or dd.dataAppId),
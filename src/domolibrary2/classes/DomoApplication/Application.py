@@ -55,7 +55,7 @@ class DomoApplication:
 
     @classmethod
     def from_dict(cls, obj, auth: DomoAuth = None):
-        dd = util_dd.DictDot(obj)
+        dd = util_dd.LazyDictDot(obj)
 
         return cls(
             id=dd.applicationId,
@@ -126,6 +126,18 @@ class DomoJob_Base(DomoEntity):
         """
         return f"https://{self.auth.domo_instance}.domo.com/admin/apps/{self.application_id}/jobs/{self.id}"
 
+    @property
+    def entity_type(self) -> str:
+        return "JOB"
+
+    @classmethod
+    async def get_entity_by_id(
+        cls, entity_id: str, auth: DomoAuth, application_id: str, **kwargs
+    ):
+        return await cls.get_by_id(
+            auth=auth, application_id=application_id, job_id=entity_id, **kwargs
+        )
+
     @staticmethod
     def _format_remote_instance(remote_instance):
         if not remote_instance:
@@ -19,8 +19,8 @@ from enum import Enum
 import httpx
 
 from ...auth import DomoAuth
-from ..classes.DomoApplication_Job_Base import DomoJob_Base, DomoTrigger_Schedule
-from ..routes import application as application_routes
+from ...routes import application as application_routes
+from .Job_Base import DomoJob_Base, DomoTrigger_Schedule
 
 
 @dataclass
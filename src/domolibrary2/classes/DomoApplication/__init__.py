@@ -6,6 +6,12 @@ __all__ = [
     "DomoJob_Base",
     "DomoTrigger",
     "DomoTrigger_Schedule",
+    # Batch job placement
+    "JobPlacement_Error",
+    "JobSlot_Histogram",
+    "JobPlacement_Request",
+    "JobPlacement_Plan",
+    "JobPlacement_Planner",
     # Application route exceptions
     "Application_GET_Error",
     "ApplicationError_NoJobRetrieved",
@@ -20,3 +26,10 @@ from .Job import (
     DomoJob,
 )
 from .Job_Base import DomoJob_Base, DomoTrigger, DomoTrigger_Schedule
+from .job_placement import (
+    JobPlacement_Error,
+    JobPlacement_Plan,
+    JobPlacement_Planner,
+    JobPlacement_Request,
+    JobSlot_Histogram,
+)
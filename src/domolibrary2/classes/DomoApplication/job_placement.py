@@ -0,0 +1,398 @@
+"""Batch placement of new application jobs into the daily schedule.
+
+``JobPlacement_Planner`` loads existing triggers once, tracks jobs running per
+minute of the day, and places a batch of new jobs where peak concurrency stays
+lowest.
+
+Example:
+    >>> planner = await JobPlacement_Planner.load(auth=auth)
+    >>> plan = planner.plan(
+    ...     [
+    ...         JobPlacement_Request(
+    ...             name=f"rds - {instance}",
+    ...             application_id=application_id,
+    ...             job_cls=DomoJob_RemoteDomoStats,
+    ...             create_kwargs={"config": config, "logs_dataset_id": logs_dataset_id, "remote_instance": instance},
+    ...             allowed_hours=range(1, 6),
+    ...         )
+    ...         for instance in instances
+    ...     ]
+    ... )
+    >>> plan.to_dataframe()
+    >>> plan = await planner.apply(plan)
+"""
+
+__all__ = [
+    "JobPlacement_Error",
+    "JobSlot_Histogram",
+    "JobPlacement_Request",
+    "JobPlacement_Assignment",
+    "JobPlacement_Plan",
+    "JobPlacement_Planner",
+    "get_schedule_slot_mask",
+]
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from ...auth import DomoAuth
+from ...base import exceptions as dmde
+from ...client.get_data import create_httpx_session
+from ...routes import application as application_routes
+from ...utils import chunk_execution as dmce
+from ..subentity.schedule_engine import compile_schedule_expression
+from .Job_Base import DomoTrigger, DomoTrigger_Schedule
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class JobPlacement_Error(dmde.ClassError):  # noqa: N801
+    def __init__(self, cls_instance, message):
+        super().__init__(cls_instance=cls_instance, message=message)
+
+
+def get_schedule_slot_mask(schedule: DomoTrigger_Schedule) -> Optional[np.ndarray]:
+    """Minutes of the day a trigger schedule fires at, as a boolean array of 1440.
+
+    Returns None if the schedule is not a supported cron expression.
+    """
+    if schedule is None:
+        return None
+
+    compiled = compile_schedule_expression(
+        schedule.schedule_text or schedule.to_dict()["eventEntity"]
+    )
+    if compiled is None:
+        return None
+
+    return np.outer(compiled.hours, compiled.minutes).ravel()
+
+
+@dataclass
+class JobSlot_Histogram:
+    """Jobs running in each minute of the day (index = ``hour * 60 + minute``)."""
+
+    counts: np.ndarray = field(
+        default_factory=lambda: np.zeros(MINUTES_PER_DAY, dtype=np.int32)
+    )
+
+    @property
+    def peak(self) -> int:
+        return int(self.counts.max())
+
+    def copy(self) -> "JobSlot_Histogram":
+        return JobSlot_Histogram(counts=self.counts.copy())
+
+    def add(self, start_minutes: Iterable[int], duration_minutes: int = 1) -> None:
+        """Count a run of ``duration_minutes`` from each start; runs wrap past midnight."""
+        start_minutes = np.asarray(list(start_minutes), dtype=np.int64)
+        if not len(start_minutes):
+            return
+
+        running = (
+            start_minutes[:, None] + np.arange(max(duration_minutes, 1))
+        ) % MINUTES_PER_DAY
+        np.add.at(self.counts, running.ravel(), 1)
+
+    def add_schedule(
+        self, schedule: DomoTrigger_Schedule, duration_minutes: int = 1
+    ) -> bool:
+        """Count every run of ``schedule``; False if it could not be parsed."""
+        mask = get_schedule_slot_mask(schedule)
+        if mask is None:
+            return False
+
+        self.add(np.flatnonzero(mask), duration_minutes=duration_minutes)
+        return True
+
+    def get_window_load(self, duration_minutes: int) -> tuple[np.ndarray, np.ndarray]:
+        """Peak and total load over ``[start, start + duration)`` for every start minute."""
+        windows = np.stack(
+            [
+                np.roll(self.counts, -offset)
+                for offset in range(max(duration_minutes, 1))
+            ]
+        )
+        return windows.max(axis=0), windows.sum(axis=0)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per minute of the day with its ``cnt_schedule``."""
+        minute_of_day = np.arange(MINUTES_PER_DAY)
+        return pd.DataFrame(
+            {
+                "hour": minute_of_day // 60,
+                "minute": minute_of_day % 60,
+                "cnt_schedule": self.counts,
+            }
+        )
+
+
+@dataclass
+class JobPlacement_Request:
+    """A job to create, and where in the day it may start.
+
+    Args:
+        name: Job name
+        application_id: Application the job is created in
+        job_cls: Job class whose ``create`` is called on apply (e.g. ``DomoJob_Watchdog``)
+        create_kwargs: Extra ``create`` arguments (config, logs_dataset_id, ...)
+        duration_minutes: Expected run time; the job occupies this many minutes
+        allowed_hours / allowed_minutes: Restrict the start time (all by default)
+    """
+
+    name: str
+    application_id: str
+    job_cls: Any = None
+    create_kwargs: dict = field(default_factory=dict, repr=False)
+    duration_minutes: int = 1
+    allowed_hours: Optional[Iterable[int]] = None
+    allowed_minutes: Optional[Iterable[int]] = None
+
+    def get_allowed_mask(self) -> np.ndarray:
+        hours = np.zeros(24, dtype=bool)
+        hours[list(range(24) if self.allowed_hours is None else self.allowed_hours)] = (
+            True
+        )
+
+        minutes = np.zeros(60, dtype=bool)
+        minutes[
+            list(range(60) if self.allowed_minutes is None else self.allowed_minutes)
+        ] = True
+
+        return np.outer(hours, minutes).ravel()
+
+
+@dataclass
+class JobPlacement_Assignment:
+    request: JobPlacement_Request
+    schedule: DomoTrigger_Schedule
+    window_peak: int  # jobs already running during the new job's window
+
+
+@dataclass
+class JobPlacement_Plan:
+    """Start times for a batch of jobs, plus apply results.
+
+    ``results`` maps job name to the created job, or the exception that stopped it.
+    """
+
+    assignments: list[JobPlacement_Assignment] = field(default_factory=list)
+    histogram: JobSlot_Histogram = field(default_factory=JobSlot_Histogram, repr=False)
+    peak_before: int = 0
+    results: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def peak_after(self) -> int:
+        return self.histogram.peak
+
+    @property
+    def failed(self) -> dict[str, Exception]:
+        return {
+            name: result
+            for name, result in self.results.items()
+            if isinstance(result, Exception)
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "job_name": assignment.request.name,
+                    "application_id": assignment.request.application_id,
+                    "hour": assignment.schedule.hour,
+                    "minute": assignment.schedule.minute,
+                    "duration_minutes": assignment.request.duration_minutes,
+                    "window_peak": assignment.window_peak,
+                }
+                for assignment in self.assignments
+            ],
+            columns=[
+                "job_name",
+                "application_id",
+                "hour",
+                "minute",
+                "duration_minutes",
+                "window_peak",
+            ],
+        )
+
+
+@dataclass
+class JobPlacement_Planner:
+    """Place new jobs against the triggers of every loaded application.
+
+    Args:
+        auth: Instance auth
+        histogram: Load of the existing triggers
+        default_duration_minutes: Assumed run time of existing jobs
+    """
+
+    auth: DomoAuth = field(repr=False)
+    histogram: JobSlot_Histogram = field(default_factory=JobSlot_Histogram)
+    default_duration_minutes: int = 1
+    n_triggers: int = 0
+    unparsed_triggers: list[DomoTrigger] = field(default_factory=list, repr=False)
+
+    def add_jobs(self, job_ls: list[dict]) -> None:
+        """Count the triggers of raw ``get_application_jobs`` objects."""
+        for obj in job_ls:
+            for trigger_obj in obj.get("triggers") or []:
+                trigger = DomoTrigger.from_dict(trigger_obj)
+                self.n_triggers += 1
+
+                if not self.histogram.add_schedule(
+                    trigger.schedule, duration_minutes=self.default_duration_minutes
+                ):
+                    self.unparsed_triggers.append(trigger)
+
+    @classmethod
+    async def load(
+        cls,
+        auth: DomoAuth,
+        application_ids: Optional[list[str]] = None,
+        default_duration_minutes: int = 1,
+        max_concurrency: int = 5,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> "JobPlacement_Planner":
+        """Load the triggers of ``application_ids`` (every application by default) once."""
+        planner = cls(auth=auth, default_duration_minutes=default_duration_minutes)
+
+        session, is_close_session = create_httpx_session(session=session)
+        try:
+            if application_ids is None:
+                res = await application_routes.get_applications(
+                    auth=auth, session=session, debug_api=debug_api
+                )
+                application_ids = [obj["applicationId"] for obj in res.response]
+
+            res_ls = await dmce.gather_with_concurrency(
+                *[
+                    application_routes.get_application_jobs(
+                        auth=auth,
+                        application_id=application_id,
+                        session=session,
+                        debug_api=debug_api,
+                        parent_class=cls.__name__,
+                    )
+                    for application_id in application_ids
+                ],
+                n=max_concurrency,
+            )
+        finally:
+            if is_close_session:
+                await session.aclose()
+
+        for res in res_ls:
+            planner.add_jobs(res.response)
+
+        return planner
+
+    def plan(self, requests: list[JobPlacement_Request]) -> JobPlacement_Plan:
+        """Assign a start time to every request without changing the planner.
+
+        Requests with the fewest allowed starts (then the longest runs) are placed
+        first.  Each takes the allowed start with the lowest peak load over its run,
+        then the lowest total load, then the earliest time.
+        """
+        histogram = self.histogram.copy()
+        plan = JobPlacement_Plan(histogram=histogram, peak_before=histogram.peak)
+
+        allowed_masks = [request.get_allowed_mask() for request in requests]
+        for request, allowed_mask in zip(requests, allowed_masks):
+            if not allowed_mask.any():
+                raise JobPlacement_Error(
+                    cls_instance=self,
+                    message=f"{request.name} has no allowed start time",
+                )
+
+        order = sorted(
+            range(len(requests)),
+            key=lambda idx: (
+                int(allowed_masks[idx].sum()),
+                -requests[idx].duration_minutes,
+                idx,
+            ),
+        )
+
+        assignments = {}
+        for idx in order:
+            request = requests[idx]
+            peaks, totals = histogram.get_window_load(request.duration_minutes)
+
+            candidates = np.flatnonzero(allowed_masks[idx])
+            best = candidates[
+                np.lexsort((candidates, totals[candidates], peaks[candidates]))[0]
+            ]
+
+            histogram.add([best], duration_minutes=request.duration_minutes)
+            assignments[idx] = JobPlacement_Assignment(
+                request=request,
+                schedule=DomoTrigger_Schedule(
+                    hour=int(best // 60), minute=int(best % 60)
+                ),
+                window_peak=int(peaks[best]),
+            )
+
+        plan.assignments = [assignments[idx] for idx in range(len(requests))]
+        return plan
+
+    async def apply(
+        self,
+        plan: JobPlacement_Plan,
+        max_concurrency: int = 10,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> JobPlacement_Plan:
+        """Create the planned jobs concurrently; failures are recorded on ``plan.results``.
+
+        Created jobs are counted in the planner so later plans see them.
+        """
+
+        async def _create(assignment: JobPlacement_Assignment):
+            request = assignment.request
+            try:
+                if request.job_cls is None:
+                    raise JobPlacement_Error(
+                        cls_instance=self,
+                        message=f"{request.name} has no job_cls to create",
+                    )
+
+                return await request.job_cls.create(
+                    auth=self.auth,
+                    name=request.name,
+                    application_id=request.application_id,
+                    triggers=[assignment.schedule],
+                    session=session,
+                    debug_api=debug_api,
+                    **request.create_kwargs,
+                )
+            except Exception as e:
+                return e
+
+        session, is_close_session = create_httpx_session(session=session)
+        try:
+            job_ls = await dmce.gather_with_concurrency(
+                *[_create(assignment) for assignment in plan.assignments],
+                n=max_concurrency,
+            )
+        finally:
+            if is_close_session:
+                await session.aclose()
+
+        for assignment, job in zip(plan.assignments, job_ls):
+            plan.results[assignment.request.name] = job
+
+            if not isinstance(job, Exception):
+                self.n_triggers += 1
+                self.histogram.add_schedule(
+                    assignment.schedule,
+                    duration_minutes=assignment.request.duration_minutes,
+                )
+
+        return plan
@@ -13,7 +13,6 @@ import httpx
 
 from ...auth import DomoAuth
 from ...base.entities_federated import DomoFederatedEntity, DomoPublishedEntity
-from ...utils import chunk_execution as dmce
 from .card_default import DomoCard_Default
 
 
@@ -29,42 +28,26 @@ class FederatedDomoCard(DomoCard_Default, DomoFederatedEntity):
         self,
         parent_auth: None = None,
         parent_auth_retrieval_fn: Optional[Callable] = None,
+        content_map: Any = None,  # DomoEverywhere_ContentMap
     ):
-        from ...classes.DomoEverywhere import DomoEverywhere
+        """Resolve the publisher-side entity.
 
-        domo_everywhere = DomoEverywhere(
-            auth=self.auth,
-        )
+        Pass a prebuilt ``DomoEverywhere_ContentMap`` when resolving many
+        federated entities; otherwise one is built for this call.
 
-        await domo_everywhere.get_subscriptions()
-
-        await dmce.gather_with_concurrency(
-            *[
-                sub.get_parent_publication(
-                    parent_auth_retrieval_fn=parent_auth_retrieval_fn,  # type: ignore
-                    parent_auth=parent_auth,  # type: ignore
-                )
-                for sub in domo_everywhere.subscriptions
-            ],
-            n=20,
-        )
+        Raises:
+            DomoEverywhere_ContentMap_NoMatch: no publication shares this card
+        """
+        from ...classes.DomoEverywhere import DomoEverywhere_ContentMap
 
-        all = await dmce.gather_with_concurrency(
-            *[
-                sub.parent_publication.get_publication_entity_by_subscriber_entity(
-                    subscriber_domain=sub.subscriber_domain,
-                    subscriber=self,
-                )
-                for sub in domo_everywhere.subscriptions
-            ],
-            n=20,
-        )
+        if content_map is None:
+            content_map = await DomoEverywhere_ContentMap.build(
+                auth=self.auth,
+                parent_auth=parent_auth,  # type: ignore
+                parent_auth_retrieval_fn=parent_auth_retrieval_fn,
+            )
 
-        self.parent_entity = next(
-            (entity for entity in all if entity is not None), None
-        )
-        if not self.parent_entity:
-            raise NotImplementedError("To Do")
+        self.parent_entity = await content_map.get_publisher_entity(subscriber=self)
 
         return self.parent_entity
 
@@ -7,6 +7,7 @@ import httpx
 
 from ..auth import DomoAuth
 from ..base.exceptions import DomoError
+from ..base.records import DomoRecord_Batch
 from ..routes import datacenter as datacenter_routes
 from ..routes.datacenter import generate_search_datacenter_filter
 from ..utils import chunk_execution as dmce
@@ -54,9 +55,12 @@ class DomoDatacenter:
         # can accept one value or a list of values
         additional_filters_ls=None,
         return_raw: bool = False,
+        return_records: bool = False,
         debug_api: bool = False,
         session: httpx.AsyncClient = None,
-    ) -> list[Any]:
+    ) -> Union[list[Any], DomoRecord_Batch]:
+        """search datasets; return_records returns a DomoRecord_Batch of
+        `DomoDataset.record_fields` instead of DomoDataset objects"""
         from . import DomoDataset as dmds
 
         json_list = await self.search_datacenter(
@@ -69,7 +73,15 @@ class DomoDatacenter:
             debug_api=debug_api,
         )
 
-        if return_raw or len(json_list) == 0:
+        if return_raw:
+            return json_list
+
+        if return_records:
+            return DomoRecord_Batch.from_dicts(
+                dmds.DomoDataset, auth=self.auth, obj_ls=json_list
+            )
+
+        if len(json_list) == 0:
             return json_list
 
         # return await dmce.gather_with_concurrency(
@@ -44,7 +44,7 @@ class DomoDataflow_Action(DomoAction):
         dd = obj
 
         if isinstance(dd, dict):
-            dd = util_dd.DictDot(obj)
+            dd = util_dd.LazyDictDot(obj)
 
         tbl_name = dd.dataSource.name if dd.dataSource else None
         ds_id = dd.dataSource.guid if dd.dataSource else None
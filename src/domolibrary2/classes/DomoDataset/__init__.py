@@ -10,9 +10,11 @@ Classes:
     FederatedDomoDataset: Federated dataset functionality
     DomoPublishDataset: Published dataset operations
     DomoDataset_Schema: Dataset schema management
+    DomoDataset_Partitions: Bulk partition listing, retention planning and deletion
     DomoDataset_Schema_Column: Individual column management
     PDP_Policy: PDP policy management
     DomoStream: Dataset streaming operations
+    get_stream_inventory: Instance-wide one-row-per-stream inventory
     DomoConnector: Dataset connector management
 
 Exceptions:
@@ -35,6 +37,11 @@ from .core import (
     DomoPublishDataset,
     FederatedDomoDataset,
 )
+from .partitions import (
+    DomoDataset_PartitionPlan,
+    DomoDataset_Partitions,
+    parse_partition_dates,
+)
 from .pdp import DatasetPdpPolicies, PdpParameter, PDPPolicy
 from .schema import (
     DatasetSchema_InvalidSchemaError,
@@ -52,6 +59,11 @@ from .stream_configs import (
     StreamConfig,
     StreamConfig_Mappings,
 )
+from .stream_inventory import (
+    STREAM_INVENTORY_COLUMNS,
+    get_stream_inventory,
+    iter_stream_inventory,
+)
 
 # Import route-level exceptions that are commonly used
 try:
@@ -75,6 +87,10 @@ __all__ = [
     "DomoDataset_Schema_Column",
     "DatasetSchema_Types",
     "DatasetSchema_InvalidSchemaError",
+    # Partitions
+    "DomoDataset_Partitions",
+    "DomoDataset_PartitionPlan",
+    "parse_partition_dates",
     # PDP functionality
     "PDPPolicy",
     "PdpParameter",
@@ -84,6 +100,9 @@ __all__ = [
     "DomoStreams",
     "StreamConfig",
     "StreamConfig_Mappings",
+    "STREAM_INVENTORY_COLUMNS",
+    "get_stream_inventory",
+    "iter_stream_inventory",
     # Conformed properties (NEW)
     "ConformedProperty",
     "CONFORMED_PROPERTIES",
@@ -1,19 +1,23 @@
 """a class based approach for interacting with Domo Datasets"""
 
 __all__ = [
+    "read_export_chunks",
     "DomoDataset_Data",
 ]
 
 
 import asyncio
 import io
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
+from pathlib import Path
 
 import httpx
 import pandas as pd
 
 from ...base.entities import DomoSubEntity
 from ...base.exceptions import DomoError
+from ...client import get_data as gd
 from ...routes import dataset as dataset_routes
 from ...routes.dataset import (
     DatasetNotFoundError,
@@ -22,6 +26,52 @@ from ...routes.dataset import (
 from ...utils import chunk_execution as dmce
 
 
+def read_export_chunks(
+    export: "gd.DataStream_Result | str | Path",
+    chunksize: int = 100_000,
+    engine: str = "pandas",
+    is_gzip: bool = None,
+) -> Iterator:
+    """Read an exported CSV in chunks so memory stays bounded by ``chunksize``.
+
+    Args:
+        export: ``DomoDataset_Data.export`` result, or a path to an exported file
+        chunksize: Rows per DataFrame (``engine="pandas"``); bytes per block for ``"arrow"``
+        engine: ``"pandas"`` yields DataFrames, ``"arrow"`` yields ``pyarrow.RecordBatch``
+        is_gzip: Defaults to the export's ``content_encoding`` (or a ``.gz`` suffix)
+    """
+    if isinstance(export, gd.DataStream_Result):
+        path = export.path
+        is_gzip = export.content_encoding == "gzip" if is_gzip is None else is_gzip
+    else:
+        path = Path(export)
+        is_gzip = path.suffix == ".gz" if is_gzip is None else is_gzip
+
+    if engine == "pandas":
+        with pd.read_csv(
+            path, chunksize=chunksize, compression="gzip" if is_gzip else None
+        ) as reader:
+            yield from reader
+        return
+
+    if engine != "arrow":
+        raise ValueError(f"engine must be 'pandas' or 'arrow', got {engine}")
+
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for engine='arrow' (pip install pyarrow)"
+        ) from e
+
+    with pa.OSFile(str(path)) as f:
+        stream = pa.CompressedInputStream(f, "gzip") if is_gzip else f
+        yield from pa_csv.open_csv(
+            stream, read_options=pa_csv.ReadOptions(block_size=chunksize)
+        )
+
+
 @dataclass
 class DomoDataset_Data(DomoSubEntity):
     "interacts with domo datasets"
@@ -94,6 +144,59 @@ class DomoDataset_Data(DomoSubEntity):
 
         return pd.DataFrame(res.response)
 
+    async def export(
+        self,
+        output_path: str | Path,
+        include_header: bool = True,
+        is_gzip: bool = True,
+        is_resume: bool = True,
+        max_retry: int = 3,
+        timeout: int = 60,
+        return_raw: bool = False,
+        session: httpx.AsyncClient | None = None,
+        debug_api: bool = False,
+    ) -> gd.DataStream_Result:
+        """stream every row to a CSV file with the bulk export api
+
+        memory use is constant regardless of dataset size; a dropped connection
+        resumes from the bytes already written, unless the dataset changed in
+        the meantime (then the export starts over).  a gzip-encoded export is
+        saved with a `.gz` suffix (`result.path`).  read the file back with
+        `read_export_chunks` or use `iter_export`.  throughput is reported on the
+        result (`megabytes_per_second`)
+        """
+        res = await dataset_routes.export_dataset(
+            auth=self.auth,
+            dataset_id=self.parent_id,
+            output_path=output_path,
+            include_header=include_header,
+            is_gzip=is_gzip,
+            is_resume=is_resume,
+            max_retry=max_retry,
+            timeout=timeout,
+            session=session,
+            debug_api=debug_api,
+            parent_class=self.__class__.__name__,
+        )
+
+        if return_raw:
+            return res
+
+        return res.response
+
+    async def iter_export(
+        self,
+        output_path: str | Path,
+        chunksize: int = 100_000,
+        engine: str = "pandas",
+        **export_kwargs,
+    ) -> AsyncIterator:
+        """export to `output_path`, then yield DataFrames (or Arrow record batches) of `chunksize`"""
+        export = await self.export(output_path=output_path, **export_kwargs)
+
+        for chunk in read_export_chunks(export, chunksize=chunksize, engine=engine):
+            yield chunk
+
     async def index(
         self,
         debug_api: bool = False,
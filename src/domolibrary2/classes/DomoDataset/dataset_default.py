@@ -30,6 +30,7 @@ from . import (
     stream as dmdst,
 )
 from .dataset_data import DomoDataset_Data
+from .partitions import DomoDataset_Partitions
 
 
 class DomoDataset_NoTransportType_Error(ClassError):
@@ -67,6 +68,7 @@ class DomoDataset_Default(DomoEntity_w_Lineage):  # noqa: N801
     formulas: dict = field(default_factory=dict)
 
     Data: Optional[DomoDataset_Data] = field(default=None, repr=False)
+    Partitions: Optional[DomoDataset_Partitions] = field(default=None, repr=False)
     Schema: Optional[dmdsc.DomoDataset_Schema] = field(default=None, repr=False)
     Stream: Optional[dmdst.DomoStream] = field(default=None, repr=False)
     Tags: Optional[dmtg.DomoTags] = field(default=None, repr=False)
@@ -79,6 +81,18 @@ class DomoDataset_Default(DomoEntity_w_Lineage):  # noqa: N801
     # Include selected computed properties in generic to_dict serialization
     __serialize_properties__: ClassVar[tuple] = ("display_url", "transport_type")
 
+    # fields kept by DomoDatacenter.search_datasets(return_records=True)
+    record_fields: ClassVar[dict] = {
+        "id": ("id", "databaseId"),
+        "name": "name",
+        "display_type": "displayType",
+        "data_provider_type": "dataProviderType",
+        "row_count": "rowCount",
+        "column_count": "columnCount",
+        "owner_id": "ownedById",
+        "last_touched": "lastTouched",
+    }
+
     @property
     def entity_type(self):
         return "DATASET"
@@ -140,6 +154,7 @@ class DomoDataset_Default(DomoEntity_w_Lineage):  # noqa: N801
 
         # Lineage implemented by parent post init
         self.Data = DomoDataset_Data.from_parent(parent=self)
+        self.Partitions = DomoDataset_Partitions.from_parent(parent=self)
         self.Schema = dmdsc.DomoDataset_Schema.from_parent(parent=self)
         self.Tags = dmtg.DomoTags.from_parent(parent=self)
 
@@ -0,0 +1,304 @@
+"""Bulk partition lifecycle management for datasets.
+
+``DomoDataset_Partitions`` lists every partition, plans retention as a reviewable
+``DomoDataset_PartitionPlan``, and deletes the planned partitions concurrently
+with a single re-index at the end.
+
+Example:
+    >>> plan = await domo_dataset.Partitions.remove_partitions(keep_last_days=90, is_dry_run=True)
+    >>> plan.to_dataframe().query("action == 'delete'")
+    >>> await domo_dataset.Partitions.apply(plan)
+"""
+
+__all__ = [
+    "parse_partition_dates",
+    "DomoDataset_PartitionPlan",
+    "DomoDataset_Partitions",
+]
+
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+import pandas as pd
+
+from ...base.entities import DomoSubEntity
+from ...routes import dataset as dataset_routes
+from ...utils import chunk_execution as dmce
+
+PARTITION_ID_COL = "partitionId"
+
+
+def parse_partition_dates(
+    partition_ids: pd.Series,
+    separator: Optional[str] = None,
+    date_index: int = 0,
+    date_format: str = "%Y-%m-%d",
+) -> pd.Series:
+    """Parse partition ids such as ``2024-01-31`` or ``store_7|2024-01-31`` to dates.
+
+    Ids that do not contain a date in ``date_format`` become ``NaT``.
+    """
+    date_strings = partition_ids.astype(str)
+
+    if separator:
+        date_strings = date_strings.str.split(separator, regex=False).str[date_index]
+
+    return pd.to_datetime(date_strings, format=date_format, errors="coerce")
+
+
+@dataclass
+class DomoDataset_PartitionPlan:
+    """Partitions of one dataset split into delete / keep, plus apply results."""
+
+    dataset_id: str
+    partitions_df: pd.DataFrame = field(repr=False)
+    delete_mask: pd.Series = field(repr=False)
+    is_dry_run: bool = True
+    is_applied: bool = False
+    results: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def partition_ids_to_delete(self) -> list[str]:
+        return self.partitions_df.loc[self.delete_mask, "partition_id"].tolist()
+
+    @property
+    def n_delete(self) -> int:
+        return int(self.delete_mask.sum())
+
+    @property
+    def n_keep(self) -> int:
+        return len(self.partitions_df) - self.n_delete
+
+    @property
+    def failed(self) -> dict:
+        return {
+            partition_id: result
+            for partition_id, result in self.results.items()
+            if isinstance(result, Exception)
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per partition with its planned ``action`` and, once applied, ``status``."""
+        df = self.partitions_df.assign(
+            action=self.delete_mask.map({True: "delete", False: "keep"})
+        )
+
+        if self.results:
+            df["status"] = df["partition_id"].map(
+                lambda partition_id: (
+                    None
+                    if partition_id not in self.results
+                    else (
+                        f"failed: {self.results[partition_id]}"
+                        if isinstance(self.results[partition_id], Exception)
+                        else "deleted"
+                    )
+                )
+            )
+
+        return df
+
+
+@dataclass
+class DomoDataset_Partitions(DomoSubEntity):
+    """Bulk partition listing, retention planning and deletion for a dataset."""
+
+    async def get(
+        self,
+        separator: Optional[str] = None,
+        date_index: int = 0,
+        date_format: str = "%Y-%m-%d",
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> pd.DataFrame:
+        """All partitions as a DataFrame with ``partition_id`` and parsed ``partition_date``."""
+        res = await dataset_routes.list_partitions(
+            auth=self.auth,
+            dataset_id=self.parent_id,
+            session=session,
+            debug_api=debug_api,
+        )
+
+        df = pd.DataFrame(res.response)
+        if df.empty:
+            df = pd.DataFrame(columns=[PARTITION_ID_COL])
+
+        df.insert(0, "partition_id", df[PARTITION_ID_COL].astype(str))
+        df.insert(
+            1,
+            "partition_date",
+            parse_partition_dates(
+                df["partition_id"],
+                separator=separator,
+                date_index=date_index,
+                date_format=date_format,
+            ),
+        )
+        return df
+
+    @staticmethod
+    def _check_retention_rules(keep_last_days, before_date, keep_latest_n) -> None:
+        # with no rule every dated partition would match
+        if keep_last_days is None and before_date is None and keep_latest_n is None:
+            raise ValueError(
+                "pass at least one of keep_last_days, before_date or keep_latest_n"
+            )
+
+    def plan_retention(
+        self,
+        partitions_df: pd.DataFrame,
+        keep_last_days: Optional[int] = None,
+        before_date: Optional[dt.date] = None,
+        keep_latest_n: Optional[int] = None,
+        today: Optional[dt.date] = None,
+    ) -> DomoDataset_PartitionPlan:
+        """Select partitions to delete; all given rules must match.
+
+        Partitions whose date could not be parsed are always kept.
+
+        Args:
+            partitions_df: Output of ``get``
+            keep_last_days: Delete partitions dated before ``today - keep_last_days``
+            before_date: Delete partitions dated before this date
+            keep_latest_n: Never delete the ``n`` most recent partitions
+            today: Reference date for ``keep_last_days`` (defaults to today)
+
+        Raises:
+            ValueError: If no rule is given
+        """
+        self._check_retention_rules(keep_last_days, before_date, keep_latest_n)
+
+        partition_dates = partitions_df["partition_date"]
+        delete_mask = partition_dates.notna()
+
+        if keep_last_days is not None:
+            cutoff = (today or dt.date.today()) - dt.timedelta(days=keep_last_days)
+            delete_mask &= partition_dates < pd.Timestamp(cutoff)
+
+        if before_date is not None:
+            delete_mask &= partition_dates < pd.Timestamp(before_date)
+
+        if keep_latest_n is not None:
+            recency_rank = partition_dates.rank(method="first", ascending=False)
+            delete_mask &= recency_rank > keep_latest_n
+
+        return DomoDataset_PartitionPlan(
+            dataset_id=self.parent_id,
+            partitions_df=partitions_df,
+            delete_mask=delete_mask.astype(bool),
+        )
+
+    async def _delete_partition(
+        self,
+        partition_id: str,
+        session: httpx.AsyncClient = None,
+        debug_api: bool = False,
+    ):
+        await dataset_routes.delete_partition_stage_1(
+            auth=self.auth,
+            dataset_id=self.parent_id,
+            dataset_partition_id=partition_id,
+            session=session,
+            debug_api=debug_api,
+        )
+
+        return await dataset_routes.delete_partition_stage_2(
+            auth=self.auth,
+            dataset_id=self.parent_id,
+            dataset_partition_id=partition_id,
+            session=session,
+            debug_api=debug_api,
+        )
+
+    async def _try_delete_partition(self, partition_id: str, **kwargs):
+        try:
+            return await self._delete_partition(partition_id, **kwargs)
+        except Exception as e:
+            return e
+
+    async def apply(
+        self,
+        plan: DomoDataset_PartitionPlan,
+        max_concurrency: int = 10,
+        is_index: bool = True,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> DomoDataset_PartitionPlan:
+        """Delete the planned partitions; failures are recorded on ``plan.results``.
+
+        The dataset is indexed once, after all deletes, if anything was deleted.
+        """
+        partition_ids = plan.partition_ids_to_delete
+
+        res_ls = await dmce.gather_with_concurrency(
+            *[
+                self._try_delete_partition(
+                    partition_id, session=session, debug_api=debug_api
+                )
+                for partition_id in partition_ids
+            ],
+            n=max_concurrency,
+        )
+
+        plan.results = dict(zip(partition_ids, res_ls))
+        plan.is_dry_run = False
+        plan.is_applied = True
+
+        if is_index and len(plan.failed) < len(partition_ids):
+            await dataset_routes.index_dataset(
+                auth=self.auth,
+                dataset_id=self.parent_id,
+                session=session,
+                debug_api=debug_api,
+            )
+
+        return plan
+
+    async def remove_partitions(
+        self,
+        keep_last_days: Optional[int] = None,
+        before_date: Optional[dt.date] = None,
+        keep_latest_n: Optional[int] = None,
+        separator: Optional[str] = None,
+        date_index: int = 0,
+        date_format: str = "%Y-%m-%d",
+        is_dry_run: bool = False,
+        max_concurrency: int = 10,
+        is_index: bool = True,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> DomoDataset_PartitionPlan:
+        """List, plan and (unless ``is_dry_run``) apply a retention policy.
+
+        At least one of ``keep_last_days``, ``before_date`` or ``keep_latest_n`` is
+        required; a ``ValueError`` is raised before anything is listed otherwise.
+        """
+        self._check_retention_rules(keep_last_days, before_date, keep_latest_n)
+
+        partitions_df = await self.get(
+            separator=separator,
+            date_index=date_index,
+            date_format=date_format,
+            session=session,
+            debug_api=debug_api,
+        )
+
+        plan = self.plan_retention(
+            partitions_df,
+            keep_last_days=keep_last_days,
+            before_date=before_date,
+            keep_latest_n=keep_latest_n,
+        )
+
+        if is_dry_run:
+            return plan
+
+        return await self.apply(
+            plan,
+            max_concurrency=max_concurrency,
+            is_index=is_index,
+            session=session,
+            debug_api=debug_api,
+        )
@@ -678,6 +678,31 @@ class DomoStreams(DomoManager):
 
         return self.streams
 
+    async def get_inventory(
+        self,
+        page_size: int = 500,
+        maximum: int | None = None,
+        is_parse_tables: bool = True,
+        return_type: str = "dataframe",
+        debug_api: bool = False,
+        session: httpx.AsyncClient | None = None,
+    ):
+        """Retrieve a one-row-per-stream inventory without building DomoStream objects.
+
+        See ``stream_inventory.get_stream_inventory`` for column definitions.
+        """
+        from .stream_inventory import get_stream_inventory
+
+        return await get_stream_inventory(
+            auth=self.auth,
+            page_size=page_size,
+            maximum=maximum,
+            is_parse_tables=is_parse_tables,
+            return_type=return_type,
+            session=session,
+            debug_api=debug_api,
+        )
+
     async def upsert(
         self,
         cnfg_body,
@@ -16,8 +16,6 @@ from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
 
-from sqlglot import exp, parse_one
-
 from ....base.base import DomoBase, DomoEnumMixin
 from ....routes.stream import Stream_CRUD_Error, Stream_GET_Error
 
@@ -337,6 +335,8 @@ class StreamConfig:
 
         self.parent.configuration_query = self.value
 
+        from sqlglot import exp, parse_one  # only needed for SQL stream configs
+
         try:
             for table in parse_one(self.value).find_all(exp.Table):
                 self.parent.configuration_tables.append(table.name.lower())
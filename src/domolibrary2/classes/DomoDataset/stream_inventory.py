@@ -0,0 +1,340 @@
+"""Instance-wide stream inventory.
+
+Builds one row per stream straight from the ``/api/data/v1/streams`` listing
+payload without instantiating ``DomoStream`` / ``StreamConfig`` objects.
+
+Pages are streamed from the API and converted to a DataFrame (or Arrow table)
+one batch at a time, so derived columns (conformed properties, schedule,
+referenced tables) are computed per page rather than per entity.
+
+Example:
+    >>> df = await get_stream_inventory(auth=auth)
+    >>> df.groupby("data_provider_key").size()
+
+    >>> async for batch_df in iter_stream_inventory(auth=auth, page_size=500):
+    ...     batch_df.to_parquet(...)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "STREAM_INVENTORY_COLUMNS",
+    "extract_stream_inventory_row",
+    "iter_stream_inventory",
+    "get_stream_inventory",
+]
+
+import functools
+import json
+from collections.abc import AsyncIterator
+from dataclasses import fields
+from typing import Any
+
+import httpx
+import pandas as pd
+
+from ...auth import DomoAuth
+from ...client.get_data import create_httpx_session
+from ...routes import stream as stream_routes
+from ..subentity.schedule import DomoSchedule
+from .stream_configs._base import _CONFIG_REGISTRY, _camel_to_snake
+from .stream_configs._conformed import CONFORMED_PROPERTIES
+
+_BASE_COLUMNS = [
+    "stream_id",
+    "dataset_id",
+    "data_provider_key",
+    "data_provider_name",
+    "transport_description",
+    "transport_version",
+    "update_method",
+    "account_id",
+    "account_display_name",
+    "account_userid",
+]
+
+_SCHEDULE_COLUMNS = [
+    "schedule_frequency",
+    "schedule_expression",
+    "schedule_start_date",
+    "schedule_timezone",
+    "schedule_is_active",
+]
+
+STREAM_INVENTORY_COLUMNS = [
+    *_BASE_COLUMNS,
+    *[name for name in CONFORMED_PROPERTIES if name not in _BASE_COLUMNS],
+    "tables",
+    *_SCHEDULE_COLUMNS,
+]
+
+
+@functools.cache
+def _resolve_config_attr(data_provider_key: str, api_key: str) -> str | None:
+    """Map an API config name to the typed_config attribute for a provider.
+
+    Mirrors ``StreamConfig_Base.from_dict`` key resolution (``_field_map`` first,
+    then camelCase -> snake_case) so inventory values match ``DomoStream``
+    conformed properties.  Cached per (provider, key) pair.
+    """
+    config_class = _CONFIG_REGISTRY.get(data_provider_key)
+    if not config_class:
+        return None
+
+    field_map = {}
+    field_map_field = config_class.__dataclass_fields__.get("_field_map")
+    if field_map_field is not None and field_map_field.default_factory:
+        field_map = field_map_field.default_factory()
+
+    attr = field_map.get(api_key) or _camel_to_snake(api_key)
+
+    if attr not in {fld.name for fld in fields(config_class)}:
+        return None
+
+    return attr
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_tables_from_sql(sql: str) -> tuple[str, ...]:
+    """Extract sorted, lower-cased table names referenced by a SQL statement."""
+    from sqlglot import exp, parse_one
+
+    try:
+        return tuple(
+            sorted({table.name.lower() for table in parse_one(sql).find_all(exp.Table)})
+        )
+    except Exception:
+        return ()
+
+
+@functools.lru_cache(maxsize=4096)
+def _interpret_schedule_frequency(
+    schedule_expression: str | None,
+    advanced_schedule_json: str | None,
+) -> str | None:
+    """Return the schedule frequency for a schedule expression / advanced JSON.
+
+    Streams share a small number of distinct schedules, so the frequency is
+    cached by schedule text instead of being re-parsed for every stream.
+    """
+    schedule = DomoSchedule.from_parent(
+        parent=None,
+        obj={
+            "scheduleExpression": schedule_expression,
+            "advancedScheduleJson": advanced_schedule_json,
+        },
+    )
+    return schedule.frequency.value if schedule.frequency else None
+
+
+def extract_stream_inventory_row(
+    obj: dict, is_parse_tables: bool = True
+) -> dict[str, Any]:
+    """Convert a raw stream API payload into a flat inventory row.
+
+    Args:
+        obj: Stream payload as returned by ``routes.stream.get_streams``
+        is_parse_tables: Parse the stream SQL with sqlglot to populate ``tables``
+
+    Returns:
+        dict keyed by ``STREAM_INVENTORY_COLUMNS``
+    """
+    data_provider = obj.get("dataProvider") or {}
+    transport = obj.get("transport") or {}
+    account = obj.get("account") or {}
+    data_provider_key = data_provider.get("key")
+
+    row = dict.fromkeys(STREAM_INVENTORY_COLUMNS)
+    row.update(
+        {
+            "stream_id": obj.get("id"),
+            "dataset_id": (obj.get("dataSource") or {}).get("id"),
+            "data_provider_key": data_provider_key,
+            "data_provider_name": data_provider.get("name"),
+            "transport_description": transport.get("description"),
+            "transport_version": transport.get("version"),
+            "update_method": obj.get("updateMethod"),
+            "account_id": account.get("id"),
+            "account_display_name": account.get("displayName"),
+            "account_userid": account.get("userId"),
+        }
+    )
+
+    # typed_config attribute -> value, resolved without building the config class
+    typed_values = {}
+    if data_provider_key:
+        for cfg in obj.get("configuration") or []:
+            if cfg.get("value") is None:
+                continue
+            attr = _resolve_config_attr(data_provider_key, cfg.get("name"))
+            if attr:
+                typed_values[attr] = cfg["value"]
+
+    for prop_name, conformed_prop in CONFORMED_PROPERTIES.items():
+        attr = conformed_prop.get_key_for_provider(data_provider_key)
+        value = typed_values.get(attr) if attr else None
+
+        if prop_name == "dataset_id":
+            # dataset-copy connectors point at the source dataset (see DomoStream.dataset_id)
+            if value:
+                row["dataset_id"] = value
+            continue
+
+        row[prop_name] = value
+
+    sql = row.get("query")
+    row["tables"] = (
+        list(_extract_tables_from_sql(sql)) if sql and is_parse_tables else []
+    )
+
+    advanced_json = obj.get("advancedScheduleJson")
+    row.update(
+        {
+            "schedule_frequency": _interpret_schedule_frequency(
+                obj.get("scheduleExpression"),
+                (
+                    json.dumps(advanced_json, sort_keys=True)
+                    if isinstance(advanced_json, dict)
+                    else advanced_json
+                ),
+            ),
+            "schedule_expression": obj.get("scheduleExpression"),
+            "schedule_start_date": obj.get("scheduleStartDate"),
+            "schedule_timezone": obj.get("timezone"),
+            "schedule_is_active": obj.get("isActive", True),
+        }
+    )
+
+    return row
+
+
+def _rows_to_dataframe(rows: list[dict]) -> pd.DataFrame:
+    """Build a DataFrame batch, converting schedule dates in one vectorized step."""
+    df = pd.DataFrame(rows, columns=STREAM_INVENTORY_COLUMNS)
+
+    # scheduleStartDate is returned as either epoch milliseconds or an ISO string
+    start_date = df["schedule_start_date"]
+    epoch_ms = pd.to_numeric(start_date, errors="coerce")
+    parsed = pd.to_datetime(epoch_ms, unit="ms", errors="coerce", utc=True)
+
+    is_text = epoch_ms.isna() & start_date.notna()
+    if is_text.any():
+        parsed[is_text] = pd.to_datetime(start_date[is_text], errors="coerce", utc=True)
+
+    df["schedule_start_date"] = parsed
+    return df
+
+
+async def iter_stream_inventory(
+    auth: DomoAuth,
+    page_size: int = 500,
+    maximum: int | None = None,
+    is_parse_tables: bool = True,
+    session: httpx.AsyncClient | None = None,
+    debug_api: bool = False,
+) -> AsyncIterator[pd.DataFrame]:
+    """Yield one inventory DataFrame per page of streams.
+
+    Args:
+        auth: Authentication object
+        page_size: Number of streams requested per page
+        maximum: Stop after this many streams (None retrieves all streams)
+        is_parse_tables: Parse stream SQL to populate the ``tables`` column
+        session: Optional httpx session reused across pages
+        debug_api: Enable API debugging
+
+    Yields:
+        pd.DataFrame with ``STREAM_INVENTORY_COLUMNS`` for each page
+    """
+    session, is_close_session = create_httpx_session(session=session)
+
+    skip = 0
+    try:
+        while True:
+            limit = page_size if not maximum else min(page_size, maximum - skip)
+            if limit <= 0:
+                break
+
+            res = await stream_routes.get_streams(
+                auth=auth,
+                skip=skip,
+                maximum=limit,
+                loop_until_end=False,
+                session=session,
+                debug_api=debug_api,
+                parent_class="DomoStreams",
+            )
+
+            page = res.response or []
+            if not page:
+                break
+
+            yield _rows_to_dataframe(
+                [
+                    extract_stream_inventory_row(obj, is_parse_tables=is_parse_tables)
+                    for obj in page
+                ]
+            )
+
+            skip += len(page)
+            if len(page) < limit:
+                break
+
+    finally:
+        if is_close_session:
+            await session.aclose()
+
+
+async def get_stream_inventory(
+    auth: DomoAuth,
+    page_size: int = 500,
+    maximum: int | None = None,
+    is_parse_tables: bool = True,
+    return_type: str = "dataframe",  # "dataframe" or "arrow"
+    session: httpx.AsyncClient | None = None,
+    debug_api: bool = False,
+):
+    """Retrieve an instance-wide stream inventory in a single pass.
+
+    Args:
+        auth: Authentication object
+        page_size: Number of streams requested per page
+        maximum: Stop after this many streams (None retrieves all streams)
+        is_parse_tables: Parse stream SQL to populate the ``tables`` column
+        return_type: ``"dataframe"`` for pandas, ``"arrow"`` for a pyarrow Table
+        session: Optional httpx session reused across pages
+        debug_api: Enable API debugging
+
+    Returns:
+        pd.DataFrame or pyarrow.Table with one row per stream
+    """
+    if return_type not in ("dataframe", "arrow"):
+        raise ValueError(
+            f"return_type must be 'dataframe' or 'arrow', got {return_type}"
+        )
+
+    batches = [
+        batch_df
+        async for batch_df in iter_stream_inventory(
+            auth=auth,
+            page_size=page_size,
+            maximum=maximum,
+            is_parse_tables=is_parse_tables,
+            session=session,
+            debug_api=debug_api,
+        )
+    ]
+
+    df = pd.concat(batches, ignore_index=True) if batches else _rows_to_dataframe([])
+
+    if return_type == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for return_type='arrow' (pip install pyarrow)"
+            ) from e
+
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    return df
@@ -9,6 +9,7 @@ Classes:
     DomoSubscription: Subscription entity management
     DomoPublication_Content: Content within publications
     DomoPublication_Content_Enum: Enum of publishable content types
+    DomoEverywhere_ContentMap: Subscriber -> publisher content map for federated lookups
 
 Example:
     Basic DomoEverywhere usage:
@@ -19,6 +20,11 @@ Example:
         >>> subscriptions = await de.get_subscriptions()
 """
 
+from .content_map import (
+    DomoEverywhere_ContentLink,
+    DomoEverywhere_ContentMap,
+    DomoEverywhere_ContentMap_NoMatch,
+)
 from .core import (
     DomoEverywhere,
     DomoPublication,
@@ -28,6 +34,7 @@ from .core import (
     DomoSubscription,
     DomoSubscription_NoParent,
     DomoSubscription_NoParentAuth,
+    get_publisher_entity,
 )
 
 __all__ = [
@@ -39,4 +46,8 @@ __all__ = [
     "DomoSubscription",
     "DomoSubscription_NoParent",
     "DomoSubscription_NoParentAuth",
+    "get_publisher_entity",
+    "DomoEverywhere_ContentLink",
+    "DomoEverywhere_ContentMap",
+    "DomoEverywhere_ContentMap_NoMatch",
 ]
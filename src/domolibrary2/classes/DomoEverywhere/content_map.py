@@ -0,0 +1,209 @@
+"""Publisher <-> subscriber content map for Domo Everywhere.
+
+Indexes subscriber content details by subscriber object so a federated card,
+dataset or page resolves its publisher entity with one lookup and one fetch.
+
+Example:
+    >>> content_map = await DomoEverywhere_ContentMap.build(
+    ...     auth=subscriber_auth, parent_auth_retrieval_fn=get_publisher_auth
+    ... )
+    >>> for card in federated_cards:
+    ...     parent = await card.get_federated_parent(content_map=content_map)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DomoEverywhere_ContentLink",
+    "DomoEverywhere_ContentMap",
+    "DomoEverywhere_ContentMap_NoMatch",
+]
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import httpx
+
+from ...auth import DomoAuth
+from ...base import exceptions as dmde
+from ...routes import publish as publish_routes
+from ...utils import chunk_execution as dmce
+from .core import DomoSubscription, DomoSubscription_NoParentAuth, get_publisher_entity
+
+
+def _normalize_domain(domain: str) -> str:
+    domain = (domain or "").lower()
+    return domain if domain.endswith(".domo.com") else f"{domain}.domo.com"
+
+
+class DomoEverywhere_ContentMap_NoMatch(dmde.ClassError):
+    def __init__(self, cls_instance, subscriber: Any):
+        super().__init__(
+            cls_instance=cls_instance,
+            entity_id=getattr(subscriber, "id", None),
+            message=f"no publication content found for subscriber {getattr(subscriber, 'entity_type', '')} {getattr(subscriber, 'id', '')}",
+        )
+
+
+@dataclass(frozen=True)
+class DomoEverywhere_ContentLink:
+    """One subscriber object and the publisher object it was published from."""
+
+    subscriber_domain: str
+    subscriber_object_id: str
+    content_type: str
+    publisher_domain: str
+    publisher_object_id: str
+    publication_id: str
+    publisher_auth: DomoAuth = field(repr=False, compare=False, default=None)
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.subscriber_domain, self.subscriber_object_id, self.content_type)
+
+
+@dataclass
+class DomoEverywhere_ContentMap:
+    """Hash map of subscriber content to publisher content for one subscriber instance."""
+
+    auth: DomoAuth = field(repr=False)
+    links: dict[tuple[str, str, str], DomoEverywhere_ContentLink] = field(
+        default_factory=dict, repr=False
+    )
+    subscriptions: list[DomoSubscription] = field(default_factory=list, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def add_subscriber_content(
+        self,
+        subscription: DomoSubscription,
+        subscriber_content_ls: list[dict],
+        publisher_auth: DomoAuth = None,
+    ) -> None:
+        """Index the ``get_subscriber_content_details`` payload for one subscription."""
+        for obj in subscriber_content_ls or []:
+            link = DomoEverywhere_ContentLink(
+                subscriber_domain=_normalize_domain(
+                    obj.get("subscriberDomain") or subscription.subscriber_domain
+                ),
+                subscriber_object_id=str(obj["subscriberObjectId"]),
+                content_type=obj["contentType"],
+                publisher_domain=_normalize_domain(
+                    subscription.publisher_domain
+                    or (publisher_auth.domo_instance if publisher_auth else "")
+                ),
+                publisher_object_id=str(obj["publisherObjectId"]),
+                publication_id=subscription.publication_id,
+                publisher_auth=publisher_auth,
+            )
+            self.links.setdefault(link.key, link)
+
+    @classmethod
+    async def build(
+        cls,
+        auth: DomoAuth,
+        parent_auth: DomoAuth = None,
+        parent_auth_retrieval_fn: Callable | None = None,
+        subscriptions: list[DomoSubscription] | None = None,
+        max_concurrency: int = 20,
+        debug_api: bool = False,
+        session: httpx.AsyncClient | None = None,
+    ) -> DomoEverywhere_ContentMap:
+        """Build the content map for every subscription in the subscriber instance.
+
+        Args:
+            auth: Subscriber instance auth
+            parent_auth: Publisher auth used for every subscription
+            parent_auth_retrieval_fn: Callable returning publisher auth given a subscription
+            subscriptions: Pre-fetched subscriptions (defaults to the instance's summaries)
+            max_concurrency: Concurrent content-detail requests
+        """
+        from .core import DomoEverywhere
+
+        if subscriptions is None:
+            subscriptions = await DomoEverywhere(auth=auth).get_subscriptions(
+                session=session, debug_api=debug_api
+            )
+
+        content_map = cls(auth=auth, subscriptions=subscriptions)
+
+        # one content-details call per (publication, subscriber domain) pair
+        unique_subscriptions = {
+            (sub.publication_id, _normalize_domain(sub.subscriber_domain)): sub
+            for sub in subscriptions
+        }
+
+        async def _get_subscriber_content(subscription: DomoSubscription):
+            publisher_auth = parent_auth
+            if not publisher_auth and parent_auth_retrieval_fn:
+                publisher_auth = parent_auth_retrieval_fn(subscription)
+
+            if not publisher_auth:
+                raise DomoSubscription_NoParentAuth(subscription)
+
+            res = await publish_routes.get_subscriber_content_details(
+                auth=publisher_auth,
+                publication_id=subscription.publication_id,
+                subscriber_instance=_normalize_domain(subscription.subscriber_domain),
+                debug_api=debug_api,
+                session=session,
+                parent_class=cls.__name__,
+            )
+            return subscription, res.response, publisher_auth
+
+        results = await dmce.gather_with_concurrency(
+            *[_get_subscriber_content(sub) for sub in unique_subscriptions.values()],
+            n=max_concurrency,
+        )
+
+        for subscription, subscriber_content_ls, publisher_auth in results:
+            content_map.add_subscriber_content(
+                subscription=subscription,
+                subscriber_content_ls=subscriber_content_ls,
+                publisher_auth=publisher_auth,
+            )
+
+        return content_map
+
+    def lookup(
+        self,
+        subscriber_object_id: str,
+        content_type: str,
+        subscriber_domain: str | None = None,
+    ) -> DomoEverywhere_ContentLink | None:
+        """Return the publisher link for a subscriber object (None if not published)."""
+        return self.links.get(
+            (
+                _normalize_domain(subscriber_domain or self.auth.domo_instance),
+                str(subscriber_object_id),
+                content_type,
+            )
+        )
+
+    def lookup_entity(self, subscriber: Any) -> DomoEverywhere_ContentLink | None:
+        """Return the publisher link for a federated card / dataset / page."""
+        return self.lookup(
+            subscriber_object_id=subscriber.id,
+            content_type=subscriber.entity_type,
+            subscriber_domain=subscriber.auth.domo_instance,
+        )
+
+    async def get_publisher_entity(
+        self, subscriber: Any, is_suppress_errors: bool = False
+    ) -> Any:
+        """Resolve a subscriber entity's publisher entity with one lookup and one fetch."""
+        link = self.lookup_entity(subscriber)
+
+        if not link:
+            if is_suppress_errors:
+                return None
+            raise DomoEverywhere_ContentMap_NoMatch(
+                cls_instance=self, subscriber=subscriber
+            )
+
+        return await get_publisher_entity(
+            subscriber=subscriber,
+            publisher_object_id=link.publisher_object_id,
+            publisher_auth=link.publisher_auth,
+        )
@@ -28,9 +28,50 @@ __all__ = [
     "DomoSubscription_NoParent",
     "DomoSubscription",
     "DomoEverywhere",
+    "get_publisher_entity",
 ]
 
 
+def _index_subscriber_content(subscriber_content_ls: list[dict]) -> dict:
+    """Index subscriber content details by (publisherObjectId, contentType)."""
+    index = {}
+    for subscriber_obj in subscriber_content_ls or []:
+        key = (str(subscriber_obj["publisherObjectId"]), subscriber_obj["contentType"])
+        index.setdefault(key, subscriber_obj)  # first match wins, as before
+    return index
+
+
+async def get_publisher_entity(
+    subscriber: Any,  # DomoPage, DomoCard, DomoDataset
+    publisher_object_id: str,
+    publisher_auth: DomoAuth,
+) -> Any:  # DomoCard, DomoDataset, DomoPage
+    """Fetch the publisher-side entity that a subscriber entity was published from."""
+
+    # If the provided 'subscriber' is a FederatedDomoDataset we should fetch the
+    # publisher-side dataset as the default dataset class (not the federated wrapper).
+    # Lazy import to avoid circular imports
+    if subscriber.__class__.__name__ == "FederatedDomoDataset":
+        try:
+            from ..DomoDataset.core import DomoDataset as PublisherDataset
+
+            return await PublisherDataset.get_by_id(
+                dataset_id=publisher_object_id,
+                auth=publisher_auth,
+                is_use_default_dataset_class=True,
+            )
+        except Exception:
+            # Fall back to calling the subscriber's resolver if publisher fetch fails
+            return await subscriber.get_entity_by_id(
+                entity_id=publisher_object_id, auth=publisher_auth
+            )
+
+    # Default behavior: delegate to subscriber's get_entity_by_id
+    return await subscriber.get_entity_by_id(
+        entity_id=publisher_object_id, auth=publisher_auth
+    )
+
+
 class DomoSubscription_NoParentAuth(dmde.ClassError):
     def __init__(self, cls_instance):
         super().__init__(
@@ -156,6 +197,9 @@ class DomoPublication(DomoEntity_w_Lineage):
 
     content: list[DomoPublication_Content] = None
 
+    # False when built from the search summary; details load on hydrate()
+    is_hydrated: bool = field(default=True, repr=False)
+
     # content_page_id_ls: list[str] = default = None
     # content_dataset_id_ls: list[str] = field(default_factory=list)
     # content_data_app_id_ls: list[str] = field(default_factory=list)
@@ -218,6 +262,64 @@ class DomoPublication(DomoEntity_w_Lineage):
 
         return domo_pub
 
+    @classmethod
+    def from_summary(cls, obj, auth: DomoAuth):
+        """build an unhydrated publication from a `search_publications` summary"""
+        return cls(
+            id=obj["id"],
+            name=obj.get("name"),
+            description=obj.get("description"),
+            created_dt=(
+                dt.datetime.fromtimestamp(obj["created"] / 1000)
+                if obj.get("created")
+                else None
+            ),
+            is_v2=obj.get("isV2"),
+            auth=auth,
+            raw=obj,
+            is_hydrated=False,
+        )
+
+    async def hydrate(
+        self,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+        timeout=10,
+    ):
+        """load publication details (content and subscriptions) in place"""
+        if self.is_hydrated:
+            return self
+
+        res = await publish_routes.get_publication_by_id(
+            auth=self.auth,
+            publication_id=self.id,
+            timeout=timeout,
+            debug_api=debug_api,
+            session=session,
+            parent_class=self.__class__.__name__,
+        )
+
+        domo_pub = self.from_dict(obj=res.response, auth=self.auth)
+
+        self.name = domo_pub.name
+        self.description = domo_pub.description
+        self.is_v2 = domo_pub.is_v2
+        self.created_dt = domo_pub.created_dt
+        self.updated_dt = domo_pub.updated_dt
+        self.raw = domo_pub.raw
+
+        # adopt the children built by from_dict rather than parsing them again
+        self.subscriptions = domo_pub.subscriptions
+        for subscription in self.subscriptions or []:
+            subscription.parent_publication = self
+
+        self.content = domo_pub.content
+        for publication_content in self.content or []:
+            publication_content.parent = self
+
+        self.is_hydrated = True
+        return self
+
     @classmethod
     async def get_by_id(
         cls,
@@ -273,15 +375,11 @@ class DomoPublication(DomoEntity_w_Lineage):
 
         publication_content = self.content
 
+        subscriber_obj_index = _index_subscriber_content(res.response)
+
         for content in publication_content:
-            subscriber_obj = next(
-                (
-                    subscriber_obj
-                    for subscriber_obj in res.response
-                    if subscriber_obj["publisherObjectId"] == content.entity_id
-                    and subscriber_obj["contentType"] == content.entity_type
-                ),
-                None,
+            subscriber_obj = subscriber_obj_index.get(
+                (str(content.entity_id), content.entity_type)
             )
             if subscriber_obj is not None:
                 content.subscriber_content_id = subscriber_obj["subscriberObjectId"]
@@ -359,29 +457,10 @@ class DomoPublication(DomoEntity_w_Lineage):
                 #     )
             return None
 
-        # Resolve publisher entity. If the provided 'subscriber' is a FederatedDomoDataset
-        # we should fetch the publisher-side dataset as the default dataset class (not the federated wrapper).
-        publisher_obj_id = obj["publisherObjectId"]
-
-        # Lazy import to avoid circular imports
-        if subscriber.__class__.__name__ == "FederatedDomoDataset":
-            try:
-                from ..DomoDataset.core import DomoDataset as PublisherDataset
-
-                return await PublisherDataset.get_by_id(
-                    dataset_id=publisher_obj_id,
-                    auth=self.auth,
-                    is_use_default_dataset_class=True,
-                )
-            except Exception:
-                # Fall back to calling the subscriber's resolver if publisher fetch fails
-                return await subscriber.get_entity_by_id(
-                    entity_id=publisher_obj_id, auth=self.auth
-                )
-
-        # Default behavior: delegate to subscriber's get_entity_by_id
-        return await subscriber.get_entity_by_id(
-            entity_id=publisher_obj_id, auth=self.auth
+        return await get_publisher_entity(
+            subscriber=subscriber,
+            publisher_object_id=obj["publisherObjectId"],
+            publisher_auth=self.auth,
         )
 
     @classmethod
@@ -599,15 +678,11 @@ class DomoSubscription(dmen.DomoEntity):
             parent_class=self.__class__.__name__,
         )
 
+        subscriber_obj_index = _index_subscriber_content(res.response)
+
         for content in publication_content:
-            subscriber_obj = next(
-                (
-                    subscriber_obj
-                    for subscriber_obj in res.response
-                    if subscriber_obj["publisherObjectId"] == content.entity_id
-                    and subscriber_obj["contentType"] == content.entity_type
-                ),
-                None,
+            subscriber_obj = subscriber_obj_index.get(
+                (str(content.entity_id), content.entity_type)
             )
             if subscriber_obj is not None:
                 content.subscriber_content_id = subscriber_obj["subscriberObjectId"]
@@ -628,6 +703,8 @@ class DomoEverywhere:
 
     invitations: list[dict] = field(default=None)
 
+    content_map: Any = field(default=None, repr=False)
+
     async def get_publications(
         self,
         search_term: str = None,
@@ -635,7 +712,15 @@ class DomoEverywhere:
         session: httpx.AsyncClient = None,
         return_raw: bool = False,
         debug_num_stacks_to_drop=2,
+        is_hydrate: bool = True,
+        max_concurrency: int = 60,
     ):
+        """list publications from the search payload
+
+        with `is_hydrate = False` publications are built from the summaries alone
+        (one paged request); call `hydrate_publications` or `DomoPublication.hydrate`
+        later for content and subscription details
+        """
         res = await publish_routes.search_publications(
             auth=self.auth,
             debug_api=debug_api,
@@ -648,14 +733,46 @@ class DomoEverywhere:
         if return_raw:
             return res
 
-        self.publications = await dmce.gather_with_concurrency(
-            n=60,
+        # search pages can overlap; keep the first summary for each id
+        publication_index = {}
+        for obj in res.response:
+            if obj.get("id") in publication_index:
+                continue
+            publication_index[obj.get("id")] = DomoPublication.from_summary(
+                obj=obj, auth=self.auth
+            )
+
+        self.publications = list(publication_index.values())
+
+        if is_hydrate:
+            await self.hydrate_publications(
+                debug_api=debug_api,
+                session=session,
+                max_concurrency=max_concurrency,
+            )
+
+        return self.publications
+
+    async def hydrate_publications(
+        self,
+        publications: list[DomoPublication] = None,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+        max_concurrency: int = 60,
+    ):
+        """fetch details for unhydrated publications (defaults to self.publications)"""
+        publications = publications if publications is not None else self.publications
+
+        await dmce.gather_with_concurrency(
+            n=max_concurrency,
             *[
-                DomoPublication.get_by_id(publication_id=obj.get("id"), auth=self.auth)
-                for obj in res.response
+                publication.hydrate(debug_api=debug_api, session=session)
+                for publication in publications or []
+                if not publication.is_hydrated
             ],
         )
-        return self.publications
+
+        return publications
 
     async def search_publications(
         self,
@@ -683,8 +800,6 @@ class DomoEverywhere:
     ):
         """get instances subscription summaries"""
 
-        self.subscriptions = []
-
         res = await publish_routes.get_subscription_summaries(
             auth=self.auth, session=session, debug_api=debug_api
         )
@@ -692,12 +807,15 @@ class DomoEverywhere:
         if return_raw:
             return res
 
+        subscription_index = {}
         for sub in res.response:
             domo_sub = DomoSubscription.from_dict(sub, auth=self.auth)
+            subscription_index.setdefault(
+                domo_sub.id or (domo_sub.publication_id, domo_sub.subscriber_domain),
+                domo_sub,
+            )
 
-            if sub in self.subscriptions:
-                continue
-            self.subscriptions.append(domo_sub)
+        self.subscriptions = list(subscription_index.values())
 
         return self.subscriptions
 
@@ -715,6 +833,27 @@ class DomoEverywhere:
 
         return res
 
+    async def get_content_map(
+        self,
+        parent_auth: DomoAuth = None,
+        parent_auth_retrieval_fn: Callable = None,
+        debug_api: bool = False,
+        session: httpx.AsyncClient = None,
+    ):
+        """build a subscriber -> publisher content map for federated entity lookups"""
+        from .content_map import DomoEverywhere_ContentMap
+
+        self.content_map = await DomoEverywhere_ContentMap.build(
+            auth=self.auth,
+            parent_auth=parent_auth,
+            parent_auth_retrieval_fn=parent_auth_retrieval_fn,
+            subscriptions=self.subscriptions,
+            debug_api=debug_api,
+            session=session,
+        )
+
+        return self.content_map
+
     async def accept_invite_by_id(
         self,
         subscription_id: str,
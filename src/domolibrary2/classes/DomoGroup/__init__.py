@@ -1,3 +1,16 @@
 from .core import DomoGroup, DomoGroups
+from .membership_sync import (
+    GroupMembership_Change,
+    GroupMembership_SyncPlan,
+    plan_group_membership_change,
+    sync_group_memberships,
+)
 
-__all__ = ["DomoGroup", "DomoGroups"]
+__all__ = [
+    "DomoGroup",
+    "DomoGroups",
+    "GroupMembership_Change",
+    "GroupMembership_SyncPlan",
+    "plan_group_membership_change",
+    "sync_group_memberships",
+]
@@ -1,12 +1,15 @@
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from ...auth import DomoAuth
 from ...base import exceptions as dmde
 from ...base.entities import DomoEntity, DomoManager
 from ...base.exceptions import RouteError
+from ...base.records import DomoRecord_Batch
 from ...routes import group as group_routes
 from ...routes.group import Group_CRUD_Error, GroupType_Enum
 from .membership import DomoMembership_Group
+from .membership_sync import GroupMembership_SyncPlan, sync_group_memberships
 
 __all__ = ["Group_Class_Error", "DomoGroup", "DomoGroups"]
 
@@ -43,6 +46,15 @@ class DomoGroup(DomoEntity):
 
     Membership: DomoMembership_Group = field(repr=False, default=None)
 
+    # fields kept by DomoGroups.get(return_records=True)
+    record_fields: ClassVar[dict] = {
+        "id": ("id", "groupId"),
+        "name": "name",
+        "description": "description",
+        "type": ("type", "groupType"),
+        "member_count": ("userCount", "memberCount"),
+    }
+
     @property
     def entity_type(self) -> str:
         return "group"
@@ -116,11 +128,11 @@ class DomoGroup(DomoEntity):
         return dg
 
     @classmethod
-    async def get_entity_by_id(cls, entity_id, **kwargs):
+    async def get_entity_by_id(cls, entity_id, auth: DomoAuth, **kwargs):
         """
         Internal method to get an entity by ID.
         """
-        return await cls.get_by_id(auth=cls.auth, group_id=entity_id, **kwargs)
+        return await cls.get_by_id(auth=auth, group_id=entity_id, **kwargs)
 
     @classmethod
     async def create_from_name(
@@ -276,8 +288,11 @@ class DomoGroups(DomoManager):
         self,
         is_hide_system_groups: bool = True,
         return_raw: bool = False,
+        return_records: bool = False,
         **context_kwargs,
     ):
+        """retrieves all groups; return_records returns a DomoRecord_Batch of
+        `DomoGroup.record_fields` instead of DomoGroup objects"""
         await self.toggle_show_system_groups(
             is_hide_system_groups=is_hide_system_groups,
             **context_kwargs,
@@ -293,6 +308,11 @@ class DomoGroups(DomoManager):
         if return_raw:
             return res
 
+        if return_records:
+            return DomoRecord_Batch.from_dicts(
+                DomoGroup, auth=self.auth, obj_ls=res.response
+            )
+
         if len(res.response):
             self.groups = self._groups_to_domo_group(
                 json_list=res.response, auth=self.auth
@@ -303,6 +323,29 @@ class DomoGroups(DomoManager):
 
         return self.groups
 
+    async def sync_memberships(
+        self,
+        desired_members: dict[str, list[str]],
+        is_remove: bool = True,
+        is_dry_run: bool = False,
+        max_concurrency: int = 10,
+        max_members_per_request: int = 500,
+        **context_kwargs,
+    ) -> GroupMembership_SyncPlan:
+        """Reconcile the user members of many groups with `{group_id: user ids}`.
+
+        see `membership_sync.sync_group_memberships`
+        """
+        return await sync_group_memberships(
+            auth=self.auth,
+            desired_members=desired_members,
+            is_remove=is_remove,
+            is_dry_run=is_dry_run,
+            max_concurrency=max_concurrency,
+            max_members_per_request=max_members_per_request,
+            context=self._build_route_context(**context_kwargs),
+        )
+
     async def search_by_name(
         self,
         group_name: list[str],
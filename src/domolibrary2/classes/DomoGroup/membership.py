@@ -6,6 +6,7 @@ from typing import Any
 from ...base.relationships import ShareAccount
 from ...routes import group as group_routes
 from ...utils import chunk_execution as dmce
+from ..subentity.AccessControl import get_member_entity_type
 from ..subentity.membership import DomoMembership, MembershipRelationship
 
 
@@ -24,13 +25,20 @@ class DomoMembership_Group(DomoMembership):
     _remove_member_ls: list[MembershipRelationship] = field(default_factory=list)
     _add_owner_ls: list[MembershipRelationship] = field(default_factory=list)
     _remove_owner_ls: list[MembershipRelationship] = field(default_factory=list)
+    _pending_keys: dict[str, set] = field(default_factory=dict, repr=False)
 
     async def get_owners(
         self,
         return_raw: bool = False,
+        is_hydrate: bool = False,
+        max_concurrency: int = 10,
         **context_kwargs,
     ) -> list[MembershipRelationship]:
-        """Get all owner relationships for this group."""
+        """Get all owner relationships for this group.
+
+        Owners are built from the listing payload; with `is_hydrate = True` each
+        owner is also retrieved by id (see `hydrate`).
+        """
         res = await group_routes.get_group_owners(
             group_id=self.parent_id,
             auth=self.auth,
@@ -39,10 +47,17 @@ class DomoMembership_Group(DomoMembership):
         if return_raw:
             return res
 
-        owner_relationships = await self._extract_domo_entities_from_list(
-            res.response, relation_type="OWNER", **context_kwargs
+        owner_relationships = self._extract_domo_entities_from_list(
+            res.response, relation_type="OWNER"
         )
 
+        if is_hydrate:
+            await self.hydrate(
+                relationships=owner_relationships,
+                max_concurrency=max_concurrency,
+                **context_kwargs,
+            )
+
         # Update relationships list - replace existing owners
         self.relationships = [
             rel
@@ -55,9 +70,16 @@ class DomoMembership_Group(DomoMembership):
     async def get_members(
         self,
         return_raw: bool = False,
+        is_hydrate: bool = False,
+        max_concurrency: int = 10,
         **context_kwargs,
     ) -> list[MembershipRelationship]:
-        """Get all member relationships for this group."""
+        """Get all member relationships for this group.
+
+        Members are built from the paged `groupUserList` payload, so a group loads
+        in one request per page.  With `is_hydrate = True` each member is also
+        retrieved by id (full user details and role, see `hydrate`).
+        """
         res = await group_routes.get_group_membership(
             group_id=self.parent_id,
             auth=self.auth,
@@ -67,10 +89,17 @@ class DomoMembership_Group(DomoMembership):
         if return_raw:
             return res
 
-        member_relationships = await self._extract_domo_entities_from_list(
-            res.response, relation_type="MEMBER", **context_kwargs
+        member_relationships = self._extract_domo_entities_from_list(
+            res.response, relation_type="MEMBER"
         )
 
+        if is_hydrate:
+            await self.hydrate(
+                relationships=member_relationships,
+                max_concurrency=max_concurrency,
+                **context_kwargs,
+            )
+
         # Update relationships list - replace existing members
         self.relationships = [
             rel
@@ -85,12 +114,53 @@ class DomoMembership_Group(DomoMembership):
 
         return self.members
 
-    async def get(self) -> list[MembershipRelationship]:
+    async def get(self, is_hydrate: bool = False) -> list[MembershipRelationship]:
         """Get all membership relationships for this group."""
-        await self.get_owners()
-        await self.get_members()
+        await self.get_owners(is_hydrate=is_hydrate)
+        await self.get_members(is_hydrate=is_hydrate)
         return self.relationships
 
+    async def hydrate(
+        self,
+        relationships: list[MembershipRelationship] = None,
+        max_concurrency: int = 10,
+        **context_kwargs,
+    ) -> list[MembershipRelationship]:
+        """Replace listing-built entities with entities retrieved by id.
+
+        Users are retrieved with `DomoUser.get_by_id` (which also loads the role) and
+        groups with `DomoGroup.get_by_id`, at most `max_concurrency` at a time.
+        Entities that can't be retrieved keep their listing values.
+        """
+        from .. import DomoUser as dmu
+        from ..DomoGroup import core as dmg
+
+        relationships = self.relationships if relationships is None else relationships
+
+        async def _hydrate(rel: MembershipRelationship):
+            if isinstance(rel.entity, dmg.DomoGroup):
+                entity = await dmg.DomoGroup.get_by_id(
+                    group_id=rel.entity.id, auth=self.auth, **context_kwargs
+                )
+            else:
+                entity = await dmu.DomoUser.get_by_id(
+                    user_id=rel.entity.id, auth=self.auth, **context_kwargs
+                )
+
+            if entity:
+                rel.entity = entity
+
+            return rel
+
+        await dmce.gather_with_concurrency(
+            *[_hydrate(rel) for rel in relationships], n=max_concurrency
+        )
+
+        if self.parent and relationships:
+            self.parent.members_ls = [member.entity for member in self.members]
+
+        return relationships
+
     async def add_relationship(
         self,
         entity: Any,  # DomoUser, DomoGroup
@@ -134,23 +204,30 @@ class DomoMembership_Group(DomoMembership):
 
     # Helper methods for managing pending operations
 
-    def _add_to_list(self, member, list_to_update, relation_type):
-        """Add member to pending operations list."""
-        if not isinstance(member, MembershipRelationship):
-            member_entity = MembershipRelationship(
-                parent_entity=self.parent,
-                entity=member,
-                relationship_type=ShareAccount(relation_type),
-            )
-        else:
-            member_entity = member
+    def _to_relationship(self, member, relation_type) -> MembershipRelationship:
+        if isinstance(member, MembershipRelationship):
+            return member
 
-        if member_entity not in list_to_update:
-            list_to_update.append(member_entity)
+        return MembershipRelationship(
+            parent_entity=self.parent,
+            entity=member,
+            relationship_type=ShareAccount(relation_type),
+        )
+
+    def _add_to_list(self, member, list_name, relation_type):
+        """Add member to a pending operations list, once per membership key."""
+        member_entity = self._to_relationship(member, relation_type)
+
+        pending_keys = self._pending_keys.setdefault(list_name, set())
+        if member_entity.membership_key in pending_keys:
+            return
+
+        pending_keys.add(member_entity.membership_key)
+        getattr(self, list_name).append(member_entity)
 
     def _add_member(self, member):
         """Add member to pending add list."""
-        return self._add_to_list(member, self._add_member_ls, relation_type="MEMBER")
+        return self._add_to_list(member, "_add_member_ls", relation_type="MEMBER")
 
     def _remove_member(self, member, is_keep_system_group=True):
         """Remove member - does not remove system groups by default."""
@@ -163,11 +240,11 @@ class DomoMembership_Group(DomoMembership):
         ):
             return
 
-        return self._add_to_list(member, self._remove_member_ls, relation_type="MEMBER")
+        return self._add_to_list(member, "_remove_member_ls", relation_type="MEMBER")
 
     def _add_owner(self, member):
         """Add owner to pending add list."""
-        return self._add_to_list(member, self._add_owner_ls, relation_type="OWNER")
+        return self._add_to_list(member, "_add_owner_ls", relation_type="OWNER")
 
     def _remove_owner(self, member, is_keep_system_group=True):
         """Remove owner - does not remove system groups by default."""
@@ -180,7 +257,7 @@ class DomoMembership_Group(DomoMembership):
         ):
             return
 
-        return self._add_to_list(member, self._remove_owner_ls, relation_type="OWNER")
+        return self._add_to_list(member, "_remove_owner_ls", relation_type="OWNER")
 
     def _reset_obj(self):
         """Clear all pending operations lists."""
@@ -188,62 +265,54 @@ class DomoMembership_Group(DomoMembership):
         self._remove_member_ls = []
         self._add_owner_ls = []
         self._remove_owner_ls = []
+        self._pending_keys = {}
+
+    @staticmethod
+    def _listing_entity_type(obj: dict) -> str | None:
+        """`USER` or `GROUP` for an owners / groupUserList entry."""
+        return get_member_entity_type(obj)
 
-    async def _extract_domo_groups_from_list(self, entity_ls, **context_kwargs):
-        """Extract DomoGroup objects from API response list."""
+    def _extract_domo_groups_from_list(self, entity_ls):
+        """Build DomoGroup objects from the listing payload without further requests."""
         from ..DomoGroup import core as dmg
 
-        return await dmce.gather_with_concurrency(
-            *[
-                dmg.DomoGroup.get_by_id(
-                    group_id=obj.get("groupId") or obj.get("id"),
-                    auth=self.auth,
-                    **context_kwargs,
-                )
-                for obj in entity_ls
-                if obj.get("type") == "GROUP" or obj.get("groupId")
-            ],
-            n=60,
-        )
+        return [
+            dmg.DomoGroup(
+                auth=self.auth,
+                id=obj.get("groupId") or obj.get("id"),
+                name=obj.get("name") or obj.get("displayName"),
+                type=obj.get("groupType"),
+                raw=obj,
+            )
+            for obj in entity_ls
+            if self._listing_entity_type(obj) == "GROUP"
+        ]
 
-    async def _extract_domo_users_from_list(self, entity_ls, **context_kwargs):
-        """Extract DomoUser objects from API response list."""
+    def _extract_domo_users_from_list(self, entity_ls):
+        """Build DomoUser objects from the listing payload without further requests."""
         from .. import DomoUser as dmu
 
-        return await dmce.gather_with_concurrency(
-            *[
-                dmu.DomoUser.get_by_id(
-                    user_id=obj.get("userId") or obj.get("id"),
-                    auth=self.auth,
-                    **context_kwargs,
-                )
-                for obj in entity_ls
-                if obj.get("type") == "USER" or obj.get("userId")
-            ],
-            n=10,
-        )
+        return [
+            dmu.DomoUser.from_dict(auth=self.auth, obj=obj)
+            for obj in entity_ls
+            if self._listing_entity_type(obj) == "USER"
+        ]
 
-    async def _extract_domo_entities_from_list(
-        self, entity_ls, relation_type, **context_kwargs
+    def _extract_domo_entities_from_list(
+        self, entity_ls, relation_type
     ) -> list[MembershipRelationship]:
         """Extract all entities from API response and create MembershipRelationship objects."""
-        domo_groups = await self._extract_domo_groups_from_list(
-            entity_ls, **context_kwargs
-        )
-        domo_users = await self._extract_domo_users_from_list(
-            entity_ls, **context_kwargs
-        )
+        domo_groups = self._extract_domo_groups_from_list(entity_ls)
+        domo_users = self._extract_domo_users_from_list(entity_ls)
 
-        membership_entities = []
-        for entity in domo_groups + domo_users:
-            membership_entity = MembershipRelationship(
+        return [
+            MembershipRelationship(
                 parent_entity=self.parent,
                 entity=entity,
                 relationship_type=ShareAccount(relation_type),
             )
-            membership_entities.append(membership_entity)
-
-        return membership_entities
+            for entity in domo_groups + domo_users
+        ]
 
     @staticmethod
     def _list_to_dict(entity_ls):
@@ -321,16 +390,8 @@ class DomoMembership_Group(DomoMembership):
             nested_kwargs["debug_num_stacks_to_drop"] = 3
 
         # Convert users to Membership_Entity instances
-        user_entities = []
-        for user in user_ls:
-            member_entity = MembershipRelationship(
-                relationship_type=ShareAccount("MEMBER"),
-                parent_entity=self.parent,
-                entity=user,
-            )
-            user_entities.append(member_entity)
-
-        user_ls = user_entities
+        user_ls = [self._to_relationship(user, "MEMBER") for user in user_ls]
+        user_keys = {rel.membership_key for rel in user_ls}
 
         memberships = await self.get_members(**nested_kwargs)
 
@@ -338,7 +399,7 @@ class DomoMembership_Group(DomoMembership):
             self._add_member(domo_user)
 
         for me in memberships:
-            if me not in user_ls:
+            if me.membership_key not in user_keys:
                 self._remove_member(me)
 
         res = await self.update(**nested_kwargs)
@@ -418,14 +479,9 @@ class DomoMembership_Group(DomoMembership):
             nested_kwargs["debug_num_stacks_to_drop"] = 3
 
         # Convert owners to Membership_Entity instances
-        [
-            MembershipRelationship(
-                relationship_type=ShareAccount("OWNER"),
-                parent_entity=self.parent,
-                entity=owner,
-            )
-            for owner in owner_ls
-        ]
+        owner_keys = {
+            self._to_relationship(owner, "OWNER").membership_key for owner in owner_ls
+        }
 
         membership: list[MembershipRelationship] = await self.get_owners()
 
@@ -447,7 +503,7 @@ class DomoMembership_Group(DomoMembership):
                 self._add_owner(oe)
                 continue
 
-            if oe.entity not in owner_ls:
+            if oe.membership_key not in owner_keys:
                 self._remove_owner(oe)
 
         res = await self.update(**nested_kwargs)
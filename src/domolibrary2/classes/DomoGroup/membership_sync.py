@@ -0,0 +1,237 @@
+"""Bulk group membership reconciliation.
+
+Reconciles the user members of many groups against a desired state of
+``{group_id: member user ids}``, batching adds and removes into the fewest
+``update_group_membership`` calls.  Nested groups are left untouched.
+
+Example:
+    >>> plan = await DomoGroups(auth=auth).sync_memberships(
+    ...     {"1324": ["27", "28"], "1325": []}, is_dry_run=True
+    ... )
+    >>> plan.to_dataframe()
+    >>> plan = await DomoGroups(auth=auth).sync_memberships({"1324": ["27", "28"]})
+"""
+
+__all__ = [
+    "GroupMembership_Change",
+    "GroupMembership_SyncPlan",
+    "plan_group_membership_change",
+    "sync_group_memberships",
+]
+
+import asyncio
+import dataclasses
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import pandas as pd
+
+from ...auth import DomoAuth
+from ...client import get_data as gd
+from ...client.context import RouteContext
+from ...routes import group as group_routes
+from ...utils import chunk_execution as dmce
+from .membership import DomoMembership_Group
+
+
+@dataclass
+class GroupMembership_Change:  # noqa: N801
+    """User ids to add to / remove from one group."""
+
+    group_id: str
+    add_user_ids: list[str] = field(default_factory=list)
+    remove_user_ids: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.add_user_ids and not self.remove_user_ids
+
+    def to_requests(self, max_members_per_request: int) -> list[dict]:
+        """``update_group_membership`` arguments, at most ``max_members_per_request`` users each."""
+        operations = [("add", user_id) for user_id in self.add_user_ids] + [
+            ("remove", user_id) for user_id in self.remove_user_ids
+        ]
+
+        return [
+            {
+                "add_member_arr": [
+                    {"type": "USER", "id": user_id}
+                    for action, user_id in chunk
+                    if action == "add"
+                ],
+                "remove_member_arr": [
+                    {"type": "USER", "id": user_id}
+                    for action, user_id in chunk
+                    if action == "remove"
+                ],
+            }
+            for chunk in dmce.chunk_list(operations, max_members_per_request)
+        ]
+
+
+@dataclass
+class GroupMembership_SyncPlan:  # noqa: N801
+    """Membership changes for many groups, plus apply results.
+
+    ``errors`` holds groups whose current membership could not be listed;
+    ``results`` maps group id to the list of update responses, or the
+    exception that stopped the group's updates.
+    """
+
+    changes: dict[str, GroupMembership_Change] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    results: dict[str, Any] = field(default_factory=dict, repr=False)
+    is_dry_run: bool = True
+    n_requests: int = 0
+
+    @property
+    def n_add(self) -> int:
+        return sum(len(change.add_user_ids) for change in self.changes.values())
+
+    @property
+    def n_remove(self) -> int:
+        return sum(len(change.remove_user_ids) for change in self.changes.values())
+
+    @property
+    def failed(self) -> dict[str, Exception]:
+        return {
+            **self.errors,
+            **{
+                group_id: result
+                for group_id, result in self.results.items()
+                if isinstance(result, Exception)
+            },
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per (group, user) change with its ``action``."""
+        return pd.DataFrame(
+            [
+                {"group_id": group_id, "user_id": user_id, "action": action}
+                for group_id, change in self.changes.items()
+                for action, user_ids in (
+                    ("add", change.add_user_ids),
+                    ("remove", change.remove_user_ids),
+                )
+                for user_id in user_ids
+            ],
+            columns=["group_id", "user_id", "action"],
+        )
+
+
+def _listing_user_ids(entity_ls: list[dict]) -> set[str]:
+    """User ids in a ``groupUserList`` payload.
+
+    Nested groups, and entries that cannot be classified, are skipped so they are
+    never sent back as users to remove.
+    """
+    return {
+        str(obj.get("userId") or obj.get("id"))
+        for obj in entity_ls
+        if DomoMembership_Group._listing_entity_type(obj) == "USER"
+        and (obj.get("userId") or obj.get("id"))
+    }
+
+
+def plan_group_membership_change(
+    group_id: str,
+    current_user_ids: Iterable[str],
+    desired_user_ids: Iterable[str],
+    is_remove: bool = True,
+) -> GroupMembership_Change:
+    """Set difference of current and desired user ids for one group."""
+    current = {str(user_id) for user_id in current_user_ids}
+    desired = {str(user_id) for user_id in desired_user_ids}
+
+    return GroupMembership_Change(
+        group_id=str(group_id),
+        add_user_ids=sorted(desired - current),
+        remove_user_ids=sorted(current - desired) if is_remove else [],
+    )
+
+
+async def sync_group_memberships(
+    auth: DomoAuth,
+    desired_members: dict[str, Iterable[str]],
+    is_remove: bool = True,
+    is_dry_run: bool = False,
+    max_concurrency: int = 10,
+    max_members_per_request: int = 500,
+    context: Optional[RouteContext] = None,
+) -> GroupMembership_SyncPlan:
+    """Reconcile the user members of many groups with ``desired_members``.
+
+    Args:
+        auth: Instance auth
+        desired_members: ``{group_id: user ids}`` - the complete member list per group
+        is_remove: Remove users that are not in the desired list
+        is_dry_run: Only list and plan; no updates are sent
+        max_concurrency: Requests in flight at once, across listing and updates
+        max_members_per_request: Users (adds + removes) per update request
+
+    Returns:
+        GroupMembership_SyncPlan; failures are recorded per group, not raised
+    """
+    context = context or RouteContext()
+    session, is_close_session = gd.create_httpx_session(session=context.session)
+    context = dataclasses.replace(context, session=session)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    plan = GroupMembership_SyncPlan(is_dry_run=is_dry_run)
+
+    async def _sync_group(group_id, desired_user_ids):
+        group_id = str(group_id)
+
+        try:
+            async with semaphore:
+                res = await group_routes.get_group_membership(
+                    auth=auth, group_id=group_id, context=context
+                )
+        except Exception as e:
+            plan.errors[group_id] = e
+            return
+
+        change = plan_group_membership_change(
+            group_id,
+            current_user_ids=_listing_user_ids(res.response),
+            desired_user_ids=desired_user_ids,
+            is_remove=is_remove,
+        )
+        if change.is_empty:
+            return
+
+        plan.changes[group_id] = change
+        if is_dry_run:
+            return
+
+        res_ls = []
+        try:
+            for request in change.to_requests(max_members_per_request):
+                async with semaphore:
+                    res_ls.append(
+                        await group_routes.update_group_membership(
+                            auth=auth, group_id=group_id, context=context, **request
+                        )
+                    )
+        except Exception as e:
+            plan.results[group_id] = e
+            return
+
+        plan.results[group_id] = res_ls
+
+    try:
+        await asyncio.gather(
+            *[
+                _sync_group(group_id, desired_user_ids)
+                for group_id, desired_user_ids in desired_members.items()
+            ]
+        )
+    finally:
+        if is_close_session:
+            await session.aclose()
+
+    plan.n_requests = sum(
+        len(res_ls) for res_ls in plan.results.values() if isinstance(res_ls, list)
+    )
+    return plan
@@ -34,7 +34,7 @@ class DomoGrant(DomoBase):
     def from_dict(cls, obj):
         dd = obj
         if not isinstance(dd, util_dd.DictDot):
-            dd = util_dd.DictDot(obj)
+            dd = util_dd.LazyDictDot(obj)
 
         return cls(
             id=dd.authority,
@@ -40,7 +40,7 @@ class DomoJupyter_Content:
 
     @classmethod
     def from_dict(cls, obj: dict, auth: dmda.DomoJupyterAuth):
-        dd = util_dd.DictDot(obj) if not isinstance(obj, util_dd.DictDot) else obj
+        dd = util_dd.LazyDictDot(obj) if not isinstance(obj, util_dd.DictDot) else obj
 
         dc = cls(
             name=dd.name,
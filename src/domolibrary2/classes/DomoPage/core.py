@@ -142,7 +142,7 @@ class DomoPage(DomoEntity_w_Lineage):
 
         dd = page_obj
         if isinstance(page_obj, dict):
-            dd = util_dd.DictDot(page_obj)
+            dd = util_dd.LazyDictDot(page_obj)
 
         pg = cls(
             id=int(dd.id),
@@ -230,7 +230,7 @@ class DomoPage(DomoEntity_w_Lineage):
         dd = page_obj
 
         if isinstance(page_obj, dict):
-            dd = util_dd.DictDot(page_obj)
+            dd = util_dd.LazyDictDot(page_obj)
 
         page_id = int(dd.id or dd.pageId)
 
@@ -277,7 +277,7 @@ class DomoPage(DomoEntity_w_Lineage):
     ):
         dd = page_obj
         if isinstance(page_obj, dict):
-            dd = util_dd.DictDot(page_obj)
+            dd = util_dd.LazyDictDot(page_obj)
 
         pg = cls(
             id=int(dd.id),
@@ -20,7 +20,7 @@ __all__ = [
 import asyncio
 import datetime as dt
 from dataclasses import dataclass, field
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, Optional, Union
 
 import httpx
 from dc_logger.decorators import log_call
@@ -28,6 +28,7 @@ from dc_logger.decorators import log_call
 from ..auth import DomoAuth
 from ..base.entities import DomoEntity, DomoManager
 from ..base.exceptions import ClassError, DomoError
+from ..base.records import DomoRecord_Batch
 from ..client.response import ResponseGetData
 from ..routes import user as user_routes
 from ..routes.instance_config import sso as sso_routes
@@ -122,6 +123,17 @@ class DomoUser(DomoEntity):
     Role: Optional[Any] = None  # DomoRole
     ApiClients: Optional[Any] = None  # DomoApiClients
 
+    # fields kept by DomoUsers.get(return_records=True)
+    record_fields: ClassVar[dict] = {
+        "id": ("id", "userId"),
+        "display_name": "displayName",
+        "email_address": ("emailAddress", "email"),
+        "role_id": "roleId",
+        "department": "department",
+        "title": "title",
+        "employee_id": "employeeId",
+    }
+
     def __post_init__(self):
         from .DomoInstanceConfig.api_client import ApiClients
 
@@ -631,6 +643,10 @@ class DomoUsers(DomoManager):
     def _users_to_domo_user(cls, user_ls, auth: DomoAuth):
         return [DomoUser.from_dict(auth=auth, obj=obj) for obj in user_ls]
 
+    @classmethod
+    def _users_to_records(cls, user_ls, auth: DomoAuth) -> DomoRecord_Batch:
+        return DomoRecord_Batch.from_dicts(DomoUser, auth=auth, obj_ls=user_ls)
+
     @classmethod
     def _users_to_virtual_user(cls, user_ls, auth: DomoAuth):
         return [DomoUser.from_virtual_dict(auth=auth, obj=obj) for obj in user_ls]
@@ -666,12 +682,18 @@ class DomoUsers(DomoManager):
         self,
         *args,
         return_raw: bool = False,
+        return_records: bool = False,
         debug_api: bool = False,
         debug_num_stacks_to_drop=2,
         session: httpx.AsyncClient | None = None,
         **kwargs,
-    ) -> list[DomoUser]:
-        """retrieves all users from Domo"""
+    ) -> Union[list[DomoUser], DomoRecord_Batch, ResponseGetData]:
+        """retrieves all users from Domo
+
+        return_records returns a DomoRecord_Batch of `DomoUser.record_fields`
+        instead of DomoUser objects (and leaves `self.users` untouched);
+        use it for instance-wide listings.
+        """
 
         res = await user_routes.get_all_users(
             auth=self.auth,
@@ -684,6 +706,9 @@ class DomoUsers(DomoManager):
         if return_raw:
             return res
 
+        if return_records:
+            return self._users_to_records(user_ls=res.response, auth=self.auth)
+
         self.users = self._users_to_domo_user(user_ls=res.response, auth=self.auth)
         return self.users
 
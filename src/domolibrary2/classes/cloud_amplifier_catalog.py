@@ -0,0 +1,361 @@
+"""Cached crawl of a Cloud Amplifier integration's databases, schemas and tables.
+
+The catalog is persisted as JSON; later runs only re-list branches older than
+``max_age_seconds``.
+
+Example:
+    >>> crawler = CloudAmplifier_CatalogCrawler(
+    ...     auth=auth, integration_id=integration_id, catalog_path="catalog.json"
+    ... )
+    >>> result = await crawler.crawl()
+    >>> result.catalog.to_dataframe()
+    >>> collisions = await check_colliding_datasources(auth, dataset_ids)
+"""
+
+__all__ = [
+    "CloudAmplifier_Catalog",
+    "CloudAmplifier_CrawlResult",
+    "CloudAmplifier_CatalogCrawler",
+    "check_colliding_datasources",
+]
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+import pandas as pd
+
+from ..auth import DomoAuth
+from ..client.get_data import create_httpx_session
+from ..routes import cloud_amplifier as cloud_amplifier_routes
+from ..utils import files as dmfi
+
+
+def _listing_items(response: Any, key: str) -> list[dict]:
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        return response.get(key) or response.get("results") or []
+    return []
+
+
+def _item_name(obj: dict, *keys: str) -> str:
+    for key in keys:
+        if obj.get(key):
+            return str(obj[key])
+    return str(obj.get("name"))
+
+
+@dataclass
+class CloudAmplifier_Catalog:
+    """Databases, schemas and tables of one integration, with listing timestamps.
+
+    ``databases`` is ``{database: {"crawled_at", "schemas": {schema: {"crawled_at",
+    "tables": [table objects]}}}}``; ``crawled_at`` values are epoch seconds and
+    ``None`` means the level has not been listed yet.
+    """
+
+    integration_id: str
+    crawled_at: Optional[float] = None
+    databases: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, path: Optional[Path], integration_id: str
+    ) -> "CloudAmplifier_Catalog":
+        if path is None or not Path(path).exists():
+            return cls(integration_id=integration_id)
+
+        obj = json.loads(Path(path).read_text())
+        if str(obj.get("integration_id")) != str(integration_id):
+            return cls(integration_id=integration_id)
+
+        return cls(
+            integration_id=integration_id,
+            crawled_at=obj.get("crawled_at"),
+            databases=obj.get("databases", {}),
+        )
+
+    def save(self, path: Path) -> None:
+        dmfi.write_json_atomic(
+            path,
+            {
+                "integration_id": self.integration_id,
+                "crawled_at": self.crawled_at,
+                "databases": self.databases,
+            },
+        )
+
+    @property
+    def n_tables(self) -> int:
+        return sum(
+            len(schema_obj["tables"] or [])
+            for database_obj in self.databases.values()
+            for schema_obj in database_obj["schemas"].values()
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per table with its database, schema and listing time."""
+        return pd.DataFrame(
+            [
+                {
+                    "database": database,
+                    "schema": schema,
+                    "table": _item_name(table, "tableName", "objectName"),
+                    "table_type": table.get("type") or table.get("tableType"),
+                    "crawled_at": pd.to_datetime(
+                        schema_obj["crawled_at"], unit="s", utc=True
+                    ),
+                }
+                for database, database_obj in self.databases.items()
+                for schema, schema_obj in database_obj["schemas"].items()
+                for table in schema_obj["tables"] or []
+            ],
+            columns=["database", "schema", "table", "table_type", "crawled_at"],
+        )
+
+
+@dataclass
+class CloudAmplifier_CrawlResult:
+    """``refreshed`` lists the branches re-listed this run (``""`` is the integration)."""
+
+    catalog: CloudAmplifier_Catalog
+    refreshed: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    n_requests: int = 0
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class CloudAmplifier_CatalogCrawler:
+    """Crawl an integration's warehouse catalog, re-listing only stale branches.
+
+    Args:
+        auth: Instance auth
+        integration_id: Cloud Amplifier integration to crawl
+        catalog_path: JSON file the catalog is loaded from and saved to (optional)
+        max_age_seconds: Listings younger than this are reused
+        max_concurrency: Listing requests in flight at once, across all levels
+        rows: Entries requested per page
+    """
+
+    auth: DomoAuth = field(repr=False)
+    integration_id: str
+    catalog_path: Optional[Path] = None
+    max_age_seconds: float = 24 * 60 * 60
+    max_concurrency: int = 10
+    rows: int = 5000
+
+    def __post_init__(self):
+        self.catalog_path = Path(self.catalog_path) if self.catalog_path else None
+
+    def _is_stale(self, crawled_at: Optional[float], now: float) -> bool:
+        return crawled_at is None or now - crawled_at >= self.max_age_seconds
+
+    async def _get_all(
+        self, route_fn: Callable, key: str, semaphore, result, **kwargs
+    ) -> list[dict]:
+        items = []
+        page = 0
+
+        while True:
+            async with semaphore:
+                res = await route_fn(
+                    auth=self.auth,
+                    integration_id=self.integration_id,
+                    page=page,
+                    rows=self.rows,
+                    **kwargs,
+                )
+            result.n_requests += 1
+
+            page_items = _listing_items(res.response, key)
+            items += page_items
+            page += 1
+
+            if len(page_items) < self.rows:
+                return items
+
+    async def _crawl_schema(
+        self, database, schema, schema_obj, semaphore, result, now, is_force, kwargs
+    ):
+        if not is_force and not self._is_stale(schema_obj["crawled_at"], now):
+            return
+
+        branch = f"{database}.{schema}"
+        try:
+            schema_obj["tables"] = await self._get_all(
+                cloud_amplifier_routes.get_tables,
+                "tables",
+                semaphore,
+                result,
+                database=database,
+                schema=schema,
+                **kwargs,
+            )
+        except Exception as e:
+            result.errors[branch] = e
+            return
+
+        schema_obj["crawled_at"] = now
+        result.refreshed.append(branch)
+
+    async def _crawl_database(
+        self, database, database_obj, semaphore, result, now, is_force, kwargs
+    ):
+        if is_force or self._is_stale(database_obj["crawled_at"], now):
+            try:
+                schema_ls = await self._get_all(
+                    cloud_amplifier_routes.get_schemas,
+                    "schemas",
+                    semaphore,
+                    result,
+                    database=database,
+                    **kwargs,
+                )
+            except Exception as e:
+                result.errors[database] = e
+            else:
+                schemas = database_obj["schemas"]
+                database_obj["schemas"] = {
+                    name: schemas.get(name) or {"crawled_at": None, "tables": None}
+                    for name in (
+                        _item_name(obj, "schemaName", "schema") for obj in schema_ls
+                    )
+                }
+                database_obj["crawled_at"] = now
+                result.refreshed.append(database)
+
+        await asyncio.gather(
+            *[
+                self._crawl_schema(
+                    database,
+                    schema,
+                    schema_obj,
+                    semaphore,
+                    result,
+                    now,
+                    is_force,
+                    kwargs,
+                )
+                for schema, schema_obj in database_obj["schemas"].items()
+            ]
+        )
+
+    async def crawl(
+        self,
+        is_force: bool = False,
+        databases: Optional[list[str]] = None,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> CloudAmplifier_CrawlResult:
+        """Refresh stale branches of the catalog and save it to ``catalog_path``.
+
+        Args:
+            is_force: Re-list every branch regardless of age
+            databases: Only crawl below these databases (all by default)
+
+        Failed listings are recorded in ``result.errors`` by branch
+        (``""``, ``"DB"`` or ``"DB.SCHEMA"``) and keep their previous contents.
+        """
+        start_time = time.perf_counter()
+        now = time.time()
+
+        catalog = CloudAmplifier_Catalog.load(self.catalog_path, self.integration_id)
+        result = CloudAmplifier_CrawlResult(catalog=catalog)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        session, is_close_session = create_httpx_session(session=session)
+        kwargs = {"session": session, "debug_api": debug_api}
+        try:
+            if is_force or self._is_stale(catalog.crawled_at, now):
+                try:
+                    database_ls = await self._get_all(
+                        cloud_amplifier_routes.get_databases,
+                        "databases",
+                        semaphore,
+                        result,
+                        **kwargs,
+                    )
+                except Exception as e:
+                    result.errors[""] = e
+                else:
+                    catalog.databases = {
+                        name: catalog.databases.get(name)
+                        or {"crawled_at": None, "schemas": {}}
+                        for name in (
+                            _item_name(obj, "databaseName", "database")
+                            for obj in database_ls
+                        )
+                    }
+                    catalog.crawled_at = now
+                    result.refreshed.append("")
+
+            await asyncio.gather(
+                *[
+                    self._crawl_database(
+                        database,
+                        database_obj,
+                        semaphore,
+                        result,
+                        now,
+                        is_force,
+                        kwargs,
+                    )
+                    for database, database_obj in catalog.databases.items()
+                    if databases is None or database in databases
+                ]
+            )
+        finally:
+            if is_close_session:
+                await session.aclose()
+
+        if self.catalog_path:
+            catalog.save(self.catalog_path)
+
+        result.elapsed_seconds = time.perf_counter() - start_time
+        return result
+
+
+async def check_colliding_datasources(
+    auth: DomoAuth,
+    dataset_ids: list[str],
+    max_concurrency: int = 10,
+    session: Optional[httpx.AsyncClient] = None,
+    debug_api: bool = False,
+) -> dict[str, Any]:
+    """Collision check for many datasets at once.
+
+    Returns:
+        ``{dataset_id: collision response}``; datasets whose check failed (e.g. no
+        federated metadata) map to the exception instead
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _check(dataset_id):
+        try:
+            async with semaphore:
+                res = await cloud_amplifier_routes.check_for_colliding_datasources(
+                    auth=auth,
+                    dataset_id=dataset_id,
+                    session=session,
+                    debug_api=debug_api,
+                )
+            return res.response
+        except Exception as e:
+            return e
+
+    session, is_close_session = create_httpx_session(session=session)
+    try:
+        result_ls = await asyncio.gather(
+            *[_check(dataset_id) for dataset_id in dataset_ids]
+        )
+    finally:
+        if is_close_session:
+            await session.aclose()
+
+    return dict(zip(dataset_ids, result_ls))
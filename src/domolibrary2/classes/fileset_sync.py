@@ -0,0 +1,282 @@
+"""Incremental mirroring of a Domo fileset to a local directory.
+
+Directories are listed and files streamed to disk concurrently; a manifest in
+``_fileset_manifest.json`` lets the next run skip files that have not changed.
+
+Example:
+    >>> fileset_sync = DomoFileset_Sync(auth=auth, fileset_id=fileset_id, output_dir="mirror")
+    >>> result = await fileset_sync.sync()
+    >>> result.n_downloaded, result.n_skipped, result.failed
+"""
+
+__all__ = [
+    "FilesetSync_Error",
+    "DomoFileset_Manifest",
+    "DomoFileset_SyncResult",
+    "DomoFileset_Sync",
+]
+
+import datetime as dt
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+import httpx
+
+from ..auth import DomoAuth
+from ..base import exceptions as dmde
+from ..client.get_data import create_httpx_session
+from ..routes import filesets as fileset_routes
+from ..utils import (
+    chunk_execution as dmce,
+    files as dmfi,
+)
+
+MANIFEST_FILE_NAME = "_fileset_manifest.json"
+
+
+class FilesetSync_Error(dmde.ClassError):  # noqa: N801
+    def __init__(self, cls_instance, message):
+        super().__init__(cls_instance=cls_instance, message=message)
+
+
+def _is_directory(obj: dict) -> bool:
+    return str(
+        obj.get("fileType") or obj.get("type") or ""
+    ).upper() == "DIRECTORY" or bool(obj.get("isDirectory"))
+
+
+def _file_path(obj: dict) -> str:
+    return str(obj.get("path") or obj.get("name") or obj["id"]).strip("/")
+
+
+def _file_signature(obj: dict) -> dict:
+    return {
+        "size": obj.get("size"),
+        "updated": obj.get("updated") or obj.get("modified") or obj.get("created"),
+    }
+
+
+@dataclass
+class DomoFileset_Manifest:
+    """Size / modified metadata of downloaded files, keyed by file id."""
+
+    path: Path
+    files: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "DomoFileset_Manifest":
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+
+        return cls(path=path, files=json.loads(path.read_text()).get("files", {}))
+
+    def is_unchanged(self, obj: dict, local_path: Path) -> bool:
+        entry = self.files.get(str(obj["id"]))
+        if not entry or not local_path.exists():
+            return False
+
+        signature = _file_signature(obj)
+        if entry["size"] is not None and local_path.stat().st_size != entry["size"]:
+            return False
+
+        return (
+            entry["path"] == _file_path(obj)
+            and entry["size"] == signature["size"]
+            and entry["updated"] == signature["updated"]
+        )
+
+    def record(self, obj: dict) -> None:
+        self.files[str(obj["id"])] = {"path": _file_path(obj), **_file_signature(obj)}
+
+    def save(self) -> None:
+        dmfi.write_json_atomic(
+            self.path,
+            {
+                "files": self.files,
+                "updated": dt.datetime.now(dt.timezone.utc).isoformat(),
+            },
+        )
+
+
+@dataclass
+class DomoFileset_SyncResult:
+    directories: int = 0
+    files: int = 0
+    downloaded: list[str] = field(default_factory=list, repr=False)
+    skipped: list[str] = field(default_factory=list, repr=False)
+    failed: dict[str, Exception] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def n_downloaded(self) -> int:
+        return len(self.downloaded)
+
+    @property
+    def n_skipped(self) -> int:
+        return len(self.skipped)
+
+
+@dataclass
+class DomoFileset_Sync:
+    """Mirror a fileset to ``output_dir``, downloading only new or changed files.
+
+    Args:
+        auth: Instance auth
+        fileset_id: Fileset to mirror
+        output_dir: Local root; files keep their fileset paths below it
+        max_concurrency: Directory listings / downloads in flight at once
+        page_size: Entries requested per directory page
+    """
+
+    auth: DomoAuth = field(repr=False)
+    fileset_id: str
+    output_dir: Path
+    max_concurrency: int = 8
+    page_size: int = 100
+
+    def __post_init__(self):
+        self.output_dir = Path(self.output_dir)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_dir / MANIFEST_FILE_NAME
+
+    def get_local_path(self, obj: dict) -> Path:
+        relative_path = PurePosixPath(_file_path(obj))
+
+        if ".." in relative_path.parts or relative_path.name == MANIFEST_FILE_NAME:
+            raise FilesetSync_Error(
+                cls_instance=self,
+                message=f"refusing to write {relative_path} outside {self.output_dir}",
+            )
+
+        return self.output_dir.joinpath(*relative_path.parts)
+
+    async def _list_directory(self, directory_path: str, session, debug_api):
+        try:
+            res = await fileset_routes.get_fileset_directory_files(
+                auth=self.auth,
+                fileset_id=self.fileset_id,
+                directory_path=directory_path,
+                limit=self.page_size,
+                session=session,
+                debug_api=debug_api,
+            )
+            return res.response
+        except Exception as e:
+            return e
+
+    async def crawl(
+        self,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+        result: Optional[DomoFileset_SyncResult] = None,
+    ) -> list[dict]:
+        """Every file in the fileset.
+
+        Directories that cannot be listed are recorded in ``result.failed`` (keyed
+        by directory path) and skipped with their subdirectories.
+        """
+        result = result or DomoFileset_SyncResult()
+        files = []
+        directory_paths = [""]
+
+        while directory_paths:
+            listing_ls = await dmce.gather_with_concurrency(
+                *[
+                    self._list_directory(directory_path, session, debug_api)
+                    for directory_path in directory_paths
+                ],
+                n=self.max_concurrency,
+            )
+            result.directories += len(directory_paths)
+
+            next_paths = []
+            for directory_path, listing in zip(directory_paths, listing_ls):
+                if isinstance(listing, Exception):
+                    result.failed[directory_path or "/"] = listing
+                    continue
+
+                for obj in listing:
+                    if _is_directory(obj):
+                        next_paths.append(_file_path(obj))
+                    else:
+                        files.append(obj)
+            directory_paths = next_paths
+
+        result.files = len(files)
+        return files
+
+    async def _download(self, obj: dict, session, debug_api):
+        try:
+            res = await fileset_routes.download_fileset_file(
+                auth=self.auth,
+                fileset_id=self.fileset_id,
+                file_id=obj["id"],
+                output_path=self.get_local_path(obj),
+                is_resume=False,  # a leftover .part may be an older version
+                session=session,
+                debug_api=debug_api,
+            )
+            return res.response
+        except Exception as e:
+            return e
+
+    async def sync(
+        self,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> DomoFileset_SyncResult:
+        """Crawl the fileset and download files that are new or changed since the last run.
+
+        Failed listings and downloads are recorded on the result and retried on
+        the next run; the manifest is saved even if some of them failed.
+        """
+        start_time = time.perf_counter()
+        result = DomoFileset_SyncResult()
+        manifest = DomoFileset_Manifest.load(self.manifest_path)
+
+        session, is_close_session = create_httpx_session(session=session)
+        try:
+            files = await self.crawl(
+                session=session, debug_api=debug_api, result=result
+            )
+
+            to_download = []
+            for obj in files:
+                try:
+                    local_path = self.get_local_path(obj)
+                except FilesetSync_Error as e:
+                    result.failed[_file_path(obj)] = e
+                    continue
+
+                if manifest.is_unchanged(obj, local_path):
+                    result.skipped.append(_file_path(obj))
+                else:
+                    to_download.append(obj)
+
+            download_ls = await dmce.gather_with_concurrency(
+                *[self._download(obj, session, debug_api) for obj in to_download],
+                n=self.max_concurrency,
+            )
+        finally:
+            if is_close_session:
+                await session.aclose()
+
+        for obj, download in zip(to_download, download_ls):
+            if isinstance(download, Exception):
+                result.failed[_file_path(obj)] = download
+                continue
+
+            manifest.record(obj)
+            result.downloaded.append(_file_path(obj))
+            result.bytes_downloaded += download.bytes_written
+
+        manifest.save()
+        result.elapsed_seconds = time.perf_counter() - start_time
+        return result
@@ -28,12 +28,13 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 import httpx
 
-from ...client.auth import DomoAuth
-from ...entities.entities import DomoEntity, DomoEnum, DomoSubEntity, Entity_Relation
-from ...client.exceptions import DomoError
+from ...auth import DomoAuth
+from ...base import DomoEntity, DomoEnumMixin
+from ...base.exceptions import DomoError
+from ...utils import chunk_execution as dmce
 
 
-class AccessLevel(DomoEnum):
+class AccessLevel(DomoEnumMixin, Enum):
     """Standardized access levels across all Domo objects."""
 
     OWNER = "OWNER"  # Full control including deletion
@@ -46,7 +47,29 @@ class AccessLevel(DomoEnum):
     default = NONE
 
 
-class EntityType(DomoEnum):
+# higher rank = more access; computed once instead of list(AccessLevel).index per grant
+ACCESS_LEVEL_RANK: dict[AccessLevel, int] = {
+    AccessLevel.NONE: 0,
+    AccessLevel.VIEWER: 1,
+    AccessLevel.CONTRIBUTOR: 2,
+    AccessLevel.EDITOR: 3,
+    AccessLevel.ADMIN: 4,
+    AccessLevel.OWNER: 5,
+}
+
+ACCESS_LEVEL_BY_RANK: dict[int, AccessLevel] = {
+    rank: level for level, rank in ACCESS_LEVEL_RANK.items()
+}
+
+
+def max_access_level(access_levels) -> AccessLevel:
+    """Return the highest access level in an iterable (NONE if empty)."""
+    return ACCESS_LEVEL_BY_RANK[
+        max((ACCESS_LEVEL_RANK[level] for level in access_levels), default=0)
+    ]
+
+
+class EntityType(DomoEnumMixin, Enum):
     """Types of entities that can have access."""
 
     USER = "USER"
@@ -56,6 +79,32 @@ class EntityType(DomoEnum):
     default = USER
 
 
+def get_member_entity_type(obj: dict) -> str | None:
+    """`USER` or `GROUP` for an owners / groupUserList / groupMembers entry.
+
+    Uses ``type`` when present, otherwise ``userId`` / ``groupId``; None if the
+    entry cannot be classified.
+    """
+    if obj.get("type") in ("USER", "GROUP"):
+        return obj["type"]
+
+    if obj.get("userId"):
+        return "USER"
+
+    if obj.get("groupId"):
+        return "GROUP"
+
+    return None
+
+
+def parse_group_member(obj: dict) -> dict:
+    """Normalize a groupUserList / groupMembers entry to ``{"id", "type"}``."""
+    if get_member_entity_type(obj) == "GROUP":
+        return {"id": str(obj.get("groupId") or obj.get("id")), "type": "GROUP"}
+
+    return {"id": str(obj.get("userId") or obj.get("id")), "type": "USER"}
+
+
 @dataclass
 class AccessGrant:
     """Represents a single access grant to an entity."""
@@ -87,23 +136,16 @@ class AccessSummary:
     @property
     def direct_access_level(self) -> AccessLevel:
         """Get the highest direct access level (not from group resolution)."""
-        direct_grants = [g for g in self.access_grants if g.source_group_id is None]
-        if not direct_grants:
-            return AccessLevel.NONE
-
-        # Return highest access level (assuming enum order represents hierarchy)
-        access_levels = [g.access_level for g in direct_grants]
-        return max(access_levels, key=lambda x: list(AccessLevel).index(x))
+        return max_access_level(
+            g.access_level for g in self.access_grants if g.source_group_id is None
+        )
 
     @property
     def group_access_level(self) -> AccessLevel:
         """Get the highest access level from group membership."""
-        group_grants = [g for g in self.access_grants if g.source_group_id is not None]
-        if not group_grants:
-            return AccessLevel.NONE
-
-        access_levels = [g.access_level for g in group_grants]
-        return max(access_levels, key=lambda x: list(AccessLevel).index(x))
+        return max_access_level(
+            g.access_level for g in self.access_grants if g.source_group_id is not None
+        )
 
 
 class DomoAccessController(ABC):
@@ -151,17 +193,19 @@ class DomoAccessController(ABC):
         direct_grants = await self.get_direct_access_grants()
         group_grants = [g for g in direct_grants if g.entity_type == EntityType.GROUP]
 
-        # For each group, get its members and create inherited grants
-        for group_grant in group_grants:
-            group_members = await self._get_group_members(group_grant.entity_id)
+        # Fetch every group's members concurrently, then create inherited grants
+        group_members_ls = await dmce.gather_with_concurrency(
+            *[self._get_group_members(g.entity_id) for g in group_grants], n=20
+        )
 
+        for group_grant, group_members in zip(group_grants, group_members_ls):
             for member in group_members:
                 inherited_grant = AccessGrant(
-                    entity_id=member.id,
+                    entity_id=str(member["id"]),
                     entity_type=(
-                        EntityType.USER
-                        if hasattr(member, "email")
-                        else EntityType.GROUP
+                        EntityType.GROUP
+                        if member.get("type") == "GROUP"
+                        else EntityType.USER
                     ),
                     access_level=group_grant.access_level,
                     source_group_id=group_grant.entity_id,
@@ -218,10 +262,7 @@ class DomoAccessController(ABC):
         self._access_cache = {}
         for entity_id, grants in entity_grants.items():
             # Calculate effective access level (highest level from all grants)
-            access_levels = [g.access_level for g in grants]
-            effective_level = max(
-                access_levels, key=lambda x: list(AccessLevel).index(x)
-            )
+            effective_level = max_access_level(g.access_level for g in grants)
 
             # Determine entity type from grants
             entity_type = grants[0].entity_type if grants else EntityType.USER
@@ -236,11 +277,13 @@ class DomoAccessController(ABC):
 
         self._cache_valid = True
 
-    async def _get_group_members(self, group_id: str) -> List[Any]:
-        """Get members of a group. Override in subclasses for specific implementations."""
-        # This would be implemented to get actual group members
-        # For now, return empty list
-        return []
+    async def _get_group_members(self, group_id: str) -> List[dict]:
+        """Get members of a group as ``{"id", "type"}`` dicts (USER or GROUP)."""
+        from ...routes import group as group_routes
+
+        res = await group_routes.get_group_membership(auth=self.auth, group_id=group_id)
+
+        return [parse_group_member(obj) for obj in res.response]
 
     def invalidate_cache(self):
         """Invalidate the access cache to force refresh on next access."""
@@ -252,18 +295,23 @@ class DomoObjectAccessManager:
 
     def __init__(self, auth: DomoAuth):
         self.auth = auth
-        self._controllers: Dict[str, DomoAccessController] = {}
+        self._controllers: Dict[str, DomoAccessController] = dict(
+            DEFAULT_ACCESS_CONTROLLERS
+        )
 
     def register_controller(self, object_type: str, controller_class: type):
         """Register an access controller for a specific object type."""
         self._controllers[object_type] = controller_class
 
     def get_controller(self, domo_object: DomoEntity) -> Optional[DomoAccessController]:
-        """Get the appropriate access controller for a Domo object."""
-        object_type = type(domo_object).__name__
+        """Get the appropriate access controller for a Domo object.
 
-        if object_type in self._controllers:
-            return self._controllers[object_type](self.auth, domo_object)
+        Matches the object's class or the nearest registered base class, so
+        ``DomoAccount_OAuth`` resolves to the ``DomoAccount_Default`` controller.
+        """
+        for cls in type(domo_object).__mro__:
+            if cls.__name__ in self._controllers:
+                return self._controllers[cls.__name__](self.auth, domo_object)
 
         return None
 
@@ -410,13 +458,167 @@ class DomoGroupAccessController(DomoAccessController):
         pass
 
 
+class DomoDatasetAccessController(DomoAccessController):
+    """Access controller for DomoDataset objects."""
+
+    async def get_direct_access_grants(self) -> list[AccessGrant]:
+        """Get direct share grants for the dataset."""
+        from ...routes import dataset as dataset_routes
+
+        res = await dataset_routes.get_permissions(
+            auth=self.auth, dataset_id=self.parent_id
+        )
+
+        permission_ls = (
+            res.response.get("list", [])
+            if isinstance(res.response, dict)
+            else res.response
+        )
+
+        return [
+            AccessGrant(
+                entity_id=str(item["id"]),
+                entity_type=(
+                    EntityType.GROUP if item.get("type") == "GROUP" else EntityType.USER
+                ),
+                access_level=self._map_dataset_access_level(item.get("accessLevel")),
+            )
+            for item in permission_ls
+        ]
+
+    async def grant_access(
+        self,
+        entity_id: str,
+        entity_type: EntityType,
+        access_level: AccessLevel,
+        **kwargs,
+    ) -> bool:
+        """Share the dataset with an entity.
+
+        OWNER and ADMIN map to CO_OWNER, EDITOR to CAN_EDIT and anything lower
+        to CAN_SHARE.
+        """
+        from ...routes import dataset as dataset_routes
+
+        share_access_level = {
+            AccessLevel.OWNER: dataset_routes.ShareDataset_AccessLevelEnum.CO_OWNER,
+            AccessLevel.ADMIN: dataset_routes.ShareDataset_AccessLevelEnum.CO_OWNER,
+            AccessLevel.EDITOR: dataset_routes.ShareDataset_AccessLevelEnum.CAN_EDIT,
+        }.get(access_level, dataset_routes.ShareDataset_AccessLevelEnum.CAN_SHARE)
+
+        res = await dataset_routes.share_dataset(
+            auth=self.auth,
+            dataset_id=self.parent_id,
+            body=dataset_routes.generate_share_dataset_payload(
+                entity_type=entity_type.value,
+                entity_id=entity_id,
+                access_level=share_access_level,
+            ),
+        )
+
+        self.invalidate_cache()
+        return res.is_success
+
+    async def revoke_access(
+        self, entity_id: str, entity_type: EntityType, **kwargs
+    ) -> bool:
+        """Revoke dataset access from an entity."""
+        raise NotImplementedError("dataset unshare route not yet implemented")
+
+    def _map_dataset_access_level(self, domo_access_level: str) -> AccessLevel:
+        """Map Domo dataset access levels to standardized access levels."""
+        mapping = {
+            "OWNER": AccessLevel.OWNER,
+            "CO_OWNER": AccessLevel.ADMIN,
+            "CAN_EDIT": AccessLevel.EDITOR,
+            "CAN_SHARE": AccessLevel.VIEWER,
+            "CAN_VIEW": AccessLevel.VIEWER,
+        }
+        return mapping.get(domo_access_level, AccessLevel.NONE)
+
+
+class DomoPageAccessController(DomoAccessController):
+    """Access controller for DomoPage objects (explicit user and group shares)."""
+
+    async def get_direct_access_grants(self) -> list[AccessGrant]:
+        """Get direct share grants for the page."""
+        from ...routes import page as page_routes
+
+        res = await page_routes.get_page_access_list(
+            auth=self.auth, page_id=self.parent_id, is_expand_users=False
+        )
+
+        grants = [
+            AccessGrant(
+                entity_id=str(user["id"]),
+                entity_type=EntityType.USER,
+                access_level=AccessLevel.VIEWER,
+            )
+            for user in res.response.get("users") or []
+        ]
+
+        grants.extend(
+            AccessGrant(
+                entity_id=str(group["id"]),
+                entity_type=EntityType.GROUP,
+                access_level=AccessLevel.VIEWER,
+            )
+            for group in res.response.get("groups") or []
+        )
+
+        return grants
+
+    async def grant_access(
+        self,
+        entity_id: str,
+        entity_type: EntityType,
+        access_level: AccessLevel,
+        **kwargs,
+    ) -> bool:
+        """Share the page with an entity (pages have a single share level)."""
+        from ...routes import datacenter as datacenter_routes
+
+        res = await datacenter_routes.share_resource(
+            auth=self.auth,
+            resource_ids=self.parent_id,
+            resource_type=datacenter_routes.ShareResource_Enum.PAGE,
+            user_ids=entity_id if entity_type == EntityType.USER else None,
+            group_ids=entity_id if entity_type == EntityType.GROUP else None,
+        )
+
+        self.invalidate_cache()
+        return res.is_success
+
+    async def revoke_access(
+        self, entity_id: str, entity_type: EntityType, **kwargs
+    ) -> bool:
+        """Remove page access from an entity."""
+        raise NotImplementedError("page unshare route not yet implemented")
+
+
+# dataset and page controllers cannot revoke access yet, so they are not registered
+# by default; register them explicitly where only grants are read
+DEFAULT_ACCESS_CONTROLLERS: dict[str, type] = {
+    "DomoAccount_Default": DomoAccountAccessController,
+    "DomoGroup": DomoGroupAccessController,
+}
+
+
 __all__ = [
     "AccessLevel",
     "EntityType",
     "AccessGrant",
     "AccessSummary",
+    "ACCESS_LEVEL_RANK",
+    "ACCESS_LEVEL_BY_RANK",
+    "max_access_level",
+    "get_member_entity_type",
+    "parse_group_member",
     "DomoAccessController",
     "DomoObjectAccessManager",
     "DomoAccountAccessController",
     "DomoGroupAccessController",
+    "DomoDatasetAccessController",
+    "DomoPageAccessController",
+    "DEFAULT_ACCESS_CONTROLLERS",
 ]
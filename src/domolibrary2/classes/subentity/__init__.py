@@ -17,6 +17,7 @@ Legacy Access Control System:
     - Standardized access levels (OWNER, ADMIN, EDITOR, VIEWER, etc.)
     - Basic access grant tracking
     - Unified API across Domo object types
+    - DomoAccessMatrix: instance-wide user x object effective access with nested groups
 
 Legacy Classes (being phased out):
     DomoAccess: Account-specific access management
@@ -41,6 +42,17 @@ from ...base.relationships import (
     ShareAccount,
 )
 
+# Transitional access control system
+from .access_matrix import DomoAccessMatrix, DomoGroupGraph
+from .AccessControl import (
+    AccessGrant,
+    AccessLevel,
+    AccessSummary,
+    DomoAccessController,
+    DomoObjectAccessManager,
+    EntityType,
+)
+
 # Other subentity classes
 from .certification import DomoCertification
 from .lineage import DomoLineage
@@ -61,11 +73,6 @@ from .trigger import (
     TriggerEventType,
 )
 
-# Transitional access control system
-# AccessControl module not yet implemented
-# from .AccessControl import (...)
-
-
 __all__ = [
     # New unified relationship system (recommended)
     "ShareAccount",
@@ -76,6 +83,15 @@ __all__ = [
     "DomoMembership",
     "MembershipRelationship",
     "UpdateMembership",
+    # Transitional access control system
+    "AccessLevel",
+    "EntityType",
+    "AccessGrant",
+    "AccessSummary",
+    "DomoAccessController",
+    "DomoObjectAccessManager",
+    "DomoGroupGraph",
+    "DomoAccessMatrix",
     # Other subentities
     "DomoCertification",
     "DomoLineage",
@@ -0,0 +1,379 @@
+"""
+Instance-wide effective access matrix
+
+``DomoAccessController`` answers "who can reach this one object" by walking its
+grants and fetching group members on demand.  Answering "what can user X reach"
+that way means one membership request per group per object.
+
+This module loads every group and its memberships once (``DomoGroupGraph``),
+computes the transitive closure of nested groups, and folds the direct grants
+of accounts, datasets, pages and AppDb collections into a sparse
+user x object matrix (``DomoAccessMatrix``) stored as two dict-of-dicts, so both
+query directions are hash lookups.
+
+Example:
+    >>> matrix = await DomoAccessMatrix.build(auth=auth, objects=accounts + datasets)
+    >>> matrix.get_user_access("12345")
+    {('ACCOUNT', '7'): <AccessLevel.OWNER: 'OWNER'>, ...}
+    >>> matrix.get_object_access("DATASET", "abc-123")
+    {'12345': <AccessLevel.EDITOR: 'EDITOR'>, ...}
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DomoGroupGraph",
+    "DomoAccessMatrix",
+]
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import pandas as pd
+
+from ...auth import DomoAuth
+from ...base.exceptions import DomoError
+from ...routes import group as group_routes
+from ...utils import chunk_execution as dmce
+from .AccessControl import (
+    ACCESS_LEVEL_BY_RANK,
+    ACCESS_LEVEL_RANK,
+    AccessGrant,
+    AccessLevel,
+    DomoDatasetAccessController,
+    DomoObjectAccessManager,
+    DomoPageAccessController,
+    EntityType,
+    parse_group_member,
+)
+
+ObjectKey = tuple[str, str]  # (object_type, object_id)
+
+# only direct grants are read, so controllers that cannot revoke yet are usable here
+GRANT_CONTROLLERS: dict[str, type] = {
+    "DomoDataset_Default": DomoDatasetAccessController,
+    "DomoPage": DomoPageAccessController,
+}
+
+
+def _object_key(object_type: str, object_id: str) -> ObjectKey:
+    return (str(object_type).upper(), str(object_id))
+
+
+def _entity_object_type(domo_object: Any) -> str:
+    return str(
+        getattr(domo_object, "entity_type", None) or type(domo_object).__name__
+    ).upper()
+
+
+@dataclass
+class DomoGroupGraph:
+    """Group memberships for an instance, with nested groups resolved transitively."""
+
+    direct_users: dict[str, set[str]] = field(default_factory=dict)
+    direct_subgroups: dict[str, set[str]] = field(default_factory=dict)
+
+    _group_users: dict[str, frozenset[str]] = field(default_factory=dict, repr=False)
+    _user_groups: dict[str, frozenset[str]] | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.direct_users)
+
+    @classmethod
+    def from_memberships(cls, memberships: dict[str, list[dict]]) -> DomoGroupGraph:
+        """Build from ``{group_id: [groupUserList / groupMembers entries]}``."""
+        graph = cls()
+
+        for group_id, member_ls in memberships.items():
+            users = graph.direct_users.setdefault(str(group_id), set())
+            subgroups = graph.direct_subgroups.setdefault(str(group_id), set())
+
+            for member in map(parse_group_member, member_ls or []):
+                (subgroups if member["type"] == "GROUP" else users).add(member["id"])
+
+        return graph
+
+    @classmethod
+    async def build(
+        cls,
+        auth: DomoAuth,
+        max_concurrency: int = 20,
+        session: httpx.AsyncClient | None = None,
+        debug_api: bool = False,
+    ) -> DomoGroupGraph:
+        """Load all groups and their memberships once.
+
+        Groups whose grouplist row already carries ``groupMembers`` are used as-is;
+        the rest are fetched concurrently.
+        """
+        res = await group_routes.get_all_groups(
+            auth=auth, session=session, debug_api=debug_api
+        )
+
+        memberships: dict[str, list[dict]] = {}
+        pending_group_ids = []
+
+        for obj in res.response:
+            group_id = str(obj.get("groupId") or obj.get("id"))
+
+            if "groupMembers" in obj:
+                memberships[group_id] = obj["groupMembers"]
+            else:
+                pending_group_ids.append(group_id)
+
+        membership_res_ls = await dmce.gather_with_concurrency(
+            *[
+                group_routes.get_group_membership(
+                    auth=auth, group_id=group_id, session=session, debug_api=debug_api
+                )
+                for group_id in pending_group_ids
+            ],
+            n=max_concurrency,
+        )
+
+        for group_id, membership_res in zip(pending_group_ids, membership_res_ls):
+            memberships[group_id] = membership_res.response
+
+        return cls.from_memberships(memberships)
+
+    def get_nested_groups(self, group_id: str) -> frozenset[str]:
+        """All groups reachable from ``group_id`` through nesting (excluding itself)."""
+        group_id = str(group_id)
+        seen = {group_id}
+        stack = [group_id]
+
+        while stack:
+            for subgroup_id in self.direct_subgroups.get(stack.pop(), ()):
+                if subgroup_id not in seen:
+                    seen.add(subgroup_id)
+                    stack.append(subgroup_id)
+
+        seen.discard(group_id)
+        return frozenset(seen)
+
+    def get_group_users(self, group_id: str) -> frozenset[str]:
+        """Users in ``group_id`` directly or through any nested group."""
+        group_id = str(group_id)
+
+        if group_id not in self._group_users:
+            users = set(self.direct_users.get(group_id, ()))
+            for subgroup_id in self.get_nested_groups(group_id):
+                users.update(self.direct_users.get(subgroup_id, ()))
+
+            self._group_users[group_id] = frozenset(users)
+
+        return self._group_users[group_id]
+
+    def get_user_groups(self, user_id: str) -> frozenset[str]:
+        """Groups ``user_id`` belongs to directly or through nesting."""
+        if self._user_groups is None:
+            user_groups: dict[str, set[str]] = {}
+            for group_id in self.direct_users:
+                for member_id in self.get_group_users(group_id):
+                    user_groups.setdefault(member_id, set()).add(group_id)
+
+            self._user_groups = {
+                member_id: frozenset(group_ids)
+                for member_id, group_ids in user_groups.items()
+            }
+
+        return self._user_groups.get(str(user_id), frozenset())
+
+
+@dataclass
+class DomoAccessMatrix:
+    """Sparse user x object effective-access matrix.
+
+    Cells hold the rank of the highest ``AccessLevel`` a user reaches an object
+    with, directly or through (nested) group grants.  Cells with no access are
+    not stored.
+    """
+
+    group_graph: DomoGroupGraph = field(default_factory=DomoGroupGraph, repr=False)
+
+    user_access: dict[str, dict[ObjectKey, int]] = field(
+        default_factory=dict, repr=False
+    )
+    object_access: dict[ObjectKey, dict[str, int]] = field(
+        default_factory=dict, repr=False
+    )
+    object_grants: dict[ObjectKey, list[AccessGrant]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.user_access), len(self.object_access))
+
+    @property
+    def nnz(self) -> int:
+        return sum(len(user_ranks) for user_ranks in self.object_access.values())
+
+    def __repr__(self) -> str:
+        return f"DomoAccessMatrix(users={self.shape[0]}, objects={self.shape[1]}, nnz={self.nnz})"
+
+    def _remove_object(self, key: ObjectKey) -> None:
+        for user_id in self.object_access.pop(key, {}):
+            user_ranks = self.user_access.get(user_id)
+            if user_ranks is None:
+                continue
+
+            user_ranks.pop(key, None)
+            if not user_ranks:
+                del self.user_access[user_id]
+
+    def add_object_grants(
+        self, object_type: str, object_id: str, grants: Iterable[AccessGrant]
+    ) -> None:
+        """Set (or replace) the direct grants of one object and expand them to users."""
+        key = _object_key(object_type, object_id)
+        grants = list(grants)
+
+        self._remove_object(key)
+        self.object_grants[key] = grants
+
+        user_ranks: dict[str, int] = {}
+        for grant in grants:
+            rank = ACCESS_LEVEL_RANK[grant.access_level]
+            if not rank:
+                continue
+
+            if grant.entity_type == EntityType.GROUP:
+                user_ids: Iterable[str] = self.group_graph.get_group_users(
+                    grant.entity_id
+                )
+            else:
+                user_ids = (str(grant.entity_id),)
+
+            for user_id in user_ids:
+                if user_ranks.get(user_id, 0) < rank:
+                    user_ranks[user_id] = rank
+
+        self.object_access[key] = user_ranks
+
+        for user_id, rank in user_ranks.items():
+            self.user_access.setdefault(user_id, {})[key] = rank
+
+    @classmethod
+    async def build(
+        cls,
+        auth: DomoAuth,
+        objects: list[Any] | None = None,  # DomoAccount, DomoDataset, DomoPage ...
+        object_grants: dict[ObjectKey, list[AccessGrant]] | None = None,
+        group_graph: DomoGroupGraph | None = None,
+        max_concurrency: int = 20,
+        session: httpx.AsyncClient | None = None,
+        debug_api: bool = False,
+    ) -> DomoAccessMatrix:
+        """Load groups once, fetch each object's direct grants concurrently, build the matrix.
+
+        Args:
+            auth: Instance auth
+            objects: Entities whose grants are fetched through the registered
+                access controllers (``DEFAULT_ACCESS_CONTROLLERS`` plus
+                ``GRANT_CONTROLLERS``)
+            object_grants: Pre-fetched grants keyed ``(object_type, object_id)``,
+                e.g. AppDb collection permissions
+            group_graph: Reuse an already loaded group graph
+            max_concurrency: Concurrent membership / grant requests
+        """
+        group_graph = group_graph or await DomoGroupGraph.build(
+            auth=auth,
+            max_concurrency=max_concurrency,
+            session=session,
+            debug_api=debug_api,
+        )
+
+        matrix = cls(group_graph=group_graph)
+
+        for (object_type, object_id), grants in (object_grants or {}).items():
+            matrix.add_object_grants(object_type, object_id, grants)
+
+        if not objects:
+            return matrix
+
+        access_manager = DomoObjectAccessManager(auth=auth)
+        for object_type, controller_class in GRANT_CONTROLLERS.items():
+            access_manager.register_controller(object_type, controller_class)
+
+        controllers = []
+        for domo_object in objects:
+            controller = access_manager.get_controller(domo_object)
+            if not controller:
+                raise DomoError(
+                    f"No access controller found for object type: {type(domo_object).__name__}"
+                )
+            controllers.append(controller)
+
+        grants_ls = await dmce.gather_with_concurrency(
+            *[controller.get_direct_access_grants() for controller in controllers],
+            n=max_concurrency,
+        )
+
+        for domo_object, grants in zip(objects, grants_ls):
+            matrix.add_object_grants(
+                _entity_object_type(domo_object), domo_object.id, grants
+            )
+
+        return matrix
+
+    def get_access_level(
+        self, user_id: str, object_type: str, object_id: str
+    ) -> AccessLevel:
+        """Effective access level of one user on one object."""
+        return ACCESS_LEVEL_BY_RANK[
+            self.user_access.get(str(user_id), {}).get(
+                _object_key(object_type, object_id), 0
+            )
+        ]
+
+    def get_user_access(
+        self,
+        user_id: str,
+        object_type: str | None = None,
+        min_access_level: AccessLevel = AccessLevel.VIEWER,
+    ) -> dict[ObjectKey, AccessLevel]:
+        """What can ``user_id`` reach -- ``{(object_type, object_id): AccessLevel}``."""
+        min_rank = ACCESS_LEVEL_RANK[min_access_level]
+        object_type = object_type and object_type.upper()
+
+        return {
+            key: ACCESS_LEVEL_BY_RANK[rank]
+            for key, rank in self.user_access.get(str(user_id), {}).items()
+            if rank >= min_rank and (object_type is None or key[0] == object_type)
+        }
+
+    def get_object_access(
+        self,
+        object_type: str,
+        object_id: str,
+        min_access_level: AccessLevel = AccessLevel.VIEWER,
+    ) -> dict[str, AccessLevel]:
+        """Who can reach an object -- ``{user_id: AccessLevel}``."""
+        min_rank = ACCESS_LEVEL_RANK[min_access_level]
+
+        return {
+            user_id: ACCESS_LEVEL_BY_RANK[rank]
+            for user_id, rank in self.object_access.get(
+                _object_key(object_type, object_id), {}
+            ).items()
+            if rank >= min_rank
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Long-format matrix: one row per (user, object) with access."""
+        return pd.DataFrame(
+            [
+                {
+                    "user_id": user_id,
+                    "object_type": object_type,
+                    "object_id": object_id,
+                    "access_level": ACCESS_LEVEL_BY_RANK[rank].value,
+                }
+                for (object_type, object_id), user_ranks in self.object_access.items()
+                for user_id, rank in user_ranks.items()
+            ],
+            columns=["user_id", "object_type", "object_id", "access_level"],
+        )
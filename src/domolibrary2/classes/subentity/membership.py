@@ -38,6 +38,11 @@ class MembershipRelationship(DomoRelationship):
             return self.entity.entity_type.upper()
         return self.entity.__class__.__name__.replace("Domo", "").upper()
 
+    @property
+    def membership_key(self) -> tuple:
+        """Hashable identity of the relationship: (entity type, entity id, relationship type)."""
+        return (self.entity_type, str(self.entity.id), self.relationship_type)
+
     def to_dict(self):
         """Convert relationship to dictionary for API requests."""
         entity_type = self.entity_type
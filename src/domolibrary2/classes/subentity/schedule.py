@@ -9,6 +9,7 @@ __all__ = [
 ]
 
 import datetime as dt
+import functools
 import json
 import re
 from abc import ABC, abstractmethod
@@ -19,6 +20,9 @@ from typing import Any, Callable, Optional
 # from ...auth import DomoAuth
 from ...base.base import DomoBase, DomoEnumMixin
 
+_AT_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(AM|PM)?", re.IGNORECASE)
+_DAILY_INTERVAL_RE = re.compile(r"(\d+)\s*daily")
+
 
 class ScheduleFrequencyEnum(DomoEnumMixin, Enum):
     """Common schedule frequency types"""
@@ -41,6 +45,76 @@ class ScheduleType(DomoEnumMixin, Enum):
     CRON = "CRON"
 
 
+_SIMPLE_EXPRESSION_PATTERNS = [
+    (re.compile(r"(\d+)\s*minute"), ScheduleFrequencyEnum.MINUTELY),
+    (re.compile(r"(\d+)\s*hour"), ScheduleFrequencyEnum.HOURLY),
+    (re.compile(r"(\d+)\s*day"), ScheduleFrequencyEnum.DAILY),
+    (re.compile(r"(\d+)\s*week"), ScheduleFrequencyEnum.WEEKLY),
+    (re.compile(r"(\d+)\s*month"), ScheduleFrequencyEnum.MONTHLY),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cron_components_cached(expr: str) -> tuple[tuple[str, Any], ...]:
+    """Parse cron expression components, cached by expression text"""
+    parts = expr.split()
+
+    if len(parts) < 5:
+        return (("frequency", ScheduleFrequencyEnum.CUSTOM_CRON),)
+
+    minute_part, hour_part, day_month_part, month_part, day_week_part = parts[:5]
+
+    result = {
+        "frequency": ScheduleFrequencyEnum.CUSTOM_CRON,
+        "minute": None,
+        "hour": None,
+    }
+
+    # Extract specific numeric values
+    try:
+        if minute_part.isdigit():
+            result["minute"] = int(minute_part)
+        if hour_part.isdigit():
+            result["hour"] = int(hour_part)
+    except ValueError:
+        pass
+
+    # Infer frequency from pattern
+    if minute_part != "*" and hour_part == "*":
+        result["frequency"] = ScheduleFrequencyEnum.HOURLY
+    elif minute_part != "*" and hour_part != "*" and day_month_part == "*":
+        result["frequency"] = ScheduleFrequencyEnum.DAILY
+    elif day_week_part != "*":
+        result["frequency"] = ScheduleFrequencyEnum.WEEKLY
+    elif day_month_part != "*":
+        result["frequency"] = ScheduleFrequencyEnum.MONTHLY
+
+    return tuple(result.items())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_simple_expression_components_cached(
+    expr: str,
+) -> tuple[tuple[str, Any], ...]:
+    """Parse simple schedule expression, cached by expression text"""
+    expr_lower = expr.lower()
+
+    # Check for daily patterns
+    if "daily" in expr_lower:
+        match = _DAILY_INTERVAL_RE.search(expr_lower)
+        interval = int(match.group(1)) if match else 1
+        return (("frequency", ScheduleFrequencyEnum.DAILY), ("interval", interval))
+
+    # Check other patterns
+    for pattern, frequency in _SIMPLE_EXPRESSION_PATTERNS:
+        if frequency.value.lower()[:-2] in expr_lower:  # Remove 'LY' suffix
+            match = pattern.search(expr_lower)
+            interval = int(match.group(1)) if match else 1
+            return (("frequency", frequency), ("interval", interval))
+
+    return (("frequency", ScheduleFrequencyEnum.CUSTOM_CRON), ("interval", 1))
+
+
 @dataclass
 class DomoSchedule_Base(DomoBase, ABC):
     """Base class for interpreting and managing Domo schedule configurations"""
@@ -115,11 +189,7 @@ class DomoSchedule_Base(DomoBase, ABC):
         at_str = schedule_data.get("at")
         if at_str:
             # Expect format like '09:02 AM' or '14:30'
-            import re
-
-            match = re.match(
-                r"(\d{1,2}):(\d{2})\s*(AM|PM)?", at_str.strip(), re.IGNORECASE
-            )
+            match = _AT_TIME_RE.match(at_str.strip())
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2))
@@ -170,39 +240,7 @@ class DomoSchedule_Base(DomoBase, ABC):
     @staticmethod
     def _parse_cron_components(expr: str) -> dict[str, Any]:
         """Parse cron expression components and return parsed data"""
-        parts = expr.split()
-
-        if len(parts) < 5:
-            return {"frequency": ScheduleFrequencyEnum.CUSTOM_CRON}
-
-        minute_part, hour_part, day_month_part, month_part, day_week_part = parts[:5]
-
-        result = {
-            "frequency": ScheduleFrequencyEnum.CUSTOM_CRON,
-            "minute": None,
-            "hour": None,
-        }
-
-        # Extract specific numeric values
-        try:
-            if minute_part.isdigit():
-                result["minute"] = int(minute_part)
-            if hour_part.isdigit():
-                result["hour"] = int(hour_part)
-        except ValueError:
-            pass
-
-        # Infer frequency from pattern
-        if minute_part != "*" and hour_part == "*":
-            result["frequency"] = ScheduleFrequencyEnum.HOURLY
-        elif minute_part != "*" and hour_part != "*" and day_month_part == "*":
-            result["frequency"] = ScheduleFrequencyEnum.DAILY
-        elif day_week_part != "*":
-            result["frequency"] = ScheduleFrequencyEnum.WEEKLY
-        elif day_month_part != "*":
-            result["frequency"] = ScheduleFrequencyEnum.MONTHLY
-
-        return result
+        return dict(_parse_cron_components_cached(expr))
 
     def _parse_cron_expression(self, expr: str):
         """Parse a cron expression (simplified)"""
@@ -218,31 +256,7 @@ class DomoSchedule_Base(DomoBase, ABC):
     @staticmethod
     def _parse_simple_expression_components(expr: str) -> dict[str, Any]:
         """Parse simple schedule expression and return components"""
-        expr_lower = expr.lower()
-
-        # Define patterns for different time units
-        patterns = [
-            (r"(\d+)\s*minute", ScheduleFrequencyEnum.MINUTELY),
-            (r"(\d+)\s*hour", ScheduleFrequencyEnum.HOURLY),
-            (r"(\d+)\s*day", ScheduleFrequencyEnum.DAILY),
-            (r"(\d+)\s*week", ScheduleFrequencyEnum.WEEKLY),
-            (r"(\d+)\s*month", ScheduleFrequencyEnum.MONTHLY),
-        ]
-
-        # Check for daily patterns
-        if "daily" in expr_lower:
-            match = re.search(r"(\d+)\s*daily", expr_lower)
-            interval = int(match.group(1)) if match else 1
-            return {"frequency": ScheduleFrequencyEnum.DAILY, "interval": interval}
-
-        # Check other patterns
-        for pattern, frequency in patterns:
-            if frequency.value.lower()[:-2] in expr_lower:  # Remove 'LY' suffix
-                match = re.search(pattern, expr_lower)
-                interval = int(match.group(1)) if match else 1
-                return {"frequency": frequency, "interval": interval}
-
-        return {"frequency": ScheduleFrequencyEnum.CUSTOM_CRON, "interval": 1}
+        return dict(_parse_simple_expression_components_cached(expr))
 
     def _parse_simple_expression(self, expr: str):
         """Parse simple schedule expressions"""
@@ -483,7 +497,11 @@ class DomoSchedule_Base(DomoBase, ABC):
         return base_desc
 
     def is_due_now(self, current_time: Optional[dt.datetime] = None) -> bool:
-        """Check if the schedule is due to run now (simplified logic)"""
+        """Check if the schedule fires in the current minute.
+
+        Uses the compiled schedule engine; see ``schedule_engine`` to evaluate
+        many schedules at once.
+        """
         if not self.is_active or self.frequency == ScheduleFrequencyEnum.MANUAL:
             return False
 
@@ -493,9 +511,31 @@ class DomoSchedule_Base(DomoBase, ABC):
         if self.schedule_start_date and current_time < self.schedule_start_date:
             return False
 
-        # This is a simplified check - real implementation would need more complex logic
-        # based on the specific schedule configuration
-        return False  # Placeholder
+        next_run = self.get_next_run_times(
+            n=1,
+            start=current_time.replace(second=0, microsecond=0),
+            horizon=dt.timedelta(minutes=1),
+        )
+        return bool(next_run)
+
+    def get_next_run_times(
+        self,
+        n: int = 1,
+        start: Optional[dt.datetime] = None,
+        horizon: dt.timedelta = dt.timedelta(days=35),
+    ) -> list[dt.datetime]:
+        """Get the next ``n`` run times within ``horizon`` of ``start`` (default now)"""
+        import numpy as np
+
+        from .schedule_engine import compute_next_runs
+
+        next_runs = compute_next_runs([self], n=n, start=start, horizon=horizon)[0]
+
+        return [
+            run.astype("datetime64[m]").astype(dt.datetime)
+            for run in next_runs
+            if not np.isnat(run)
+        ]
 
     def __str__(self) -> str:
         return self.get_human_readable_schedule()
@@ -0,0 +1,633 @@
+"""Vectorized schedule engine for instance-wide capacity planning.
+
+Compiles schedules (cron / Quartz expressions, simple expressions and advanced
+schedule JSON) into boolean component masks once, caching compiled expressions
+by normalized text.  Run times for thousands of schedules are then evaluated
+together against a minute-resolution NumPy ``datetime64`` grid.
+
+Cron handling:
+    * 5 fields  -> ``minute hour day_of_month month day_of_week`` (0 = Sunday)
+    * 6-7 fields -> Quartz ``second minute hour day_of_month month day_of_week [year]``
+      as used by Domo triggers (1 = Sunday); seconds and year are ignored
+    * ``*``, ``?``, lists, ranges, steps and JAN-DEC / SUN-SAT names are supported;
+      ``L``, ``W`` and ``#`` modifiers are not and leave the schedule uncompiled
+
+All times are naive wall-clock times in each schedule's own timezone.
+
+Example:
+    >>> next_runs = compute_next_runs(schedules, n=3, start=dt.datetime(2024, 1, 1))
+    >>> next_runs.shape
+    (len(schedules), 3)
+
+    >>> load = compute_load_histogram(schedules, start, start + dt.timedelta(days=1))
+    >>> load.idxmax()  # busiest hour
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "CompiledSchedule",
+    "compile_schedule_expression",
+    "compile_schedule",
+    "compute_schedule_matches",
+    "compute_next_runs",
+    "compute_load_histogram",
+]
+
+import datetime as dt
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .schedule import DomoSchedule_Base, ScheduleFrequencyEnum, ScheduleType
+
+_MONTH_NAMES = {
+    name: idx
+    for idx, name in enumerate(
+        ["JAN", "FEB", "MAR", "APR", "MAY", "JUN"]
+        + ["JUL", "AUG", "SEP", "OCT", "NOV", "DEC"],
+        start=1,
+    )
+}
+_DOW_NAMES = {
+    name: idx
+    for idx, name in enumerate(["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"])
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSUPPORTED_CRON_RE = re.compile(r"[LW#]")
+# day names are removed before the L / W / # check so WED is not read as W
+_DOW_NAME_RE = re.compile(r"\b(?:" + "|".join(_DOW_NAMES) + r")\b")
+
+_EPOCH_MINUTE = np.datetime64("1970-01-01T00:00", "m")
+
+
+@dataclass(frozen=True)
+class CompiledSchedule:
+    """Boolean component masks describing when a schedule fires.
+
+    Masks are indexed by minute (60), hour (24), day of month (31, index 0 = day 1),
+    month (12, index 0 = January) and day of week (7, index 0 = Sunday).
+    """
+
+    minutes: np.ndarray = field(repr=False)
+    hours: np.ndarray = field(repr=False)
+    days_of_month: np.ndarray = field(repr=False)
+    months: np.ndarray = field(repr=False)
+    days_of_week: np.ndarray = field(repr=False)
+
+    # cron semantics: when both day fields are restricted, either one matching fires
+    is_day_or: bool = False
+
+    # interval anchored on the schedule start date ("day", "week" or "month")
+    period_unit: str | None = None
+    period_interval: int = 1
+
+    is_once: bool = False
+
+
+def _full(size: int) -> np.ndarray:
+    return np.ones(size, dtype=bool)
+
+
+def _only(size: int, values, offset: int = 0) -> np.ndarray:
+    mask = np.zeros(size, dtype=bool)
+    for value in values:
+        idx = int(value) - offset
+        if 0 <= idx < size:
+            mask[idx] = True
+    return mask
+
+
+def _parse_cron_value(token: str, names: dict[str, int]) -> int:
+    return names[token] if token in names else int(token)
+
+
+def _parse_cron_field(
+    text: str, low: int, high: int, names: dict[str, int] | None = None
+) -> np.ndarray | None:
+    """Parse one cron field into a mask over ``low..high`` (None if unsupported)."""
+    names = names or {}
+    size = high - low + 1
+    mask = np.zeros(size, dtype=bool)
+
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start = _parse_cron_value(start_text, names)
+            end = _parse_cron_value(end_text, names)
+        else:
+            start = _parse_cron_value(part, names)
+            end = high if step != 1 else start
+
+        if start < low or end > high or step < 1:
+            return None
+
+        mask[start - low : end - low + 1 : step] = True
+
+    return mask
+
+
+def _normalize_expression(expression: str) -> str:
+    return _WHITESPACE_RE.sub(" ", expression.strip().upper())
+
+
+@functools.lru_cache(maxsize=8192)
+def _compile_normalized_expression(expr: str) -> CompiledSchedule | None:
+    parts = expr.split(" ")
+
+    if len(parts) == 5:
+        minute, hour, dom, month, dow = parts
+        dow_offset = 0
+    elif len(parts) in (6, 7):
+        _, minute, hour, dom, month, dow = parts[:6]
+        dow_offset = 1  # Quartz: 1 = Sunday
+    else:
+        return None
+
+    if _UNSUPPORTED_CRON_RE.search(" ".join([dom, _DOW_NAME_RE.sub("", dow)])):
+        return None
+
+    try:
+        minutes = _parse_cron_field(minute, 0, 59)
+        hours = _parse_cron_field(hour, 0, 23)
+        days_of_month = _parse_cron_field(dom, 1, 31)
+        months = _parse_cron_field(month, 1, 12, _MONTH_NAMES)
+
+        dow_names = {name: idx + dow_offset for name, idx in _DOW_NAMES.items()}
+        days_of_week = _parse_cron_field(dow, dow_offset, 7, dow_names)
+    except (ValueError, KeyError):
+        return None
+
+    if any(
+        mask is None for mask in (minutes, hours, days_of_month, months, days_of_week)
+    ):
+        return None
+
+    if dow_offset == 0:
+        # standard cron allows both 0 and 7 for Sunday
+        days_of_week = days_of_week[:7] | np.append(days_of_week[7:], [False] * 6)
+    else:
+        days_of_week = days_of_week[:7]
+
+    return CompiledSchedule(
+        minutes=minutes,
+        hours=hours,
+        days_of_month=days_of_month,
+        months=months,
+        days_of_week=days_of_week,
+        is_day_or=dom not in ("*", "?") and dow not in ("*", "?"),
+    )
+
+
+def compile_schedule_expression(expression: str) -> CompiledSchedule | None:
+    """Compile a cron / Quartz expression, cached by normalized text.
+
+    Args:
+        expression: cron expression such as ``"0 8 * * 1-5"`` or ``"0 47 12 ? * MON *"``
+
+    Returns:
+        CompiledSchedule, or None if the expression is not a supported cron expression
+    """
+    if not expression:
+        return None
+
+    return _compile_normalized_expression(_normalize_expression(expression))
+
+
+def _coerce_int_list(values: Any, names: dict[str, int] | None = None) -> list[int]:
+    if values is None:
+        return []
+    if not isinstance(values, (list, tuple, set)):
+        values = [values]
+
+    result = []
+    for value in values:
+        if isinstance(value, str):
+            key = value.strip().upper()[:3]
+            if names and key in names:
+                result.append(names[key])
+                continue
+            if not value.strip().isdigit():
+                continue
+        result.append(int(value))
+    return result
+
+
+@functools.lru_cache(maxsize=8192)
+def _compile_components(
+    frequency: ScheduleFrequencyEnum,
+    interval: int,
+    minute: int | None,
+    hour: int | None,
+    days_of_week: tuple[int, ...],
+    days_of_month: tuple[int, ...],
+    months: tuple[int, ...],
+) -> CompiledSchedule | None:
+    minute_mask = _only(60, [minute or 0])
+    hour_mask = _only(24, [hour or 0])
+    dom_mask = _only(31, days_of_month, offset=1) if days_of_month else _full(31)
+    month_mask = _only(12, months, offset=1) if months else _full(12)
+    dow_mask = _only(7, days_of_week) if days_of_week else _full(7)
+
+    period_unit = None
+    period_interval = max(int(interval or 1), 1)
+
+    if frequency == ScheduleFrequencyEnum.MINUTELY:
+        minute_mask = _only(60, range(0, 60, period_interval))
+        hour_mask = _full(24)
+        period_interval = 1
+
+    elif frequency == ScheduleFrequencyEnum.HOURLY:
+        hour_mask = _only(24, range(0, 24, period_interval))
+        period_interval = 1
+
+    elif frequency == ScheduleFrequencyEnum.DAILY:
+        period_unit = "day"
+
+    elif frequency == ScheduleFrequencyEnum.WEEKLY:
+        period_unit = "week"
+
+    elif frequency == ScheduleFrequencyEnum.MONTHLY:
+        period_unit = "month"
+        if not days_of_month:
+            dom_mask = _only(31, [1], offset=1)
+
+    elif frequency == ScheduleFrequencyEnum.YEARLY:
+        if not days_of_month:
+            dom_mask = _only(31, [1], offset=1)
+        if not months:
+            month_mask = _only(12, [1], offset=1)
+
+    elif frequency == ScheduleFrequencyEnum.ONCE:
+        return CompiledSchedule(
+            minutes=minute_mask,
+            hours=hour_mask,
+            days_of_month=dom_mask,
+            months=month_mask,
+            days_of_week=dow_mask,
+            is_once=True,
+        )
+
+    else:
+        return None
+
+    return CompiledSchedule(
+        minutes=minute_mask,
+        hours=hour_mask,
+        days_of_month=dom_mask,
+        months=month_mask,
+        days_of_week=dow_mask,
+        period_unit=period_unit if period_interval > 1 else None,
+        period_interval=period_interval,
+    )
+
+
+ScheduleInput = DomoSchedule_Base | str | None
+
+
+def compile_schedule(schedule: ScheduleInput) -> CompiledSchedule | None:
+    """Compile a DomoSchedule (or raw cron expression) into component masks.
+
+    Cron expressions are compiled from their text; simple expressions and
+    advanced schedule JSON are compiled from the interpreted schedule fields.
+
+    Returns:
+        CompiledSchedule, or None for manual, inactive or unsupported schedules
+    """
+    if schedule is None:
+        return None
+
+    if isinstance(schedule, str):
+        return compile_schedule_expression(schedule)
+
+    if not schedule.is_active or schedule.frequency == ScheduleFrequencyEnum.MANUAL:
+        return None
+
+    if schedule.schedule_type == ScheduleType.MANUAL:
+        return None
+
+    expression = getattr(schedule, "schedule_expression", None)
+    if expression and not getattr(schedule, "advanced_schedule_json", None):
+        compiled = compile_schedule_expression(expression)
+        if compiled is not None:
+            return compiled
+
+    # simple expressions run at the time of day / weekday / day of the start date
+    start_date = schedule.schedule_start_date
+    minute = _coerce_int_list(schedule.minute) or (
+        [start_date.minute] if start_date else []
+    )
+    hour = _coerce_int_list(schedule.hour) or ([start_date.hour] if start_date else [])
+    days_of_week = _coerce_int_list(schedule.day_of_week, _DOW_NAMES)
+    days_of_month = _coerce_int_list(schedule.day_of_month)
+
+    if (
+        start_date
+        and not days_of_week
+        and schedule.frequency == ScheduleFrequencyEnum.WEEKLY
+    ):
+        days_of_week = [(start_date.weekday() + 1) % 7]
+
+    if (
+        start_date
+        and not days_of_month
+        and schedule.frequency
+        in (
+            ScheduleFrequencyEnum.MONTHLY,
+            ScheduleFrequencyEnum.YEARLY,
+        )
+    ):
+        days_of_month = [start_date.day]
+
+    return _compile_components(
+        schedule.frequency,
+        schedule.interval or 1,
+        minute[0] if minute else None,
+        hour[0] if hour else None,
+        tuple(days_of_week),
+        tuple(days_of_month),
+        tuple(_coerce_int_list(schedule.month, _MONTH_NAMES)),
+    )
+
+
+def _to_minute(value: dt.datetime | None) -> np.datetime64:
+    if value is None:
+        return np.datetime64("NaT", "m")
+    if isinstance(value, dt.datetime) and value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return np.datetime64(value, "m")
+
+
+@dataclass
+class _ScheduleMatrix:
+    """Stacked masks for the distinct compiled schedules in a batch.
+
+    Schedules sharing a compiled expression (and whose start date does not
+    affect the evaluated window) collapse onto one row; ``inverse`` maps each
+    input schedule back to its row.
+    """
+
+    minutes: np.ndarray
+    hours: np.ndarray
+    days_of_month: np.ndarray
+    months: np.ndarray
+    days_of_week: np.ndarray
+    is_day_or: np.ndarray
+    period_unit: np.ndarray  # 0 none, 1 day, 2 week, 3 month
+    period_interval: np.ndarray
+    is_once: np.ndarray
+    start: np.ndarray  # datetime64[m], NaT when no start date
+    is_valid: np.ndarray
+    inverse: np.ndarray
+
+    @property
+    def row_count(self) -> int:
+        return len(self.is_valid)
+
+    @classmethod
+    def build(
+        cls, schedules: list[ScheduleInput], grid_start: np.datetime64
+    ) -> _ScheduleMatrix:
+        unique_rows: dict[tuple, int] = {}
+        compiled_rows: list[CompiledSchedule | None] = []
+        start_rows: list[np.datetime64] = []
+        inverse = np.empty(len(schedules), dtype=np.int64)
+
+        for idx, schedule in enumerate(schedules):
+            compiled = compile_schedule(schedule)
+            start = _to_minute(
+                schedule.schedule_start_date
+                if isinstance(schedule, DomoSchedule_Base)
+                else None
+            )
+
+            is_start_relevant = compiled is not None and (
+                compiled.is_once
+                or compiled.period_unit is not None
+                or (not np.isnat(start) and start > grid_start)
+            )
+            if not is_start_relevant:
+                start = np.datetime64("NaT", "m")
+
+            key = (
+                id(compiled),
+                None if np.isnat(start) else int(start.astype(np.int64)),
+            )
+            if key not in unique_rows:
+                unique_rows[key] = len(compiled_rows)
+                compiled_rows.append(compiled)
+                start_rows.append(start)
+
+            inverse[idx] = unique_rows[key]
+
+        empty = CompiledSchedule(
+            minutes=np.zeros(60, dtype=bool),
+            hours=np.zeros(24, dtype=bool),
+            days_of_month=np.zeros(31, dtype=bool),
+            months=np.zeros(12, dtype=bool),
+            days_of_week=np.zeros(7, dtype=bool),
+        )
+        is_valid = np.array([c is not None for c in compiled_rows], dtype=bool)
+        rows = [c or empty for c in compiled_rows]
+        unit_codes = {None: 0, "day": 1, "week": 2, "month": 3}
+
+        return cls(
+            minutes=np.stack([c.minutes for c in rows]),
+            hours=np.stack([c.hours for c in rows]),
+            days_of_month=np.stack([c.days_of_month for c in rows]),
+            months=np.stack([c.months for c in rows]),
+            days_of_week=np.stack([c.days_of_week for c in rows]),
+            is_day_or=np.array([c.is_day_or for c in rows], dtype=bool),
+            period_unit=np.array([unit_codes[c.period_unit] for c in rows]),
+            period_interval=np.array([c.period_interval for c in rows]),
+            is_once=np.array([c.is_once for c in rows], dtype=bool),
+            start=np.array(start_rows, dtype="datetime64[m]"),
+            is_valid=is_valid,
+            inverse=inverse,
+        )
+
+    def match(self, grid: np.ndarray, rows: slice) -> np.ndarray:
+        """Return a (rows x len(grid)) boolean matrix of scheduled minutes."""
+        minute_abs = (grid - _EPOCH_MINUTE).astype(np.int64)
+        day_abs = minute_abs // 1440
+
+        grid_minute = minute_abs % 60
+        grid_hour = (minute_abs // 60) % 24
+        grid_dow = (day_abs + 4) % 7  # 1970-01-01 was a Thursday
+
+        grid_months = grid.astype("datetime64[M]")
+        grid_month_abs = grid_months.astype(np.int64)
+        grid_month = grid_month_abs % 12
+        grid_dom = (grid.astype("datetime64[D]") - grid_months).astype(np.int64)
+
+        day_of_month = self.days_of_month[rows][:, grid_dom]
+        day_of_week = self.days_of_week[rows][:, grid_dow]
+        day_match = np.where(
+            self.is_day_or[rows][:, None],
+            day_of_month | day_of_week,
+            day_of_month & day_of_week,
+        )
+
+        result = (
+            self.minutes[rows][:, grid_minute]
+            & self.hours[rows][:, grid_hour]
+            & self.months[rows][:, grid_month]
+            & day_match
+            & self.is_valid[rows][:, None]
+        )
+
+        start = self.start[rows]
+        has_start = ~np.isnat(start)
+        start_abs = np.where(has_start, start.astype(np.int64), np.iinfo(np.int64).min)
+        result &= minute_abs[None, :] >= start_abs[:, None]
+
+        # anchored intervals (every N days / weeks / months from the start date)
+        unit = self.period_unit[rows]
+        interval = self.period_interval[rows][:, None]
+        if np.any(unit > 0):
+            start_day = np.where(has_start, start_abs // 1440, 0)[:, None]
+            start_month = np.where(
+                has_start,
+                start.astype("datetime64[M]").astype(np.int64),
+                0,
+            )[:, None]
+            elapsed = np.select(
+                [unit[:, None] == 1, unit[:, None] == 2, unit[:, None] == 3],
+                [
+                    day_abs[None, :] - start_day,
+                    (day_abs[None, :] + 4) // 7 - (start_day + 4) // 7,
+                    grid_month_abs[None, :] - start_month,
+                ],
+                default=0,
+            )
+            result &= (elapsed % interval) == 0
+
+        # ONCE schedules fire only at their start minute
+        is_once = self.is_once[rows]
+        if np.any(is_once):
+            once_match = minute_abs[None, :] == start_abs[:, None]
+            result = np.where(is_once[:, None], once_match & has_start[:, None], result)
+
+        return result
+
+
+def _build_grid(start: dt.datetime, end: dt.datetime) -> np.ndarray:
+    return np.arange(_to_minute(start), _to_minute(end), dtype="datetime64[m]")
+
+
+def compute_schedule_matches(
+    schedules: list[ScheduleInput],
+    start: dt.datetime,
+    end: dt.datetime,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate every schedule against every minute in ``[start, end)``.
+
+    Returns:
+        (grid, matches) where grid is a ``datetime64[m]`` array and matches is a
+        ``(len(schedules), len(grid))`` boolean matrix
+    """
+    grid = _build_grid(start, end)
+    if not schedules:
+        return grid, np.zeros((0, len(grid)), dtype=bool)
+
+    matrix = _ScheduleMatrix.build(schedules, grid_start=_to_minute(start))
+    return grid, matrix.match(grid, slice(None))[matrix.inverse]
+
+
+def compute_next_runs(
+    schedules: list[ScheduleInput],
+    n: int = 1,
+    start: dt.datetime | None = None,
+    horizon: dt.timedelta = dt.timedelta(days=35),
+    chunk_size: int = 256,
+) -> np.ndarray:
+    """Compute the next ``n`` run times for many schedules at once.
+
+    Args:
+        schedules: DomoSchedule objects or cron expressions
+        n: Number of upcoming runs to return per schedule
+        start: Earliest run time considered (defaults to now)
+        horizon: How far ahead to search; runs beyond it are returned as NaT
+        chunk_size: Distinct schedules evaluated per vectorized batch (bounds memory)
+
+    Returns:
+        ``datetime64[m]`` array of shape ``(len(schedules), n)``, NaT-padded
+    """
+    start = start or dt.datetime.now()
+    grid = _build_grid(start, start + horizon)
+
+    if not schedules or not len(grid):
+        return np.full((len(schedules), n), np.datetime64("NaT", "m"))
+
+    matrix = _ScheduleMatrix.build(schedules, grid_start=grid[0])
+    result = np.full((matrix.row_count, n), np.datetime64("NaT", "m"))
+
+    for chunk_start in range(0, matrix.row_count, chunk_size):
+        rows = slice(chunk_start, chunk_start + chunk_size)
+        matches = matrix.match(grid, rows)
+
+        row_idx, col_idx = np.nonzero(matches)  # sorted by row, then by time
+        if not len(row_idx):
+            continue
+
+        first_in_row = np.searchsorted(row_idx, row_idx, side="left")
+        rank = np.arange(len(row_idx)) - first_in_row
+        keep = rank < n
+
+        result[chunk_start + row_idx[keep], rank[keep]] = grid[col_idx[keep]]
+
+    return result[matrix.inverse]
+
+
+def compute_load_histogram(
+    schedules: list[ScheduleInput],
+    start: dt.datetime,
+    end: dt.datetime,
+    bucket_minutes: int = 60,
+    chunk_size: int = 256,
+) -> pd.Series:
+    """Count scheduled runs per time bucket across all schedules.
+
+    Args:
+        schedules: DomoSchedule objects or cron expressions
+        start: Window start (inclusive)
+        end: Window end (exclusive)
+        bucket_minutes: Bucket width in minutes (60 = runs per hour, 1 = per minute)
+        chunk_size: Distinct schedules evaluated per vectorized batch (bounds memory)
+
+    Returns:
+        pd.Series of run counts indexed by bucket start time
+    """
+    grid = _build_grid(start, end)
+    counts = np.zeros(len(grid), dtype=np.int64)
+
+    if schedules and len(grid):
+        matrix = _ScheduleMatrix.build(schedules, grid_start=grid[0])
+        row_weights = np.bincount(matrix.inverse, minlength=matrix.row_count)
+
+        for chunk_start in range(0, matrix.row_count, chunk_size):
+            rows = slice(chunk_start, chunk_start + chunk_size)
+            counts += row_weights[rows] @ matrix.match(grid, rows)
+
+    bucket_idx = np.arange(len(grid)) // bucket_minutes
+    bucket_counts = np.bincount(
+        bucket_idx, weights=counts, minlength=bucket_idx[-1] + 1 if len(grid) else 0
+    ).astype(np.int64)
+
+    return pd.Series(
+        bucket_counts,
+        index=pd.DatetimeIndex(grid[::bucket_minutes], name="bucket_start"),
+        name="run_count",
+    )
@@ -2,27 +2,43 @@ __all__ = [
     "GetDataError",
     "get_data",
     "get_data_stream",
+    "DataStream_Result",
+    "get_data_stream_to_sink",
+    "stream_to_file",
     "LooperError",
     "looper",
     "RouteFunctionResponseTypeError",
     "route_function",
+    "get_default_transport",
+    "set_default_transport",
 ]
 
+import hashlib
+import inspect
 import time
+from dataclasses import dataclass
 from functools import wraps
+from pathlib import Path
 from pprint import pprint
 from typing import Any, Callable, Optional
 
 import httpx
-from dc_logger.decorators import LogDecoratorConfig, log_call
+from dc_logger.decorators import LogDecoratorConfig
 
 from ..auth import (
     base as dmda,
 )
 from ..base.exceptions import DomoError
 from ..utils import chunk_execution as dmce
-from ..utils.logging import ResponseGetDataProcessor, get_colored_logger
-from . import response as rgd
+from ..utils.logging import (
+    ResponseGetDataProcessor,
+    gated_log_call,
+    get_colored_logger,
+)
+from . import (
+    metrics as client_metrics,
+    response as rgd,
+)
 from .context import RouteContext
 
 # Initialize colored logger
@@ -31,6 +47,10 @@ logger = get_colored_logger()
 # Constants
 DEFAULT_TIMEOUT = 20
 DEFAULT_STREAM_TIMEOUT = 10
+DEFAULT_STREAM_READ_TIMEOUT = 60
+
+# transport for sessions created when no session is passed (see ``set_default_transport``)
+_default_transport: Optional[httpx.AsyncBaseTransport] = None
 
 
 class GetDataError(DomoError):
@@ -63,14 +83,33 @@ def create_headers(
     return headers
 
 
+def get_default_transport() -> Optional[httpx.AsyncBaseTransport]:
+    """Transport used for sessions created by ``create_httpx_session``."""
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+    """Set the transport for sessions created when no session is passed.
+
+    Args:
+        transport: e.g. ``httpx.MockTransport`` or ``DomoApiSimulator.transport``;
+            None restores httpx's default network transport
+    """
+    global _default_transport
+    _default_transport = transport
+
+
 def create_httpx_session(
-    session: httpx.AsyncClient = None, is_verify: bool = False
+    session: httpx.AsyncClient = None,
+    is_verify: bool = False,
+    limits: Optional[httpx.Limits] = None,
 ) -> tuple[httpx.AsyncClient, bool]:
     """Creates or reuses an asynchronous HTTPX session.
 
     Args:
         session: An optional existing HTTPX AsyncClient session.
         is_verify: Boolean flag for SSL verification.
+        limits: Connection pool limits for a new session (httpx defaults if None).
 
     Returns:
         A tuple containing the HTTPX session and a boolean indicating if the session should be closed.
@@ -79,12 +118,16 @@ def create_httpx_session(
 
     if session is None:
         is_close_session = True
-        session = httpx.AsyncClient(verify=is_verify)
+        session = httpx.AsyncClient(
+            verify=is_verify,
+            transport=_default_transport,
+            **({"limits": limits} if limits else {}),
+        )
     return session, is_close_session
 
 
 @dmce.run_with_retry()
-@log_call(
+@gated_log_call(
     action_name="get_data",
     level_name="client",
     log_level="DEBUG",
@@ -110,6 +153,7 @@ async def get_data(
     log_level: Optional[str] = None,
     is_verify: bool = False,
     dry_run: bool = False,
+    is_lazy_response: bool = False,
 ) -> rgd.ResponseGetData:
     """Asynchronously performs an HTTP request to retrieve data from a Domo API endpoint.
 
@@ -132,6 +176,7 @@ async def get_data(
         log_level: Optional log level for the request (overridden by context if provided)
         is_verify: SSL verification flag
         dry_run: If True, return request parameters without executing
+        is_lazy_response: Keep the raw body and decode it on first access of ``.response``
 
     Returns:
         ResponseGetData object containing the response
@@ -203,6 +248,10 @@ async def get_data(
             additional_information=additional_information,
         )
 
+    recorder = client_metrics.start_request(
+        "get_data", auth=auth, method=method, url=url
+    )
+
     try:
         # Build and execute request
         request_kwargs = {
@@ -214,26 +263,45 @@ async def get_data(
             "timeout": timeout,
         }
 
-        if isinstance(body, dict):
+        if isinstance(body, (dict, list)):
             request_kwargs["json"] = body
         elif isinstance(body, str):
             request_kwargs["content"] = body
 
-        response = await session.request(**request_kwargs)
+        if recorder:
+            request_kwargs["extensions"] = recorder.extensions
+
+        try:
+            response = await session.request(**request_kwargs)
+        except Exception as e:
+            if recorder:
+                recorder.finish(error=e)
+            raise
+
+        if recorder:
+            bytes_sent, bytes_received = client_metrics.response_bytes(response)
+            recorder.finish(
+                status=response.status_code,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+            )
 
         if debug_api:
             message = f"[DEBUG] Response Status: {response.status_code} - {response.text[:500]}"
             print(message)
             await logger.debug(message)
 
-        # Handle special response cases
-        if "<title>Domo - Blocked</title>" in response.text:
-            ip_address = rgd.find_ip(response.text)
-            raise GetDataError(url=url, message=f"Blocked by VPN: {ip_address}")
+        # Handle special response cases (blocked pages are HTML, never JSON)
+        if "json" not in response.headers.get("Content-Type", ""):
+            if "<title>Domo - Blocked</title>" in response.text:
+                ip_address = rgd.find_ip(response.text)
+                raise GetDataError(url=url, message=f"Blocked by VPN: {ip_address}")
 
-        if response.status_code == 303 and "whitelist/blocked" in response.text:
-            ip_address = rgd.find_ip(response.text)
-            raise GetDataError(url=url, message=f"Blocked by Allowlist: {ip_address}")
+            if response.status_code == 303 and "whitelist/blocked" in response.text:
+                ip_address = rgd.find_ip(response.text)
+                raise GetDataError(
+                    url=url, message=f"Blocked by Allowlist: {ip_address}"
+                )
 
         if return_raw:
             return rgd.ResponseGetData(
@@ -249,6 +317,7 @@ async def get_data(
             res=response,
             request_metadata=request_metadata,
             additional_information=additional_information,
+            is_lazy=is_lazy_response,
         )
 
     finally:
@@ -257,7 +326,7 @@ async def get_data(
 
 
 @dmce.run_with_retry()
-@log_call(
+@gated_log_call(
     action_name="get_data_stream",
     level_name="client",
     log_level="DEBUG",
@@ -277,9 +346,13 @@ async def get_data_stream(
     session: httpx.AsyncClient | None = None,
     is_verify: bool = False,
     is_follow_redirects: bool = True,
+    read_timeout: Optional[float] = DEFAULT_STREAM_READ_TIMEOUT,
 ) -> rgd.ResponseGetData:
     """Asynchronously streams data from a Domo API endpoint.
 
+    The body is collected in memory; use ``get_data_stream_to_sink`` to write
+    large bodies to a file or callback as they arrive.
+
     Args:
         url: API endpoint URL.
         auth: Authentication object for Domo APIs.
@@ -289,11 +362,12 @@ async def get_data_stream(
         params: Query parameters for the request.
         context: Optional RouteContext with debug/session settings (takes precedence over individual params)
         debug_api: Enable debugging information (overridden by context if provided).
-        timeout: Maximum time to wait for a response (in seconds).
+        timeout: Maximum time to connect / write (in seconds).
         parent_class: (Optional) Name of the calling class (overridden by context if provided).
         session: Optional HTTPX session to be used (overridden by context if provided).
         is_verify: SSL verification flag.
         is_follow_redirects: Follow HTTP redirects if True.
+        read_timeout: Longest wait for the next chunk (in seconds).
 
     Returns:
         An instance of ResponseGetData containing the streamed response data.
@@ -343,18 +417,29 @@ async def get_data_stream(
         session=session, is_verify=is_verify
     )
 
+    recorder = client_metrics.start_request(
+        "get_data_stream", auth=auth, method=method, url=url
+    )
+
     try:
         async with session.stream(
             method,
             url=url,
             headers=headers,
+            params=params,
             follow_redirects=is_follow_redirects,
-            timeout=timeout,
+            timeout=_build_stream_timeout(timeout, read_timeout),
+            extensions=recorder.extensions if recorder else None,
         ) as res:
             if res.status_code != 200:
                 response_text = (
                     res.text if hasattr(res, "text") else str(await res.aread())
                 )
+                if recorder:
+                    recorder.finish(
+                        status=res.status_code,
+                        bytes_received=res.num_bytes_downloaded,
+                    )
                 res_obj = rgd.ResponseGetData(
                     status=res.status_code,
                     response=response_text,
@@ -368,6 +453,11 @@ async def get_data_stream(
             async for chunk in res.aiter_bytes():
                 content += chunk
 
+            if recorder:
+                recorder.finish(
+                    status=res.status_code, bytes_received=res.num_bytes_downloaded
+                )
+
             res_obj = rgd.ResponseGetData(
                 status=res.status_code,
                 response=content,  # type: ignore
@@ -378,19 +468,413 @@ async def get_data_stream(
             return res_obj
 
     except httpx.TransportError as e:
+        if recorder:
+            recorder.finish(error=e)
         raise GetDataError(url=url, message=str(e)) from e
 
+    except BaseException as e:
+        # decoding errors and cancellation are timed and counted as errors too
+        if recorder:
+            recorder.finish(error=e)
+        raise
+
+    finally:
+        if is_close_session:
+            await session.aclose()
+
+
+@dataclass
+class DataStream_Result:  # noqa: N801
+    """What ``get_data_stream_to_sink`` delivered.
+
+    ``bytes_written`` counts bytes received by this call; ``bytes_resumed`` the
+    bytes already in the sink from an earlier, interrupted download.  ``path`` is
+    set for file-path sinks, ``checksum`` (hex digest) when one was requested.
+    """
+
+    path: Optional[Path] = None
+    bytes_written: int = 0
+    bytes_resumed: int = 0
+    total_bytes: Optional[int] = None
+    elapsed_seconds: float = 0.0
+    attempts: int = 0
+    content_encoding: Optional[str] = None
+    checksum: Optional[str] = None
+    checksum_algorithm: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return self.bytes_resumed + self.bytes_written
+
+    @property
+    def bytes_per_second(self) -> float:
+        return (
+            self.bytes_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        )
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_per_second / (1024 * 1024)
+
+
+def _get_response_validator(headers) -> Optional[str]:
+    """Strong ETag, else Last-Modified: what ``If-Range`` can compare against."""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("last-modified")
+
+
+class _StreamSink:
+    """Adapts a file path, file-like object or (async) callback to ``write`` / ``restart``.
+
+    For path sinks the validator (ETag / Last-Modified) of the response that
+    started ``{path}.part`` is kept in ``{path}.part.validator``; a ``.part``
+    without one cannot be checked against the server and is discarded.
+    """
+
+    def __init__(self, sink, is_resume: bool = True):
+        self.path = None
+        self.part_path = None
+        self.validator_path = None
+        self.validator = None
+        self._file = None
+        self._is_close_file = False
+        self._callback = None
+
+        if isinstance(sink, (str, Path)):
+            self.path = Path(sink)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.part_path = self.path.with_name(f"{self.path.name}.part")
+            self.validator_path = self.path.with_name(
+                f"{self.path.name}.part.validator"
+            )
+
+            if is_resume and self.validator_path.exists():
+                self.validator = self.validator_path.read_text() or None
+
+            if not self.validator:
+                self.part_path.unlink(missing_ok=True)
+                self.validator_path.unlink(missing_ok=True)
+
+        elif hasattr(sink, "write"):
+            self._file = sink
+
+        elif callable(sink):
+            self._callback = sink
+
+        else:
+            raise TypeError(
+                f"sink must be a path, a file-like object or a callable, got {type(sink).__name__}"
+            )
+
+    @property
+    def existing_size(self) -> int:
+        """Bytes left in a ``.part`` file by an earlier run."""
+        if self.part_path and self.part_path.exists():
+            return self.part_path.stat().st_size
+        return 0
+
+    def iter_existing(self, block_size: int = 1024 * 1024):
+        if not self.existing_size:
+            return
+        with open(self.part_path, "rb") as f:
+            while block := f.read(block_size):
+                yield block
+
+    def set_validator(self, validator: Optional[str]) -> None:
+        """Record the validator of the response the sink now holds bytes of."""
+        self.validator = validator
+        if not self.validator_path:
+            return
+
+        if validator:
+            self.validator_path.write_text(validator)
+        else:
+            self.validator_path.unlink(missing_ok=True)
+
+    def open(self, offset: int) -> None:
+        if self.part_path:
+            self._file = open(self.part_path, "ab" if offset else "wb")
+            self._is_close_file = True
+
+    async def write(self, chunk: bytes) -> None:
+        if self._callback:
+            result = self._callback(chunk)
+            if inspect.isawaitable(result):
+                await result
+            return
+
+        self._file.write(chunk)
+
+    def restart(self) -> None:
+        """Discard what was written; the server ignored a ``Range`` request."""
+        if self.part_path:
+            return  # reopened with "wb" by ``open(0)``
+
+        if self._file and hasattr(self._file, "seek") and self._file.seekable():
+            self._file.seek(self._restart_position)
+            self._file.truncate()
+            return
+
+        raise GetDataError(
+            url=None,
+            message="server does not support Range requests and the sink cannot be rewound",
+        )
+
+    def mark_start(self) -> None:
+        self._restart_position = (
+            self._file.tell()
+            if self._file and hasattr(self._file, "tell") and self._file.seekable()
+            else 0
+        )
+
+    def close(self) -> None:
+        if self._is_close_file and self._file:
+            self._file.close()
+            self._file = None
+
+    def commit(self) -> None:
+        if self.part_path:
+            self.part_path.replace(self.path)
+            self.validator_path.unlink(missing_ok=True)
+
+
+def _build_stream_timeout(
+    timeout: float, read_timeout: Optional[float]
+) -> httpx.Timeout:
+    """``timeout`` bounds connect / write / pool; ``read_timeout`` the wait between chunks."""
+    return httpx.Timeout(timeout, read=read_timeout)
+
+
+@gated_log_call(
+    action_name="get_data_stream_to_sink",
+    level_name="client",
+    log_level="DEBUG",
+    config=LogDecoratorConfig(result_processor=ResponseGetDataProcessor()),
+)
+async def get_data_stream_to_sink(
+    url: str,
+    auth: dmda.DomoAuth,
+    sink: Any,
+    method: str = "GET",
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
+    is_gzip: bool = False,
+    is_resume: bool = True,
+    max_retry: int = 3,
+    checksum_algorithm: Optional[str] = None,
+    on_progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    context: RouteContext | None = None,
+    debug_api: bool = False,
+    timeout: float = DEFAULT_STREAM_TIMEOUT,
+    read_timeout: Optional[float] = DEFAULT_STREAM_READ_TIMEOUT,
+    parent_class: Optional[str] = None,
+    session: httpx.AsyncClient | None = None,
+    is_verify: bool = False,
+    is_follow_redirects: bool = True,
+) -> rgd.ResponseGetData:
+    """Stream a response body into ``sink`` chunk by chunk, without holding it in memory.
+
+    If the connection drops, the download continues from the bytes already
+    delivered with an HTTP ``Range`` request (up to ``max_retry`` times).  The
+    resumed request carries ``If-Range`` with the first response's ETag /
+    Last-Modified, so a body that changed on the server is sent again in full.
+    Servers that ignore ``Range`` (or answer with a different validator) restart
+    the body; the sink is rewound if it can be.
+
+    Args:
+        sink: Where chunks go as they arrive:
+
+            - a path: written to ``{path}.part`` and renamed once complete; with
+              ``is_resume`` a ``.part`` file left by an earlier run is continued,
+              only while the server still reports the same ETag / Last-Modified
+            - a binary file-like object (``write``; rewound on restart if seekable)
+            - a callable taking each ``bytes`` chunk, sync or async
+        is_gzip: Request ``Content-Encoding: gzip``.  Bytes are delivered exactly as
+            transferred (see ``DataStream_Result.content_encoding``)
+        checksum_algorithm: ``hashlib`` algorithm (e.g. ``"sha256"``) computed over
+            the complete body, resumed bytes included
+        on_progress: Called with ``(bytes_done, total_bytes or None)`` after each
+            chunk; may be async
+        timeout: Connect / write / pool timeout in seconds
+        read_timeout: Longest wait for the next chunk, in seconds (None waits forever)
+
+    Returns:
+        ResponseGetData whose ``response`` is a ``DataStream_Result``
+    """
+    if isinstance(context, RouteContext):
+        session = context.session or session
+        parent_class = context.parent_class or parent_class
+        debug_api = context.debug_api if context.debug_api is not None else debug_api
+
+    if debug_api:
+        message = f"[DEBUG] get_data_stream_to_sink: {method} {url}"
+        print(message)
+        await logger.debug(message)
+
+    if auth and not auth.token:
+        await auth.get_auth_token()
+
+    stream_sink = _StreamSink(sink, is_resume=is_resume)
+
+    headers = create_headers(
+        headers={
+            "Accept-Encoding": "gzip" if is_gzip else "identity",
+            **(headers or {}),
+        },
+        auth=auth,
+    )
+
+    request_metadata = rgd.RequestMetadata(
+        url=url, headers=headers, body=None, params=params
+    )
+    additional_information = {"parent_class": parent_class} if parent_class else {}
+
+    hasher = hashlib.new(checksum_algorithm) if checksum_algorithm else None
+
+    result = DataStream_Result(
+        path=stream_sink.path, checksum_algorithm=checksum_algorithm
+    )
+    result.bytes_resumed = stream_sink.existing_size
+    if hasher:
+        for block in stream_sink.iter_existing():
+            hasher.update(block)
+
+    stream_sink.mark_start()
+    start_time = time.perf_counter()
+    status = None
+
+    session, is_close_session = create_httpx_session(
+        session=session, is_verify=is_verify
+    )
+
+    def restart():
+        nonlocal hasher
+        stream_sink.restart()
+        result.bytes_resumed = result.bytes_written = 0
+        hasher = hashlib.new(checksum_algorithm) if hasher else None
+
+    try:
+        while True:
+            result.attempts += 1
+            offset = result.size
+
+            request_headers = dict(headers)
+            if offset:
+                request_headers["Range"] = f"bytes={offset}-"
+                if stream_sink.validator:
+                    request_headers["If-Range"] = stream_sink.validator
+
+            try:
+                async with session.stream(
+                    method,
+                    url=url,
+                    headers=request_headers,
+                    params=params,
+                    follow_redirects=is_follow_redirects,
+                    timeout=_build_stream_timeout(timeout, read_timeout),
+                ) as res:
+                    status = res.status_code
+
+                    if offset and status == 416:
+                        status = 206
+                        break  # the sink already holds the whole body
+
+                    if status not in (200, 206):
+                        return rgd.ResponseGetData(
+                            status=status,
+                            response=(await res.aread()).decode(errors="replace"),
+                            is_success=False,
+                            request_metadata=request_metadata,
+                            additional_information=additional_information,
+                        )
+
+                    response_validator = _get_response_validator(res.headers)
+
+                    if (
+                        status == 206
+                        and stream_sink.validator
+                        and response_validator
+                        and response_validator != stream_sink.validator
+                    ):
+                        # If-Range was ignored and the body changed; fetch it again
+                        restart()
+                        stream_sink.set_validator(None)
+                        continue
+
+                    if status == 200:
+                        if offset:
+                            # Range was ignored or the body changed; it starts over
+                            restart()
+                            offset = 0
+                        stream_sink.set_validator(response_validator)
+
+                    result.content_encoding = res.headers.get("content-encoding")
+                    content_length = res.headers.get("content-length")
+                    result.total_bytes = (
+                        offset + int(content_length) if content_length else None
+                    )
+
+                    stream_sink.open(offset)
+                    try:
+                        async for chunk in res.aiter_raw():
+                            await stream_sink.write(chunk)
+                            result.bytes_written += len(chunk)
+
+                            if hasher:
+                                hasher.update(chunk)
+
+                            if on_progress:
+                                progress = on_progress(result.size, result.total_bytes)
+                                if inspect.isawaitable(progress):
+                                    await progress
+                    finally:
+                        stream_sink.close()
+                break
+
+            except httpx.TransportError as e:
+                if result.attempts > max_retry:
+                    raise GetDataError(url=url, message=str(e)) from e
+
+                if debug_api:
+                    print(
+                        f"[DEBUG] get_data_stream_to_sink: {type(e).__name__} after {result.size} bytes, resuming"
+                    )
+
+        stream_sink.commit()
+        result.elapsed_seconds = time.perf_counter() - start_time
+        result.checksum = hasher.hexdigest() if hasher else None
+
+        return rgd.ResponseGetData(
+            status=status,
+            response=result,
+            is_success=True,
+            request_metadata=request_metadata,
+            additional_information=additional_information,
+        )
+
     finally:
         if is_close_session:
             await session.aclose()
 
 
+async def stream_to_file(
+    url: str,
+    auth: dmda.DomoAuth,
+    output_path: str | Path,
+    **kwargs,
+) -> rgd.ResponseGetData:
+    """``get_data_stream_to_sink`` into the file at ``output_path``."""
+    return await get_data_stream_to_sink(url=url, auth=auth, sink=output_path, **kwargs)
+
+
 class LooperError(DomoError):
     def __init__(self, loop_stage: str, message):
         super().__init__(message=f"{loop_stage} - {message}")
 
 
-@log_call(action_name="looper", level_name="client", log_level="DEBUG")
+@gated_log_call(action_name="looper", level_name="client", log_level="DEBUG")
 async def looper(
     auth: dmda.DomoAuth,
     session: httpx.AsyncClient | None = None,
@@ -463,104 +947,128 @@ async def looper(
 
     all_rows = []
     is_loop = True
+    pages = 0
 
     res: Optional[rgd.ResponseGetData] = None
 
+    recorder = client_metrics.start_request("looper", auth=auth, method=method, url=url)
+
     if maximum and maximum <= limit and not loop_until_end:
         limit = maximum
 
-    while is_loop:
-        params = fixed_params or {}
-
-        if offset_params_in_body:
-            if body is None:
-                body = {}
-            body.update(
-                {offset_params.get("offset"): skip, offset_params.get("limit"): limit}
-            )
+    try:
+        while is_loop:
+            params = fixed_params or {}
+
+            if offset_params_in_body:
+                if body is None:
+                    body = {}
+                body.update(
+                    {
+                        offset_params.get("offset"): skip,
+                        offset_params.get("limit"): limit,
+                    }
+                )
 
-        else:
-            params.update(
-                {offset_params.get("offset"): skip, offset_params.get("limit"): limit}
-            )
+            else:
+                params.update(
+                    {
+                        offset_params.get("offset"): skip,
+                        offset_params.get("limit"): limit,
+                    }
+                )
 
-        if body_fn:
-            try:
-                body = body_fn(skip, limit, body)
+            if body_fn:
+                try:
+                    body = body_fn(skip, limit, body)
 
-            except Exception as e:
-                await session.aclose()
+                except Exception as e:
+                    await session.aclose()
 
-                message = f"processing body_fn {str(e)}"
+                    message = f"processing body_fn {str(e)}"
 
-                raise LooperError(loop_stage=message, message=str(e)) from e
+                    raise LooperError(loop_stage=message, message=str(e)) from e
 
-        if debug_loop:
-            print(f"\n🚀 Retrieving records {skip} through {skip + limit} via {url}")
-            await logger.debug(
-                f"\n🚀 Retrieving records {skip} through {skip + limit} via {url}"
+            if debug_loop:
+                print(
+                    f"\n🚀 Retrieving records {skip} through {skip + limit} via {url}"
+                )
+                await logger.debug(
+                    f"\n🚀 Retrieving records {skip} through {skip + limit} via {url}"
+                )
+                # pprint(params)
+
+                message = {
+                    "action": "looper_request",
+                    "params": params,
+                    "body": body,
+                    "skip": skip,
+                    "limit": limit,
+                }
+
+            res = await get_data(
+                auth=auth,
+                url=url,
+                method=method,
+                params=params,
+                body=body,
+                timeout=timeout,
+                debug_api=debug_api,
+                debug_num_stacks_to_drop=debug_num_stacks_to_drop,
+                session=session,
+                context=context,
             )
-            # pprint(params)
+            pages += 1
 
-            message = {
-                "action": "looper_request",
-                "params": params,
-                "body": body,
-                "skip": skip,
-                "limit": limit,
-            }
+            if not res or not res.is_success:
+                if is_close_session:
+                    await session.aclose()
 
-        res = await get_data(
-            auth=auth,
-            url=url,
-            method=method,
-            params=params,
-            body=body,
-            timeout=timeout,
-            debug_api=debug_api,
-            debug_num_stacks_to_drop=debug_num_stacks_to_drop,
-            session=session,
-            context=context,
-        )
+                if recorder:
+                    recorder.finish(status=res.status if res else None, pages=pages)
 
-        if not res or not res.is_success:
-            if is_close_session:
-                await session.aclose()
+                return res or rgd.ResponseGetData(
+                    status=500, response="No response", is_success=False
+                )
 
-            return res or rgd.ResponseGetData(
-                status=500, response="No response", is_success=False
-            )
+            if return_raw:
+                if recorder:
+                    recorder.finish(status=res.status, pages=pages)
+                return res
 
-        if return_raw:
-            return res
+            try:
+                new_records = arr_fn(res)
 
-        try:
-            new_records = arr_fn(res)
+            except Exception as e:
+                await session.aclose()
 
-        except Exception as e:
-            await session.aclose()
+                raise LooperError(loop_stage="processing arr_fn", message=str(e)) from e
 
-            raise LooperError(loop_stage="processing arr_fn", message=str(e)) from e
+            all_rows += new_records
 
-        all_rows += new_records
+            if len(new_records) == 0:
+                is_loop = False
 
-        if len(new_records) == 0:
-            is_loop = False
+            if maximum and len(all_rows) >= maximum and not loop_until_end:
+                is_loop = False
 
-        if maximum and len(all_rows) >= maximum and not loop_until_end:
-            is_loop = False
+            message = f"🐛 Looper iteration complete: {{'all_rows': {len(all_rows)}, 'new_records': {len(new_records)}, 'skip': {skip}, 'limit': {limit}}}"
 
-        message = f"🐛 Looper iteration complete: {{'all_rows': {len(all_rows)}, 'new_records': {len(new_records)}, 'skip': {skip}, 'limit': {limit}}}"
+            if debug_loop:
+                print(message)
+                await logger.debug(message)
 
-        if debug_loop:
-            print(message)
-            await logger.debug(message)
+            if maximum and skip + limit > maximum and not loop_until_end:
+                limit = maximum - len(all_rows)
 
-        if maximum and skip + limit > maximum and not loop_until_end:
-            limit = maximum - len(all_rows)
+            skip += len(new_records)
+            time.sleep(wait_sleep)
 
-        skip += len(new_records)
-        time.sleep(wait_sleep)
+    except BaseException as e:
+        # LooperError, get_data errors and cancellation still close out the recorder
+        if recorder:
+            recorder.finish(status=res.status if res else None, pages=pages, error=e)
+        raise
 
     if debug_loop:
         message = f"\n🎉 Success - {len(all_rows)} records retrieved from {url} in query looper\n"
@@ -570,6 +1078,9 @@ async def looper(
     if is_close_session:
         await session.aclose()
 
+    if recorder:
+        recorder.finish(status=res.status if res else None, pages=pages)
+
     if not res:
         return rgd.ResponseGetData(
             status=500, response="No response received", is_success=False
@@ -618,6 +1129,13 @@ def route_function(func: Callable[..., Any]) -> Callable[..., Any]:
         param.kind == inspect.Parameter.VAR_KEYWORD for param in sig.parameters.values()
     )
 
+    # routes that still take session / debug settings as plain parameters
+    forwarded_context_params = [
+        name
+        for name in ("session", "debug_api", "debug_num_stacks_to_drop", "parent_class")
+        if name in sig.parameters
+    ]
+
     @wraps(func)
     async def wrapper(
         *args: Any,
@@ -655,7 +1173,29 @@ def route_function(func: Callable[..., Any]) -> Callable[..., Any]:
         if is_accepts_context:
             call_kwargs["context"] = context
 
-        result = await func(*args, **call_kwargs)
+        # forward only what the caller set, so the route's own defaults still apply
+        explicit_params = {
+            "session": context.session,
+            "parent_class": context.parent_class,
+        }
+        if context.debug_api is not False:
+            explicit_params["debug_api"] = context.debug_api
+        if context.debug_num_stacks_to_drop != 1:
+            explicit_params["debug_num_stacks_to_drop"] = (
+                context.debug_num_stacks_to_drop
+            )
+
+        for name in forwarded_context_params:
+            value = explicit_params.get(name)
+            if value is not None:
+                call_kwargs[name] = value
+
+        # label client metrics with the route name
+        route_token = client_metrics.current_route_name.set(func.__name__)
+        try:
+            result = await func(*args, **call_kwargs)
+        finally:
+            client_metrics.current_route_name.reset(route_token)
 
         if not isinstance(result, rgd.ResponseGetData):
             raise RouteFunctionResponseTypeError(result)
@@ -0,0 +1,444 @@
+"""Per-request metrics for the HTTP client.
+
+``get_data``, ``get_data_stream`` and ``looper`` report a ``RequestMetrics``
+record to every registered hook once a request (or pagination loop)
+finishes.  Records are labelled with the calling route function and the Domo
+instance.
+
+Phase timings come from httpcore's ``trace`` request extension, which works
+with caller-provided sessions (unlike session-level ``event_hooks``):
+
+- connect: TCP connect, including DNS resolution (httpcore does not time DNS separately)
+- tls: TLS handshake
+- send: writing request headers and body
+- server: request sent until response headers received (time to first byte)
+- transfer: reading the response body
+
+When no hooks are registered nothing is recorded and no trace callback is
+attached, so the request path is unchanged.
+
+Example:
+    >>> from domolibrary2.client import metrics
+    >>> registry = metrics.enable_metrics()
+    >>> await dataset_routes.get_dataset_by_id(auth=auth, dataset_id=...)
+    >>> print(registry.to_prometheus_text())
+    >>> registry.to_dataframe().head()  # slowest routes first
+
+    >>> # export each request as an OpenTelemetry span
+    >>> metrics.add_metrics_hook(metrics.OpenTelemetryMetricsHook())
+"""
+
+__all__ = [
+    "RequestMetrics",
+    "MetricsRegistry",
+    "OpenTelemetryMetricsHook",
+    "add_metrics_hook",
+    "remove_metrics_hook",
+    "enable_metrics",
+    "disable_metrics",
+    "current_route_name",
+]
+
+import time
+import warnings
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import httpx
+
+if TYPE_CHECKING:  # pandas is imported by to_dataframe, off the request path
+    import pandas as pd
+
+from ..utils.chunk_execution import current_retry_attempt
+
+# set by ``route_function`` so get_data can label requests with the calling route
+current_route_name: ContextVar[Optional[str]] = ContextVar(
+    "current_route_name", default=None
+)
+
+MetricsHook = Callable[["RequestMetrics"], None]
+
+_HOOKS: list[MetricsHook] = []
+
+# phase -> (start event, end event); event names have the httpcore prefix removed
+_PHASE_EVENTS = {
+    "connect": ("connect_tcp.started", "connect_tcp.complete"),
+    "tls": ("start_tls.started", "start_tls.complete"),
+    "send": ("send_request_headers.started", "send_request_body.complete"),
+    "server": ("send_request_body.complete", "receive_response_headers.complete"),
+    "transfer": ("receive_response_body.started", "receive_response_body.complete"),
+}
+
+PHASES = list(_PHASE_EVENTS)
+
+
+@dataclass
+class RequestMetrics:
+    """Metrics for one HTTP request or one ``looper`` pagination run."""
+
+    kind: str  # "get_data", "get_data_stream" or "looper"
+    route: Optional[str]
+    instance: Optional[str]
+    method: Optional[str]
+    url: Optional[str]
+    start_time_ns: int
+    end_time_ns: Optional[int] = None
+    status: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    pages: int = 0
+    timings: dict[str, float] = field(default_factory=dict)  # phase -> seconds
+    error: Optional[str] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        if self.end_time_ns is None:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    @property
+    def is_error(self) -> bool:
+        return self.error is not None or (self.status or 0) >= 400
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "route": self.route,
+            "instance": self.instance,
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "duration_seconds": self.duration_seconds,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "pages": self.pages,
+            **{f"{phase}_seconds": self.timings.get(phase) for phase in PHASES},
+            "error": self.error,
+        }
+
+
+def add_metrics_hook(hook: MetricsHook) -> MetricsHook:
+    """Register a callable that receives every ``RequestMetrics`` record."""
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
+    return hook
+
+
+def remove_metrics_hook(hook: MetricsHook) -> None:
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
+
+
+def enable_metrics(registry: Optional["MetricsRegistry"] = None) -> "MetricsRegistry":
+    """Register (and return) an in-process registry as a metrics hook."""
+    registry = registry or MetricsRegistry()
+    add_metrics_hook(registry)
+    return registry
+
+
+def disable_metrics() -> None:
+    """Remove all metrics hooks."""
+    _HOOKS.clear()
+
+
+class _RequestRecorder:
+    """Collects timings for a single request and emits them on ``finish``."""
+
+    def __init__(self, kind: str, auth: Any, method: Optional[str], url: Optional[str]):
+        self.metrics = RequestMetrics(
+            kind=kind,
+            route=current_route_name.get(),
+            instance=getattr(auth, "domo_instance", None),
+            method=method.upper() if method else None,
+            url=url,
+            start_time_ns=time.time_ns(),
+            retries=current_retry_attempt.get(),
+        )
+        self._perf_start = time.perf_counter()
+        self._events: dict[str, float] = {}
+
+    async def trace(self, event_name: str, info: dict) -> None:
+        """httpcore ``trace`` extension callback."""
+        # "connection.connect_tcp.started" -> "connect_tcp.started"
+        self._events[event_name.split(".", 1)[-1]] = time.perf_counter()
+
+    @property
+    def extensions(self) -> dict:
+        return {"trace": self.trace}
+
+    def finish(
+        self,
+        status: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        pages: int = 0,
+        error: Optional[BaseException] = None,
+    ) -> RequestMetrics:
+        metrics = self.metrics
+        metrics.end_time_ns = metrics.start_time_ns + int(
+            (time.perf_counter() - self._perf_start) * 1e9
+        )
+        metrics.status = status
+        metrics.bytes_sent = bytes_sent
+        metrics.bytes_received = bytes_received
+        metrics.pages = pages
+        metrics.error = f"{type(error).__name__}: {error}" if error else None
+
+        for phase, (start_event, end_event) in _PHASE_EVENTS.items():
+            if start_event in self._events and end_event in self._events:
+                metrics.timings[phase] = max(
+                    self._events[end_event] - self._events[start_event], 0.0
+                )
+
+        for hook in list(_HOOKS):
+            try:
+                hook(metrics)
+            except Exception as e:  # a broken hook must not fail the request
+                warnings.warn(f"metrics hook {hook!r} failed: {e}")
+
+        return metrics
+
+
+def start_request(
+    kind: str, auth: Any = None, method: Optional[str] = None, url: Optional[str] = None
+) -> Optional[_RequestRecorder]:
+    """Return a recorder for a request, or None when no hooks are registered."""
+    if not _HOOKS:
+        return None
+    return _RequestRecorder(kind=kind, auth=auth, method=method, url=url)
+
+
+def response_bytes(response: Any) -> tuple[int, int]:
+    """Return (bytes_sent, bytes_received) for an httpx response."""
+    try:
+        bytes_sent = int(response.request.headers.get("content-length") or 0)
+    except (RuntimeError, ValueError):
+        bytes_sent = 0
+
+    # num_bytes_downloaded is the on-the-wire size; transports that hand back
+    # pre-built content (e.g. MockTransport) leave it at 0
+    bytes_received = getattr(response, "num_bytes_downloaded", 0)
+    if not bytes_received:
+        try:
+            bytes_received = len(response.content)
+        except httpx.ResponseNotRead:
+            bytes_received = 0
+
+    return bytes_sent, bytes_received
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+@dataclass
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+    maximum: float = 0.0
+
+    def __post_init__(self):
+        self.counts = self.counts or [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        self.maximum = max(self.maximum, value)
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+
+
+class MetricsRegistry:
+    """Prometheus-style in-process registry of request metrics.
+
+    Counters and a duration histogram are kept per ``route`` / ``instance``
+    label set.  Use as a metrics hook (``enable_metrics`` registers one).
+    """
+
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix="domolibrary"
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.reset()
+
+    def reset(self) -> None:
+        self._counters: dict[str, dict[tuple, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._histograms: dict[tuple, _Histogram] = {}
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        self.observe(metrics)
+
+    def observe(self, metrics: RequestMetrics) -> None:
+        labels = (
+            ("route", metrics.route or ""),
+            ("instance", metrics.instance or ""),
+            ("kind", metrics.kind),
+        )
+
+        self._inc(
+            "http_requests_total",
+            labels
+            + (("method", metrics.method or ""), ("status", str(metrics.status or ""))),
+        )
+        if metrics.is_error:
+            self._inc("http_request_errors_total", labels)
+
+        self._inc("http_bytes_sent_total", labels, metrics.bytes_sent)
+        self._inc("http_bytes_received_total", labels, metrics.bytes_received)
+        self._inc("http_retries_total", labels, metrics.retries)
+        self._inc("http_pages_total", labels, metrics.pages)
+
+        for phase, seconds in metrics.timings.items():
+            self._inc("http_phase_seconds_total", labels + (("phase", phase),), seconds)
+
+        histogram = self._histograms.get(labels)
+        if histogram is None:
+            histogram = self._histograms[labels] = _Histogram(buckets=self.buckets)
+        histogram.observe(metrics.duration_seconds)
+
+    def _inc(self, name: str, labels: tuple, value: float = 1) -> None:
+        if value:
+            self._counters[name][labels] += value
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """Sum a counter across every label set matching ``labels``."""
+        return sum(
+            value
+            for label_set, value in self._counters.get(name, {}).items()
+            if all(dict(label_set).get(k) == v for k, v in labels.items())
+        )
+
+    def to_prometheus_text(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+
+        for name, series in sorted(self._counters.items()):
+            full_name = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {full_name} counter")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{full_name}{_format_labels(labels)} {value:g}")
+
+        full_name = f"{self.prefix}_http_request_duration_seconds"
+        lines.append(f"# TYPE {full_name} histogram")
+        for labels, histogram in sorted(self._histograms.items()):
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                bucket_labels = labels + (("le", f"{bound:g}"),)
+                lines.append(
+                    f"{full_name}_bucket{_format_labels(bucket_labels)} {count}"
+                )
+            inf_labels = labels + (("le", "+Inf"),)
+            lines.append(
+                f"{full_name}_bucket{_format_labels(inf_labels)} {histogram.count}"
+            )
+            lines.append(f"{full_name}_sum{_format_labels(labels)} {histogram.total:g}")
+            lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Summarize per route / instance / kind, slowest total time first."""
+        import pandas as pd
+
+        rows = []
+        for labels, histogram in self._histograms.items():
+            label_dict = dict(labels)
+
+            def counter(name, labels=labels):
+                return self._counters.get(name, {}).get(labels, 0)
+
+            rows.append(
+                {
+                    **label_dict,
+                    "requests": histogram.count,
+                    "errors": int(counter("http_request_errors_total")),
+                    "total_seconds": histogram.total,
+                    "mean_seconds": histogram.total / histogram.count,
+                    "max_seconds": histogram.maximum,
+                    "bytes_sent": int(counter("http_bytes_sent_total")),
+                    "bytes_received": int(counter("http_bytes_received_total")),
+                    "retries": int(counter("http_retries_total")),
+                    "pages": int(counter("http_pages_total")),
+                    **{
+                        f"{phase}_seconds": self.get_counter(
+                            "http_phase_seconds_total", phase=phase, **label_dict
+                        )
+                        for phase in PHASES
+                    },
+                }
+            )
+
+        columns = ["route", "instance", "kind", "requests", "errors", "total_seconds"]
+        if not rows:
+            return pd.DataFrame(columns=columns)
+
+        return (
+            pd.DataFrame(rows)
+            .sort_values("total_seconds", ascending=False)
+            .reset_index(drop=True)
+        )
+
+
+class OpenTelemetryMetricsHook:
+    """Metrics hook that exports each record as an OpenTelemetry span.
+
+    Requires ``opentelemetry-api`` (and an SDK/exporter configured by the caller).
+    """
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace
+            from opentelemetry.trace import Status, StatusCode
+        except ImportError as e:
+            raise ImportError(
+                "opentelemetry-api is required for OpenTelemetryMetricsHook "
+                "(pip install opentelemetry-api)"
+            ) from e
+
+        self._tracer = tracer or trace.get_tracer("domolibrary2")
+        self._error_status = Status(StatusCode.ERROR)
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        attributes = {
+            "domo.route": metrics.route or "",
+            "domo.instance": metrics.instance or "",
+            "domo.kind": metrics.kind,
+            "http.request.method": metrics.method or "",
+            "url.full": metrics.url or "",
+            "http.request.body.size": metrics.bytes_sent,
+            "http.response.body.size": metrics.bytes_received,
+            "domo.retries": metrics.retries,
+            "domo.pages": metrics.pages,
+            **{
+                f"domo.{phase}_seconds": value
+                for phase, value in metrics.timings.items()
+            },
+        }
+        if metrics.status is not None:
+            attributes["http.response.status_code"] = metrics.status
+
+        span = self._tracer.start_span(
+            name=f"{metrics.kind} {metrics.route or metrics.method}",
+            start_time=metrics.start_time_ns,
+            attributes=attributes,
+        )
+        if metrics.is_error:
+            span.set_status(self._error_status)
+        span.end(end_time=metrics.end_time_ns)
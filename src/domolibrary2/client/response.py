@@ -1,14 +1,76 @@
 """preferred response class for all API requests"""
 
-__all__ = ["STREAM_FILE_PATH", "ResponseGetData", "find_ip", "RequestMetadata"]
-
+__all__ = [
+    "STREAM_FILE_PATH",
+    "ResponseGetData",
+    "ResponseGetData_Lazy",
+    "find_ip",
+    "RequestMetadata",
+    "json_loads",
+    "set_json_loads",
+]
+
+import json
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import httpx
-import requests
-from bs4 import BeautifulSoup
+
+if TYPE_CHECKING:  # requests / bs4 are only needed by the helpers that use them
+    import requests
+
+try:
+    import orjson
+
+    def _orjson_loads(data: bytes | str) -> Any:
+        """``orjson.loads``, falling back to ``json.loads`` for input orjson rejects.
+
+        The stdlib also accepts NaN / Infinity.  Some orjson versions read
+        integers wider than 64 bits as floats; call ``set_json_loads(json.loads)``
+        where such ids must stay exact.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    _DEFAULT_JSON_LOADS: Callable[[bytes | str], Any] = _orjson_loads
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    _DEFAULT_JSON_LOADS = json.loads
+
+_json_loads = _DEFAULT_JSON_LOADS
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON with the configured backend (orjson when available)."""
+    return _json_loads(data)
+
+
+def set_json_loads(loads: Optional[Callable[[bytes | str], Any]] = None) -> None:
+    """Set the JSON decoder used for API responses.
+
+    Args:
+        loads: Callable accepting bytes or str and raising ValueError on invalid
+            JSON (e.g. ``json.loads``, ``orjson.loads``); None restores the default
+    """
+    global _json_loads
+    _json_loads = loads or _DEFAULT_JSON_LOADS
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    return "json" in content_type
+
+
+def _decode_body(content: bytes, content_type: str, encoding: Optional[str]) -> Any:
+    """Decode a response body once: JSON straight from bytes, otherwise text."""
+    if _is_json_content_type(content_type):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass  # Keep as text if JSON parse fails
+
+    return content.decode(encoding or "utf-8", errors="replace")
 
 
 @dataclass
@@ -57,7 +119,7 @@ class ResponseGetData:
     @classmethod
     def from_requests_response(
         cls,
-        res: requests.Response,
+        res: "requests.Response",
         request_metadata: Optional[RequestMetadata] = None,
         additional_information: Optional[dict] = None,
     ) -> "ResponseGetData":
@@ -94,8 +156,14 @@ class ResponseGetData:
         res: httpx.Response,
         request_metadata: Optional[RequestMetadata] = None,
         additional_information: Optional[dict] = None,
+        is_lazy: bool = False,
     ) -> "ResponseGetData":
-        """returns ResponseGetData from httpx.Response"""
+        """returns ResponseGetData from httpx.Response
+
+        The body is decoded once from bytes (JSON via the ``set_json_loads``
+        backend).  With ``is_lazy=True`` the raw bytes are kept and decoded on
+        first access of ``.response``.
+        """
 
         # Check if response is successful
         ok = 200 <= res.status_code <= 399
@@ -103,17 +171,19 @@ class ResponseGetData:
         if ok:
             content_type = res.headers.get("Content-Type", "")
 
-            # Try to parse as JSON if content type indicates it
-            response = res.text  # Default to text
-            if "application/json" in content_type:
-                try:
-                    response = res.json()
-                except ValueError:
-                    pass  # Keep as text if JSON parse fails
+            if is_lazy:
+                return ResponseGetData_Lazy.from_content(
+                    status=res.status_code,
+                    content=res.content,
+                    content_type=content_type,
+                    encoding=res.encoding,
+                    request_metadata=request_metadata,
+                    additional_information=additional_information,
+                )
 
             return cls(
                 status=res.status_code,
-                response=response,
+                response=_decode_body(res.content, content_type, res.encoding),
                 is_success=True,
                 additional_information=additional_information,
                 request_metadata=request_metadata,
@@ -146,6 +216,66 @@ class ResponseGetData:
         return res
 
 
+class ResponseGetData_Lazy(ResponseGetData):
+    """ResponseGetData that keeps the raw body and decodes it on first access.
+
+    Useful for multi-MB payloads that are passed through or written to disk
+    without being inspected.  ``raw_content`` stays available after decoding.
+    """
+
+    raw_content: Optional[bytes] = None
+    _value: Any = None
+    _pending: Optional[tuple[bytes, str, Optional[str]]] = None
+
+    @classmethod
+    def from_content(
+        cls,
+        status: int,
+        content: bytes,
+        content_type: str = "",
+        encoding: Optional[str] = None,
+        request_metadata: Optional[RequestMetadata] = None,
+        additional_information: Optional[dict] = None,
+    ) -> "ResponseGetData_Lazy":
+        res = cls(
+            status=status,
+            response=None,
+            is_success=True,
+            request_metadata=request_metadata,
+            additional_information=additional_information,
+        )
+        res.raw_content = content
+        res._pending = (content, content_type, encoding)
+        return res
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._pending is None
+
+    @property
+    def response(self) -> Any:
+        if self._pending is not None:
+            self._value = _decode_body(*self._pending)
+            self._pending = None
+        return self._value
+
+    @response.setter
+    def response(self, value: Any) -> None:
+        self._value = value
+        self._pending = None
+
+    def __repr__(self) -> str:
+        if self._pending is None:
+            return super().__repr__()
+
+        # repr must not force decoding (asyncio and debuggers repr task results)
+        return (
+            f"{self.__class__.__name__}(status={self.status!r}, "
+            f"response=<{len(self._pending[0])} bytes, not decoded>, "
+            f"is_success={self.is_success!r}, request_metadata={self.request_metadata!r})"
+        )
+
+
 def find_ip(html: str, html_tag: str = "p") -> Optional[str]:
     """Extract IP address from HTML content.
 
@@ -156,6 +286,8 @@ def find_ip(html: str, html_tag: str = "p") -> Optional[str]:
     Returns:
         IP address string if found, None otherwise
     """
+    from bs4 import BeautifulSoup
+
     ip_address_regex = r"(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
     soup = BeautifulSoup(html, "html.parser")
 
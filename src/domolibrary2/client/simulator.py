@@ -0,0 +1,1224 @@
+"""Offline Domo API simulator.
+
+``DomoApiSimulator`` answers the paginated endpoints the client leans on from
+seeded, generated data through an ``httpx.MockTransport``, so loopers, query
+paging, uploads, page crawls and lineage traversal can be exercised -- and
+benchmarked -- without a Domo instance.  Latency, error rate, 429 throttling
+and data volume are configurable; the same seed always yields the same data
+and the same failure sequence.
+
+Simulated endpoints (under ``https://{domo_instance}.domo.com``):
+
+- POST ``/api/search/v1/query`` (datacenter search)
+- GET ``/api/content/v2/users``, POST ``/api/identity/v1/users/search``
+- GET ``/api/content/v2/groups/grouplist``, GET ``/api/content/v2/groups/users``,
+  PUT ``/api/content/v2/groups/access``
+- POST ``/api/query/v1/execute/{dataset_id}``, GET ``/api/query/v1/export/{dataset_id}``
+  (CSV; honours ``Accept-Encoding: gzip``, ``Range`` and ``If-Range``)
+- POST ``/api/files/v1/filesets/{fileset_id}/files/search`` (one directory, paged),
+  GET ``/api/files/v1/filesets/{fileset_id}/files/{file_id}/download``
+- GET ``/api/executor/v1/applications/``, GET ``/api/executor/v2/applications/{application_id}/jobs``,
+  POST ``/api/executor/v1/applications/{application_id}/jobs``
+- GET ``/api/query/v1/byos/accounts/{integration_id}/databases[/{database}/schemas[/{schema}/objects]]``
+  (paged with ``page`` / ``rows``), GET ``/api/query/migration/integrations/datasource/{dataset_id}``
+- GET ``/api/audit/v1/user-audits[/objectTypes/{object_type}]``
+- POST ``/api/content/v1/pages/adminsummary``, POST ``/api/content/v2/cards/adminsummary``
+- GET ``/api/content/v3/stacks/{page_id}/cards``
+- GET ``/api/data/v1/lineage/{entity_type}/{entity_id}``
+- POST / PUT ``/api/data/v3/datasources/{dataset_id}/uploads[/{upload_id}/parts/{part_id}|/commit]``
+- POST ``/api/data/v3/datasources/{dataset_id}/indexes``
+- POST ``/api/query/v1/datasources/{dataset_id}/partition/list``, DELETE
+  ``.../tag/{partition_id}/data`` and ``.../partition/{partition_id}``
+
+Example:
+    >>> simulator = DomoApiSimulator(n_users=5_000, latency=0.02, rate_limit_every=50)
+    >>> async with simulator.session() as session:
+    ...     res = await user_routes.search_users(auth=simulator.auth, body={}, session=session)
+    >>> simulator.stats.requests, simulator.stats.rate_limited
+
+    >>> # route every request that does not pass a session through the simulator
+    >>> with simulator.install():
+    ...     await group_routes.get_all_groups(auth=simulator.auth)
+
+    >>> result = run_benchmark(crawl_pages, simulator=simulator)
+    >>> result.requests_per_second, result.peak_memory_bytes
+"""
+
+__all__ = [
+    "DomoApiSimulator",
+    "DomoApiSimulator_Auth",
+    "DomoApiSimulator_Stats",
+    "SimulatorBenchmark_Result",
+    "run_benchmark",
+]
+
+import asyncio
+import bisect
+import datetime as dt
+import gzip
+import hashlib
+import random
+import re
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from . import (
+    get_data as gd,
+    response as rgd,
+)
+
+ACTIVITY_OBJECT_TYPES = ["DATASET", "CARD", "PAGE", "DATAFLOW", "USER", "GROUP"]
+ACTIVITY_ACTION_TYPES = ["VIEWED", "UPDATED", "CREATED", "DELETED", "SHARED"]
+
+_SQL_LIMIT_RE = re.compile(r"\blimit\s+(\d+)", re.IGNORECASE)
+_SQL_OFFSET_RE = re.compile(r"\boffset\s+(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class DomoApiSimulator_Auth:
+    """Minimal auth object accepted by route functions when talking to the simulator."""
+
+    domo_instance: str = "simulated"
+    token: str = "simulated-token"
+
+    @property
+    def auth_header(self) -> dict:
+        return {"x-domo-developer-token": self.token}
+
+
+@dataclass
+class DomoApiSimulator_Stats:
+    """Counters for what the simulator served."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    bytes_uploaded: int = 0
+    bytes_downloaded: int = 0
+    by_endpoint: Counter = field(default_factory=Counter)
+
+    def reset(self) -> None:
+        self.requests = self.errors = self.rate_limited = 0
+        self.bytes_uploaded = self.bytes_downloaded = 0
+        self.by_endpoint.clear()
+
+
+class _DroppingStream(httpx.AsyncByteStream):
+    """Response body that raises ``httpx.ReadError`` after ``drop_after`` bytes."""
+
+    def __init__(self, content: bytes, drop_after: int, chunk_size: int = 64 * 1024):
+        self.content = content
+        self.drop_after = drop_after
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        limit = self.drop_after or len(self.content)
+        for start in range(0, min(limit, len(self.content)), self.chunk_size):
+            yield self.content[start : min(start + self.chunk_size, limit)]
+
+        if limit < len(self.content):
+            raise httpx.ReadError("simulated dropped connection")
+
+
+def _page(items: list, offset: Any, limit: Any) -> list:
+    offset = int(offset or 0)
+    limit = int(limit) if limit not in (None, "") else len(items)
+    return items[offset : offset + limit]
+
+
+def _json_body(request: httpx.Request) -> dict:
+    if not request.content:
+        return {}
+    return rgd.json_loads(request.content) or {}
+
+
+@dataclass
+class DomoApiSimulator:
+    """Deterministic, in-process stand-in for the Domo endpoints ``get_data`` pages through.
+
+    Args:
+        domo_instance: Instance name the simulator answers for; other hosts get a 404
+        n_users / n_groups / n_search_objects / n_pages / n_cards: Listing sizes
+        n_activity_events: Activity-log events spread evenly over
+            ``[activity_start, activity_end)`` (epoch ms)
+        n_dataset_rows / n_dataset_columns: Shape of every queried / exported dataset
+        export_drop_after: Export responses drop the connection after this many
+            bytes (0 disables), to exercise resumed downloads
+        n_lineage_datasets / lineage_fanout: Size and branching of the lineage DAG;
+            dataset ``ds-k`` is produced by dataflow ``df-k`` from datasets
+            ``ds-{k * fanout + 1}`` .. ``ds-{k * fanout + fanout}``
+        latency / latency_jitter: Seconds slept per request (uniform jitter added)
+        error_rate: Share of requests answered with a 500
+        rate_limit_every: Every Nth request is answered with a 429 (0 disables)
+        retry_after: ``Retry-After`` header sent with 429s, in seconds
+        fileset_depth / fileset_fanout / n_fileset_files: Shape of every fileset;
+            each directory holds ``n_fileset_files`` files and, above
+            ``fileset_depth``, ``fileset_fanout`` subdirectories
+        n_applications / n_application_jobs: Applications and jobs per application;
+            job ``k`` of application ``a`` runs daily at ``(a + k) % 6``:00 or :30
+        n_warehouse_databases / n_warehouse_schemas / n_warehouse_tables: Shape of
+            every Cloud Amplifier integration's catalog (schemas per database,
+            tables per schema); collision checks for ``ds-k`` with ``k % 4 == 0``
+            return 400 (no federated metadata)
+        n_partitions / partition_end_date: Every dataset starts with one daily
+            partition (``YYYY-MM-DD``) per day up to ``partition_end_date``
+        seed: Seed for generated data, jitter and error sampling
+    """
+
+    domo_instance: str = "simulated"
+
+    n_users: int = 1_000
+    n_groups: int = 50
+    n_search_objects: int = 1_000
+    n_pages: int = 500
+    n_cards: int = 1_000
+    n_activity_events: int = 5_000
+    activity_start: int = 1_700_000_000_000
+    activity_end: int = 1_700_086_400_000
+    n_dataset_rows: int = 10_000
+    n_dataset_columns: int = 5
+    export_drop_after: int = 0
+    n_lineage_datasets: int = 100
+    lineage_fanout: int = 2
+    fileset_depth: int = 2
+    fileset_fanout: int = 3
+    n_fileset_files: int = 5
+    n_applications: int = 3
+    n_application_jobs: int = 20
+    n_warehouse_databases: int = 2
+    n_warehouse_schemas: int = 3
+    n_warehouse_tables: int = 10
+    n_partitions: int = 365
+    partition_end_date: dt.date = dt.date(2024, 12, 31)
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_every: int = 0
+    retry_after: float = 1.0
+    seed: int = 0
+
+    stats: DomoApiSimulator_Stats = field(default_factory=DomoApiSimulator_Stats)
+
+    _rng: random.Random = field(init=False, repr=False)
+    _cache: dict = field(init=False, repr=False, default_factory=dict)
+    _uploads: dict = field(init=False, repr=False, default_factory=dict)
+    _partitions: dict = field(init=False, repr=False, default_factory=dict)
+    _group_members: dict = field(init=False, repr=False, default_factory=dict)
+    _application_jobs: dict = field(init=False, repr=False, default_factory=dict)
+    _warehouse_tables: dict = field(init=False, repr=False, default_factory=dict)
+    _fileset_versions: Counter = field(init=False, repr=False, default_factory=Counter)
+    _routes: list = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+
+        self._routes = [
+            ("POST", r"/api/search/v1/query", self._search_datacenter),
+            ("GET", r"/api/content/v2/users", self._get_all_users),
+            ("POST", r"/api/identity/v1/users/search", self._search_users),
+            ("GET", r"/api/content/v2/groups/grouplist", self._get_all_groups),
+            ("GET", r"/api/content/v2/groups/users", self._get_group_membership),
+            ("PUT", r"/api/content/v2/groups/access", self._update_group_membership),
+            ("POST", r"/api/query/v1/execute/(?P<dataset_id>[^/]+)", self._query),
+            ("GET", r"/api/query/v1/export/(?P<dataset_id>[^/]+)", self._export),
+            (
+                "POST",
+                r"/api/files/v1/filesets/(?P<fileset_id>[^/]+)/files/search",
+                self._search_fileset_files,
+            ),
+            (
+                "GET",
+                r"/api/files/v1/filesets/(?P<fileset_id>[^/]+)/files/(?P<file_id>[^/]+)/download",
+                self._download_fileset_file,
+            ),
+            (
+                "GET",
+                r"/api/query/v1/byos/accounts/(?P<integration_id>[^/]+)/databases",
+                self._get_warehouse_databases,
+            ),
+            (
+                "GET",
+                r"/api/query/v1/byos/accounts/(?P<integration_id>[^/]+)/databases/(?P<database>[^/]+)/schemas",
+                self._get_warehouse_schemas,
+            ),
+            (
+                "GET",
+                r"/api/query/v1/byos/accounts/(?P<integration_id>[^/]+)/databases/(?P<database>[^/]+)/schemas/(?P<schema>[^/]+)/objects",
+                self._get_warehouse_tables,
+            ),
+            (
+                "GET",
+                r"/api/query/migration/integrations/datasource/(?P<dataset_id>[^/]+)",
+                self._check_colliding_datasource,
+            ),
+            ("GET", r"/api/executor/v1/applications/?", self._get_applications),
+            (
+                "GET",
+                r"/api/executor/v2/applications/(?P<application_id>[^/]+)/jobs",
+                self._get_application_jobs,
+            ),
+            (
+                "POST",
+                r"/api/executor/v1/applications/(?P<application_id>[^/]+)/jobs",
+                self._create_application_job,
+            ),
+            (
+                "GET",
+                r"/api/audit/v1/user-audits(?:/objectTypes/(?P<object_type>[^/]+))?",
+                self._activity_log,
+            ),
+            ("POST", r"/api/content/v1/pages/adminsummary", self._pages_adminsummary),
+            ("POST", r"/api/content/v2/cards/adminsummary", self._cards_adminsummary),
+            ("GET", r"/api/content/v3/stacks/(?P<page_id>[^/]+)/cards", self._page),
+            (
+                "GET",
+                r"/api/data/v1/lineage/(?P<entity_type>[^/]+)/(?P<entity_id>[^/]+)",
+                self._lineage,
+            ),
+            (
+                "POST",
+                r"/api/data/v3/datasources/(?P<dataset_id>[^/]+)/uploads",
+                self._upload_start,
+            ),
+            (
+                "PUT",
+                r"/api/data/v3/datasources/(?P<dataset_id>[^/]+)/uploads/(?P<upload_id>[^/]+)/parts/(?P<part_id>[^/]+)",
+                self._upload_part,
+            ),
+            (
+                "PUT",
+                r"/api/data/v3/datasources/(?P<dataset_id>[^/]+)/uploads/(?P<upload_id>[^/]+)/commit",
+                self._upload_commit,
+            ),
+            (
+                "POST",
+                r"/api/data/v3/datasources/(?P<dataset_id>[^/]+)/indexes",
+                self._index,
+            ),
+            (
+                "POST",
+                r"/api/query/v1/datasources/(?P<dataset_id>[^/]+)/partition/list",
+                self._list_partitions,
+            ),
+            (
+                "DELETE",
+                r"/api/query/v1/datasources/(?P<dataset_id>[^/]+)/tag/(?P<partition_id>[^/]+)/data",
+                self._delete_partition_data,
+            ),
+            (
+                "DELETE",
+                r"/api/query/v1/datasources/(?P<dataset_id>[^/]+)/partition/(?P<partition_id>[^/]+)",
+                self._delete_partition,
+            ),
+        ]
+        self._routes = [
+            (method, re.compile(f"{pattern}$"), handler)
+            for method, pattern, handler in self._routes
+        ]
+
+    @property
+    def auth(self) -> DomoApiSimulator_Auth:
+        return DomoApiSimulator_Auth(domo_instance=self.domo_instance)
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def session(self, **client_kwargs) -> httpx.AsyncClient:
+        """An ``httpx.AsyncClient`` wired to the simulator."""
+        return httpx.AsyncClient(transport=self.transport, **client_kwargs)
+
+    @contextmanager
+    def install(self):
+        """Route requests made without an explicit session through the simulator."""
+        previous_transport = gd.get_default_transport()
+        gd.set_default_transport(self.transport)
+        try:
+            yield self
+        finally:
+            gd.set_default_transport(previous_transport)
+
+    # ------------------------------------------------------------------
+    # generated data (built once per simulator, on first use)
+    # ------------------------------------------------------------------
+
+    def _cached(self, key: str, build_fn: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._cache[key] = build_fn()
+        return self._cache[key]
+
+    @property
+    def users(self) -> list[dict]:
+        return self._cached(
+            "users",
+            lambda: [
+                {
+                    "id": user_id,
+                    "displayName": f"User {user_id}",
+                    "emailAddress": f"user{user_id}@{self.domo_instance}.com",
+                    "roleId": 1 + user_id % 3,
+                }
+                for user_id in range(1, self.n_users + 1)
+            ],
+        )
+
+    @property
+    def groups(self) -> list[dict]:
+        return self._cached(
+            "groups",
+            lambda: [
+                {
+                    "groupId": group_id,
+                    "name": f"Group {group_id}",
+                    "groupType": "open",
+                    "memberCount": len(self.get_group_users(group_id)),
+                }
+                for group_id in range(1, self.n_groups + 1)
+            ],
+        )
+
+    def get_group_users(self, group_id: int) -> list[dict]:
+        """Users ``u`` with ``u % n_groups == group_id % n_groups``, until updated."""
+        group_id = int(group_id)
+        if group_id in self._group_members:
+            return self._group_members[group_id]
+
+        if not 1 <= group_id <= self.n_groups:
+            return []
+
+        return self.users[group_id - 1 :: self.n_groups]
+
+    @property
+    def search_objects(self) -> list[dict]:
+        return self._cached(
+            "search_objects",
+            lambda: [
+                {
+                    "databaseId": f"ds-{index}",
+                    "entityType": "DATASET",
+                    "name": f"Dataset {index}",
+                    "ownedById": 1 + index % max(self.n_users, 1),
+                    "rowCount": self.n_dataset_rows,
+                }
+                for index in range(self.n_search_objects)
+            ],
+        )
+
+    @property
+    def pages(self) -> list[dict]:
+        return self._cached(
+            "pages",
+            lambda: [
+                {
+                    "pageId": page_id,
+                    "pageTitle": f"Page {page_id:06d}",
+                    "parentPageId": page_id // 10 if page_id >= 10 else None,
+                    "ownerId": 1 + page_id % max(self.n_users, 1),
+                    "cardCount": 1 + page_id % 5,
+                }
+                for page_id in range(1, self.n_pages + 1)
+            ],
+        )
+
+    @property
+    def cards(self) -> list[dict]:
+        return self._cached(
+            "cards",
+            lambda: [
+                {
+                    "id": card_id,
+                    "title": f"Card {card_id}",
+                    "type": "kpi",
+                    "pageId": 1 + card_id % max(self.n_pages, 1),
+                    "datasources": [
+                        {"dataSourceId": f"ds-{card_id % self.n_search_objects}"}
+                    ],
+                }
+                for card_id in range(1, self.n_cards + 1)
+            ],
+        )
+
+    @property
+    def activity_events(self) -> list[dict]:
+        def build():
+            step = (self.activity_end - self.activity_start) / max(
+                self.n_activity_events, 1
+            )
+            return [
+                {
+                    "time": int(self.activity_start + index * step),
+                    "userId": 1 + index % max(self.n_users, 1),
+                    "objectType": ACTIVITY_OBJECT_TYPES[
+                        index % len(ACTIVITY_OBJECT_TYPES)
+                    ],
+                    "objectId": str(index % 97),
+                    "actionType": ACTIVITY_ACTION_TYPES[
+                        index % len(ACTIVITY_ACTION_TYPES)
+                    ],
+                    "eventId": f"event-{index}",
+                }
+                for index in range(self.n_activity_events)
+            ]
+
+        return self._cached("activity_events", build)
+
+    @property
+    def fileset_directories(self) -> dict[str, list[dict]]:
+        """Immediate children of every fileset directory, keyed by directory path."""
+
+        def build():
+            directories = {}
+            n_files = 0
+            pending = [("", 0)]
+            while pending:
+                directory_path, depth = pending.pop(0)
+                prefix = f"{directory_path}/" if directory_path else ""
+                children = []
+
+                for index in range(1, self.n_fileset_files + 1):
+                    n_files += 1
+                    children.append(
+                        {
+                            "id": f"file-{n_files}",
+                            "name": f"file_{index}.txt",
+                            "path": f"{prefix}file_{index}.txt",
+                            "fileType": "FILE",
+                        }
+                    )
+
+                if depth < self.fileset_depth:
+                    for index in range(1, self.fileset_fanout + 1):
+                        path = f"{prefix}dir_{index}"
+                        children.append(
+                            {
+                                "id": f"dir-{path.replace('/', '-')}",
+                                "name": f"dir_{index}",
+                                "path": path,
+                                "fileType": "DIRECTORY",
+                            }
+                        )
+                        pending.append((path, depth + 1))
+
+                directories[directory_path] = children
+            return directories
+
+        return self._cached("fileset_directories", build)
+
+    def get_fileset_file_content(self, file_id: str) -> bytes:
+        """Body of ``file_id``; changes every time the file is updated."""
+        version = self._fileset_versions[file_id]
+        line = f"{file_id} version {version}\n".encode()
+        return line * (1 + int(file_id.rsplit("-", 1)[-1]) % 50)
+
+    def update_fileset_file(self, file_id: str) -> None:
+        """Modify a fileset file, as a user re-uploading it would."""
+        self._fileset_versions[file_id] += 1
+
+    @property
+    def warehouse_databases(self) -> list[str]:
+        return [f"DB_{index}" for index in range(1, self.n_warehouse_databases + 1)]
+
+    def get_warehouse_schemas(self, database: str) -> list[str]:
+        if database not in self.warehouse_databases:
+            return []
+        return [f"SCHEMA_{index}" for index in range(1, self.n_warehouse_schemas + 1)]
+
+    def get_warehouse_tables(self, database: str, schema: str) -> list[str]:
+        """Tables of ``database.schema``, including tables added with ``add_warehouse_table``."""
+        if schema not in self.get_warehouse_schemas(database):
+            return []
+
+        return self._warehouse_tables.setdefault(
+            (database, schema),
+            [f"TABLE_{index}" for index in range(1, self.n_warehouse_tables + 1)],
+        )
+
+    def add_warehouse_table(self, database: str, schema: str, table: str) -> None:
+        self.get_warehouse_tables(database, schema).append(table)
+
+    @property
+    def applications(self) -> list[dict]:
+        return self._cached(
+            "applications",
+            lambda: [
+                {
+                    "applicationId": f"app-{index}",
+                    "name": f"Application {index}",
+                    "customerId": self.domo_instance,
+                    "version": "1.0",
+                    "executionClass": "com.domo.executor.simulated",
+                    "authorities": [],
+                }
+                for index in range(1, self.n_applications + 1)
+            ],
+        )
+
+    def get_application_jobs(self, application_id: str) -> list[dict]:
+        """Jobs of ``application_id``, including jobs created through the simulator."""
+        if application_id not in self._application_jobs:
+            index = int(application_id.rsplit("-", 1)[-1])
+            self._application_jobs[application_id] = [
+                self._build_job(
+                    application_id,
+                    {
+                        "jobName": f"Job {index}-{k}",
+                        "executionPayload": {},
+                        "triggers": [
+                            {
+                                "eventEntity": f"0 {30 * (k % 2)} {(index + k) % 6} ? * *",
+                                "eventType": "scheduleTriggered",
+                            }
+                        ],
+                    },
+                )
+                for k in range(self.n_application_jobs)
+            ]
+        return self._application_jobs[application_id]
+
+    def _build_job(self, application_id: str, body: dict) -> dict:
+        job_id = f"{application_id}-job-{len(self._application_jobs.get(application_id, []))}"
+        return {
+            **body,
+            "jobId": job_id,
+            "applicationId": application_id,
+            "customerId": self.domo_instance,
+            "userId": body.get("userId") or 1,
+            "executionTimeout": body.get("executionTimeout") or 1440,
+            "executionPayload": {"metricsDatasetId": None, **body["executionPayload"]},
+            "created": self.activity_start,
+            "updated": self.activity_start,
+            "triggers": [
+                {**trigger, "triggerId": f"{job_id}-trigger-{index}", "jobId": job_id}
+                for index, trigger in enumerate(body.get("triggers") or [])
+            ],
+        }
+
+    @property
+    def dataset_columns(self) -> list[str]:
+        return ["row_id"] + [
+            f"col_{index}" for index in range(1, self.n_dataset_columns)
+        ]
+
+    # ------------------------------------------------------------------
+    # transport
+    # ------------------------------------------------------------------
+
+    def _json(self, status: int, payload: Any, **headers) -> httpx.Response:
+        return httpx.Response(status, json=payload, headers=headers or None)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """``httpx.MockTransport`` handler."""
+        self.stats.requests += 1
+        request_number = self.stats.requests
+
+        if self.latency or self.latency_jitter:
+            await asyncio.sleep(
+                self.latency + self._rng.uniform(0, self.latency_jitter)
+            )
+
+        url = urlparse(str(request.url))
+
+        if url.hostname != f"{self.domo_instance}.domo.com":
+            return self._json(404, {"status": 404, "message": "unknown instance"})
+
+        for method, pattern, handler in self._routes:
+            match = pattern.match(url.path)
+            if not match or request.method != method:
+                continue
+
+            self.stats.by_endpoint[handler.__name__.lstrip("_")] += 1
+
+            if self.rate_limit_every and request_number % self.rate_limit_every == 0:
+                self.stats.rate_limited += 1
+                return self._json(
+                    429,
+                    {"status": 429, "message": "Too Many Requests"},
+                    **{"Retry-After": str(self.retry_after)},
+                )
+
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.stats.errors += 1
+                return self._json(
+                    500, {"status": 500, "message": "simulated server error"}
+                )
+
+            return handler(request, **match.groupdict())
+
+        return self._json(404, {"status": 404, "message": f"not simulated: {url.path}"})
+
+    # ------------------------------------------------------------------
+    # endpoint handlers
+    # ------------------------------------------------------------------
+
+    def _search_datacenter(self, request: httpx.Request) -> httpx.Response:
+        body = _json_body(request)
+        return self._json(
+            200,
+            {
+                "searchObjects": _page(
+                    self.search_objects, body.get("offset"), body.get("count")
+                ),
+                "totalResultCount": len(self.search_objects),
+            },
+        )
+
+    def _get_all_users(self, request: httpx.Request) -> httpx.Response:
+        return self._json(200, self.users)
+
+    def _search_users(self, request: httpx.Request) -> httpx.Response:
+        """v1 identity search: everything but ``id`` comes back as key/values attributes."""
+        body = _json_body(request)
+        users = [
+            {
+                "id": user["id"],
+                "attributes": [
+                    {"key": key, "values": [value]}
+                    for key, value in user.items()
+                    if key != "id"
+                ],
+            }
+            for user in _page(self.users, body.get("offset"), body.get("limit"))
+        ]
+        return self._json(200, {"users": users, "count": len(self.users)})
+
+    def _get_all_groups(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        return self._json(
+            200, _page(self.groups, params.get("offset"), params.get("limit"))
+        )
+
+    def _get_group_membership(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        members = [
+            {"userId": user["id"], "displayName": user["displayName"]}
+            for user in self.get_group_users(params.get("group", 0))
+        ]
+        return self._json(
+            200,
+            {
+                "groupUserList": _page(
+                    members, params.get("offset"), params.get("limit")
+                )
+            },
+        )
+
+    def get_export_csv(self, include_header: bool = True) -> bytes:
+        """The CSV body the export endpoint serves for every dataset."""
+        csv = self._cached(
+            "export_csv",
+            lambda: "".join(
+                ",".join(
+                    str(row_id * column) if column else str(row_id)
+                    for column in range(self.n_dataset_columns)
+                )
+                + "\n"
+                for row_id in range(self.n_dataset_rows)
+            ).encode(),
+        )
+        header = (",".join(self.dataset_columns) + "\n").encode()
+        return header + csv if include_header else csv
+
+    def _export(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        include_header = request.url.params.get("includeHeader", "true") == "true"
+        content = self.get_export_csv(include_header=include_header)
+        headers = {"Content-Type": "text/csv", "Accept-Ranges": "bytes"}
+
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            content = self._cached(
+                f"export_csv_gzip_{include_header}", lambda: gzip.compress(content)
+            )
+            headers["Content-Encoding"] = "gzip"
+
+        return self._stream_response(
+            request, content, headers, drop_after=self.export_drop_after
+        )
+
+    def _stream_response(
+        self,
+        request: httpx.Request,
+        content: bytes,
+        headers: dict,
+        drop_after: int = 0,
+    ) -> httpx.Response:
+        """A streamed body that honours ``Range: bytes={start}-`` and ``If-Range``.
+
+        The ETag is derived from the full body, so it changes with the content.
+        """
+        status = 200
+        headers["ETag"] = f'"{hashlib.md5(content).hexdigest()}"'
+
+        range_match = re.match(r"bytes=(\d+)-$", request.headers.get("range", ""))
+        if_range = request.headers.get("if-range")
+        if range_match and if_range and if_range != headers["ETag"]:
+            range_match = None  # stale validator: send the whole body
+
+        if range_match:
+            start = int(range_match.group(1))
+            if start >= len(content):
+                return httpx.Response(
+                    416, headers={"Content-Range": f"bytes */{len(content)}"}
+                )
+
+            headers["Content-Range"] = (
+                f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+            content = content[start:]
+            status = 206
+
+        headers["Content-Length"] = str(len(content))
+        self.stats.bytes_downloaded += min(len(content), drop_after or len(content))
+        return httpx.Response(
+            status,
+            headers=headers,
+            stream=_DroppingStream(content, drop_after=drop_after),
+        )
+
+    def _search_fileset_files(
+        self, request: httpx.Request, fileset_id: str
+    ) -> httpx.Response:
+        directory_path = request.url.params.get("directoryPath", "").strip("/")
+        if directory_path not in self.fileset_directories:
+            return self._json(404, {"status": 404, "message": "directory not found"})
+
+        files = [
+            (
+                {
+                    **obj,
+                    "size": len(self.get_fileset_file_content(obj["id"])),
+                    "updated": 1_700_000_000_000 + self._fileset_versions[obj["id"]],
+                }
+                if obj["fileType"] == "FILE"
+                else obj
+            )
+            for obj in self.fileset_directories[directory_path]
+        ]
+
+        params = request.url.params
+        return self._json(
+            200, {"files": _page(files, params.get("offset"), params.get("limit"))}
+        )
+
+    def _download_fileset_file(
+        self, request: httpx.Request, fileset_id: str, file_id: str
+    ) -> httpx.Response:
+        if not file_id.startswith("file-"):
+            return self._json(404, {"status": 404, "message": "file not found"})
+
+        return self._stream_response(
+            request,
+            self.get_fileset_file_content(file_id),
+            {"Content-Type": "application/octet-stream", "Accept-Ranges": "bytes"},
+        )
+
+    def _warehouse_page(self, request: httpx.Request, items: list) -> httpx.Response:
+        rows = int(request.url.params.get("rows", 5000))
+        page = int(request.url.params.get("page", 0))
+        return self._json(200, _page(items, page * rows, rows))
+
+    def _get_warehouse_databases(
+        self, request: httpx.Request, integration_id: str
+    ) -> httpx.Response:
+        return self._warehouse_page(
+            request, [{"databaseName": name} for name in self.warehouse_databases]
+        )
+
+    def _get_warehouse_schemas(
+        self, request: httpx.Request, integration_id: str, database: str
+    ) -> httpx.Response:
+        if database not in self.warehouse_databases:
+            return self._json(404, {"status": 404, "message": "database not found"})
+
+        return self._warehouse_page(
+            request,
+            [{"schemaName": name} for name in self.get_warehouse_schemas(database)],
+        )
+
+    def _get_warehouse_tables(
+        self, request: httpx.Request, integration_id: str, database: str, schema: str
+    ) -> httpx.Response:
+        if schema not in self.get_warehouse_schemas(database):
+            return self._json(404, {"status": 404, "message": "schema not found"})
+
+        return self._warehouse_page(
+            request,
+            [
+                {"tableName": name, "type": "TABLE"}
+                for name in self.get_warehouse_tables(database, schema)
+            ],
+        )
+
+    def _check_colliding_datasource(
+        self, request: httpx.Request, dataset_id: str
+    ) -> httpx.Response:
+        index = int(dataset_id.rsplit("-", 1)[-1])
+        if index % 4 == 0:
+            return self._json(
+                400, {"status": 400, "message": "no federated metadata for datasource"}
+            )
+
+        return self._json(
+            200,
+            {
+                "datasourceId": dataset_id,
+                "collidingDatasources": [f"ds-{index + 1}"] if index % 2 else [],
+            },
+        )
+
+    def _get_applications(self, request: httpx.Request) -> httpx.Response:
+        return self._json(200, self.applications)
+
+    def _get_application_jobs(
+        self, request: httpx.Request, application_id: str
+    ) -> httpx.Response:
+        if application_id not in {obj["applicationId"] for obj in self.applications}:
+            return self._json(404, {"status": 404, "message": "application not found"})
+
+        params = request.url.params
+        jobs = _page(
+            self.get_application_jobs(application_id),
+            params.get("offset"),
+            params.get("limit"),
+        )
+        return self._json(200, {"jobs": jobs})
+
+    def _create_application_job(
+        self, request: httpx.Request, application_id: str
+    ) -> httpx.Response:
+        if application_id not in {obj["applicationId"] for obj in self.applications}:
+            return self._json(404, {"status": 404, "message": "application not found"})
+
+        jobs = self.get_application_jobs(application_id)
+        job = self._build_job(application_id, _json_body(request))
+        jobs.append(job)
+        return self._json(200, job)
+
+    def _update_group_membership(self, request: httpx.Request) -> httpx.Response:
+        for update in _json_body(request):
+            group_id = int(update["groupId"])
+            if not 1 <= group_id <= self.n_groups:
+                return self._json(404, {"status": 404, "message": "group not found"})
+
+            remove_ids = {
+                int(member["id"])
+                for member in update.get("removeMembers", [])
+                if member["type"] == "USER"
+            }
+            members = [
+                user
+                for user in self.get_group_users(group_id)
+                if user["id"] not in remove_ids
+            ]
+
+            member_ids = {user["id"] for user in members}
+            for member in update.get("addMembers", []):
+                user_id = int(member["id"])
+                if member["type"] == "USER" and user_id not in member_ids:
+                    if not 1 <= user_id <= self.n_users:
+                        return self._json(
+                            400, {"status": 400, "message": f"unknown user {user_id}"}
+                        )
+                    members.append(self.users[user_id - 1])
+                    member_ids.add(user_id)
+
+            self._group_members[group_id] = members
+
+        return httpx.Response(200)
+
+    def _query(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        sql = _json_body(request).get("sql", "")
+
+        limit_match = _SQL_LIMIT_RE.search(sql)
+        offset_match = _SQL_OFFSET_RE.search(sql)
+
+        offset = int(offset_match.group(1)) if offset_match else 0
+        limit = int(limit_match.group(1)) if limit_match else self.n_dataset_rows
+        stop = min(offset + limit, self.n_dataset_rows)
+
+        rows = [
+            [row_id] + [row_id * column for column in range(1, self.n_dataset_columns)]
+            for row_id in range(offset, stop)
+        ]
+
+        return self._json(
+            200,
+            {
+                "datasource": dataset_id,
+                "columns": self.dataset_columns,
+                "rows": rows,
+                "numRows": len(rows),
+                "numColumns": self.n_dataset_columns,
+            },
+        )
+
+    def _activity_log(
+        self, request: httpx.Request, object_type: Optional[str] = None
+    ) -> httpx.Response:
+        params = request.url.params
+        events = self.activity_events
+        times = self._cached("activity_times", lambda: [e["time"] for e in events])
+
+        start = int(params.get("start", self.activity_start))
+        end = int(params.get("end", self.activity_end))
+
+        window = events[
+            bisect.bisect_left(times, start) : bisect.bisect_right(times, end)
+        ]
+
+        if object_type:
+            window = [event for event in window if event["objectType"] == object_type]
+
+        return self._json(200, _page(window, params.get("offset"), params.get("limit")))
+
+    def _pages_adminsummary(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        return self._json(
+            200,
+            {
+                "pageAdminSummaries": _page(
+                    self.pages, params.get("skip"), params.get("limit")
+                )
+            },
+        )
+
+    def _cards_adminsummary(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        return self._json(
+            200,
+            {
+                "cardAdminSummaries": _page(
+                    self.cards, params.get("skip"), params.get("limit")
+                )
+            },
+        )
+
+    def _page(self, request: httpx.Request, page_id: str) -> httpx.Response:
+        page_id = int(page_id)
+        if not 1 <= page_id <= self.n_pages:
+            return self._json(404, {"status": 404, "message": "page not found"})
+
+        summary = self.pages[page_id - 1]
+        return self._json(
+            200,
+            {
+                "id": page_id,
+                "title": summary["pageTitle"],
+                "page": {
+                    "pageId": page_id,
+                    "title": summary["pageTitle"],
+                    "parentPageId": summary["parentPageId"],
+                    "owners": [{"id": summary["ownerId"], "type": "USER"}],
+                },
+                "cards": [
+                    {"id": page_id * 10 + index, "title": f"Card {index}"}
+                    for index in range(summary["cardCount"])
+                ],
+            },
+        )
+
+    def _lineage_parents(self, entity_type: str, entity_id: str) -> list[dict]:
+        index = int(entity_id.split("-")[-1])
+
+        if entity_type == "DATASET":
+            first_input = index * self.lineage_fanout + 1
+            if first_input >= self.n_lineage_datasets:
+                return []
+            return [{"type": "DATAFLOW", "id": f"df-{index}"}]
+
+        return [
+            {"type": "DATASET", "id": f"ds-{input_index}"}
+            for input_index in range(
+                index * self.lineage_fanout + 1,
+                min((index + 1) * self.lineage_fanout + 1, self.n_lineage_datasets),
+            )
+        ]
+
+    def _lineage(
+        self, request: httpx.Request, entity_type: str, entity_id: str
+    ) -> httpx.Response:
+        """Upstream graph of an entity, keyed ``{TYPE}{id}`` like the datacenter API."""
+        entity_type = entity_type.upper()
+        nodes: dict[str, dict] = {}
+        stack = [(entity_type, entity_id, None)]
+
+        while stack:
+            node_type, node_id, child = stack.pop()
+            key = f"{node_type}{node_id}"
+
+            if key in nodes:
+                if child:
+                    nodes[key]["children"].append(child)
+                continue
+
+            parents = self._lineage_parents(node_type, node_id)
+            nodes[key] = {
+                "type": node_type,
+                "id": node_id,
+                "complete": True,
+                "children": [child] if child else [],
+                "parents": parents,
+            }
+
+            stack.extend(
+                (parent["type"], parent["id"], {"type": node_type, "id": node_id})
+                for parent in parents
+            )
+
+        return self._json(200, nodes)
+
+    def get_partitions(self, dataset_id: str) -> dict[str, dict]:
+        """Current partitions of a dataset, newest first, keyed by partition id."""
+        if dataset_id not in self._partitions:
+            self._partitions[dataset_id] = {
+                partition_date.isoformat(): {
+                    "partitionId": partition_date.isoformat(),
+                    "dateCompleted": int(
+                        dt.datetime.combine(partition_date, dt.time())
+                        .replace(tzinfo=dt.timezone.utc)
+                        .timestamp()
+                        * 1000
+                    ),
+                    "rowCount": 100,
+                    "isDataDeleted": False,
+                }
+                for partition_date in (
+                    self.partition_end_date - dt.timedelta(days=days_ago)
+                    for days_ago in range(self.n_partitions)
+                )
+            }
+        return self._partitions[dataset_id]
+
+    def _index(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        return self._json(200, {"indexId": self.stats.by_endpoint["index"]})
+
+    def _list_partitions(
+        self, request: httpx.Request, dataset_id: str
+    ) -> httpx.Response:
+        body = _json_body(request)
+        return self._json(
+            200,
+            _page(
+                list(self.get_partitions(dataset_id).values()),
+                body.get("offset"),
+                body.get("limit"),
+            ),
+        )
+
+    def _delete_partition_data(
+        self, request: httpx.Request, dataset_id: str, partition_id: str
+    ) -> httpx.Response:
+        partition = self.get_partitions(dataset_id).get(partition_id)
+        if not partition:
+            return self._json(404, {"status": 404, "message": "partition not found"})
+
+        partition["isDataDeleted"] = True
+        return self._json(200, {"partitionId": partition_id})
+
+    def _delete_partition(
+        self, request: httpx.Request, dataset_id: str, partition_id: str
+    ) -> httpx.Response:
+        if not self.get_partitions(dataset_id).pop(partition_id, None):
+            return self._json(404, {"status": 404, "message": "partition not found"})
+
+        return self._json(200, {"partitionId": partition_id})
+
+    def _upload_start(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        upload_id = len(self._uploads) + 1
+        self._uploads[upload_id] = {"dataset_id": dataset_id, "parts": {}}
+        return self._json(200, {"uploadId": upload_id})
+
+    def _upload_part(
+        self, request: httpx.Request, dataset_id: str, upload_id: str, part_id: str
+    ) -> httpx.Response:
+        upload = self._uploads.get(int(upload_id))
+        if not upload:
+            return self._json(404, {"status": 404, "message": "unknown upload"})
+
+        upload["parts"][part_id] = len(request.content)
+        self.stats.bytes_uploaded += len(request.content)
+        return self._json(200, {"uploadId": int(upload_id), "partId": part_id})
+
+    def _upload_commit(
+        self, request: httpx.Request, dataset_id: str, upload_id: str
+    ) -> httpx.Response:
+        upload = self._uploads.get(int(upload_id))
+        if not upload:
+            return self._json(404, {"status": 404, "message": "unknown upload"})
+
+        body = _json_body(request)
+        return self._json(
+            200,
+            {
+                "uploadId": int(upload_id),
+                "action": body.get("action"),
+                "parts": len(upload["parts"]),
+                "bytes": sum(upload["parts"].values()),
+            },
+        )
+
+
+@dataclass
+class SimulatorBenchmark_Result:
+    """Throughput, wall time and peak memory of one benchmarked workload."""
+
+    name: str
+    requests: int
+    wall_seconds: float
+    peak_memory_bytes: int
+    result: Any = field(default=None, repr=False)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "wall_seconds": self.wall_seconds,
+            "requests_per_second": self.requests_per_second,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+def run_benchmark(
+    workload: Callable[[DomoApiSimulator], Awaitable[Any]],
+    simulator: DomoApiSimulator,
+    name: Optional[str] = None,
+) -> SimulatorBenchmark_Result:
+    """Run ``await workload(simulator)`` once under ``tracemalloc`` and time it.
+
+    The workload receives the simulator and is responsible for passing
+    ``simulator.session()`` (or using ``simulator.install()``).
+    """
+    simulator.stats.reset()
+
+    is_tracing = tracemalloc.is_tracing()
+    if not is_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    try:
+        result = asyncio.run(workload(simulator))
+        wall_seconds = time.perf_counter() - start
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        if not is_tracing:
+            tracemalloc.stop()
+
+    return SimulatorBenchmark_Result(
+        name=name or getattr(workload, "__name__", "workload"),
+        requests=simulator.stats.requests,
+        wall_seconds=wall_seconds,
+        peak_memory_bytes=peak_memory_bytes,
+        result=result,
+    )
@@ -155,35 +155,37 @@ async def remove_partition_by_x_days(
     separator: str = None,
     date_index: int = 0,
     date_format: str = "%Y-%m-%d",
-):
-    domo_ds = dmds.DomoDataset(auth=auth, id=dataset_id)
-
-    list_partition = await domo_ds.list_partitions(auth=auth, dataset_id=dataset_id)
-
-    today = dt.date.today()
-    days_ago = today - dt.timedelta(days=x_last_days)
-    for i in list_partition:
-        compare_date = ""
-        if separator is not None and separator != "":
-            compare_date = i["partitionId"].split(separator)[date_index]
-        else:
-            compare_date = i["partitionId"]
-
-        try:
-            d = dt.datetime.strptime(compare_date, date_format).date()
-        except ValueError:
-            d = None
-        if d is not None and d < days_ago:
-            print(
-                auth.domo_instance,
-                ": 🚀  Removing partition key : ",
-                (i["partitionId"]),
-                " in ",
-                dataset_id,
-            )
-            await domo_ds.delete_partition(
-                dataset_partition_id=i["partitionId"], dataset_id=dataset_id, auth=auth
-            )
+    is_dry_run: bool = False,
+    max_concurrency: int = 10,
+    is_index: bool = True,
+) -> dmds.DomoDataset_PartitionPlan:
+    """delete partitions dated more than x_last_days ago; see DomoDataset_Partitions"""
+    domo_ds = dmds.DomoDataset_Default(auth=auth, id=dataset_id, raw={})
+
+    plan = await domo_ds.Partitions.remove_partitions(
+        keep_last_days=x_last_days,
+        separator=separator,
+        date_index=date_index,
+        date_format=date_format,
+        is_dry_run=is_dry_run,
+        max_concurrency=max_concurrency,
+        is_index=is_index,
+    )
+
+    for partition_id in plan.partition_ids_to_delete:
+        print(
+            auth.domo_instance,
+            (
+                ": 🚀  Removing partition key : "
+                if not is_dry_run
+                else ": 📝  Would remove partition key : "
+            ),
+            partition_id,
+            " in ",
+            dataset_id,
+        )
+
+    return plan
 
 
 async def get_company_domains(
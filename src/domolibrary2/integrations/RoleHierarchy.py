@@ -1,14 +1,46 @@
-"""a class based approach to handling role hierarchy"""
+"""a class based approach to handling role hierarchy
 
-__all__ = ["extract_role_hierarchy", "get_roles_w_hierarchy", "calc_role"]
+Roles are read once per instance into a TTL-cached ``RoleHierarchy_Index`` that
+plans role changes for many users at once:
 
+    >>> index = await get_role_hierarchy_index(auth=auth)
+    >>> plan = index.plan([(user, "Editor - h5") for user in domo_users])
+    >>> plan = await apply_role_changes(auth=auth, plan=plan)
+"""
+
+__all__ = [
+    "extract_role_hierarchy",
+    "get_roles_w_hierarchy",
+    "calc_role",
+    "RoleHierarchy_Error",
+    "RoleAssignment_Change",
+    "RoleAssignment_Plan",
+    "RoleHierarchy_Index",
+    "get_role_hierarchy_index",
+    "clear_role_hierarchy_cache",
+    "apply_role_changes",
+]
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+import pandas as pd
+
+from ..auth import DomoAuth
+from ..base.exceptions import ClassError
 from ..classes.DomoInstanceConfig.role import DomoRole, DomoRoles
+from ..routes import role as role_routes
+from ..utils import chunk_execution as dmce
 
 
 def extract_role_hierarchy(
     role: DomoRole, hierarchy_delimiter, debug_prn: bool = False
 ) -> DomoRole:  # augments the domo role with a hierarchy INT attribute
-    description_arr = role.description.split(hierarchy_delimiter)
+    description_arr = (role.description or "").split(hierarchy_delimiter)
 
     if len(description_arr) != 1:
         hierarchy = int(description_arr[1])
@@ -51,6 +83,268 @@ async def get_roles_w_hierarchy(
     ]
 
 
+class RoleHierarchy_Error(ClassError):  # noqa: N801
+    def __init__(self, cls_instance, message):
+        super().__init__(cls_instance=cls_instance, message=message)
+
+
+@dataclass
+class RoleAssignment_Change:  # noqa: N801
+    user_id: str
+    current_role_id: Optional[str]
+    new_role: DomoRole = field(repr=False)
+
+    @property
+    def new_role_id(self) -> str:
+        return str(self.new_role.id)
+
+
+@dataclass
+class RoleAssignment_Plan:  # noqa: N801
+    """Minimal set of role changes for a batch of (user, desired role) pairs.
+
+    ``unchanged`` holds users whose current role already meets or exceeds the
+    desired role (or is a protected system role); ``errors`` holds pairs that
+    could not be resolved, keyed by user id.
+    """
+
+    changes: list[RoleAssignment_Change] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    results: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def by_role(self) -> dict[str, list[str]]:
+        """user ids to add, grouped by new role id"""
+        role_users = defaultdict(list)
+        for change in self.changes:
+            role_users[change.new_role_id].append(change.user_id)
+        return dict(role_users)
+
+    @property
+    def failed(self) -> dict[str, Exception]:
+        return {
+            key: result
+            for key, result in self.results.items()
+            if isinstance(result, Exception)
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "user_id": change.user_id,
+                    "current_role_id": change.current_role_id,
+                    "new_role_id": change.new_role_id,
+                    "new_role_name": change.new_role.name,
+                }
+                for change in self.changes
+            ],
+            columns=["user_id", "current_role_id", "new_role_id", "new_role_name"],
+        )
+
+
+@dataclass
+class RoleHierarchy_Index:  # noqa: N801
+    """instance roles with precomputed hierarchy, indexed by id and name"""
+
+    auth: DomoAuth = field(repr=False)
+    roles: list[DomoRole] = field(repr=False)
+    hierarchy_delimiter: str = " - h"
+    ttl_seconds: Optional[float] = 900
+    built_at: float = field(default_factory=time.monotonic)
+
+    by_id: dict[str, DomoRole] = field(init=False, repr=False)
+    by_name: dict[str, DomoRole] = field(init=False, repr=False)
+    rank_by_id: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        for role in self.roles:
+            extract_role_hierarchy(
+                role=role, hierarchy_delimiter=self.hierarchy_delimiter
+            )
+
+        self.by_id = {str(role.id): role for role in self.roles}
+        self.by_name = {role.name: role for role in self.roles}
+        self.rank_by_id = {str(role.id): role.hierarchy for role in self.roles}
+
+    @classmethod
+    async def build(
+        cls,
+        auth: DomoAuth,
+        hierarchy_delimiter: str = " - h",
+        ttl_seconds: Optional[float] = 900,
+        session: Optional[httpx.AsyncClient] = None,
+        debug_api: bool = False,
+    ) -> "RoleHierarchy_Index":
+        res = await role_routes.get_roles(
+            auth=auth, session=session, debug_api=debug_api
+        )
+
+        return cls(
+            auth=auth,
+            roles=[DomoRole.from_dict(obj=obj, auth=auth) for obj in res.response],
+            hierarchy_delimiter=hierarchy_delimiter,
+            ttl_seconds=ttl_seconds,
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return time.monotonic() - self.built_at > self.ttl_seconds
+
+    def get_role(self, role_id) -> DomoRole:
+        role = self.by_id.get(str(role_id))
+        if not role:
+            raise RoleHierarchy_Error(
+                cls_instance=self,
+                message=f"role {role_id} not found in {self.auth.domo_instance}",
+            )
+        return role
+
+    def get_role_by_name(self, role_name: str) -> DomoRole:
+        role = self.by_name.get(role_name)
+        if not role:
+            raise RoleHierarchy_Error(
+                cls_instance=self,
+                message=f"{role_name} not found in {self.auth.domo_instance}",
+            )
+        return role
+
+    def resolve(
+        self,
+        current_role_id,
+        new_role_name: str,
+        is_alter_system_roles: bool = False,
+        debug_prn: bool = False,
+    ) -> DomoRole:
+        """compares current role to new role hierarchy and returns the higher one.  will not adjust system roles"""
+
+        current_role = self.get_role(current_role_id)
+
+        if current_role.is_system_role and not is_alter_system_roles:
+            if debug_prn:
+                print(f"{current_role.name} is a system role -- no changes")
+            return current_role
+
+        expected_role = self.get_role_by_name(new_role_name)
+
+        if current_role.hierarchy >= expected_role.hierarchy:
+            if debug_prn:
+                print(
+                    f"do nothing:  {current_role.name} - {current_role.hierarchy} exceeds or equals {expected_role.name} - {expected_role.hierarchy}"
+                )
+            return current_role
+
+        if debug_prn:
+            print(
+                f"upgrade role: {current_role.name} - {current_role.hierarchy} to a {expected_role.name} - {expected_role.hierarchy}"
+            )
+        return expected_role
+
+    def plan(
+        self,
+        assignments: list[tuple[Any, str]],
+        is_alter_system_roles: bool = False,
+    ) -> RoleAssignment_Plan:
+        """plan role changes for ``(user, new_role_name)`` pairs
+
+        ``user`` is a DomoUser (``id`` / ``role_id``) or a ``(user_id, current_role_id)`` tuple.
+        Users listed more than once are planned against the highest requested role.
+        """
+        plan = RoleAssignment_Plan()
+        planned = {}
+
+        for user, new_role_name in assignments:
+            if isinstance(user, tuple):
+                user_id, current_role_id = user
+            else:
+                user_id, current_role_id = user.id, user.role_id
+
+            user_id = str(user_id)
+
+            try:
+                new_role = self.resolve(
+                    current_role_id=current_role_id,
+                    new_role_name=new_role_name,
+                    is_alter_system_roles=is_alter_system_roles,
+                )
+            except RoleHierarchy_Error as e:
+                plan.errors[user_id] = e
+                continue
+
+            previous = planned.get(user_id)
+            if previous and previous[1].hierarchy >= new_role.hierarchy:
+                continue
+
+            planned[user_id] = (current_role_id, new_role)
+
+        for user_id, (current_role_id, new_role) in planned.items():
+            if str(new_role.id) == str(current_role_id):
+                plan.unchanged.append(user_id)
+                continue
+
+            plan.changes.append(
+                RoleAssignment_Change(
+                    user_id=user_id,
+                    current_role_id=(
+                        str(current_role_id) if current_role_id is not None else None
+                    ),
+                    new_role=new_role,
+                )
+            )
+
+        return plan
+
+
+_index_cache: dict[tuple, RoleHierarchy_Index] = {}
+_index_builds: dict[tuple, asyncio.Task] = {}
+
+
+def clear_role_hierarchy_cache() -> None:
+    _index_cache.clear()
+    _index_builds.clear()
+
+
+async def get_role_hierarchy_index(
+    auth: DomoAuth,
+    hierarchy_delimiter: str = " - h",
+    ttl_seconds: Optional[float] = 900,
+    is_force_refresh: bool = False,
+    session: Optional[httpx.AsyncClient] = None,
+    debug_api: bool = False,
+) -> RoleHierarchy_Index:
+    """cached ``RoleHierarchy_Index`` for the instance; concurrent callers share one build"""
+
+    key = (auth.domo_instance, hierarchy_delimiter)
+
+    index = _index_cache.get(key)
+    if index and not is_force_refresh and not index.is_expired:
+        return index
+
+    task = _index_builds.get(key)
+    if not task:
+        task = asyncio.ensure_future(
+            RoleHierarchy_Index.build(
+                auth=auth,
+                hierarchy_delimiter=hierarchy_delimiter,
+                ttl_seconds=ttl_seconds,
+                session=session,
+                debug_api=debug_api,
+            )
+        )
+        _index_builds[key] = task
+
+    try:
+        index = await task
+    finally:
+        if _index_builds.get(key) is task:
+            del _index_builds[key]
+
+    _index_cache[key] = index
+    return index
+
+
 async def calc_role(
     current_role_id,
     new_role_name,
@@ -61,32 +355,66 @@ async def calc_role(
 ):
     """compares current role to new role hierarchy and returns the higher one.  will not adjust system roles"""
 
-    instance_roles = await get_roles_w_hierarchy(
+    index = await get_role_hierarchy_index(
         auth=auth, hierarchy_delimiter=hierarchy_delimiter
     )
 
-    current_role = next(role for role in instance_roles if role.id == current_role_id)
+    return index.resolve(
+        current_role_id=current_role_id,
+        new_role_name=new_role_name,
+        is_alter_system_roles=is_alter_system_roles,
+        debug_prn=debug_prn,
+    )
 
-    if current_role.is_system_role and not is_alter_system_roles:
-        print(f"{current_role.name} is a system role -- no changes")
-        return current_role
 
-    expected_role = next(
-        (role for role in instance_roles if role.name == new_role_name), None
-    )
+async def _try_add_users(auth, role_id, user_ids, session, debug_api):
+    try:
+        return await role_routes.role_membership_add_users(
+            auth=auth,
+            role_id=role_id,
+            user_ids=user_ids,
+            session=session,
+            debug_api=debug_api,
+        )
+    except Exception as e:
+        return e
 
-    if not expected_role:
-        raise Exception(f"{new_role_name} not found in {auth.domo_instance}")
 
-    if current_role.hierarchy >= expected_role.hierarchy:
-        if debug_prn:
-            print(
-                f"do nothing:  {current_role.name} - {current_role.hierarchy} exceeds or equals {expected_role.name} - {expected_role.hierarchy}"
-            )
-        return current_role
+async def apply_role_changes(
+    auth: DomoAuth,
+    plan: RoleAssignment_Plan,
+    chunk_size: int = 100,
+    max_concurrency: int = 5,
+    session: Optional[httpx.AsyncClient] = None,
+    debug_api: bool = False,
+) -> RoleAssignment_Plan:
+    """add users to their new roles in chunks of ``chunk_size`` user ids per request
 
-    if debug_prn:
-        print(
-            f"upgrade role: {current_role.name} - {current_role.hierarchy} to a {expected_role.name} - {expected_role.hierarchy}"
+    results are recorded on ``plan.results`` keyed by ``"{role_id}:{chunk_index}"``;
+    a failed chunk is stored as its exception rather than raised.
+    """
+
+    batches = [
+        (f"{role_id}:{chunk_index}", role_id, user_ids)
+        for role_id, role_user_ids in plan.by_role().items()
+        for chunk_index, user_ids in enumerate(
+            dmce.chunk_list(role_user_ids, chunk_size)
         )
-    return expected_role
+    ]
+
+    res_ls = await dmce.gather_with_concurrency(
+        *[
+            _try_add_users(
+                auth=auth,
+                role_id=role_id,
+                user_ids=user_ids,
+                session=session,
+                debug_api=debug_api,
+            )
+            for _, role_id, user_ids in batches
+        ],
+        n=max_concurrency,
+    )
+
+    plan.results = {key: res for (key, _, _), res in zip(batches, res_ls)}
+    return plan
@@ -74,11 +74,7 @@ async def search_activity_log(
 ) -> rgd.ResponseGetData:
     """loops over activity log api to retrieve audit logs"""
 
-    is_close_session = False
-
-    if not session:
-        session = httpx.AsyncClient()
-        is_close_session = True
+    session, is_close_session = gd.create_httpx_session(session)
 
     url = f"https://{auth.domo_instance}.domo.com/api/audit/v1/user-audits"
 
@@ -29,6 +29,8 @@ __all__ = [
     "Application_GET_Error",
     "SearchApplication_NotFound_Error",
     "Application_CRUD_Error",
+    "ApplicationNoJobRetrievedError",
+    "ApplicationError_NoJobRetrieved",
     "get_applications",
     "get_application_by_id",
     "get_application_jobs",
@@ -116,6 +118,10 @@ class ApplicationNoJobRetrievedError(RouteError):
         )
 
 
+# name used by classes.DomoApplication
+ApplicationError_NoJobRetrieved = ApplicationNoJobRetrievedError
+
+
 class Application_CRUD_Error(RouteError):
     """
     Raised when application create, update, or delete operations fail.
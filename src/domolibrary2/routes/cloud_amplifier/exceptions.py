@@ -7,6 +7,7 @@ This module contains all exception classes for Cloud Amplifier operations.
 __all__ = [
     "CloudAmplifier_GET_Error",
     "SearchCloudAmplifierNotFoundError",
+    "SearchCloudAmplifier_NotFound",
     "CloudAmplifier_CRUD_Error",
     "Cloud_Amplifier_Error",
 ]
@@ -35,24 +36,15 @@ class CloudAmplifier_GET_Error(RouteError):
         if not message:
             if entity_id:
                 message = f"Failed to retrieve Cloud Amplifier integration {entity_id}"
+            else:
+                message = "Failed to retrieve Cloud Amplifier integrations"
 
-    class SearchCloudAmplifierNotFoundError(RouteError):
-        """
-        Raised when Cloud Amplifier integration search operations return no results.
-        """
-
-        def __init__(
-            self,
-            search_criteria: str,
-            res: Optional[rgd.ResponseGetData] = None,
+        super().__init__(
+            message=message,
+            entity_id=entity_id,
+            res=res,
             **kwargs,
-        ):
-            message = f"No Cloud Amplifier resources found matching: {search_criteria}"
-            super().__init__(
-                message=message,
-                res=res,
-                **kwargs,
-            )
+        )
 
 
 class SearchCloudAmplifierNotFoundError(RouteError):
@@ -77,6 +69,10 @@ class SearchCloudAmplifierNotFoundError(RouteError):
         )
 
 
+# name used by the cloud_amplifier route modules
+SearchCloudAmplifier_NotFound = SearchCloudAmplifierNotFoundError
+
+
 class CloudAmplifier_CRUD_Error(RouteError):
     """
     Raised when Cloud Amplifier integration create, update, or delete operations fail.
@@ -19,7 +19,7 @@ from .exceptions import (
     ShareDataset_Error,
     UploadDataError,
 )
-from .query import query_dataset_private, query_dataset_public
+from .query import export_dataset, query_dataset_private, query_dataset_public
 from .schema import (
     alter_schema,
     alter_schema_descriptions,
@@ -54,6 +54,7 @@ __all__ = [
     # Query
     "query_dataset_public",
     "query_dataset_private",
+    "export_dataset",
     # Core
     "get_dataset_by_id",
     "generate_create_dataset_body",
@@ -1,6 +1,7 @@
 """Dataset query operations."""
 
 import re
+from pathlib import Path
 
 import httpx
 from dc_logger.decorators import LogDecoratorConfig, log_call
@@ -11,8 +12,14 @@ from ...client import (
     get_data as gd,
     response as rgd,
 )
+from ...client.context import RouteContext
 from ...utils.logging import DomoEntityExtractor, DomoEntityResultProcessor
-from .exceptions import Dataset_CRUD_Error, DatasetNotFoundError, QueryRequestError
+from .exceptions import (
+    Dataset_CRUD_Error,
+    Dataset_GET_Error,
+    DatasetNotFoundError,
+    QueryRequestError,
+)
 
 
 # typically do not use
@@ -171,3 +178,64 @@ async def query_dataset_private(
         raise QueryRequestError(dataset_id=dataset_id, sql=sql, res=res)
 
     return res
+
+
+@gd.route_function
+async def export_dataset(
+    auth: DomoAuth,
+    dataset_id: str,
+    output_path: str | Path,
+    include_header: bool = True,
+    is_gzip: bool = True,
+    is_resume: bool = True,
+    max_retry: int = 3,
+    timeout: int = 60,
+    *,
+    context: RouteContext | None = None,
+    **context_kwargs,
+) -> rgd.ResponseGetData:
+    """stream the full dataset as CSV to `output_path` with the bulk export api
+
+    unlike `query_dataset_private` rows are not paged with sql or decoded; the
+    response body is written to disk as it arrives (see `gd.stream_to_file`).
+    with `is_gzip` the file is gzip-compressed if the server honoured it
+    (`res.response.content_encoding == "gzip"`); a compressed file is saved with
+    a `.gz` suffix (`res.response.path`) if `output_path` does not have one
+
+    with `is_resume` a `.part` file left by an interrupted export is continued
+    only while the server reports the same ETag / Last-Modified; an export of
+    changed data starts over
+    """
+    context = RouteContext.build_context(context, **context_kwargs)
+
+    url = f"https://{auth.domo_instance}.domo.com/api/query/v1/export/{dataset_id}"
+
+    res = await gd.stream_to_file(
+        url=url,
+        auth=auth,
+        output_path=output_path,
+        headers={"accept": "text/csv"},
+        params={
+            "includeHeader": str(include_header).lower(),
+            "fileName": f"{dataset_id}.csv",
+        },
+        is_gzip=is_gzip,
+        is_resume=is_resume,
+        max_retry=max_retry,
+        timeout=timeout,
+        context=context,
+    )
+
+    if res.status == 404:
+        raise DatasetNotFoundError(dataset_id=dataset_id, res=res)
+
+    if not res.is_success:
+        raise Dataset_GET_Error(dataset_id=dataset_id, res=res)
+
+    export = res.response
+    if export.content_encoding == "gzip" and export.path.suffix != ".gz":
+        export.path = export.path.replace(
+            export.path.with_name(f"{export.path.name}.gz")
+        )
+
+    return res
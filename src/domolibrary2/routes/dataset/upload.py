@@ -302,20 +302,19 @@ def generate_list_partitions_body(limit=100, offset=0):
     }
 
 
-gd.route_function
-
-
+@gd.route_function
 async def list_partitions(
     auth: DomoAuth,
     dataset_id: str,
     body: dict | None = None,
+    limit: int = 100,
     session: httpx.AsyncClient | None = None,
     debug_api: bool = False,
     debug_loop: bool = False,
     debug_num_stacks_to_drop=2,
     parent_class: str | None = None,
 ):
-    body = body or generate_list_partitions_body()
+    body = body or generate_list_partitions_body(limit=limit)
 
     url = f"https://{auth.domo_instance}.domo.com/api/query/v1/datasources/{dataset_id}/partition/list"
 
@@ -336,6 +335,7 @@ async def list_partitions(
         offset_params_in_body=True,
         offset_params=offset_params,
         loop_until_end=True,
+        limit=limit,
         session=session,
         debug_loop=debug_loop,
         debug_api=debug_api,
@@ -6,9 +6,12 @@ __all__ = [
     "embed_image",
     "get_fileset_by_id",
     "search_fileset_files",
+    "get_fileset_directory_files",
+    "download_fileset_file",
     "get_data_file_by_id",
 ]
 
+from pathlib import Path
 from typing import Literal, Optional
 
 import httpx
@@ -19,6 +22,7 @@ from ..client import (
     get_data as gd,
     response as rgd,
 )
+from ..client.context import RouteContext
 
 
 class Fileset_GET_Error(RouteError):
@@ -175,31 +179,47 @@ async def get_fileset_by_id(
     return res
 
 
+def generate_search_fileset_files_body() -> dict:
+    # default body will pull all files within the given fileset_id
+    return {
+        "fieldSort": [{"field": "created", "order": "DESC"}],
+        "filters": [],
+        "dateFilters": [],
+    }
+
+
 @gd.route_function
 async def search_fileset_files(
     auth: DomoAuth,
     domo_fileset_id: str,
     body: Optional[dict] = None,
+    directory_path: str = "",
+    is_immediate_children: bool = True,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
     debug_api: bool = False,
     debug_num_stacks_to_drop: int = 1,
     parent_class: Optional[str] = None,
     session: httpx.AsyncClient | None = None,
 ) -> rgd.ResponseGetData:
-    url = f"https://{auth.domo_instance}.domo.com/api/files/v1/filesets/{domo_fileset_id}/files/search?directoryPath=&immediateChildren=true"
+    """one page of files and directories under `directory_path` (the fileset root by default)"""
+    url = f"https://{auth.domo_instance}.domo.com/api/files/v1/filesets/{domo_fileset_id}/files/search"
 
-    if not body:
-        # default body will pull all files within the given fileset_id
-        body = {
-            "fieldSort": [{"field": "created", "order": "DESC"}],
-            "filters": [],
-            "dateFilters": [],
-        }
+    params = {
+        "directoryPath": directory_path,
+        "immediateChildren": str(is_immediate_children).lower(),
+    }
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
 
     res = await gd.get_data(
         auth=auth,
         method="POST",
         url=url,
-        body=body,
+        body=body or generate_search_fileset_files_body(),
+        params=params,
         debug_api=debug_api,
         debug_num_stacks_to_drop=debug_num_stacks_to_drop,
         parent_class=parent_class,
@@ -211,6 +231,85 @@ async def search_fileset_files(
     return res
 
 
+@gd.route_function
+async def get_fileset_directory_files(
+    auth: DomoAuth,
+    fileset_id: str,
+    directory_path: str = "",
+    limit: int = 100,
+    body: Optional[dict] = None,
+    *,
+    context: RouteContext | None = None,
+    **context_kwargs,
+) -> rgd.ResponseGetData:
+    """every immediate child of `directory_path`, paging `limit` entries at a time
+
+    paging stops at the first short page, so a directory smaller than `limit`
+    costs one request.  `res.response` is the list of file / directory objects
+    """
+    context = RouteContext.build_context(context, **context_kwargs)
+
+    files = []
+    offset = 0
+
+    while True:
+        res = await search_fileset_files(
+            auth=auth,
+            domo_fileset_id=fileset_id,
+            body=body,
+            directory_path=directory_path,
+            limit=limit,
+            offset=offset,
+            context=context,
+        )
+
+        page = res.response.get("files", []) if isinstance(res.response, dict) else []
+        files += page
+        offset += len(page)
+
+        if len(page) < limit:
+            break
+
+    res.response = files
+    return res
+
+
+@gd.route_function
+async def download_fileset_file(
+    auth: DomoAuth,
+    fileset_id: str,
+    file_id: str,
+    output_path: str | Path,
+    is_resume: bool = True,
+    checksum_algorithm: Optional[str] = None,
+    *,
+    context: RouteContext | None = None,
+    **context_kwargs,
+) -> rgd.ResponseGetData:
+    """stream a fileset file to `output_path` without loading it in memory
+
+    `res.response` is a `gd.DataStream_Result`
+    """
+    context = RouteContext.build_context(context, **context_kwargs)
+
+    url = f"https://{auth.domo_instance}.domo.com/api/files/v1/filesets/{fileset_id}/files/{file_id}/download"
+
+    res = await gd.stream_to_file(
+        url=url,
+        auth=auth,
+        output_path=output_path,
+        headers={"accept": "*/*"},
+        is_resume=is_resume,
+        checksum_algorithm=checksum_algorithm,
+        context=context,
+    )
+
+    if not res.is_success:
+        raise Fileset_GET_Error(fileset_id=fileset_id, res=res)
+
+    return res
+
+
 @gd.route_function
 async def get_data_file_by_id(
     auth: DomoAuth,
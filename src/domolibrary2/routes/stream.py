@@ -85,7 +85,7 @@ async def get_streams(
         auth=auth,
         session=session,
         url=url,
-        offset_params={"limit": "limit", "offset": "offet"},
+        offset_params={"limit": "limit", "offset": "offset"},
         arr_fn=arr_fn,
         loop_until_end=loop_until_end,
         method="GET",
@@ -98,6 +98,7 @@ async def get_streams(
         debug_num_stacks_to_drop=debug_num_stacks_to_drop,
         parent_class=parent_class,
         return_raw=return_raw,
+        context=context,
     )
 
     if return_raw:
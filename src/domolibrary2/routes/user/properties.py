@@ -55,7 +55,6 @@ from ...client import (
     get_data as gd,
     response as rgd,
 )
-from ...utils import images
 from ...utils.logging import DomoEntityExtractor, DomoEntityResultProcessor
 from .exceptions import (
     DownloadAvatar_Error,
@@ -489,6 +488,8 @@ def generate_avatar_bytestr(img_bytestr, img_type):
     Returns:
         str: Base64 encoded image string with data URI prefix
     """
+    from ...utils import images  # pulls in pillow / numpy
+
     if isinstance(img_bytestr, str):
         img_bytestr = img_bytestr.encode("utf-8")
 
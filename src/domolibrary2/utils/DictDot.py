@@ -6,6 +6,7 @@ making it easier to work with nested dictionary structures.
 
 Classes:
     DictDot: A utility class that converts dictionaries to objects with dot notation access
+    LazyDictDot: A DictDot view that wraps a dictionary without copying it
 
 Functions:
     split_str_to_obj: Convert pipe-separated strings to DictDot objects
@@ -25,9 +26,13 @@ Example:
     ...     ["domo_instance", "username", "password"]
     ... )
     >>> print(creds.domo_instance)  # "instance"
+
+    >>> # Hydrating entities from large API payloads: only read fields are wrapped
+    >>> page = LazyDictDot(page_obj)
+    >>> print(page.page.owners[0].id)
 """
 
-__all__ = ["DictDot", "split_str_to_obj"]
+__all__ = ["DictDot", "LazyDictDot", "split_str_to_obj"]
 
 from types import SimpleNamespace
 
@@ -154,6 +159,101 @@ class DictDot(SimpleNamespace):
         return getattr(self, key, default)
 
 
+class LazyDictDot(DictDot):
+    """
+    A DictDot view over a dictionary that converts nested values only when accessed.
+
+    ``DictDot`` copies the whole payload into nested namespaces up front; for
+    hydration paths that read a handful of fields from large API responses that
+    copy dominates CPU and memory.  ``LazyDictDot`` keeps a reference to the
+    original dictionary and wraps a nested dict or list the first time it is
+    read, caching the wrapper on the instance so repeated reads are plain
+    attribute lookups.
+
+    Args:
+        dictionary (Dict[str, Any]): Dictionary to wrap (not copied)
+
+    Example:
+        >>> obj = LazyDictDot({"user": {"name": "John"}, "posts": [{"title": "Post 1"}]})
+        >>> print(obj.user.name)  # "John"
+        >>> print(obj.posts[0].title)  # "Post 1"
+        >>> print(obj.missing)  # None
+
+    Note:
+        - It is a DictDot subclass, so ``isinstance(obj, DictDot)`` checks still pass
+        - Lists are wrapped one level deep, like DictDot: their dict elements become
+          LazyDictDot views
+        - Setting an attribute writes through to the wrapped dictionary
+        - ``to_dict`` returns the wrapped dictionary itself, not a copy
+    """
+
+    __slots__ = ("_dictionary",)
+
+    def __init__(self, dictionary: dict[str, object]):
+        object.__setattr__(self, "_dictionary", dictionary)
+
+    @staticmethod
+    def _wrap(value: object) -> object:
+        if isinstance(value, dict):
+            return LazyDictDot(value)
+
+        if isinstance(value, list):
+            return [
+                LazyDictDot(item) if isinstance(item, dict) else item for item in value
+            ]
+
+        return value
+
+    def __getattr__(self, item: str) -> object:
+        """Read ``item`` from the wrapped dictionary; None when it is missing."""
+        if item == "_dictionary":
+            # slot not set yet (e.g. while copying); avoid recursing
+            raise AttributeError(item)
+
+        value = self._dictionary.get(item)
+
+        if isinstance(value, (dict, list)):
+            value = self._wrap(value)
+            # cache on the instance so the next read skips __getattr__
+            object.__setattr__(self, item, value)
+
+        return value
+
+    def __setattr__(self, key: str, value: object) -> None:
+        self._dictionary[key] = value
+        self.__dict__.pop(key, None)
+
+    def __delattr__(self, key: str) -> None:
+        self._dictionary.pop(key, None)
+        self.__dict__.pop(key, None)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DictDot):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._dictionary!r})"
+
+    def __reduce__(self):
+        return (self.__class__, (self._dictionary,))
+
+    def __dir__(self) -> list[str]:
+        return sorted(set(super().__dir__()) | set(self._dictionary))
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the wrapped dictionary (not a copy)."""
+        return self._dictionary
+
+    def get(self, key: str, default: object = None) -> object:
+        """Get a value with a default fallback for keys missing from the dictionary."""
+        if key not in self._dictionary:
+            return default
+        return getattr(self, key)
+
+
 def split_str_to_obj(piped_str: str, key_ls: list[str]) -> DictDot:
     """
     Convert a pipe-separated string to a DictDot object with specified keys.
@@ -37,18 +37,8 @@ Author: Domo Utils Contributors
 License: MIT
 """
 
-# Import exceptions for easy access
-from . import (
-    DictDot,
-    chunk_execution,
-    compare,
-    convert,
-    files,
-    images,
-    logging,
-    read_creds_from_dotenv,
-    xkcd_password,
-)
+import importlib
+
 from .exceptions import (
     ConcatDataframeError,
     CredentialsError,
@@ -58,12 +48,20 @@ from .exceptions import (
     UtilityError,
 )
 
-# Import legacy exception names from convert module for backwards compatibility
-
-
-# Conditional import for upload_data (may have external dependencies)
-# from . import upload_data
-
+# utility modules are imported on first access (PEP 562); convert, images and
+# upload_data pull in pandas / numpy / pillow
+_SUBMODULES = {
+    "DictDot",
+    "chunk_execution",
+    "compare",
+    "convert",
+    "files",
+    "images",
+    "logging",
+    "read_creds_from_dotenv",
+    "upload_data",
+    "xkcd_password",
+}
 
 __all__ = [
     # Exception classes
@@ -84,3 +82,16 @@ __all__ = [
     "read_creds_from_dotenv",
     "xkcd_password",
 ]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
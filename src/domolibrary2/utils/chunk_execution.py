@@ -28,10 +28,17 @@ Example:
 
 from __future__ import annotations
 
-__all__ = ["run_with_retry", "gather_with_concurrency", "run_sequence", "chunk_list"]
+__all__ = [
+    "run_with_retry",
+    "current_retry_attempt",
+    "gather_with_concurrency",
+    "run_sequence",
+    "chunk_list",
+]
 
 import asyncio
 import functools
+from contextvars import ContextVar
 
 import httpx
 
@@ -40,6 +47,9 @@ from ..utils.logging import get_colored_logger
 # Initialize colored logger
 logger = get_colored_logger()
 
+# retry attempt (0 = first try) of the innermost run_with_retry call, read by client metrics
+current_retry_attempt: ContextVar[int] = ContextVar("current_retry_attempt", default=0)
+
 
 def run_with_retry(
     max_retry: int = 1, errors_to_retry_tp: tuple[type, ...] | None = None
@@ -79,6 +89,7 @@ def run_with_retry(
         async def wrapper(*args, **kwargs):
             retry = 0
             while retry <= max_retry:
+                token = current_retry_attempt.set(retry)
                 try:
                     return await run_fn(*args, **kwargs)
 
@@ -116,6 +127,9 @@ def run_with_retry(
                             color="yellow",
                         )
 
+                finally:
+                    current_retry_attempt.reset(token)
+
         return wrapper
 
     return actual_decorator
@@ -74,10 +74,7 @@ import ast
 import datetime as dt
 import re
 
-# Optional dependencies with fallbacks
-import pandas as pd
 from dateutil import parser as date_parser
-from IPython.display import display_markdown
 
 # Import custom exceptions
 from .exceptions import ConcatDataframeError, InvalidEmailError
@@ -101,6 +98,8 @@ def print_md(md_str: str) -> None:
         This function only works in Jupyter notebook environments where
         IPython.display is available.
     """
+    from IPython.display import display_markdown
+
     display_markdown(md_str, raw=True)
 
 
@@ -431,6 +430,8 @@ def concat_list_dataframe(df_ls: list[object]) -> object:
         Requires pandas to be installed. Uses inner join for concatenation
         and resets the index.
     """
+    import pandas as pd
+
     df = None
     for elem in df_ls:
         if not isinstance(elem, pd.DataFrame):
@@ -8,6 +8,7 @@ and support for various file operations.
 Functions:
     upsert_folder: Create folder if it doesn't exist, with optional replacement
     upsert_file: Create or update file with content
+    write_json_atomic: Replace a JSON file without ever leaving it truncated
     change_extension: Change file extension
     export_zip_binary_contents: Save binary content as zip file
     download_zip: Extract or save zip file contents
@@ -31,6 +32,7 @@ Example:
 __all__ = [
     "upsert_folder",
     "upsert_file",
+    "write_json_atomic",
     "change_extension",
     "export_zip_binary_contents",
     "download_zip",
@@ -38,6 +40,7 @@ __all__ = [
 
 
 import io
+import json
 import os
 import pathlib
 import shutil
@@ -154,6 +157,37 @@ def upsert_file(
         raise FileOperationError("create or write file", file_path, str(e))
 
 
+def write_json_atomic(file_path: str | pathlib.Path, obj: object) -> pathlib.Path:
+    """
+    Write obj as JSON to a temporary file, then rename it over file_path.
+
+    An interrupted run leaves either the previous file or the new one, never a
+    truncated one; used for manifests and state files read back on the next run.
+
+    Args:
+        file_path (str | Path): Path of the JSON file to replace
+        obj (Any): JSON-serializable object
+
+    Returns:
+        Path: The written file
+
+    Raises:
+        FileOperationError: If the file cannot be written
+    """
+    path = pathlib.Path(file_path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(obj))
+        tmp_path.replace(path)
+
+    except OSError as e:
+        raise FileOperationError("write json file", str(path), str(e))
+
+    return path
+
+
 def change_extension(file_path: str, new_extension: str) -> str:
     """
     Change the extension of a file path.
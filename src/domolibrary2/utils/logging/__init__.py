@@ -5,20 +5,26 @@ This module provides custom logging processors and utilities specifically design
 for domolibrary2 components, keeping the codebase clean and organized.
 """
 
-from .colored_logger import (
-    ColoredLogger,
-    get_colored_logger,
-    set_domolibrary_logger,
-    log_call,
-)
-from .processors import (
-    DomoEntityExtractor,
-    DomoEntityObjectProcessor,
-    DomoEntityProcessor,
-    DomoEntityResultProcessor,
-    NoOpEntityExtractor,
-    ResponseGetDataProcessor,
-)
+import importlib
+
+# names are resolved on first access (PEP 562): the processors import the client
+# response module and every submodule imports dc_logger
+_LAZY_NAMES = {
+    "ColoredLogger": "colored_logger",
+    "get_colored_logger": "colored_logger",
+    "set_domolibrary_logger": "colored_logger",
+    "log_call": "colored_logger",
+    "gated_log_call": "gating",
+    "get_log_sample_rate": "gating",
+    "is_log_level_enabled": "gating",
+    "set_log_sample_rate": "gating",
+    "DomoEntityExtractor": "processors",
+    "DomoEntityObjectProcessor": "processors",
+    "DomoEntityProcessor": "processors",
+    "DomoEntityResultProcessor": "processors",
+    "NoOpEntityExtractor": "processors",
+    "ResponseGetDataProcessor": "processors",
+}
 
 __all__ = [
     "ResponseGetDataProcessor",
@@ -31,4 +37,21 @@ __all__ = [
     "get_colored_logger",
     "set_domolibrary_logger",
     "log_call",
+    "gated_log_call",
+    "is_log_level_enabled",
+    "set_log_sample_rate",
+    "get_log_sample_rate",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(f".{_LAZY_NAMES[name]}", __name__)
+        value = globals()[name] = getattr(module, name)
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,219 @@
+"""
+Level-gated, sampled wrapper around dc_logger's ``log_call``.
+
+``log_call`` extracts entity / HTTP details, runs the result processor and
+builds the log record on every call, even when the logger will drop the
+record. ``gated_log_call`` checks the effective level (and an optional
+sample rate) first and calls the undecorated function when the record would
+not be emitted, so processors only run for records that are written.
+
+Errors are never sampled away: when the fast path sees an exception or an
+HTTP error response and the logger accepts ERROR records, the error record is
+written through the same result processor ``log_call`` would use.
+
+Example:
+    >>> @gated_log_call(action_name="get_data", log_level="DEBUG")
+    ... async def get_data(...): ...
+    >>>
+    >>> # keep 1% of successful get_data records when debugging a large crawl
+    >>> set_log_sample_rate("get_data", 0.01)
+"""
+
+import random
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from dc_logger.client.base import get_global_logger
+from dc_logger.client.models import LogLevel
+from dc_logger.decorators import LogDecoratorConfig, log_call
+
+__all__ = [
+    "gated_log_call",
+    "is_log_level_enabled",
+    "set_log_sample_rate",
+    "get_log_sample_rate",
+]
+
+# action_name -> fraction of successful records to keep (errors are always kept)
+_SAMPLE_RATES: dict[str, float] = {}
+
+
+def set_log_sample_rate(action_name: str, sample_rate: Optional[float]) -> None:
+    """Set the fraction of successful records kept for an action.
+
+    Args:
+        action_name: ``action_name`` passed to ``gated_log_call`` (e.g. "get_data")
+        sample_rate: Value between 0 and 1; None restores the decorator default
+    """
+    if sample_rate is None:
+        _SAMPLE_RATES.pop(action_name, None)
+        return
+
+    if not 0 <= sample_rate <= 1:
+        raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+
+    _SAMPLE_RATES[action_name] = sample_rate
+
+
+def get_log_sample_rate(action_name: str, default: float = 1.0) -> float:
+    """Return the configured sample rate for an action."""
+    return _SAMPLE_RATES.get(action_name, default)
+
+
+def is_log_level_enabled(logger: Any, level: LogLevel | str) -> bool:
+    """Return True if ``logger`` would emit a record at ``level``.
+
+    Mirrors the filtering ``logger.log`` applies for dc_logger's legacy
+    ``Logger`` (``show_debugging``) and ``DCLogger`` (``config.level``).
+    ``ColoredLogger.log`` delegates to the wrapped logger, so the wrapped logger
+    decides.  Unknown loggers are assumed to accept every level.
+    """
+    if logger is None:
+        return False
+
+    level = LogLevel.from_string(level) if isinstance(level, str) else level
+
+    logger = getattr(logger, "_logger", logger)
+
+    if hasattr(logger, "show_debugging"):
+        return level != LogLevel.DEBUG or bool(logger.show_debugging)
+
+    min_level = getattr(getattr(logger, "config", None), "level", None)
+    if isinstance(min_level, LogLevel):
+        return min_level.should_log(level)
+
+    return True
+
+
+def _is_error_result(result: Any) -> bool:
+    status = getattr(result, "status", None)
+    return isinstance(status, int) and status >= 400
+
+
+async def _log_error_record(
+    logger: Any,
+    config: LogDecoratorConfig,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    start_time: float,
+    result: Any = None,
+    exception: Optional[BaseException] = None,
+) -> None:
+    """Write the ERROR record ``log_call`` would have written on the fast path."""
+    action = config.action_name or func.__qualname__
+
+    http_details = config.http_extractor.extract(func, args, kwargs)
+    if http_details and http_details.method == "COMMENT":
+        http_details = None
+
+    context: dict[str, Any] = {
+        "action": action,
+        "entity": config.entity_extractor.extract(func, args, kwargs),
+        "multi_tenant": config.multitenant_extractor.extract(func, args, kwargs),
+    }
+    extra: dict[str, Any] = {"function": func.__qualname__, "module": func.__module__}
+
+    if exception is not None:
+        message = f"{action} failed: {exception}"
+        extra.update(
+            {"error_type": type(exception).__name__, "error_message": str(exception)}
+        )
+        if http_details and hasattr(exception, "status"):
+            http_details.status_code = getattr(exception, "status", None)
+    else:
+        message = f"{action} failed with HTTP error"
+        result_context, http_details = config.result_processor.process(
+            result, http_details
+        )
+        extra.update(result_context.pop("extra", {}))
+        context.update(result_context)
+
+    if http_details is not None:
+        context["http_details"] = http_details
+
+    await logger.log(
+        level=LogLevel.ERROR,
+        message=message,
+        duration_ms=int((time.time() - start_time) * 1000),
+        status="error",
+        level_name=config.level_name,
+        color=config.color,
+        **context,
+        extra=extra,
+    )
+
+
+def gated_log_call(
+    action_name: Optional[str] = None,
+    level_name: Optional[str] = None,
+    log_level: LogLevel | str = LogLevel.INFO,
+    config: Optional[LogDecoratorConfig] = None,
+    color: Optional[str] = None,
+    sample_rate: float = 1.0,
+    logger_getter: Optional[Callable[[], Any]] = None,
+) -> Callable:
+    """``log_call`` that skips all record-building work when it would be dropped.
+
+    Args:
+        action_name: Custom action name for logs (defaults to function name)
+        level_name: Custom level name for logs (e.g. "client")
+        log_level: Level of the success record
+        config: LogDecoratorConfig with custom extractors / result processor
+        color: Console color for log output
+        sample_rate: Default fraction of successful records kept; override at
+            runtime with ``set_log_sample_rate(action_name, ...)``
+        logger_getter: Callable returning the logger (defaults to the global logger)
+    """
+    log_level = (
+        LogLevel.from_string(log_level) if isinstance(log_level, str) else log_level
+    )
+    logger_getter = logger_getter or get_global_logger
+
+    def decorator(func: Callable) -> Callable:
+        # log_call applies action_name / level_name / color onto the shared config
+        gate_config = config or LogDecoratorConfig()
+        logged_func = log_call(
+            func,
+            logger_getter=logger_getter,
+            action_name=action_name,
+            level_name=level_name,
+            log_level=log_level,
+            config=gate_config,
+            color=color,
+        )
+        gate_action = gate_config.action_name or func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            logger = logger_getter()
+
+            if is_log_level_enabled(logger, log_level):
+                rate = _SAMPLE_RATES.get(gate_action, sample_rate)
+                if rate >= 1 or random.random() < rate:
+                    return await logged_func(*args, **kwargs)
+
+            # fast path: success records are dropped or sampled out
+            start_time = time.time()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                if is_log_level_enabled(logger, LogLevel.ERROR):
+                    await _log_error_record(
+                        logger, gate_config, func, args, kwargs, start_time, exception=e
+                    )
+                raise
+
+            if _is_error_result(result) and is_log_level_enabled(
+                logger, LogLevel.ERROR
+            ):
+                await _log_error_record(
+                    logger, gate_config, func, args, kwargs, start_time, result=result
+                )
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,16 @@
-__all__ = ["upload_data"]
+from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+__all__ = [
+    "upload_data",
+    "InstanceUpload_Result",
+    "MultiInstanceUpload_Result",
+    "upload_data_multi_instance",
+]
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
 
 import httpx
 import pandas as pd
@@ -10,6 +20,7 @@ if TYPE_CHECKING:
 
 from ..auth import DomoAuth
 from ..classes import DomoDataset
+from ..client import get_data as gd
 from ..utils.logging import get_colored_logger
 
 logger = get_colored_logger()
@@ -26,6 +37,7 @@ async def loop_upload(
     debug_fn: bool = True,
     max_retry: int = 2,
     is_index: bool = False,
+    session: httpx.AsyncClient | None = None,
 ):
     base_msg = (
         f"{partition_key} in {consol_ds.auth.domo_instance}"
@@ -47,11 +59,12 @@ async def loop_upload(
             if debug_fn:
                 print(f"attempt {retry_attempt}/{max_retry} for {base_msg}")
 
-            res = await consol_ds.upload_data(
+            res = await consol_ds.Data.upload_data(
                 upload_df=upload_df,
                 upload_method="REPLACE" if partition_key else upload_method,
                 partition_key=partition_key,
                 is_index=is_index,
+                session=session,
                 debug_api=debug_api,
                 debug_prn=debug_prn,
             )
@@ -78,13 +91,13 @@ async def upload_data(
     instance_auth: DomoAuth,  # instance to run the data function against
     consol_ds: DomoDataset,  # dataset where data should be accumulated
     # if partition key supplied, will replace existing partition
-    partition_key: Optional[str] = None,
+    partition_key: str | None = None,
     upload_method: str = "REPLACE",
     is_index: bool = False,  # index dataset
     debug_prn: bool = False,
     debug_fn: bool = True,
     debug_api: bool = False,
-    logger: Optional[Logger] = None,
+    logger: Logger | None = None,
     max_retry: int = 2,  # number of times to attempt upload
 ):
     try:
@@ -134,7 +147,7 @@ async def upload_data(
 
     finally:
         if is_index:
-            res = await consol_ds.index_dataset(
+            res = await consol_ds.Data.index(
                 debug_api=debug_api, session=instance_session
             )
             if res.is_success:
@@ -147,3 +160,180 @@ async def upload_data(
             print(message)
 
         await instance_session.aclose()
+
+
+@dataclass
+class InstanceUpload_Result:
+    """Outcome of one source instance in ``upload_data_multi_instance``."""
+
+    domo_instance: str
+    partition_key: str | None
+    status: str = "pending"  # success | empty | failed
+    rows: int = 0
+    extract_seconds: float = 0.0
+    upload_seconds: float = 0.0
+    error: BaseException | None = field(default=None, repr=False)
+    res: Any = field(default=None, repr=False)
+
+    @property
+    def is_success(self) -> bool:
+        return self.status in ("success", "empty")
+
+    def to_dict(self) -> dict:
+        return {
+            "domo_instance": self.domo_instance,
+            "partition_key": self.partition_key,
+            "status": self.status,
+            "rows": self.rows,
+            "extract_seconds": self.extract_seconds,
+            "upload_seconds": self.upload_seconds,
+            "error": repr(self.error) if self.error else None,
+        }
+
+
+@dataclass
+class MultiInstanceUpload_Result:
+    results: list[InstanceUpload_Result] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[InstanceUpload_Result]:
+        return [result for result in self.results if result.status == "failed"]
+
+    @property
+    def rows(self) -> int:
+        return sum(result.rows for result in self.results)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [result.to_dict() for result in self.results],
+            columns=list(InstanceUpload_Result("", None).to_dict()),
+        )
+
+
+async def upload_data_multi_instance(
+    data_fn: Callable,  # async (instance_auth, session, debug_api=...) -> pd.DataFrame
+    instance_auths: list[DomoAuth],  # instances to run the data function against
+    consol_ds: DomoDataset,  # dataset where data should be accumulated
+    # partition per source instance; defaults to the instance name
+    partition_key_fn: Callable[[DomoAuth], str] | None = None,
+    upload_method: str = "REPLACE",
+    max_concurrency: int = 20,  # data_fn calls in flight across all instances
+    max_concurrency_per_instance: int = 4,  # pooled connections per source instance
+    max_upload_concurrency: int = 5,  # partition uploads in flight to consol_ds
+    max_retry: int = 2,  # number of times to attempt each upload
+    is_index: bool = False,  # index consol_ds once after all uploads
+    on_result: Callable[[InstanceUpload_Result], Any] | None = None,
+    debug_prn: bool = False,
+    debug_fn: bool = False,
+    debug_api: bool = False,
+    logger: Logger | None = None,
+) -> MultiInstanceUpload_Result:
+    """Run ``data_fn`` against many instances and stream each result into a ``consol_ds`` partition.
+
+    Each instance gets one pooled ``httpx.AsyncClient`` shared by its extracts
+    (at most ``max_concurrency_per_instance`` connections), and every upload
+    goes through one pooled session to the ``consol_ds`` instance.  A partition
+    upload starts as soon as its extract finishes, and does not hold an extract
+    slot.  Failures are recorded on the instance's
+    ``InstanceUpload_Result`` and never stop the batch.
+
+    Args:
+        on_result: Called (or awaited) with each instance's result as it completes
+    """
+    logger = logger or get_colored_logger()
+    partition_key_fn = partition_key_fn or (lambda auth: auth.domo_instance)
+
+    global_semaphore = asyncio.Semaphore(max_concurrency)
+    upload_semaphore = asyncio.Semaphore(max_upload_concurrency)
+    sessions: dict[tuple[str, str], httpx.AsyncClient] = {}
+
+    def get_session(
+        role: str, domo_instance: str, max_connections: int
+    ) -> httpx.AsyncClient:
+        # extracts and uploads keep separate pools even when consol_ds lives in a
+        # source instance, so neither can starve the other of connections
+        if (role, domo_instance) not in sessions:
+            sessions[(role, domo_instance)], _ = gd.create_httpx_session(
+                is_verify=False,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+        return sessions[(role, domo_instance)]
+
+    upload_session = get_session(
+        "upload", consol_ds.auth.domo_instance, max_upload_concurrency
+    )
+
+    async def run_instance(instance_auth: DomoAuth) -> InstanceUpload_Result:
+        domo_instance = instance_auth.domo_instance
+        result = InstanceUpload_Result(
+            domo_instance=domo_instance, partition_key=partition_key_fn(instance_auth)
+        )
+
+        try:
+            async with global_semaphore:
+                start = time.perf_counter()
+                upload_df = await data_fn(
+                    instance_auth,
+                    get_session("extract", domo_instance, max_concurrency_per_instance),
+                    debug_api=debug_api,
+                )
+                result.extract_seconds = time.perf_counter() - start
+
+            if upload_df is None or len(upload_df.index) == 0:
+                result.status = "empty"
+
+            else:
+                result.rows = len(upload_df.index)
+
+                async with upload_semaphore:
+                    start = time.perf_counter()
+                    result.res = await loop_upload(
+                        upload_df=upload_df,
+                        consol_ds=consol_ds,
+                        partition_key=result.partition_key,
+                        upload_method=upload_method,
+                        logger=logger,
+                        debug_api=debug_api,
+                        debug_prn=debug_prn,
+                        debug_fn=debug_fn,
+                        max_retry=max_retry,
+                        is_index=False,
+                        session=upload_session,
+                    )
+                    result.upload_seconds = time.perf_counter() - start
+
+                result.status = "success" if result.res.is_success else "failed"
+
+        except Exception as e:
+            result.status = "failed"
+            result.error = e
+
+            await logger.error(f"💣 {domo_instance} - {data_fn.__name__} failed: {e}")
+
+        if on_result:
+            callback_result = on_result(result)
+            if asyncio.iscoroutine(callback_result):
+                await callback_result
+
+        return result
+
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(
+            *[run_instance(instance_auth) for instance_auth in instance_auths]
+        )
+
+        if is_index and any(result.status == "success" for result in results):
+            await consol_ds.Data.index(debug_api=debug_api, session=upload_session)
+
+    finally:
+        for session in sessions.values():
+            await session.aclose()
+
+    return MultiInstanceUpload_Result(
+        results=list(results), wall_seconds=time.perf_counter() - start
+    )
@@ -0,0 +1,98 @@
+"""Test stream inventory rows and paging without building DomoStream objects."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from domolibrary2.classes.DomoDataset import stream_inventory
+from domolibrary2.classes.DomoDataset.stream import DomoStream
+from domolibrary2.client import response as rgd
+
+SNOWFLAKE_STREAM = {
+    "id": 101,
+    "dataSource": {"id": "ds-101"},
+    "dataProvider": {"key": "snowflake", "name": "Snowflake"},
+    "transport": {"description": "connector", "version": 2},
+    "updateMethod": "REPLACE",
+    "account": {"id": 55, "displayName": "sf-acct", "userId": 9},
+    "configuration": [
+        {
+            "name": "query",
+            "type": "string",
+            "value": "SELECT * FROM Sales s JOIN Region r ON 1=1",
+        },
+        {"name": "databaseName", "type": "string", "value": "SA_PRD"},
+        {"name": "warehouseName", "type": "string", "value": "COMPUTE_WH"},
+    ],
+    "scheduleExpression": "0 15 * * *",
+    "scheduleStartDate": 1704067200000,
+}
+
+DATASET_COPY_STREAM = {
+    "id": 202,
+    "dataSource": {"id": "ds-202"},
+    "dataProvider": {"key": "dataset-copy", "name": "Dataset Copy"},
+    "configuration": [
+        {"name": "datasourceUrl", "type": "string", "value": "https://x.domo.com"},
+    ],
+    "scheduleStartDate": "2024-01-01T09:00:00Z",
+}
+
+
+def test_inventory_row_matches_domo_stream():
+    """Inventory rows should agree with DomoStream conformed properties."""
+    row = stream_inventory.extract_stream_inventory_row(SNOWFLAKE_STREAM)
+
+    stream = DomoStream.from_dict(auth=None, obj=dict(SNOWFLAKE_STREAM))
+
+    assert row["stream_id"] == 101
+    assert row["data_provider_key"] == "snowflake"
+    assert row["account_display_name"] == "sf-acct"
+    assert row["query"] == stream.sql
+    assert row["database"] == stream.database
+    assert row["warehouse"] == stream.warehouse
+    assert row["tables"] == ["region", "sales"]
+    assert row["schedule_frequency"] == stream.Schedule.frequency.value
+    assert set(row) == set(stream_inventory.STREAM_INVENTORY_COLUMNS)
+
+
+def test_inventory_row_without_sql():
+    row = stream_inventory.extract_stream_inventory_row(DATASET_COPY_STREAM)
+
+    assert row["dataset_id"] == "ds-202"
+    assert row["query"] is None
+    assert row["tables"] == []
+
+
+def test_inventory_pages_into_dataframe(monkeypatch):
+    """Pages are requested with increasing offsets and concatenated."""
+    streams = [dict(SNOWFLAKE_STREAM, id=i) for i in range(5)]
+    calls = []
+
+    async def fake_get_streams(auth, skip, maximum, **kwargs):
+        calls.append((skip, maximum))
+        return rgd.ResponseGetData(
+            status=200, response=streams[skip : skip + maximum], is_success=True
+        )
+
+    monkeypatch.setattr(stream_inventory.stream_routes, "get_streams", fake_get_streams)
+
+    df = asyncio.run(stream_inventory.get_stream_inventory(auth=None, page_size=2))
+
+    assert calls == [(0, 2), (2, 2), (4, 2)]
+    assert list(df["stream_id"]) == [0, 1, 2, 3, 4]
+    assert list(df.columns) == stream_inventory.STREAM_INVENTORY_COLUMNS
+    assert str(df["schedule_start_date"].iloc[0]) == "2024-01-01 00:00:00+00:00"
+
+
+def test_inventory_mixed_start_date_formats():
+    df = stream_inventory._rows_to_dataframe(
+        [
+            stream_inventory.extract_stream_inventory_row(SNOWFLAKE_STREAM),
+            stream_inventory.extract_stream_inventory_row(DATASET_COPY_STREAM),
+        ]
+    )
+
+    assert df["schedule_start_date"].notna().all()
@@ -0,0 +1,130 @@
+"""Test bulk partition retention planning and concurrent deletion."""
+
+import asyncio
+import datetime as dt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pandas as pd
+import pytest
+
+from domolibrary2.classes.DomoDataset import DomoDataset_Default, parse_partition_dates
+from domolibrary2.client.simulator import DomoApiSimulator
+from domolibrary2.integrations import Automation
+
+TODAY = dt.date(2024, 12, 31)
+
+
+def make_dataset(simulator):
+    return DomoDataset_Default(auth=simulator.auth, id="ds-1", raw={})
+
+
+def test_parse_partition_dates_vectorized():
+    dates = parse_partition_dates(
+        pd.Series(["store_1|2024-01-31", "store_2|2024-02-01", "store_3|latest"]),
+        separator="|",
+        date_index=1,
+    )
+
+    assert dates.iloc[0] == pd.Timestamp("2024-01-31")
+    assert pd.isna(dates.iloc[2])
+
+
+def test_dry_run_plans_without_deleting():
+    simulator = DomoApiSimulator(n_partitions=250)
+    domo_ds = make_dataset(simulator)
+
+    async def plan():
+        async with simulator.session() as session:
+            partitions_df = await domo_ds.Partitions.get(session=session)
+        return domo_ds.Partitions.plan_retention(
+            partitions_df, keep_last_days=30, keep_latest_n=10, today=TODAY
+        )
+
+    plan = asyncio.run(plan())
+
+    # 250 daily partitions; everything before 2024-12-01 goes
+    assert plan.n_delete == 250 - 31
+    assert plan.is_dry_run
+    assert min(plan.partitions_df.loc[~plan.delete_mask, "partition_id"]) == (
+        "2024-12-01"
+    )
+    assert simulator.stats.by_endpoint["list_partitions"] == 4  # 100 per page
+    assert "delete_partition" not in simulator.stats.by_endpoint
+
+    df = plan.to_dataframe()
+    assert df["action"].value_counts().to_dict() == {"delete": 219, "keep": 31}
+
+
+def test_apply_deletes_concurrently_and_indexes_once():
+    simulator = DomoApiSimulator(n_partitions=120)
+    domo_ds = make_dataset(simulator)
+
+    async def run():
+        async with simulator.session() as session:
+            partitions_df = await domo_ds.Partitions.get(session=session)
+
+            # a partition that vanished between listing and deleting
+            simulator.get_partitions("ds-1").pop("2024-09-05")
+
+            plan = domo_ds.Partitions.plan_retention(
+                partitions_df, before_date=dt.date(2024, 10, 1)
+            )
+            return await domo_ds.Partitions.apply(
+                plan, max_concurrency=8, session=session
+            )
+
+    plan = asyncio.run(run())
+
+    assert plan.is_applied
+    assert list(plan.failed) == ["2024-09-05"]
+    assert simulator.stats.by_endpoint["delete_partition"] == plan.n_delete - 1
+    assert simulator.stats.by_endpoint["index"] == 1
+    assert min(simulator.get_partitions("ds-1")) == "2024-10-01"
+
+    statuses = plan.to_dataframe()["status"].value_counts(dropna=False)
+    assert statuses["deleted"] == plan.n_delete - 1
+
+
+def test_automation_helper_supports_dry_run(monkeypatch):
+    simulator = DomoApiSimulator(n_partitions=40)
+
+    class FakeDate(dt.date):
+        @classmethod
+        def today(cls):
+            return TODAY
+
+    monkeypatch.setattr(dt, "date", FakeDate)
+
+    with simulator.install():
+        plan = asyncio.run(
+            Automation.remove_partition_by_x_days(
+                auth=simulator.auth, dataset_id="ds-1", x_last_days=7, is_dry_run=True
+            )
+        )
+
+    assert plan.n_delete == 40 - 8
+    assert len(simulator.get_partitions("ds-1")) == 40
+
+
+def test_retention_without_rules_is_refused():
+    simulator = DomoApiSimulator(n_partitions=10)
+    domo_ds = make_dataset(simulator)
+
+    async def remove():
+        async with simulator.session() as session:
+            return await domo_ds.Partitions.remove_partitions(session=session)
+
+    with pytest.raises(ValueError):
+        asyncio.run(remove())
+
+    assert simulator.stats.requests == 0
+    assert len(simulator.get_partitions("ds-1")) == 10
+
+    partitions_df = pd.DataFrame(
+        {"partition_id": ["2024-01-01"], "partition_date": [pd.Timestamp("2024-01-01")]}
+    )
+    with pytest.raises(ValueError):
+        domo_ds.Partitions.plan_retention(partitions_df)
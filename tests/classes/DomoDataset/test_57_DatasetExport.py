@@ -0,0 +1,107 @@
+"""Test streaming full-dataset export to disk."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pandas as pd
+import pytest
+
+from domolibrary2.classes.DomoDataset import DomoDataset_Default
+from domolibrary2.classes.DomoDataset.dataset_data import read_export_chunks
+from domolibrary2.client import get_data as gd
+from domolibrary2.client.simulator import DomoApiSimulator
+
+
+def export(simulator, output_path, **kwargs):
+    domo_ds = DomoDataset_Default(auth=simulator.auth, id="ds-1", raw={})
+
+    async def run():
+        async with simulator.session() as session:
+            return await domo_ds.Data.export(
+                output_path=output_path, session=session, **kwargs
+            )
+
+    return asyncio.run(run())
+
+
+def test_export_streams_csv_to_file(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=5_000, n_dataset_columns=3)
+
+    result = export(simulator, tmp_path / "ds-1.csv", is_gzip=False)
+
+    assert result.path.read_bytes() == simulator.get_export_csv()
+    assert result.content_encoding is None
+    assert result.size == len(simulator.get_export_csv())
+    assert result.bytes_per_second > 0
+    assert not (tmp_path / "ds-1.csv.part").exists()
+
+    chunks = list(read_export_chunks(result, chunksize=2_000))
+    assert [len(chunk) for chunk in chunks] == [2_000, 2_000, 1_000]
+    assert list(chunks[0].columns) == ["row_id", "col_1", "col_2"]
+    assert chunks[2]["col_2"].iloc[-1] == 4_999 * 2
+
+
+def test_gzip_export_resumes_after_dropped_connections(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=50_000, export_drop_after=50_000)
+
+    result = export(simulator, tmp_path / "ds-1.csv.gz", max_retry=20)
+
+    assert result.content_encoding == "gzip"
+    assert result.attempts > 1
+    assert simulator.stats.by_endpoint["export"] == result.attempts
+
+    df = pd.concat(read_export_chunks(result, chunksize=10_000))
+    assert len(df) == 50_000
+    assert df["row_id"].tolist() == list(range(50_000))
+
+
+def test_gzip_export_gets_gz_suffix(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=1_000)
+
+    result = export(simulator, tmp_path / "ds-1.csv")
+
+    assert result.content_encoding == "gzip"
+    assert result.path == tmp_path / "ds-1.csv.gz"
+    assert not (tmp_path / "ds-1.csv").exists()
+    assert len(pd.concat(read_export_chunks(result.path))) == 1_000
+
+
+def test_export_continues_partial_file(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=1_000, export_drop_after=1_234)
+    output_path = tmp_path / "ds-1.csv"
+    with pytest.raises(gd.GetDataError):
+        export(simulator, output_path, is_gzip=False, max_retry=0)
+
+    simulator.export_drop_after = 0
+    result = export(simulator, output_path, is_gzip=False)
+
+    assert result.bytes_resumed == 1_234
+    assert output_path.read_bytes() == simulator.get_export_csv()
+
+
+def test_export_restarts_when_dataset_changed(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=1_000, export_drop_after=1_234)
+    output_path = tmp_path / "ds-1.csv"
+    with pytest.raises(gd.GetDataError):
+        export(simulator, output_path, is_gzip=False, max_retry=0)
+
+    simulator.export_drop_after = 0
+    simulator.n_dataset_rows = 1_500
+    simulator._cache.clear()
+    result = export(simulator, output_path, is_gzip=False)
+
+    assert result.bytes_resumed == 0
+    assert output_path.read_bytes() == simulator.get_export_csv()
+
+
+def test_export_gives_up_after_max_retry(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=50_000, export_drop_after=10_000)
+
+    with pytest.raises(gd.GetDataError):
+        export(simulator, tmp_path / "ds-1.csv", is_gzip=False, max_retry=2)
+
+    assert simulator.stats.by_endpoint["export"] == 3
+    assert (tmp_path / "ds-1.csv.part").stat().st_size == 30_000
@@ -0,0 +1,159 @@
+"""Test the Domo Everywhere subscriber -> publisher content map."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.DomoCard import FederatedDomoCard
+from domolibrary2.classes.DomoEverywhere import (
+    DomoEverywhere_ContentMap,
+    DomoEverywhere_ContentMap_NoMatch,
+    DomoSubscription,
+    content_map as content_map_module,
+)
+
+
+@pytest.fixture
+def subscriber_auth(make_mock_auth):
+    return make_mock_auth("subscriber")
+
+
+@pytest.fixture
+def publisher_auth(make_mock_auth):
+    return make_mock_auth("publisher")
+
+
+class FakeFederatedCard:
+    entity_type = "CARD"
+    fetched = []
+
+    def __init__(self, id, auth):
+        self.id = id
+        self.auth = auth
+
+    @classmethod
+    async def get_entity_by_id(cls, entity_id, auth):
+        cls.fetched.append((entity_id, auth.domo_instance))
+        return {"id": entity_id, "instance": auth.domo_instance}
+
+
+def make_subscription(publication_id, auth):
+    return DomoSubscription.from_dict(
+        {
+            "id": f"sub-{publication_id}",
+            "publicationId": publication_id,
+            "domain": "subscriber.domo.com",
+            "publisherDomain": "publisher.domo.com",
+        },
+        auth=auth,
+    )
+
+
+CONTENT_DETAILS = {
+    "pub-1": [
+        {
+            "subscriberObjectId": "101",
+            "publisherObjectId": "9001",
+            "contentType": "CARD",
+            "subscriberDomain": "subscriber.domo.com",
+        },
+        {
+            "subscriberObjectId": "ds-1",
+            "publisherObjectId": "ds-9",
+            "contentType": "DATASET",
+            "subscriberDomain": "subscriber.domo.com",
+        },
+    ],
+    "pub-2": [
+        {
+            "subscriberObjectId": "102",
+            "publisherObjectId": "9002",
+            "contentType": "CARD",
+            "subscriberDomain": "subscriber.domo.com",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def content_calls(route_calls):
+    return route_calls.patch(
+        content_map_module.publish_routes,
+        "get_subscriber_content_details",
+        lambda publication_id, **kwargs: CONTENT_DETAILS[publication_id],
+    )
+
+
+@pytest.fixture
+def content_map(content_calls, subscriber_auth, publisher_auth):
+    return asyncio.run(
+        DomoEverywhere_ContentMap.build(
+            auth=subscriber_auth,
+            parent_auth_retrieval_fn=lambda sub: publisher_auth,
+            # duplicate subscription for pub-1 must not trigger a second call
+            subscriptions=[
+                make_subscription("pub-1", subscriber_auth),
+                make_subscription("pub-2", subscriber_auth),
+                make_subscription("pub-1", subscriber_auth),
+            ],
+        )
+    )
+
+
+def test_build_fetches_content_once_per_pair(content_map, content_calls):
+    assert sorted(
+        (
+            call["auth"].domo_instance,
+            call["publication_id"],
+            call["subscriber_instance"],
+        )
+        for call in content_calls
+    ) == [
+        ("publisher", "pub-1", "subscriber.domo.com"),
+        ("publisher", "pub-2", "subscriber.domo.com"),
+    ]
+    assert len(content_map) == 3
+
+    link = content_map.lookup("102", "CARD")
+    assert link.publisher_object_id == "9002"
+    assert link.publication_id == "pub-2"
+    assert link.publisher_domain == "publisher.domo.com"
+    assert content_map.lookup("102", "DATASET") is None
+
+
+def test_resolve_publisher_entity_with_one_fetch(content_map, subscriber_auth):
+    FakeFederatedCard.fetched = []
+
+    parent = asyncio.run(
+        content_map.get_publisher_entity(FakeFederatedCard("101", subscriber_auth))
+    )
+
+    assert parent == {"id": "9001", "instance": "publisher"}
+    assert FakeFederatedCard.fetched == [("9001", "publisher")]
+
+
+def test_unpublished_entity(content_map, subscriber_auth):
+    assert (
+        asyncio.run(
+            content_map.get_publisher_entity(
+                FakeFederatedCard("404", subscriber_auth), is_suppress_errors=True
+            )
+        )
+        is None
+    )
+
+    with pytest.raises(DomoEverywhere_ContentMap_NoMatch):
+        asyncio.run(
+            content_map.get_publisher_entity(FakeFederatedCard("404", subscriber_auth))
+        )
+
+    with pytest.raises(DomoEverywhere_ContentMap_NoMatch):
+        asyncio.run(
+            FederatedDomoCard(
+                auth=subscriber_auth, id="404", raw={}
+            ).get_federated_parent(content_map=content_map)
+        )
@@ -0,0 +1,115 @@
+"""Test publication listing from the search payload and id-keyed de-duplication."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.DomoEverywhere import (
+    DomoEverywhere,
+    core as everywhere_core,
+)
+
+
+@pytest.fixture
+def publisher_auth(make_mock_auth):
+    return make_mock_auth("publisher")
+
+
+SUMMARIES = [
+    {"id": "pub-1", "name": "Sales", "description": "", "created": 1700000000000},
+    {"id": "pub-2", "name": "Ops", "description": "", "created": None},
+    # overlapping search pages repeat rows
+    {"id": "pub-1", "name": "Sales", "description": "", "created": 1700000000000},
+]
+
+
+def make_publication(publication_id):
+    return {
+        "id": publication_id,
+        "name": f"{publication_id} details",
+        "description": "full",
+        "created": 1700000000000,
+        "content": {"updated": 1700000100000},
+        "isV2": True,
+        "subscriptionAuthorizations": [
+            {
+                "id": f"sub-{publication_id}",
+                "publicationId": publication_id,
+                "domain": "sub.domo.com",
+            }
+        ],
+        "children": [
+            {
+                "id": f"content-{publication_id}",
+                "created": 1700000000000,
+                "content": {"type": "CARD", "domoObjectId": "1", "domain": "pub"},
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def detail_calls(route_calls):
+    route_calls.patch(everywhere_core.publish_routes, "search_publications", SUMMARIES)
+    return route_calls.patch(
+        everywhere_core.publish_routes,
+        "get_publication_by_id",
+        lambda publication_id, **kwargs: make_publication(publication_id),
+    )
+
+
+def detail_ids(detail_calls):
+    return [call["publication_id"] for call in detail_calls]
+
+
+def test_listing_mode_builds_from_summaries(detail_calls, publisher_auth):
+    domo_everywhere = DomoEverywhere(auth=publisher_auth)
+
+    publications = asyncio.run(domo_everywhere.get_publications(is_hydrate=False))
+
+    assert detail_ids(detail_calls) == []
+    assert [pub.id for pub in publications] == ["pub-1", "pub-2"]
+    assert publications[0].name == "Sales"
+    assert not publications[0].is_hydrated
+
+
+def test_lazy_hydration_updates_in_place(detail_calls, publisher_auth):
+    domo_everywhere = DomoEverywhere(auth=publisher_auth)
+    publications = asyncio.run(domo_everywhere.get_publications(is_hydrate=False))
+
+    pub = asyncio.run(publications[0].hydrate())
+
+    assert pub is publications[0]
+    assert pub.is_hydrated
+    assert pub.name == "pub-1 details"
+    assert pub.subscriptions[0].parent_publication is pub
+    assert pub.content[0].parent is pub
+
+    asyncio.run(domo_everywhere.hydrate_publications())
+    assert detail_ids(detail_calls) == ["pub-1", "pub-2"]
+
+
+def test_default_mode_hydrates_each_id_once(detail_calls, publisher_auth):
+    domo_everywhere = DomoEverywhere(auth=publisher_auth)
+
+    publications = asyncio.run(domo_everywhere.get_publications())
+
+    assert sorted(detail_ids(detail_calls)) == ["pub-1", "pub-2"]
+    assert all(pub.is_hydrated for pub in publications)
+
+
+def test_subscriptions_deduplicated_by_id(route_calls, publisher_auth):
+    sub = {"subscriptionId": "s1", "publicationId": "pub-1", "domain": "a.domo.com"}
+    route_calls.patch(
+        everywhere_core.publish_routes,
+        "get_subscription_summaries",
+        [sub, dict(sub)],
+    )
+
+    subscriptions = asyncio.run(DomoEverywhere(auth=publisher_auth).get_subscriptions())
+
+    assert [sub.id for sub in subscriptions] == ["s1"]
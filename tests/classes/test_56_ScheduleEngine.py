@@ -0,0 +1,124 @@
+"""Test compiled schedule parsing, batch next-run computation and load histograms."""
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+
+from domolibrary2.classes.subentity import schedule_engine
+from domolibrary2.classes.subentity.schedule import DomoSchedule
+
+START = dt.datetime(2024, 1, 1, 0, 0)  # Monday
+
+
+def test_compile_cron_and_quartz_share_weekday_semantics():
+    """5-field cron uses 0=Sunday, Quartz uses 1=Sunday; both mean Monday here."""
+    cron = schedule_engine.compile_schedule_expression("30 9 * * 1")
+    quartz = schedule_engine.compile_schedule_expression("0 30 9 ? * 2")
+
+    assert cron.days_of_week.nonzero()[0].tolist() == [1]
+    assert quartz.days_of_week.nonzero()[0].tolist() == [1]
+    assert cron.minutes.nonzero()[0].tolist() == [30]
+    assert quartz.hours.nonzero()[0].tolist() == [9]
+
+    # normalized text shares the cached compilation
+    assert schedule_engine.compile_schedule_expression("30  9 * * 1") is cron
+
+
+def test_day_names_are_not_mistaken_for_unsupported_tokens():
+    quartz = schedule_engine.compile_schedule_expression("0 0 12 ? * MON,WED,FRI *")
+    cron = schedule_engine.compile_schedule_expression("0 12 * * WED")
+
+    assert quartz.days_of_week.nonzero()[0].tolist() == [1, 3, 5]
+    assert cron.days_of_week.nonzero()[0].tolist() == [3]
+
+    # L, W and # remain unsupported
+    for expression in (
+        "0 0 12 L * ?",
+        "0 0 12 15W * ?",
+        "0 0 12 ? * WED#2",
+        "0 0 12 ? * 6L",
+    ):
+        assert schedule_engine.compile_schedule_expression(expression) is None
+
+
+def test_compute_next_runs_for_cron_expressions():
+    runs = schedule_engine.compute_next_runs(
+        ["0 15 * * *", "*/20 * * * *", "30 9 * * 1"], n=3, start=START
+    )
+
+    assert runs.shape == (3, 3)
+    assert runs[0].tolist() == [
+        dt.datetime(2024, 1, 1, 15),
+        dt.datetime(2024, 1, 2, 15),
+        dt.datetime(2024, 1, 3, 15),
+    ]
+    assert runs[1].tolist() == [
+        dt.datetime(2024, 1, 1, 0, 0),
+        dt.datetime(2024, 1, 1, 0, 20),
+        dt.datetime(2024, 1, 1, 0, 40),
+    ]
+    assert runs[2][1].tolist() == dt.datetime(2024, 1, 8, 9, 30)
+
+
+def test_next_runs_pad_with_nat_beyond_horizon():
+    runs = schedule_engine.compute_next_runs(
+        ["0 0 1 * *"], n=2, start=START, horizon=dt.timedelta(days=10)
+    )
+
+    assert runs[0][0].tolist() == dt.datetime(2024, 1, 1)
+    assert np.isnat(runs[0][1])
+
+
+def test_manual_and_inactive_schedules_never_run():
+    manual = DomoSchedule.from_parent(parent=None, obj={})
+    inactive = DomoSchedule.from_parent(
+        parent=None, obj={"scheduleExpression": "0 15 * * *", "isActive": False}
+    )
+
+    runs = schedule_engine.compute_next_runs([manual, inactive], start=START)
+
+    assert np.isnat(runs).all()
+
+
+def test_schedule_next_run_times_and_is_due_now():
+    schedule = DomoSchedule.from_parent(
+        parent=None, obj={"scheduleExpression": "0 15 * * *"}
+    )
+
+    assert schedule.get_next_run_times(n=2, start=START) == [
+        dt.datetime(2024, 1, 1, 15),
+        dt.datetime(2024, 1, 2, 15),
+    ]
+    assert schedule.is_due_now(dt.datetime(2024, 1, 1, 15, 0, 30))
+    assert not schedule.is_due_now(dt.datetime(2024, 1, 1, 15, 1))
+
+
+def test_load_histogram_counts_duplicate_schedules():
+    schedules = ["0 * * * *"] * 3 + ["0 15 * * *"]
+
+    histogram = schedule_engine.compute_load_histogram(
+        schedules, start=START, end=START + dt.timedelta(days=1), bucket_minutes=60
+    )
+
+    assert len(histogram) == 24
+    assert histogram.sum() == 3 * 24 + 1
+    assert histogram[dt.datetime(2024, 1, 1, 15)] == 4
+    assert histogram.index.name == "bucket_start"
+
+
+def test_matches_agree_with_next_runs():
+    schedules = ["*/15 8-10 * * 1-5", "0 12 1,15 * *"]
+    end = START + dt.timedelta(days=20)
+
+    grid, matches = schedule_engine.compute_schedule_matches(schedules, START, end)
+    runs = schedule_engine.compute_next_runs(
+        schedules, n=4, start=START, horizon=end - START
+    )
+
+    for idx in range(len(schedules)):
+        found = runs[idx][~np.isnat(runs[idx])]
+        assert grid[matches[idx]][:4].tolist() == found.tolist()
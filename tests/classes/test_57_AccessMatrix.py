@@ -0,0 +1,239 @@
+"""Test the instance-wide access matrix and nested-group closure."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.subentity import access_matrix as dmam
+from domolibrary2.classes.subentity.AccessControl import (
+    DEFAULT_ACCESS_CONTROLLERS,
+    AccessGrant,
+    AccessLevel,
+    AccessSummary,
+    DomoDatasetAccessController,
+    DomoPageAccessController,
+    EntityType,
+    max_access_level,
+    parse_group_member,
+)
+from domolibrary2.routes import (
+    datacenter as datacenter_routes,
+    dataset as dataset_routes,
+)
+
+
+def user(user_id):
+    return {"userId": user_id}
+
+
+def group(group_id):
+    return {"id": group_id, "type": "GROUP"}
+
+
+# g1 contains g2, g2 contains g3, g3 contains g1 (cycle)
+MEMBERSHIPS = {
+    "g1": [user("u1"), group("g2")],
+    "g2": [user("u2"), group("g3")],
+    "g3": [user("u3"), group("g1")],
+    "g4": [user("u4")],
+}
+
+
+def test_max_access_level_uses_rank():
+    assert (
+        max_access_level([AccessLevel.VIEWER, AccessLevel.OWNER]) == AccessLevel.OWNER
+    )
+    assert max_access_level([]) == AccessLevel.NONE
+
+    summary = AccessSummary(
+        entity_id="u1",
+        entity_type=EntityType.USER,
+        effective_access_level=AccessLevel.NONE,
+        access_grants=[
+            AccessGrant("u1", EntityType.USER, AccessLevel.VIEWER),
+            AccessGrant(
+                "u1", EntityType.USER, AccessLevel.EDITOR, source_group_id="g1"
+            ),
+        ],
+    )
+    assert summary.direct_access_level == AccessLevel.VIEWER
+    assert summary.group_access_level == AccessLevel.EDITOR
+
+
+def test_nested_group_closure_handles_cycles():
+    graph = dmam.DomoGroupGraph.from_memberships(MEMBERSHIPS)
+
+    assert graph.get_nested_groups("g2") == {"g1", "g3"}
+    assert graph.get_group_users("g2") == {"u1", "u2", "u3"}
+    assert graph.get_group_users("g4") == {"u4"}
+    assert graph.get_user_groups("u3") == {"g1", "g2", "g3"}
+    assert graph.get_user_groups("unknown") == frozenset()
+
+
+def test_groups_listed_only_by_group_id_are_nested():
+    graph = dmam.DomoGroupGraph.from_memberships(
+        {"g5": [user("u5"), {"groupId": "g4"}], **MEMBERSHIPS}
+    )
+
+    assert parse_group_member({"groupId": 7, "id": 7}) == {"id": "7", "type": "GROUP"}
+    assert graph.get_nested_groups("g5") == {"g4"}
+    assert graph.get_group_users("g5") == {"u4", "u5"}
+
+
+def test_effective_access_both_directions():
+    matrix = dmam.DomoAccessMatrix(
+        group_graph=dmam.DomoGroupGraph.from_memberships(MEMBERSHIPS)
+    )
+
+    matrix.add_object_grants(
+        "ACCOUNT",
+        "7",
+        [
+            AccessGrant("g3", EntityType.GROUP, AccessLevel.VIEWER),
+            AccessGrant("u2", EntityType.USER, AccessLevel.OWNER),
+        ],
+    )
+    matrix.add_object_grants(
+        "appdb_collection",
+        "c1",
+        [AccessGrant("g4", EntityType.GROUP, AccessLevel.EDITOR)],
+    )
+
+    assert matrix.get_object_access("ACCOUNT", "7") == {
+        "u1": AccessLevel.VIEWER,
+        "u2": AccessLevel.OWNER,
+        "u3": AccessLevel.VIEWER,
+    }
+    assert matrix.get_user_access("u4") == {
+        ("APPDB_COLLECTION", "c1"): AccessLevel.EDITOR
+    }
+    assert matrix.get_user_access("u2", min_access_level=AccessLevel.ADMIN) == {
+        ("ACCOUNT", "7"): AccessLevel.OWNER
+    }
+    assert matrix.get_access_level("u4", "ACCOUNT", "7") == AccessLevel.NONE
+    assert matrix.shape == (4, 2)
+
+    # replacing an object's grants drops stale cells
+    matrix.add_object_grants(
+        "ACCOUNT", "7", [AccessGrant("u1", EntityType.USER, AccessLevel.ADMIN)]
+    )
+    assert matrix.get_object_access("ACCOUNT", "7") == {"u1": AccessLevel.ADMIN}
+    assert matrix.get_user_access("u2") == {}
+
+    df = matrix.to_dataframe()
+    assert sorted(df["user_id"]) == ["u1", "u4"]
+
+
+def test_build_loads_groups_once(route_calls, mock_auth):
+    route_calls.patch(
+        dmam.group_routes,
+        "get_all_groups",
+        [
+            {"groupId": "g1", "groupMembers": MEMBERSHIPS["g1"]},
+            {"groupId": "g2"},
+            {"groupId": "g3"},
+        ],
+    )
+    route_calls.patch(
+        dmam.group_routes,
+        "get_group_membership",
+        lambda group_id, **kwargs: MEMBERSHIPS[group_id],
+    )
+    route_calls.patch(
+        dataset_routes,
+        "get_permissions",
+        {"list": [{"id": "g2", "type": "GROUP", "accessLevel": "CAN_EDIT"}]},
+    )
+
+    class DomoDataset_Default:
+        entity_type = "DATASET"
+
+        def __init__(self, id):
+            self.id = id
+
+    matrix = asyncio.run(
+        dmam.DomoAccessMatrix.build(
+            auth=mock_auth, objects=[DomoDataset_Default("ds1")]
+        )
+    )
+
+    membership_calls = route_calls["get_group_membership"]
+    assert sorted(call["group_id"] for call in membership_calls) == ["g2", "g3"]
+    assert matrix.get_object_access("DATASET", "ds1") == {
+        "u1": AccessLevel.EDITOR,
+        "u2": AccessLevel.EDITOR,
+        "u3": AccessLevel.EDITOR,
+    }
+
+
+def test_dataset_and_page_controllers_share_but_cannot_revoke(route_calls, mock_auth):
+    route_calls.patch(dataset_routes, "share_dataset")
+    route_calls.patch(datacenter_routes, "share_resource")
+
+    class DomoEntity:
+        def __init__(self, id):
+            self.id = id
+
+    dataset_controller = DomoDatasetAccessController(mock_auth, DomoEntity("ds1"))
+    page_controller = DomoPageAccessController(mock_auth, DomoEntity("p1"))
+
+    assert asyncio.run(
+        dataset_controller.grant_access("g1", EntityType.GROUP, AccessLevel.EDITOR)
+    )
+    assert asyncio.run(
+        page_controller.grant_access("u1", EntityType.USER, AccessLevel.VIEWER)
+    )
+
+    (share_call,) = route_calls["share_dataset"]
+    assert share_call["body"]["permissions"] == [
+        {"type": "GROUP", "id": "g1", "accessLevel": "CAN_EDIT"}
+    ]
+    (page_call,) = route_calls["share_resource"]
+    assert page_call["resource_ids"] == "p1"
+    assert page_call["user_ids"] == "u1" and page_call["group_ids"] is None
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(dataset_controller.revoke_access("g1", EntityType.GROUP))
+    with pytest.raises(NotImplementedError):
+        asyncio.run(page_controller.revoke_access("u1", EntityType.USER))
+
+    # not registered by default until revoke works
+    assert "DomoDataset_Default" not in DEFAULT_ACCESS_CONTROLLERS
+    assert "DomoPage" not in DEFAULT_ACCESS_CONTROLLERS
+
+
+@pytest.mark.performance
+def test_queries_scale_to_tens_of_thousands_of_users():
+    n_users, n_groups = 20_000, 200
+    memberships = {
+        f"g{g}": [user(f"u{u}") for u in range(g, n_users, n_groups)]
+        for g in range(n_groups)
+    }
+    memberships["all"] = [group(f"g{g}") for g in range(n_groups)]
+
+    matrix = dmam.DomoAccessMatrix(
+        group_graph=dmam.DomoGroupGraph.from_memberships(memberships)
+    )
+    matrix.add_object_grants(
+        "PAGE", "everyone", [AccessGrant("all", EntityType.GROUP, AccessLevel.VIEWER)]
+    )
+    for g in range(n_groups):
+        matrix.add_object_grants(
+            "DATASET",
+            f"ds{g}",
+            [AccessGrant(f"g{g}", EntityType.GROUP, AccessLevel.EDITOR)],
+        )
+
+    start = time.perf_counter()
+    user_access = matrix.get_user_access("u12345")
+    object_access = matrix.get_object_access("PAGE", "everyone")
+    elapsed = time.perf_counter() - start
+
+    assert len(user_access) == 2
+    assert len(object_access) == n_users
+    assert elapsed < 0.5
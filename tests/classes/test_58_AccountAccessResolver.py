@@ -0,0 +1,105 @@
+"""Test bulk user/group resolution of account access lists."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.DomoAccount import (
+    DomoAccount_Default,
+    DomoAccounts,
+    access as account_access,
+)
+from domolibrary2.routes import (
+    group as group_routes,
+    user as user_routes,
+)
+from domolibrary2.routes.user.exceptions import SearchUserNotFoundError
+
+ACCESS_LISTS = {
+    1: [
+        {"id": 11, "type": "USER", "accessLevel": "OWNER"},
+        {"id": 900, "type": "GROUP", "accessLevel": "CAN_VIEW"},
+    ],
+    2: [
+        {"id": 11, "type": "USER", "accessLevel": "CAN_VIEW"},
+        {"id": 12, "type": "USER", "accessLevel": "CAN_EDIT"},
+        {"id": 99, "type": "USER", "accessLevel": "CAN_VIEW"},  # deleted user
+    ],
+}
+
+
+@pytest.fixture
+def calls(route_calls):
+    route_calls.patch(
+        account_access.account_routes,
+        "get_account_accesslist",
+        lambda account_id, **kwargs: ACCESS_LISTS[account_id],
+    )
+    route_calls.patch(
+        user_routes,
+        "search_users_by_id",
+        lambda user_ids, **kwargs: [
+            {"id": int(user_id), "displayName": f"user {user_id}"}
+            for user_id in user_ids
+            if user_id != "99"
+        ],
+    )
+    route_calls.patch(
+        group_routes,
+        "get_all_groups",
+        [{"groupId": 900, "name": "Analysts", "groupType": "open"}],
+    )
+    return route_calls
+
+
+def make_account(account_id, auth):
+    return DomoAccount_Default(id=account_id, auth=auth, raw={})
+
+
+def searched_user_ids(calls):
+    return [sorted(call["user_ids"]) for call in calls["search_users_by_id"]]
+
+
+def test_access_get_resolves_in_bulk(calls, mock_auth):
+    account = make_account(2, mock_auth)
+
+    relationships = asyncio.run(account.Access.get())
+
+    assert [(rel.entity_id, rel.relationship_type) for rel in relationships] == [
+        ("11", "CAN_VIEW"),
+        ("12", "CAN_EDIT"),
+    ]
+    assert searched_user_ids(calls) == [["11", "12", "99"]]
+    assert calls["get_all_groups"] == []
+
+
+def test_missing_user_raises_when_not_suppressed(calls, mock_auth):
+    with pytest.raises(SearchUserNotFoundError):
+        asyncio.run(
+            make_account(2, mock_auth).Access.get(suppress_no_results_error=False)
+        )
+
+
+def test_accounts_audit_shares_one_lookup(calls, mock_auth):
+    accounts = [make_account(1, mock_auth), make_account(2, mock_auth)]
+
+    account_access_map = asyncio.run(
+        DomoAccounts(auth=mock_auth).get_access(accounts=accounts)
+    )
+
+    account_ids = [call["account_id"] for call in calls["get_account_accesslist"]]
+    assert sorted(account_ids) == [1, 2]
+    assert searched_user_ids(calls) == [["11", "12", "99"]]
+    assert len(calls["get_all_groups"]) == 1
+
+    owner, group = account_access_map[1]
+    assert owner.entity.display_name == "user 11"
+    assert group.entity_name == "Analysts"
+    assert accounts[1].Access.relationships is account_access_map[2]
+
+    # user 11 is the same resolved object on both accounts
+    assert owner.entity is account_access_map[2][0].entity
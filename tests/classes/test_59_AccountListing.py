@@ -0,0 +1,111 @@
+"""Test listing-first DomoAccounts with deferred config hydration."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.base.exceptions import RouteError
+from domolibrary2.classes.DomoAccount import (
+    DomoAccount_Default,
+    DomoAccounts,
+    core as account_core,
+)
+
+ACCOUNTS = [
+    {
+        "id": account_id,
+        "name": f"account {account_id}",
+        "displayName": f"Account {account_id}",
+        "dataProviderType": "abstract-credential-store",
+        "owners": [{"id": 1, "type": "USER"}],
+    }
+    for account_id in range(1, 8)
+]
+
+
+@pytest.fixture
+def events(route_calls, monkeypatch):
+    events = []
+
+    async def fake_get_config(self, **kwargs):
+        events.append(("config", self.id))
+        self.Config = {"account_id": self.id}
+        return self.Config
+
+    route_calls.patch(account_core.account_routes, "get_accounts", ACCOUNTS)
+    monkeypatch.setattr(DomoAccount_Default, "_get_config", fake_get_config)
+    return events
+
+
+def test_listing_builds_accounts_without_config_requests(events, mock_auth):
+    domo_accounts = DomoAccounts(auth=mock_auth)
+    accounts = asyncio.run(
+        domo_accounts.get_accounts_accountsapi(is_hydrate_config=False)
+    )
+
+    assert events == []
+    assert [account.id for account in accounts] == list(range(1, 8))
+    assert accounts[0].display_name == "Account 1"
+    assert accounts[0].data_provider_type == "abstract-credential-store"
+    assert not accounts[0].is_config_loaded
+
+    # config loads once, on first access
+    assert asyncio.run(accounts[2].get_config()) == {"account_id": 3}
+    asyncio.run(accounts[2].get_config())
+    assert events == [("config", 3)]
+
+    asyncio.run(domo_accounts.hydrate_configs(max_concurrency=2))
+    assert sorted(account_id for _, account_id in events) == list(range(1, 8))
+
+
+def test_default_listing_hydrates_configs(events, mock_auth):
+    accounts = asyncio.run(DomoAccounts(auth=mock_auth).get_accounts_accountsapi())
+
+    assert len(events) == 7
+    assert all(account.is_config_loaded for account in accounts)
+
+
+def test_iter_accounts_hydrates_per_batch(events, mock_auth):
+    async def consume():
+        async for account in DomoAccounts(auth=mock_auth).iter_accounts(
+            batch_size=3, is_hydrate_config=True
+        ):
+            events.append(("yield", account.id))
+
+    asyncio.run(consume())
+
+    # the first batch is yielded before the second batch is hydrated
+    assert events.index(("yield", 3)) < events.index(("config", 4))
+    assert [event for event in events if event[0] == "yield"] == [
+        ("yield", account_id) for account_id in range(1, 8)
+    ]
+
+
+def test_failed_configs_are_recorded_not_raised(events, monkeypatch, mock_auth):
+    async def failing_get_config(self, **kwargs):
+        if self.id == 4:
+            raise RouteError(message="forbidden", status=403)
+        events.append(("config", self.id))
+
+    monkeypatch.setattr(DomoAccount_Default, "_get_config", failing_get_config)
+    domo_accounts = DomoAccounts(auth=mock_auth)
+
+    async def consume():
+        return [
+            account
+            async for account in domo_accounts.iter_accounts(
+                batch_size=3, is_hydrate_config=True
+            )
+        ]
+
+    accounts = asyncio.run(consume())
+
+    assert len(accounts) == 7
+    assert not any(account.is_admin_summary for account in accounts)
+    assert list(domo_accounts.config_errors) == [4]
+    assert not accounts[3].is_config_loaded
+    assert len(events) == 6
@@ -0,0 +1,140 @@
+"""Test the sharded, incremental activity-log exporter against the API simulator."""
+
+import asyncio
+import datetime as dt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pandas as pd
+import pytest
+
+from domolibrary2.classes.activity_log_export import (
+    ActivityLog_Export_Error,
+    DomoActivityLog_Exporter,
+    activity_log_to_dataframe,
+    shard_time_range,
+)
+from domolibrary2.client.simulator import DomoApiSimulator
+from domolibrary2.routes.activity_log import ActivityLog_GET_Error
+from domolibrary2.utils import convert
+
+HOUR_MS = 3_600_000
+
+
+def make_exporter(simulator, output_dir, **kwargs):
+    return DomoActivityLog_Exporter(
+        auth=simulator.auth,
+        output_dir=output_dir,
+        file_format="csv",
+        window=dt.timedelta(hours=2),
+        **kwargs,
+    )
+
+
+def export(simulator, exporter, **kwargs):
+    with simulator.install():
+        return asyncio.run(exporter.export(**kwargs))
+
+
+def read_export(output_dir):
+    return pd.concat(
+        [pd.read_csv(path) for path in sorted(Path(output_dir).glob("date=*/*.csv"))],
+        ignore_index=True,
+    )
+
+
+def test_shard_time_range_is_disjoint_and_inclusive():
+    assert shard_time_range(0, 2_500, 1_000) == [(0, 999), (1000, 1999), (2000, 2500)]
+    assert shard_time_range(5, 5, 1_000) == [(5, 5)]
+
+    with pytest.raises(ValueError):
+        shard_time_range(0, 10, 0)
+
+
+def test_timestamps_converted_per_column():
+    df = activity_log_to_dataframe(
+        [{"time": 1_700_000_000_000, "userId": 1}, {"time": 1_700_086_400_000}]
+    )
+
+    assert str(df["time_dt"].dtype) == "datetime64[ms, UTC]"
+    assert df["date"].tolist() == ["2023-11-14", "2023-11-15"]
+    assert activity_log_to_dataframe([]).empty
+
+
+def test_export_partitions_and_resumes_from_high_water_mark(tmp_path):
+    simulator = DomoApiSimulator(n_activity_events=2_400)
+    exporter = make_exporter(simulator, tmp_path)
+    midpoint = simulator.activity_start + 12 * HOUR_MS - 1
+
+    result = export(
+        simulator, exporter, start_time=simulator.activity_start, end_time=midpoint
+    )
+
+    assert result.windows == 6
+    assert result.event_count == 1_200
+    assert exporter.get_high_water_mark() == midpoint
+    assert sorted(path.name for path in tmp_path.glob("date=*")) == [
+        "date=2023-11-14",
+        "date=2023-11-15",
+    ]
+
+    # the next run picks up right after the mark
+    result = export(simulator, exporter, end_time=simulator.activity_end)
+
+    assert result.start_time == midpoint + 1
+    assert result.event_count == 1_200
+
+    df = read_export(tmp_path)
+    assert len(df) == 2_400
+    assert df["eventId"].is_unique
+
+    # nothing new -> no files, mark unchanged
+    result = export(simulator, exporter, end_time=simulator.activity_end)
+    assert result.windows == 0
+    assert exporter.get_high_water_mark() == simulator.activity_end
+
+
+def test_failed_window_does_not_advance_mark(tmp_path):
+    simulator = DomoApiSimulator(n_activity_events=100, error_rate=1)
+    exporter = make_exporter(simulator, tmp_path)
+
+    with pytest.raises(ActivityLog_GET_Error):
+        export(
+            simulator,
+            exporter,
+            start_time=simulator.activity_start,
+            end_time=simulator.activity_end,
+        )
+
+    assert exporter.get_high_water_mark() is None
+
+
+def test_mark_trails_now_by_ingestion_lag(tmp_path):
+    simulator = DomoApiSimulator()
+    exporter = make_exporter(simulator, tmp_path, ingestion_lag=dt.timedelta(hours=1))
+    now = dt.datetime.now()
+
+    result = export(
+        simulator,
+        exporter,
+        start_time=now - dt.timedelta(hours=3),
+        end_time=now + dt.timedelta(days=1),
+    )
+
+    lagged_ms = convert.convert_datetime_to_epoch_millisecond(now) - HOUR_MS
+    assert lagged_ms <= result.high_water_mark < lagged_ms + 60_000
+    assert exporter.get_high_water_mark() == result.high_water_mark
+
+
+def test_first_run_requires_start_time(tmp_path):
+    exporter = make_exporter(DomoApiSimulator(), tmp_path)
+
+    with pytest.raises(ActivityLog_Export_Error):
+        asyncio.run(exporter.export())
+
+    with pytest.raises(ActivityLog_Export_Error):
+        DomoActivityLog_Exporter(
+            auth=DomoApiSimulator().auth, output_dir=tmp_path, file_format="xlsx"
+        )
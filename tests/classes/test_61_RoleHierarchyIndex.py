@@ -0,0 +1,135 @@
+"""Test the cached role hierarchy index and batch role-assignment planner."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import httpx
+import pytest
+
+from domolibrary2.client import get_data as gd
+from domolibrary2.client.simulator import DomoApiSimulator_Auth
+from domolibrary2.integrations import RoleHierarchy as role_hierarchy
+from domolibrary2.routes import role as role_routes
+
+ROLES = [
+    {"id": 1, "name": "Admin", "description": "system"},
+    {"id": 2, "name": "Privileged", "description": "system"},
+    {"id": 13, "name": "Custom", "description": None},
+    {"id": 10, "name": "Viewer - h1", "description": "view only - h1"},
+    {"id": 11, "name": "Analyst - h3", "description": "analyst - h3"},
+    {"id": 12, "name": "Builder - h5", "description": "builder - h5"},
+]
+
+
+@pytest.fixture
+def calls(route_calls):
+    async def get_roles(**kwargs):
+        await asyncio.sleep(0)  # let concurrent callers overlap
+        return ROLES
+
+    def role_membership_add_users(user_ids, **kwargs):
+        if "bad" in user_ids:
+            raise RuntimeError("rejected")
+        return ""
+
+    route_calls.patch(role_routes, "get_roles", get_roles)
+    route_calls.patch(
+        role_routes, "role_membership_add_users", role_membership_add_users
+    )
+    role_hierarchy.clear_role_hierarchy_cache()
+    yield route_calls
+    role_hierarchy.clear_role_hierarchy_cache()
+
+
+def test_index_is_cached_and_shared(calls, mock_auth):
+    async def run():
+        indexes = await asyncio.gather(
+            *[role_hierarchy.get_role_hierarchy_index(auth=mock_auth) for _ in range(5)]
+        )
+        for _ in range(20):
+            await role_hierarchy.calc_role(10, "Builder - h5", auth=mock_auth)
+        return indexes
+
+    indexes = asyncio.run(run())
+
+    assert len(calls["get_roles"]) == 1
+    assert all(index is indexes[0] for index in indexes)
+    assert indexes[0].rank_by_id["12"] == 5
+    assert indexes[0].rank_by_id["2"] == 7  # system role
+    assert indexes[0].rank_by_id["13"] == 0  # no description
+
+
+def test_index_expires_after_ttl(calls, mock_auth):
+    async def run():
+        index = await role_hierarchy.get_role_hierarchy_index(
+            auth=mock_auth, ttl_seconds=60
+        )
+        index.built_at -= 61
+        return await role_hierarchy.get_role_hierarchy_index(auth=mock_auth)
+
+    index = asyncio.run(run())
+
+    assert len(calls["get_roles"]) == 2
+    assert not index.is_expired
+
+
+def test_plan_returns_minimal_changes(calls, mock_auth):
+    index = asyncio.run(role_hierarchy.get_role_hierarchy_index(auth=mock_auth))
+
+    plan = index.plan(
+        [
+            (("u1", 10), "Analyst - h3"),  # upgrade
+            (("u2", 12), "Analyst - h3"),  # already higher
+            (("u3", 1), "Viewer - h1"),  # system role, untouched
+            (("u4", 10), "Missing"),
+            (("u5", 10), "Analyst - h3"),
+            (("u5", 10), "Builder - h5"),  # highest request wins
+        ]
+    )
+
+    assert [(c.user_id, c.new_role_id) for c in plan.changes] == [
+        ("u1", "11"),
+        ("u5", "12"),
+    ]
+    assert plan.unchanged == ["u2", "u3"]
+    assert list(plan.errors) == ["u4"]
+    assert plan.by_role() == {"11": ["u1"], "12": ["u5"]}
+
+
+def test_apply_role_changes_in_chunks(calls, mock_auth):
+    index = asyncio.run(role_hierarchy.get_role_hierarchy_index(auth=mock_auth))
+    user_ids = [f"u{i}" for i in range(250)] + ["bad"]
+    plan = index.plan([((user_id, 10), "Analyst - h3") for user_id in user_ids])
+
+    plan = asyncio.run(
+        role_hierarchy.apply_role_changes(auth=mock_auth, plan=plan, chunk_size=100)
+    )
+
+    add_users_calls = calls["role_membership_add_users"]
+    assert [len(call["user_ids"]) for call in add_users_calls] == [100, 100, 51]
+    assert {call["role_id"] for call in add_users_calls} == {"11"}
+    assert list(plan.failed) == ["11:2"]
+
+
+def test_role_membership_add_users_sends_list_body():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    gd.set_default_transport(httpx.MockTransport(handler))
+    try:
+        asyncio.run(
+            role_routes.role_membership_add_users(
+                auth=DomoApiSimulator_Auth(), role_id=11, user_ids=["1", "2"]
+            )
+        )
+    finally:
+        gd.set_default_transport(None)
+
+    assert bodies == [["1", "2"]]
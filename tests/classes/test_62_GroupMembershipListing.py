@@ -0,0 +1,86 @@
+"""Test group membership built from the groupUserList payload."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes import DomoUser as dmu
+from domolibrary2.classes.DomoGroup import core as group_core
+from domolibrary2.client import response as rgd
+from domolibrary2.client.simulator import DomoApiSimulator
+from domolibrary2.routes import group as group_routes
+
+
+def make_group(auth, group_id=1):
+    return group_core.DomoGroup(
+        auth=auth, id=group_id, name=f"group {group_id}", raw={}
+    )
+
+
+def test_members_load_from_paged_listing():
+    simulator = DomoApiSimulator(n_users=10_000, n_groups=1)
+    domo_group = make_group(simulator.auth)
+
+    with simulator.install():
+        members = asyncio.run(domo_group.Membership.get_members())
+
+    assert len(members) == 10_000
+    assert members[0].entity.id == "1"
+    assert members[0].entity.display_name == "User 1"
+    assert isinstance(members[0].entity, dmu.DomoUser)
+    # 20 pages of 500, then the empty page that ends the loop; no per-user requests
+    assert simulator.stats.requests == 21
+    assert domo_group.members_id_ls[:3] == ["1", "2", "3"]
+
+
+@pytest.fixture
+def hydrated(monkeypatch):
+    hydrated = []
+
+    async def fake_get_group_owners(auth, group_id, **kwargs):
+        return rgd.ResponseGetData(
+            status=200,
+            response=[
+                {"id": 7, "type": "USER", "displayName": "Owner 7"},
+                {"id": 900, "type": "GROUP", "displayName": "Admins"},
+            ],
+            is_success=True,
+        )
+
+    async def fake_user_get_by_id(cls, auth, user_id, **kwargs):
+        hydrated.append(("user", user_id))
+        return cls(auth=auth, id=user_id, display_name="Owner 7", role_id=3, raw={})
+
+    async def fake_group_get_by_id(cls, auth, group_id, **kwargs):
+        hydrated.append(("group", group_id))
+        return cls(auth=auth, id=group_id, name="Admins", type="closed", raw={})
+
+    monkeypatch.setattr(group_routes, "get_group_owners", fake_get_group_owners)
+    monkeypatch.setattr(dmu.DomoUser, "get_by_id", classmethod(fake_user_get_by_id))
+    monkeypatch.setattr(
+        group_core.DomoGroup, "get_by_id", classmethod(fake_group_get_by_id)
+    )
+    return hydrated
+
+
+def test_owners_hydrate_on_request(hydrated):
+    domo_group = make_group(auth=DomoApiSimulator().auth)
+
+    owners = asyncio.run(domo_group.Membership.get_owners())
+
+    assert hydrated == []
+    assert [type(owner.entity).__name__ for owner in owners] == [
+        "DomoGroup",
+        "DomoUser",
+    ]
+    assert owners[0].entity.name == "Admins"
+
+    asyncio.run(domo_group.Membership.hydrate(max_concurrency=2))
+
+    assert sorted(hydrated) == [("group", 900), ("user", "7")]
+    assert owners[1].entity.role_id == 3
+    assert owners[0].entity.type == "closed"
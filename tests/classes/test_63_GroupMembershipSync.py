@@ -0,0 +1,115 @@
+"""Test set-based group membership reconciliation across many groups."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from domolibrary2.classes import DomoUser as dmu
+from domolibrary2.classes.DomoGroup import (
+    DomoGroup,
+    DomoGroups,
+    plan_group_membership_change,
+)
+from domolibrary2.classes.DomoGroup.membership_sync import _listing_user_ids
+from domolibrary2.client.simulator import DomoApiSimulator
+
+
+def test_plan_group_membership_change():
+    change = plan_group_membership_change(
+        7, current_user_ids=[1, 2, 3], desired_user_ids=["2", "3", "4", "4"]
+    )
+
+    assert change.add_user_ids == ["4"]
+    assert change.remove_user_ids == ["1"]
+
+    requests = plan_group_membership_change(
+        7, current_user_ids=range(5), desired_user_ids=range(3, 10)
+    ).to_requests(max_members_per_request=4)
+
+    assert [
+        (len(request["add_member_arr"]), len(request["remove_member_arr"]))
+        for request in requests
+    ] == [(4, 0), (1, 3)]
+
+
+def test_nested_groups_are_never_removed_as_users():
+    listing = [
+        {"userId": 1, "displayName": "User 1"},
+        {"id": 2, "type": "USER"},
+        {"groupId": 7, "id": 7},
+        {"id": 8, "type": "GROUP"},
+    ]
+
+    current_user_ids = _listing_user_ids(listing)
+    assert current_user_ids == {"1", "2"}
+
+    requests = plan_group_membership_change(
+        3, current_user_ids=current_user_ids, desired_user_ids=[]
+    ).to_requests(max_members_per_request=500)
+    assert [
+        member["id"] for request in requests for member in request["remove_member_arr"]
+    ] == ["1", "2"]
+
+
+def sync(simulator, desired_members, **kwargs):
+    async def run():
+        async with simulator.session() as session:
+            return await DomoGroups(auth=simulator.auth).sync_memberships(
+                desired_members, session=session, **kwargs
+            )
+
+    return asyncio.run(run())
+
+
+def test_sync_memberships_reconciles_many_groups():
+    simulator = DomoApiSimulator(n_users=300, n_groups=3)
+    current = {
+        group_id: [user["id"] for user in simulator.get_group_users(group_id)]
+        for group_id in (1, 2, 3)
+    }
+    desired = {
+        "1": [str(user_id) for user_id in range(1, 151)],
+        "2": current[2],  # unchanged
+        "3": [],
+        "99": ["1"],  # unknown group, update is rejected
+    }
+
+    plan = sync(simulator, desired, is_dry_run=True)
+
+    assert simulator.stats.by_endpoint["update_group_membership"] == 0
+    assert set(plan.changes) == {"1", "3", "99"}
+    assert plan.n_remove == 50 + 100
+    assert plan.to_dataframe().query("group_id == '3'")["action"].unique().tolist() == [
+        "remove"
+    ]
+
+    plan = sync(simulator, desired, max_members_per_request=40, max_concurrency=2)
+
+    # group 1: 100 adds + 50 removes in 4 requests; group 3: 100 removes in 3
+    assert plan.n_requests == 7
+    assert list(plan.failed) == ["99"]
+    assert sorted(user["id"] for user in simulator.get_group_users(1)) == list(
+        range(1, 151)
+    )
+    assert simulator.get_group_users(3) == []
+
+    assert not sync(simulator, {"1": desired["1"], "3": []}, is_dry_run=True).changes
+
+
+def test_pending_members_are_deduplicated():
+    domo_group = DomoGroup(auth=DomoApiSimulator().auth, id=1, raw={})
+    membership = domo_group.Membership
+
+    for _ in range(3):
+        for user_id in range(100):
+            membership._add_member(
+                dmu.DomoUser(auth=domo_group.auth, id=user_id, raw={})
+            )
+
+    assert len(membership._add_member_ls) == 100
+
+    membership._reset_obj()
+    membership._add_member(dmu.DomoUser(auth=domo_group.auth, id=1, raw={}))
+    assert len(membership._add_member_ls) == 1
@@ -0,0 +1,123 @@
+"""Test the parallel fileset crawler and incremental downloader."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.fileset_sync import (
+    MANIFEST_FILE_NAME,
+    DomoFileset_Sync,
+    FilesetSync_Error,
+)
+from domolibrary2.client.simulator import DomoApiSimulator
+
+
+def sync(simulator, output_dir, **kwargs):
+    fileset_sync = DomoFileset_Sync(
+        auth=simulator.auth, fileset_id="fs-1", output_dir=output_dir, **kwargs
+    )
+
+    async def run():
+        async with simulator.session() as session:
+            return await fileset_sync.sync(session=session)
+
+    return asyncio.run(run())
+
+
+def test_crawl_pages_every_directory(tmp_path):
+    # 1 + 3 + 9 directories, 5 files each; the root lists 8 entries
+    simulator = DomoApiSimulator(fileset_depth=2, fileset_fanout=3, n_fileset_files=5)
+
+    result = sync(simulator, tmp_path, page_size=4, max_concurrency=4)
+
+    assert result.directories == 13
+    assert result.files == result.n_downloaded == 65
+    assert not result.failed
+
+    # directories with 8 entries need 3 pages (4, 4, 0); leaves with 5 need 2
+    assert simulator.stats.by_endpoint["search_fileset_files"] == 4 * 3 + 9 * 2
+    assert simulator.stats.by_endpoint["download_fileset_file"] == 65
+
+    local_path = tmp_path / "dir_2" / "dir_1" / "file_3.txt"
+    listing = simulator.fileset_directories["dir_2/dir_1"]
+    file_id = next(obj["id"] for obj in listing if obj["name"] == "file_3.txt")
+    assert local_path.read_bytes() == simulator.get_fileset_file_content(file_id)
+
+    manifest = json.loads((tmp_path / MANIFEST_FILE_NAME).read_text())
+    assert len(manifest["files"]) == 65
+
+
+def test_second_sync_only_downloads_changes(tmp_path):
+    simulator = DomoApiSimulator(fileset_depth=1, fileset_fanout=2, n_fileset_files=4)
+    sync(simulator, tmp_path)
+    simulator.stats.reset()
+
+    result = sync(simulator, tmp_path)
+
+    assert result.n_downloaded == 0 and result.n_skipped == 12
+    assert simulator.stats.by_endpoint["download_fileset_file"] == 0
+
+    simulator.update_fileset_file("file-6")
+    (tmp_path / "file_1.txt").unlink()
+    (tmp_path / "dir_2" / "file_2.txt").write_bytes(b"truncated")
+
+    result = sync(simulator, tmp_path)
+
+    assert sorted(result.downloaded) == [
+        "dir_1/file_2.txt",
+        "dir_2/file_2.txt",
+        "file_1.txt",
+    ]
+    assert (tmp_path / "dir_1" / "file_2.txt").read_bytes() == (
+        simulator.get_fileset_file_content("file-6")
+    )
+
+
+def test_failed_downloads_are_retried_next_run(tmp_path):
+    simulator = DomoApiSimulator(
+        fileset_depth=0, n_fileset_files=20, error_rate=0.3, seed=2
+    )
+
+    result = sync(simulator, tmp_path)
+    failed = sorted(result.failed)
+    assert len(failed) == 5 and result.n_downloaded == 15
+
+    simulator.error_rate = 0
+    result = sync(simulator, tmp_path)
+
+    assert not result.failed
+    assert sorted(result.downloaded) == failed
+    assert result.n_skipped == 15
+
+
+def test_paths_outside_output_dir_are_rejected(tmp_path):
+    fileset_sync = DomoFileset_Sync(
+        auth=DomoApiSimulator().auth, fileset_id="fs-1", output_dir=tmp_path
+    )
+
+    assert fileset_sync.get_local_path({"id": "1", "path": "/a/b.txt"}) == (
+        tmp_path / "a" / "b.txt"
+    )
+
+    for path in ["../escape.txt", "a/../../escape.txt", MANIFEST_FILE_NAME]:
+        with pytest.raises(FilesetSync_Error):
+            fileset_sync.get_local_path({"id": "1", "path": path})
+
+
+def test_unsafe_path_fails_only_that_file(tmp_path):
+    simulator = DomoApiSimulator(fileset_depth=0, n_fileset_files=3)
+    root_files = simulator.fileset_directories[""]
+    root_files.append({**root_files[0], "id": "file-99", "path": "../escape.txt"})
+
+    result = sync(simulator, tmp_path)
+
+    assert list(result.failed) == ["../escape.txt"]
+    assert isinstance(result.failed["../escape.txt"], FilesetSync_Error)
+    assert result.n_downloaded == 3
+    assert (tmp_path / MANIFEST_FILE_NAME).exists()
+    assert not (tmp_path.parent / "escape.txt").exists()
@@ -0,0 +1,164 @@
+"""Test batch placement of new application jobs."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.DomoApplication import (
+    JobPlacement_Error,
+    JobPlacement_Planner,
+    JobPlacement_Request,
+)
+from domolibrary2.classes.DomoApplication.Job_RemoteDomoStats import (
+    DomoJob_RemoteDomoStats,
+    RemoteDomoStats_Config,
+)
+from domolibrary2.client.simulator import DomoApiSimulator
+
+
+def load(simulator, **kwargs):
+    async def run():
+        async with simulator.session() as session:
+            return await JobPlacement_Planner.load(
+                auth=simulator.auth, session=session, **kwargs
+            )
+
+    return asyncio.run(run())
+
+
+def start_minutes(plan):
+    return [
+        assignment.schedule.hour * 60 + assignment.schedule.minute
+        for assignment in plan.assignments
+    ]
+
+
+def test_load_reads_every_trigger_once():
+    # 3 applications x 20 jobs, all at hours 0-5 on :00 or :30
+    simulator = DomoApiSimulator(n_applications=3, n_application_jobs=20)
+
+    planner = load(simulator)
+
+    assert simulator.stats.by_endpoint["get_applications"] == 1
+    # one page plus the empty page that ends paging, per application
+    assert simulator.stats.by_endpoint["get_application_jobs"] == 3 * 2
+    assert planner.n_triggers == planner.histogram.counts.sum() == 60
+    assert planner.histogram.peak == 7
+
+    df = planner.histogram.to_dataframe()
+    assert len(df) == 24 * 60
+    assert df.query("cnt_schedule > 0")["minute"].unique().tolist() == [0, 30]
+
+
+def test_wildcard_triggers_count_every_run():
+    planner = JobPlacement_Planner(auth=DomoApiSimulator().auth)
+    planner.add_jobs(
+        [
+            {
+                "triggers": [
+                    {"triggerId": 1, "jobId": 1, "eventEntity": "0 */15 */2 ? * *"}
+                ]
+            }
+        ]
+    )
+
+    assert planner.histogram.counts.sum() == 12 * 4
+
+
+def test_plan_spreads_batch_without_raising_peak():
+    simulator = DomoApiSimulator()
+    planner = load(simulator)
+
+    plan = planner.plan(
+        [
+            JobPlacement_Request(
+                name=f"job {index}", application_id="app-1", allowed_hours=range(6)
+            )
+            for index in range(30)
+        ]
+    )
+
+    starts = start_minutes(plan)
+    assert len(set(starts)) == 30
+    assert not {start % 60 for start in starts} & {0, 30}
+    assert plan.peak_before == plan.peak_after == 7
+    assert planner.histogram.counts.sum() == 60  # planning does not commit
+
+
+def test_plan_honours_duration_and_constraints():
+    planner = JobPlacement_Planner(auth=DomoApiSimulator().auth)
+
+    plan = planner.plan(
+        [
+            JobPlacement_Request(
+                name="long",
+                application_id="app-1",
+                duration_minutes=30,
+                allowed_hours=[0],
+            ),
+            JobPlacement_Request(
+                name="long 2",
+                application_id="app-1",
+                duration_minutes=30,
+                allowed_hours=[0],
+            ),
+            # listed after the flexible job but placed first
+            JobPlacement_Request(
+                name="flexible", application_id="app-1", allowed_hours=[7]
+            ),
+            JobPlacement_Request(
+                name="fixed",
+                application_id="app-1",
+                allowed_hours=[7],
+                allowed_minutes=[0],
+            ),
+        ]
+    )
+
+    assert start_minutes(plan) == [0, 30, 7 * 60 + 1, 7 * 60]
+    assert plan.peak_after == 1
+
+    with pytest.raises(JobPlacement_Error):
+        planner.plan(
+            [JobPlacement_Request(name="x", application_id="a", allowed_hours=[])]
+        )
+
+
+def test_apply_creates_jobs_concurrently():
+    simulator = DomoApiSimulator(n_applications=2, n_application_jobs=4)
+    planner = load(simulator)
+
+    requests = [
+        JobPlacement_Request(
+            name=f"rds {index}",
+            application_id="app-1",
+            job_cls=DomoJob_RemoteDomoStats,
+            create_kwargs={
+                "config": RemoteDomoStats_Config.from_dict({"CARD": "ds-1"}),
+                "logs_dataset_id": "logs-1",
+                "remote_instance": f"remote{index}",
+            },
+        )
+        for index in range(5)
+    ] + [JobPlacement_Request(name="no class", application_id="app-1")]
+
+    plan = planner.plan(requests)
+
+    async def run():
+        async with simulator.session() as session:
+            return await planner.apply(plan, session=session)
+
+    plan = asyncio.run(run())
+
+    assert list(plan.failed) == ["no class"]
+    assert simulator.stats.by_endpoint["create_application_job"] == 5
+    job = plan.results["rds 0"]
+    assert isinstance(job, DomoJob_RemoteDomoStats)
+    assert job.triggers[0].schedule.hour == plan.assignments[0].schedule.hour
+
+    assert planner.n_triggers == 8 + 5
+    assert (load(simulator).histogram.counts == planner.histogram.counts).all()
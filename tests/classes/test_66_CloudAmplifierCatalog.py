@@ -0,0 +1,111 @@
+"""Test the Cloud Amplifier catalog crawler and bulk collision checks."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from domolibrary2.classes.cloud_amplifier_catalog import (
+    CloudAmplifier_CatalogCrawler,
+    check_colliding_datasources,
+)
+from domolibrary2.client.simulator import DomoApiSimulator
+from domolibrary2.routes.cloud_amplifier import CloudAmplifier_GET_Error
+
+
+def crawl(simulator, catalog_path, **kwargs):
+    crawler = CloudAmplifier_CatalogCrawler(
+        auth=simulator.auth,
+        integration_id="int-1",
+        catalog_path=catalog_path,
+        rows=4,
+        max_concurrency=3,
+    )
+
+    async def run():
+        async with simulator.session() as session:
+            return await crawler.crawl(session=session, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_crawl_pages_every_level(tmp_path):
+    # 2 databases x 3 schemas x 10 tables
+    simulator = DomoApiSimulator()
+
+    result = crawl(simulator, tmp_path / "catalog.json")
+
+    # 1 database page + 1 schema page per database + 3 table pages per schema
+    assert result.n_requests == simulator.stats.requests == 1 + 2 + 6 * 3
+    assert not result.errors
+    assert result.catalog.n_tables == 60
+
+    df = result.catalog.to_dataframe()
+    assert df.groupby(["database", "schema"]).size().tolist() == [10] * 6
+    assert df["table"].iloc[-1] == "TABLE_10"
+
+
+def test_only_stale_branches_are_recrawled(tmp_path):
+    simulator = DomoApiSimulator()
+    catalog_path = tmp_path / "catalog.json"
+    crawl(simulator, catalog_path)
+
+    simulator.stats.reset()
+    result = crawl(simulator, catalog_path)
+    assert result.n_requests == simulator.stats.requests == 0
+    assert result.catalog.n_tables == 60
+
+    # age one schema past max_age_seconds; both schemas gain a table upstream
+    catalog = json.loads(catalog_path.read_text())
+    catalog["databases"]["DB_2"]["schemas"]["SCHEMA_1"]["crawled_at"] -= 2 * 86_400
+    catalog_path.write_text(json.dumps(catalog))
+    simulator.add_warehouse_table("DB_2", "SCHEMA_1", "NEW_TABLE")
+    simulator.add_warehouse_table("DB_1", "SCHEMA_1", "NOT_SEEN_YET")
+
+    result = crawl(simulator, catalog_path)
+
+    assert result.refreshed == ["DB_2.SCHEMA_1"]
+    assert simulator.stats.by_endpoint["get_warehouse_tables"] == 3
+    assert result.catalog.n_tables == 61
+    assert "NEW_TABLE" in result.catalog.to_dataframe()["table"].tolist()
+
+    assert crawl(simulator, catalog_path, is_force=True).catalog.n_tables == 62
+
+
+def test_failed_listings_keep_previous_branch(tmp_path):
+    simulator = DomoApiSimulator()
+    catalog_path = tmp_path / "catalog.json"
+    crawl(simulator, catalog_path)
+
+    simulator.error_rate = 1
+    result = crawl(simulator, catalog_path, is_force=True)
+
+    assert set(result.errors) == {"", "DB_1", "DB_2"} | {
+        f"DB_{db}.SCHEMA_{schema}" for db in (1, 2) for schema in (1, 2, 3)
+    }
+    assert result.catalog.n_tables == 60
+    assert json.loads(catalog_path.read_text())["databases"]["DB_1"]["schemas"]
+
+
+def test_check_colliding_datasources():
+    simulator = DomoApiSimulator()
+    dataset_ids = [f"ds-{index}" for index in range(1, 9)]
+
+    async def run():
+        async with simulator.session() as session:
+            return await check_colliding_datasources(
+                simulator.auth, dataset_ids, max_concurrency=4, session=session
+            )
+
+    results = asyncio.run(run())
+
+    assert list(results) == dataset_ids
+    assert simulator.stats.by_endpoint["check_colliding_datasource"] == 8
+    assert {
+        dataset_id
+        for dataset_id, result in results.items()
+        if isinstance(result, CloudAmplifier_GET_Error)
+    } == {"ds-4", "ds-8"}
+    assert results["ds-1"]["collidingDatasources"] == ["ds-2"]
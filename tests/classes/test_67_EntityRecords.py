@@ -0,0 +1,133 @@
+"""Test lightweight record listings for users, groups and datasets."""
+
+import asyncio
+import copy
+import json
+import pickle
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.base.records import DomoRecord, DomoRecord_Batch
+from domolibrary2.classes.DomoDatacenter import DomoDatacenter
+from domolibrary2.classes.DomoDataset import DomoDataset
+from domolibrary2.classes.DomoGroup import DomoGroup
+from domolibrary2.classes.DomoUser import DomoUser, DomoUsers
+from domolibrary2.client.simulator import DomoApiSimulator
+
+
+def run(simulator, fn):
+    async def _run():
+        async with simulator.session() as session:
+            return await fn(session)
+
+    return asyncio.run(_run())
+
+
+def test_user_records_keep_listed_fields():
+    simulator = DomoApiSimulator(n_users=50)
+    domo_users = DomoUsers(auth=simulator.auth)
+
+    batch = run(
+        simulator, lambda session: domo_users.get(return_records=True, session=session)
+    )
+
+    assert isinstance(batch, DomoRecord_Batch)
+    assert len(batch) == 50
+    assert domo_users.users == []
+
+    record = batch[-1]
+    assert record.id == "50"
+    assert record.email_address == f"user50@{simulator.auth.domo_instance}.com"
+    assert record.to_dict()["role_id"] == 1 + 50 % 3
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.avatar
+
+    df = batch.to_dataframe()
+    assert list(df.columns) == list(DomoUser.record_fields)
+    assert df["id"].tolist() == [str(user_id) for user_id in range(1, 51)]
+
+    assert [record.id for record in batch[10:12]] == ["11", "12"]
+
+
+def test_records_copy_and_pickle():
+    simulator = DomoApiSimulator(n_users=3)
+    batch = DomoRecord_Batch.from_dicts(DomoUser, auth=None, obj_ls=simulator.users)
+    record = batch[1]
+
+    assert copy.copy(record) == record
+    assert copy.deepcopy(record) == record
+    assert pickle.loads(pickle.dumps(record)).email_address == record.email_address
+
+    # unset slots raise instead of recursing through ``batch``
+    empty = DomoRecord.__new__(DomoRecord)
+    with pytest.raises(AttributeError):
+        empty.batch
+    assert not hasattr(empty, "email_address")
+
+
+def test_records_promote_to_entities():
+    simulator = DomoApiSimulator(n_users=5, n_groups=3)
+
+    user_batch = run(
+        simulator,
+        lambda session: DomoUsers(auth=simulator.auth).get(
+            return_records=True, session=session
+        ),
+    )
+    domo_user = user_batch[1].to_entity()
+    assert isinstance(domo_user, DomoUser)
+    assert (domo_user.id, domo_user.display_name) == ("2", "User 2")
+    assert domo_user.auth is user_batch.auth
+
+    # the simulator does not serve the system-group toggle DomoGroups.get sets first
+    group_batch = DomoRecord_Batch.from_dicts(
+        DomoGroup, auth=simulator.auth, obj_ls=simulator.groups
+    )
+    assert group_batch.columns["member_count"] == [2, 2, 1]
+    domo_group = group_batch[0].to_entity()
+    assert isinstance(domo_group, DomoGroup)
+    assert (domo_group.id, domo_group.type) == ("1", "open")
+
+    dataset_batch = run(
+        simulator,
+        lambda session: DomoDatacenter(auth=simulator.auth).search_datasets(
+            return_records=True, session=session
+        ),
+    )
+    assert len(dataset_batch) == simulator.n_search_objects
+    domo_dataset = dataset_batch[0].to_entity()
+    assert isinstance(domo_dataset, DomoDataset)
+    assert (domo_dataset.id, domo_dataset.name) == ("ds-0", "Dataset 0")
+
+
+@pytest.mark.performance
+def test_records_use_a_fraction_of_entity_memory():
+    simulator = DomoApiSimulator(n_users=20_000)
+    body = json.dumps(simulator.users)
+    auth = simulator.auth
+
+    def retained(convert_fn):
+        """Bytes still allocated once the parsed response is released."""
+        tracemalloc.start()
+        try:
+            kept = convert_fn(json.loads(body), auth=auth)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return kept, size
+
+    entities, entity_bytes = retained(DomoUsers._users_to_domo_user)
+    batch, record_bytes = retained(DomoUsers._users_to_records)
+
+    print(
+        f"20k users: entities {entity_bytes / 1e6:.1f} MB, "
+        f"records {record_bytes / 1e6:.1f} MB"
+    )
+    assert len(entities) == len(batch) == 20_000
+    assert record_bytes * 3 < entity_bytes
@@ -0,0 +1,208 @@
+"""Test the offline Domo API simulator against the real route functions."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pandas as pd
+
+from domolibrary2.client import (
+    get_data as gd,
+    response as rgd,
+)
+from domolibrary2.client.context import RouteContext
+from domolibrary2.client.simulator import DomoApiSimulator, run_benchmark
+from domolibrary2.routes import (
+    activity_log as activity_log_routes,
+    datacenter as datacenter_routes,
+    dataset as dataset_routes,
+    group as group_routes,
+    page as page_routes,
+    user as user_routes,
+)
+
+
+async def with_session(simulator, fn):
+    async with simulator.session() as session:
+        return await fn(session)
+
+
+def test_looper_pages_through_users():
+    simulator = DomoApiSimulator(n_users=450)
+
+    res = asyncio.run(
+        with_session(
+            simulator,
+            lambda session: user_routes.search_users(
+                auth=simulator.auth, body={}, limit=200, session=session
+            ),
+        )
+    )
+
+    assert [user["id"] for user in res.response] == list(range(1, 451))
+    assert res.response[0]["displayName"] == "User 1"
+    # three full or partial pages, then the empty page that ends the loop
+    assert simulator.stats.by_endpoint["search_users"] == 4
+
+
+def test_query_pages_rows_and_columns():
+    simulator = DomoApiSimulator(n_dataset_rows=250, n_dataset_columns=3)
+
+    res = asyncio.run(
+        with_session(
+            simulator,
+            lambda session: dataset_routes.query_dataset_private(
+                auth=simulator.auth,
+                dataset_id="ds-1",
+                sql="select * from table",
+                loop_until_end=True,
+                limit=100,
+                session=session,
+            ),
+        )
+    )
+
+    assert len(res.response) == 250
+    assert res.response[249] == {"row_id": 249, "col_1": 249, "col_2": 498}
+
+
+def test_upload_round_trip_counts_bytes():
+    simulator = DomoApiSimulator()
+    upload_df = pd.DataFrame({"a": range(10), "b": ["x"] * 10})
+
+    async def upload(session):
+        upload_res = await dataset_routes.upload_dataset_stage_1(
+            auth=simulator.auth, dataset_id="ds-1", session=session
+        )
+        upload_id = upload_res.response
+        await dataset_routes.upload_dataset_stage_2_df(
+            auth=simulator.auth,
+            dataset_id="ds-1",
+            upload_id=upload_id,
+            upload_df=upload_df,
+            session=session,
+        )
+        return await dataset_routes.upload_dataset_stage_3(
+            auth=simulator.auth, dataset_id="ds-1", upload_id=upload_id, session=session
+        )
+
+    res = asyncio.run(with_session(simulator, upload))
+
+    assert res.response["parts"] == 1
+    assert res.response["bytes"] == simulator.stats.bytes_uploaded
+    assert simulator.stats.bytes_uploaded == len(
+        upload_df.to_csv(header=False, index=False)
+    )
+
+
+def test_activity_log_window_and_pages_and_lineage():
+    simulator = DomoApiSimulator(
+        n_activity_events=1_200, n_pages=80, n_lineage_datasets=7, lineage_fanout=2
+    )
+    midpoint = (simulator.activity_start + simulator.activity_end) // 2
+
+    async def crawl(session):
+        activity_res = await activity_log_routes.search_activity_log(
+            auth=simulator.auth,
+            start_time=simulator.activity_start,
+            end_time=midpoint,
+            session=session,
+        )
+        pages_res = await page_routes.get_pages_adminsummary(
+            auth=simulator.auth, session=session
+        )
+        lineage_res = await datacenter_routes.get_lineage_upstream(
+            auth=simulator.auth,
+            entity_type="DATASET",
+            entity_id="ds-0",
+            session=session,
+        )
+        return activity_res, pages_res, lineage_res
+
+    activity_res, pages_res, lineage_res = asyncio.run(with_session(simulator, crawl))
+
+    assert len(activity_res.response) == 601  # both window bounds are inclusive
+    assert all(event["time"] <= midpoint for event in activity_res.response)
+    assert len(pages_res.response) == 80
+
+    # ds-0 <- df-0 <- ds-1, ds-2; ds-1 <- df-1 <- ds-3, ds-4; ds-2 <- df-2 <- ds-5, ds-6
+    assert sorted(lineage_res.response) == sorted(
+        [f"DATASETds-{index}" for index in range(7)]
+        + [f"DATAFLOWdf-{index}" for index in range(3)]
+    )
+    assert lineage_res.response["DATASETds-3"]["parents"] == []
+
+
+def test_rate_limit_and_errors_are_deterministic():
+    def statuses(seed):
+        simulator = DomoApiSimulator(rate_limit_every=3, error_rate=0.3, seed=seed)
+
+        async def run(session):
+            url = f"https://{simulator.domo_instance}.domo.com/api/content/v2/users"
+            return [
+                await gd.get_data(
+                    auth=simulator.auth, url=url, method="GET", session=session
+                )
+                for _ in range(12)
+            ]
+
+        res_ls = asyncio.run(with_session(simulator, run))
+        return simulator, [res.status for res in res_ls]
+
+    simulator, first = statuses(seed=7)
+    _, second = statuses(seed=7)
+
+    assert first == second
+    assert first[2::3] == [429] * 4
+    assert 500 in first and 200 in first
+    assert simulator.stats.rate_limited == 4
+    assert simulator.stats.errors == first.count(500)
+
+
+def test_install_routes_sessionless_requests():
+    simulator = DomoApiSimulator(n_groups=5, n_users=20)
+
+    with simulator.install():
+        groups_res = asyncio.run(group_routes.get_all_groups(auth=simulator.auth))
+        members_res = asyncio.run(
+            group_routes.get_group_membership(auth=simulator.auth, group_id=2)
+        )
+
+    assert gd.get_default_transport() is None
+    assert [group["groupId"] for group in groups_res.response] == [1, 2, 3, 4, 5]
+    assert [member["userId"] for member in members_res.response] == [2, 7, 12, 17]
+
+
+def test_run_benchmark_reports_throughput():
+    simulator = DomoApiSimulator(n_users=300)
+
+    async def workload(simulator):
+        async with simulator.session() as session:
+            res = await user_routes.search_users(
+                auth=simulator.auth, body={}, limit=100, session=session
+            )
+        return len(res.response)
+
+    result = run_benchmark(workload, simulator=simulator)
+
+    assert result.result == 300
+    assert result.requests == 4
+    assert result.requests_per_second > 0
+    assert result.peak_memory_bytes > 0
+
+
+def test_route_function_keeps_route_defaults():
+    seen = []
+
+    @gd.route_function
+    async def plain_route(auth=None, session=None, debug_num_stacks_to_drop=2):
+        seen.append((session, debug_num_stacks_to_drop))
+        return rgd.ResponseGetData(status=200, response=None, is_success=True)
+
+    asyncio.run(plain_route())
+    asyncio.run(plain_route(debug_num_stacks_to_drop=3, session="session"))
+    asyncio.run(plain_route(context=RouteContext(debug_num_stacks_to_drop=4)))
+
+    assert seen == [(None, 2), ("session", 3), (None, 4)]
@@ -0,0 +1,179 @@
+"""Offline client benchmarks against the Domo API simulator.
+
+Each benchmark reports requests/sec, wall time and tracemalloc peak memory.
+When pytest-benchmark is installed the workloads run through its ``benchmark``
+fixture and the simulator figures are attached as ``extra_info``; otherwise each
+workload runs once and the figures are printed (``pytest -m performance -s``).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pandas as pd
+import pytest
+
+from domolibrary2.classes.DomoDataset import DomoDataset_Default
+from domolibrary2.client.simulator import DomoApiSimulator, run_benchmark
+from domolibrary2.routes import (
+    datacenter as datacenter_routes,
+    page as page_routes,
+    user as user_routes,
+)
+from domolibrary2.utils import chunk_execution as dmce
+from domolibrary2.utils.logging import get_colored_logger
+from domolibrary2.utils.upload_data import upload_data
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    pytest_benchmark = None
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture
+def bench(request):
+    """Run a workload against a simulator and return its ``SimulatorBenchmark_Result``."""
+
+    def _bench(workload, simulator):
+        if pytest_benchmark is None:
+            result = run_benchmark(workload, simulator=simulator)
+        else:
+            benchmark = request.getfixturevalue("benchmark")
+            result = benchmark.pedantic(
+                run_benchmark, args=(workload, simulator), rounds=3, iterations=1
+            )
+            benchmark.extra_info.update(result.to_dict())
+
+        print(result.to_dict())
+        return result
+
+    return _bench
+
+
+async def looper_users(simulator):
+    async with simulator.session() as session:
+        res = await user_routes.search_users(
+            auth=simulator.auth, body={}, limit=200, session=session
+        )
+    return len(res.response)
+
+
+async def query_rows(simulator):
+    domo_ds = DomoDataset_Default(auth=simulator.auth, id="ds-0", raw={})
+
+    async with simulator.session() as session:
+        df = await domo_ds.Data.query(
+            sql="select * from table",
+            loop_until_end=True,
+            limit=5_000,
+            session=session,
+        )
+    return len(df)
+
+
+async def upload_rows(simulator, n_rows=40_000):
+    """``upload_data`` of one extract, through stage 1 / 2 / 3 of the upload api."""
+    consol_ds = DomoDataset_Default(auth=simulator.auth, id="ds-0", raw={})
+
+    async def data_fn(instance_auth, session, debug_api=False):
+        return pd.DataFrame({"a": range(n_rows), "b": ["x"] * n_rows})
+
+    with simulator.install():
+        res = await upload_data(
+            data_fn=data_fn,
+            instance_auth=simulator.auth,
+            consol_ds=consol_ds,
+            logger=get_colored_logger(),
+            debug_fn=False,
+        )
+    return res.response["parts"]
+
+
+async def crawl_pages(simulator):
+    async with simulator.session() as session:
+        summary_res = await page_routes.get_pages_adminsummary(
+            auth=simulator.auth, limit=100, session=session
+        )
+        page_res_ls = await dmce.gather_with_concurrency(
+            *[
+                page_routes.get_page_by_id(
+                    auth=simulator.auth, page_id=page["pageId"], session=session
+                )
+                for page in summary_res.response
+            ],
+            n=20,
+        )
+    return len(page_res_ls)
+
+
+async def traverse_lineage(simulator):
+    """Breadth-first upstream traversal, one lineage request per unseen dataset."""
+    seen = set()
+    frontier = ["ds-0"]
+
+    async with simulator.session() as session:
+        while frontier:
+            seen.update(frontier)
+            res_ls = await dmce.gather_with_concurrency(
+                *[
+                    datacenter_routes.get_lineage_upstream(
+                        auth=simulator.auth,
+                        entity_type="DATASET",
+                        entity_id=dataset_id,
+                        session=session,
+                    )
+                    for dataset_id in frontier
+                ],
+                n=20,
+            )
+            frontier = sorted(
+                {
+                    node["id"]
+                    for res in res_ls
+                    for node in res.response.values()
+                    if node["type"] == "DATASET" and node["id"] not in seen
+                }
+            )
+    return len(seen)
+
+
+def test_bench_looper(bench):
+    result = bench(looper_users, DomoApiSimulator(n_users=20_000))
+    assert result.result == 20_000
+    assert result.requests == 101
+
+
+def test_bench_query(bench):
+    result = bench(query_rows, DomoApiSimulator(n_dataset_rows=100_000))
+    assert result.result == 100_000
+    assert result.requests == 21
+
+
+def test_bench_upload(bench, monkeypatch):
+    # DomoDataset_Data.upload_data waits a fixed 5s before committing; don't time it
+    asyncio_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda delay, *args: asyncio_sleep(0))
+
+    result = bench(upload_rows, DomoApiSimulator())
+    assert result.result == 1
+    assert result.requests == 3
+
+
+def test_bench_page_crawl(bench):
+    result = bench(crawl_pages, DomoApiSimulator(n_pages=1_000))
+    assert result.result == 1_000
+
+
+def test_bench_lineage_traversal(bench):
+    result = bench(traverse_lineage, DomoApiSimulator(n_lineage_datasets=500))
+    assert result.result == 500
+
+
+def test_bench_looper_under_latency(bench):
+    simulator = DomoApiSimulator(n_users=2_000, latency=0.001, latency_jitter=0.001)
+    result = bench(looper_users, simulator)
+    assert result.wall_seconds >= 0.011  # 11 sequential requests
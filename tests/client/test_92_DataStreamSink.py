@@ -0,0 +1,212 @@
+"""Test sink-based streaming in get_data_stream_to_sink."""
+
+import asyncio
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import httpx
+import pytest
+
+from domolibrary2.client import get_data as gd
+from domolibrary2.client.simulator import DomoApiSimulator
+
+EXPORT_URL = "https://simulated.domo.com/api/query/v1/export/ds-1"
+
+
+def stream(simulator, sink, **kwargs):
+    async def run():
+        async with simulator.session() as session:
+            return await gd.get_data_stream_to_sink(
+                url=EXPORT_URL,
+                auth=simulator.auth,
+                sink=sink,
+                session=session,
+                **kwargs,
+            )
+
+    return asyncio.run(run())
+
+
+def test_file_like_sink_with_checksum_and_resume():
+    simulator = DomoApiSimulator(n_dataset_rows=20_000, export_drop_after=100_000)
+    body = simulator.get_export_csv()
+    buffer = io.BytesIO()
+
+    res = stream(simulator, buffer, checksum_algorithm="sha256", max_retry=10)
+
+    assert buffer.getvalue() == body
+    assert res.response.checksum == hashlib.sha256(body).hexdigest()
+    assert res.response.attempts == -(-len(body) // 100_000)
+    assert res.response.path is None
+
+
+def test_async_callback_sink_reports_progress():
+    simulator = DomoApiSimulator(n_dataset_rows=5_000)
+    chunks, progress = [], []
+
+    async def on_chunk(chunk):
+        chunks.append(chunk)
+
+    res = stream(
+        simulator,
+        on_chunk,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    body = simulator.get_export_csv()
+    assert b"".join(chunks) == body
+    assert progress[-1] == (len(body), len(body))
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+    assert res.status == 200
+
+
+def interrupt(simulator, output_path, drop_after):
+    """Leave a validated ``.part`` behind, as an interrupted run would."""
+    simulator.export_drop_after = drop_after
+    with pytest.raises(gd.GetDataError):
+        stream(simulator, output_path, max_retry=0)
+    simulator.export_drop_after = 0
+
+
+def test_path_sink_checksum_includes_resumed_bytes(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=2_000)
+    body = simulator.get_export_csv()
+    interrupt(simulator, tmp_path / "out.csv", drop_after=5_000)
+    assert (tmp_path / "out.csv.part.validator").exists()
+
+    res = stream(simulator, tmp_path / "out.csv", checksum_algorithm="md5")
+
+    assert res.status == 206
+    assert res.response.bytes_resumed == 5_000
+    assert (tmp_path / "out.csv").read_bytes() == body
+    assert res.response.checksum == hashlib.md5(body).hexdigest()
+    assert not (tmp_path / "out.csv.part.validator").exists()
+
+
+def test_stale_part_is_discarded_when_content_changes(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=2_000)
+    interrupt(simulator, tmp_path / "out.csv", drop_after=5_000)
+
+    simulator.n_dataset_rows = 3_000
+    simulator._cache.clear()
+    body = simulator.get_export_csv()
+
+    res = stream(simulator, tmp_path / "out.csv", checksum_algorithm="md5")
+
+    assert res.status == 200
+    assert res.response.bytes_resumed == 0
+    assert (tmp_path / "out.csv").read_bytes() == body
+    assert res.response.checksum == hashlib.md5(body).hexdigest()
+
+
+def test_part_without_validator_is_discarded(tmp_path):
+    simulator = DomoApiSimulator(n_dataset_rows=2_000)
+    body = simulator.get_export_csv()
+    (tmp_path / "out.csv.part").write_bytes(b"written by another version" * 100)
+
+    res = stream(simulator, tmp_path / "out.csv", checksum_algorithm="md5")
+
+    assert res.status == 200
+    assert res.response.bytes_resumed == 0
+    assert (tmp_path / "out.csv").read_bytes() == body
+
+
+def changed_etag_transport(body, stale_body):
+    """A server that honours Range but whose content changed since the .part."""
+
+    def handler(request):
+        headers = {"ETag": '"new"'}
+        range_match = request.headers.get("Range")
+        if range_match:
+            start = int(range_match.split("=")[1].rstrip("-"))
+            # a server that ignores If-Range still answers 206 for the new content
+            return httpx.Response(
+                206, stream=_Stream(stale_body[start:]), headers=headers
+            )
+        return httpx.Response(200, stream=_Stream(body), headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+def test_partial_response_for_other_content_restarts(tmp_path):
+    body, stale_body = b"new content " * 500, b"old content " * 500
+    (tmp_path / "out.csv.part").write_bytes(stale_body[:1_000])
+    (tmp_path / "out.csv.part.validator").write_text('"old"')
+
+    async def run():
+        transport = changed_etag_transport(body, stale_body)
+        async with httpx.AsyncClient(transport=transport) as session:
+            return await gd.get_data_stream_to_sink(
+                url=EXPORT_URL,
+                auth=DomoApiSimulator().auth,
+                sink=tmp_path / "out.csv",
+                session=session,
+                checksum_algorithm="md5",
+            )
+
+    res = asyncio.run(run())
+
+    assert res.response.bytes_resumed == 0
+    assert (tmp_path / "out.csv").read_bytes() == body
+    assert res.response.checksum == hashlib.md5(body).hexdigest()
+
+
+def ignore_range_transport(body, drop_after, timeouts):
+    """A server that never honours Range and drops the first response."""
+    n_requests = []
+
+    def handler(request):
+        n_requests.append(request)
+        timeouts.append(request.extensions["timeout"])
+        if len(n_requests) == 1:
+            return httpx.Response(200, stream=_Stream(body[:drop_after], is_drop=True))
+        return httpx.Response(200, stream=_Stream(body))
+
+    return httpx.MockTransport(handler)
+
+
+class _Stream(httpx.AsyncByteStream):
+    def __init__(self, content, is_drop=False):
+        self.content = content
+        self.is_drop = is_drop
+
+    async def __aiter__(self):
+        yield self.content
+        if self.is_drop:
+            raise httpx.ReadError("dropped")
+
+
+def test_restart_when_range_is_ignored():
+    body = bytes(range(256)) * 100
+    timeouts = []
+    transport = ignore_range_transport(body, drop_after=1_000, timeouts=timeouts)
+    simulator = DomoApiSimulator()
+
+    async def run(sink):
+        async with httpx.AsyncClient(transport=transport) as session:
+            return await gd.get_data_stream_to_sink(
+                url=EXPORT_URL,
+                auth=simulator.auth,
+                sink=sink,
+                session=session,
+                checksum_algorithm="sha256",
+                timeout=5,
+                read_timeout=120,
+            )
+
+    buffer = io.BytesIO(b"header:")
+    buffer.seek(0, io.SEEK_END)
+    res = asyncio.run(run(buffer))
+
+    assert buffer.getvalue() == b"header:" + body
+    assert res.response.checksum == hashlib.sha256(body).hexdigest()
+    assert timeouts[0]["connect"] == 5 and timeouts[0]["read"] == 120
+
+    timeouts.clear()
+    transport = ignore_range_transport(body, drop_after=1_000, timeouts=timeouts)
+    with pytest.raises(gd.GetDataError):
+        asyncio.run(run(lambda chunk: None))
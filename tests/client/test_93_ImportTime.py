@@ -0,0 +1,72 @@
+"""Import-time benchmark for domolibrary2 entry points.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``;
+the cumulative import time is printed (``pytest -m performance -s``) and the
+heavy dependencies that must stay off the import path are asserted absent.
+"""
+
+import importlib.metadata
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+import domolibrary2
+
+SRC_PATH = Path(__file__).parent.parent.parent / "src"
+pytestmark = pytest.mark.performance
+
+HEAVY_MODULES = {"pandas", "numpy", "bs4", "requests", "sqlglot", "IPython", "PIL"}
+
+
+def import_time(module_name: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module ``module_name`` loads."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_PATH)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.parametrize(
+    "module_name, forbidden",
+    [
+        ("domolibrary2", HEAVY_MODULES | {"httpx", "dc_logger"}),
+        ("domolibrary2.client.get_data", HEAVY_MODULES),
+        ("domolibrary2.routes.user", HEAVY_MODULES),
+    ],
+)
+def test_import_stays_light(module_name, forbidden):
+    timings = import_time(module_name)
+
+    print(f"{module_name}: {timings[module_name] / 1000:.1f} ms")
+    assert not forbidden & {name.split(".")[0] for name in timings}
+
+
+def test_package_attributes_load_lazily():
+    assert domolibrary2.__version__ == importlib.metadata.version("domolibrary2")
+    assert domolibrary2.routes.__name__ == "domolibrary2.routes"
+    assert domolibrary2.exceptions.DomoError
+
+    from domolibrary2.utils import convert, logging
+
+    assert convert.convert_string_to_bool("true") is True
+    assert callable(logging.get_colored_logger)
+
+    with pytest.raises(AttributeError):
+        domolibrary2.not_a_module
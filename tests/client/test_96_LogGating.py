@@ -0,0 +1,179 @@
+"""Test level-gated, sampled logging for get_data style functions.
+
+Run the overhead benchmark with ``pytest -m performance -s``.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+from dc_logger.decorators import LogDecoratorConfig, log_call
+
+from domolibrary2.client import response as rgd
+from domolibrary2.utils.logging import (
+    ResponseGetDataProcessor,
+    gated_log_call,
+    is_log_level_enabled,
+    set_log_sample_rate,
+)
+
+
+class RecordingLogger:
+    """Minimal dc_logger-compatible logger that keeps records in memory."""
+
+    def __init__(self, show_debugging: bool = False):
+        self.show_debugging = show_debugging
+        self.records = []
+
+    async def log(self, level, message, **context):
+        level = getattr(level, "value", level)
+        if level == "DEBUG" and not self.show_debugging:
+            return True
+        self.records.append((level, message))
+        return True
+
+
+class CountingProcessor(ResponseGetDataProcessor):
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, result, http_details=None):
+        self.calls += 1
+        return super().process(result, http_details)
+
+
+def make_route(logger, status=200, sample_rate=1.0, action_name="fake_get_data"):
+    processor = CountingProcessor()
+
+    @gated_log_call(
+        action_name=action_name,
+        level_name="client",
+        log_level="DEBUG",
+        config=LogDecoratorConfig(result_processor=processor),
+        sample_rate=sample_rate,
+        logger_getter=lambda: logger,
+    )
+    async def fake_get_data(url, method="GET"):
+        return rgd.ResponseGetData(
+            status=status, response={"ok": True}, is_success=status < 400
+        )
+
+    return fake_get_data, processor
+
+
+def test_is_log_level_enabled():
+    assert not is_log_level_enabled(RecordingLogger(), "DEBUG")
+    assert is_log_level_enabled(RecordingLogger(), "ERROR")
+    assert is_log_level_enabled(RecordingLogger(show_debugging=True), "DEBUG")
+    assert not is_log_level_enabled(None, "ERROR")
+
+
+def test_processor_skipped_when_debug_disabled():
+    logger = RecordingLogger()
+    fake_get_data, processor = make_route(logger)
+
+    res = asyncio.run(fake_get_data(url="https://x.domo.com/api"))
+
+    assert res.status == 200
+    assert processor.calls == 0
+    assert logger.records == []
+
+
+def test_processor_runs_when_debug_enabled():
+    logger = RecordingLogger(show_debugging=True)
+    fake_get_data, processor = make_route(logger)
+
+    asyncio.run(fake_get_data(url="https://x.domo.com/api"))
+
+    assert processor.calls == 1
+    assert logger.records == [("DEBUG", "fake_get_data completed")]
+
+
+def test_http_errors_still_logged_on_fast_path():
+    logger = RecordingLogger()
+    fake_get_data, processor = make_route(logger, status=500)
+
+    asyncio.run(fake_get_data(url="https://x.domo.com/api"))
+
+    assert processor.calls == 1
+    assert logger.records == [("ERROR", "fake_get_data failed with HTTP error")]
+
+
+def test_exceptions_still_logged_on_fast_path():
+    logger = RecordingLogger()
+
+    @gated_log_call(action_name="boom", log_level="DEBUG", logger_getter=lambda: logger)
+    async def boom():
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError):
+        asyncio.run(boom())
+
+    assert logger.records == [("ERROR", "boom failed: nope")]
+
+
+def test_sampling_drops_success_records():
+    logger = RecordingLogger(show_debugging=True)
+    fake_get_data, processor = make_route(logger, action_name="sampled_get_data")
+
+    set_log_sample_rate("sampled_get_data", 0)
+    try:
+        for _ in range(5):
+            asyncio.run(fake_get_data(url="https://x.domo.com/api"))
+    finally:
+        set_log_sample_rate("sampled_get_data", None)
+
+    assert processor.calls == 0
+    assert logger.records == []
+
+    with pytest.raises(ValueError):
+        set_log_sample_rate("sampled_get_data", 2)
+
+
+@pytest.mark.performance
+def test_benchmark_disabled_logging_overhead():
+    """Compare per-call overhead of log_call vs gated_log_call with DEBUG off."""
+    logger = RecordingLogger()
+    num_calls = 2000
+
+    async def raw(url, method="GET"):
+        return rgd.ResponseGetData(status=200, response="x" * 1000, is_success=True)
+
+    before = log_call(
+        raw,
+        logger_getter=lambda: logger,
+        action_name="before",
+        log_level="DEBUG",
+        config=LogDecoratorConfig(result_processor=ResponseGetDataProcessor()),
+    )
+    after = gated_log_call(
+        action_name="after",
+        log_level="DEBUG",
+        config=LogDecoratorConfig(result_processor=ResponseGetDataProcessor()),
+        logger_getter=lambda: logger,
+    )(raw)
+
+    async def per_call_us(fn):
+        start = time.perf_counter()
+        for _ in range(num_calls):
+            await fn(url="https://x.domo.com/api/data/v3/datasources")
+        return (time.perf_counter() - start) / num_calls * 1e6
+
+    async def run():
+        return (
+            await per_call_us(raw),
+            await per_call_us(before),
+            await per_call_us(after),
+        )
+
+    raw_us, before_us, after_us = asyncio.run(run())
+
+    print(
+        f"\nper-call: undecorated {raw_us:.1f}us | log_call {before_us:.1f}us"
+        f" | gated_log_call {after_us:.1f}us"
+    )
+    assert after_us < before_us
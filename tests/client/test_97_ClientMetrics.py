@@ -0,0 +1,209 @@
+"""Test per-request client metrics (registry, labels, retries, pagination)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import httpx
+import pytest
+
+from domolibrary2.client import (
+    get_data as gd,
+    metrics as client_metrics,
+    response as rgd,
+)
+
+
+@pytest.fixture
+def registry():
+    registry = client_metrics.enable_metrics()
+    yield registry
+    client_metrics.disable_metrics()
+
+
+def make_session(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@gd.route_function
+async def get_widget(auth, context=None):
+    return await gd.get_data(
+        auth=auth,
+        url="https://test-instance.domo.com/api/widgets",
+        method="POST",
+        body={"name": "widget"},
+        context=context,
+    )
+
+
+def test_no_hooks_records_nothing():
+    assert client_metrics.start_request("get_data") is None
+
+
+def test_get_data_records_route_instance_status_and_bytes(registry, mock_auth):
+    session = make_session(lambda request: httpx.Response(200, json={"id": 1}))
+
+    res = asyncio.run(get_widget(auth=mock_auth, session=session))
+
+    assert res.status == 200
+    labels = {"route": "get_widget", "instance": "test-instance", "kind": "get_data"}
+    assert registry.get_counter("http_requests_total", status="200", **labels) == 1
+    assert registry.get_counter("http_bytes_sent_total", **labels) == len(
+        b'{"name":"widget"}'
+    )
+    assert registry.get_counter("http_bytes_received_total", **labels) == len(
+        b'{"id":1}'
+    )
+
+    text = registry.to_prometheus_text()
+    assert "# TYPE domolibrary_http_requests_total counter" in text
+    assert 'domolibrary_http_request_duration_seconds_count{route="get_widget"' in text
+
+    df = registry.to_dataframe()
+    assert df.loc[0, "route"] == "get_widget"
+    assert df.loc[0, "requests"] == 1
+
+
+def test_retries_are_counted(registry, mock_auth):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200, json={})
+
+    records = []
+    client_metrics.add_metrics_hook(records.append)
+
+    asyncio.run(
+        gd.get_data(
+            auth=mock_auth,
+            url="https://test-instance.domo.com/api",
+            method="GET",
+            session=make_session(handler),
+        )
+    )
+
+    assert [(r.retries, r.status, r.error is not None) for r in records] == [
+        (0, None, True),
+        (1, 200, False),
+    ]
+    assert registry.get_counter("http_retries_total") == 1
+    assert registry.get_counter("http_request_errors_total") == 1
+
+
+def test_looper_records_page_count(registry, mock_auth):
+    rows = list(range(5))
+
+    def handler(request):
+        skip = int(request.url.params["skip"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json=rows[skip : skip + limit])
+
+    res = asyncio.run(
+        gd.looper(
+            auth=mock_auth,
+            session=make_session(handler),
+            url="https://test-instance.domo.com/api/rows",
+            method="GET",
+            offset_params={"offset": "skip", "limit": "limit"},
+            arr_fn=lambda res: res.response,
+            limit=2,
+            loop_until_end=True,
+        )
+    )
+
+    assert res.response == rows
+    assert registry.get_counter("http_pages_total", kind="looper") == 4
+    assert registry.get_counter("http_requests_total", kind="get_data") == 4
+
+
+def test_failed_looper_and_stream_are_recorded_as_errors(registry, mock_auth):
+    def handler(request):
+        if request.url.path == "/api/stream":
+            # not gzip: fails to decode, which is not a TransportError
+            return httpx.Response(
+                200, content=b"plain", headers={"Content-Encoding": "gzip"}
+            )
+        return httpx.Response(200, json=[1, 2])
+
+    def broken_arr_fn(res):
+        raise KeyError("rows")
+
+    with pytest.raises(gd.LooperError):
+        asyncio.run(
+            gd.looper(
+                auth=mock_auth,
+                session=make_session(handler),
+                url="https://test-instance.domo.com/api/rows",
+                method="GET",
+                offset_params={"offset": "skip", "limit": "limit"},
+                arr_fn=broken_arr_fn,
+                limit=2,
+            )
+        )
+
+    with pytest.raises(httpx.DecodingError):
+        asyncio.run(
+            gd.get_data_stream(
+                auth=mock_auth,
+                session=make_session(handler),
+                url="https://test-instance.domo.com/api/stream",
+                method="GET",
+            )
+        )
+
+    assert registry.get_counter("http_request_errors_total", kind="looper") == 1
+    assert registry.get_counter("http_pages_total", kind="looper") == 1
+    # run_with_retry makes a second attempt; each one is recorded
+    stream_labels = {"kind": "get_data_stream"}
+    assert registry.get_counter("http_request_errors_total", **stream_labels) == 2
+
+
+def test_phase_timings_from_trace_events():
+    recorder = client_metrics._RequestRecorder(
+        kind="get_data", auth=None, method="get", url="https://x"
+    )
+
+    events = [
+        ("connection.connect_tcp.started", 1.0),
+        ("connection.connect_tcp.complete", 1.25),
+        ("http11.send_request_headers.started", 1.5),
+        ("http11.send_request_body.complete", 1.5),
+        ("http11.receive_response_headers.complete", 2.5),
+        ("http11.receive_response_body.started", 2.5),
+        ("http11.receive_response_body.complete", 3.0),
+    ]
+    for name, _ in events:
+        asyncio.run(recorder.trace(name, {}))
+    recorder._events.update({name.split(".", 1)[1]: ts for name, ts in events})
+
+    metrics = recorder.finish(status=200)
+
+    assert metrics.timings == {
+        "connect": 0.25,
+        "send": 0.0,
+        "server": 1.0,
+        "transfer": 0.5,
+    }
+    assert metrics.method == "GET"
+    assert metrics.to_dict()["server_seconds"] == 1.0
+
+
+def test_failed_hook_does_not_fail_request(registry, mock_auth):
+    def broken_hook(metrics):
+        raise RuntimeError("boom")
+
+    client_metrics.add_metrics_hook(broken_hook)
+    session = make_session(lambda request: httpx.Response(200, json={}))
+
+    with pytest.warns(UserWarning, match="boom"):
+        res = asyncio.run(
+            gd.get_data(auth=mock_auth, url="https://x", method="GET", session=session)
+        )
+
+    assert isinstance(res, rgd.ResponseGetData)
+    assert registry.get_counter("http_requests_total") == 1
@@ -0,0 +1,127 @@
+"""Test single-pass response decoding, pluggable JSON backend and lazy responses."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import httpx
+import pytest
+
+from domolibrary2.client import (
+    get_data as gd,
+    response as rgd,
+)
+
+
+def make_session(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_json_decoded_once_from_bytes():
+    calls = []
+
+    def counting_loads(data):
+        calls.append(type(data))
+        return json.loads(data)
+
+    rgd.set_json_loads(counting_loads)
+    try:
+        res = rgd.ResponseGetData.from_httpx_response(
+            httpx.Response(200, json={"rows": [1, 2, 3]})
+        )
+    finally:
+        rgd.set_json_loads(None)
+
+    assert res.response == {"rows": [1, 2, 3]}
+    assert calls == [bytes]
+
+
+def test_invalid_json_falls_back_to_text():
+    res = rgd.ResponseGetData.from_httpx_response(
+        httpx.Response(
+            200, content=b"not json", headers={"Content-Type": "application/json"}
+        )
+    )
+
+    assert res.response == "not json"
+
+
+def test_json_orjson_rejects_still_decodes():
+    def decode(content):
+        return rgd.ResponseGetData.from_httpx_response(
+            httpx.Response(
+                200, content=content, headers={"Content-Type": "application/json"}
+            )
+        ).response
+
+    nan_res = decode(b'{"v": NaN}')
+    assert isinstance(nan_res, dict) and nan_res["v"] != nan_res["v"]
+
+    # exact wide integers are opt-in through the stdlib decoder
+    rgd.set_json_loads(json.loads)
+    try:
+        assert (
+            decode(b"123456789012345678901234567890") == 123456789012345678901234567890
+        )
+    finally:
+        rgd.set_json_loads(None)
+
+
+def test_lazy_response_defers_decoding():
+    res = rgd.ResponseGetData.from_httpx_response(
+        httpx.Response(200, json={"a": 1}), is_lazy=True
+    )
+
+    assert isinstance(res, rgd.ResponseGetData)
+    assert not res.is_decoded
+    assert res.raw_content == b'{"a":1}'
+
+    assert res.response == {"a": 1}
+    assert res.is_decoded
+
+    res.response = [1, 2]
+    assert res.response == [1, 2]
+
+
+def test_get_data_lazy_response():
+    session = make_session(lambda request: httpx.Response(200, json=[{"id": 1}]))
+
+    res = asyncio.run(
+        gd.get_data(
+            url="https://x.domo.com/api",
+            method="GET",
+            session=session,
+            is_lazy_response=True,
+        )
+    )
+
+    assert not res.is_decoded
+    assert res.response == [{"id": 1}]
+
+
+def test_blocked_check_skipped_for_json():
+    body = {"description": "<title>Domo - Blocked</title>"}
+    session = make_session(lambda request: httpx.Response(200, json=body))
+
+    res = asyncio.run(
+        gd.get_data(url="https://x.domo.com/api", method="GET", session=session)
+    )
+
+    assert res.response == body
+
+
+def test_blocked_html_page_raises():
+    html = "<html><title>Domo - Blocked</title><p>Your IP 10.1.2.3</p></html>"
+    session = make_session(
+        lambda request: httpx.Response(
+            200, content=html.encode(), headers={"Content-Type": "text/html"}
+        )
+    )
+
+    with pytest.raises(gd.GetDataError, match="10.1.2.3"):
+        asyncio.run(
+            gd.get_data(url="https://x.domo.com/api", method="GET", session=session)
+        )
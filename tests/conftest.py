@@ -9,7 +9,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from .tools.test_harness import RouteTestHarness
+from .tools.test_harness import RouteCallRecorder, RouteTestHarness
 
 
 # Configure pytest for async testing
@@ -33,6 +33,19 @@ def mock_auth(route_harness):
     return route_harness.default_auth
 
 
+@pytest.fixture
+def make_mock_auth(route_harness):
+    """Provide a factory for mock authentication objects of other instances."""
+
+    return route_harness.create_mock_auth
+
+
+@pytest.fixture
+def route_calls(monkeypatch) -> RouteCallRecorder:
+    """Patch route functions with recording fakes (see ``RouteCallRecorder``)."""
+    return RouteCallRecorder(monkeypatch)
+
+
 @pytest.fixture
 def mock_developer_auth(route_harness):
     """Provide a mock developer authentication object."""
@@ -6,6 +6,7 @@ authentication, and various error scenarios.
 """
 
 import asyncio
+import inspect
 import json
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
@@ -60,6 +61,38 @@ class TestScenario:
     function_kwargs: dict[str, Any] = field(default_factory=dict)
 
 
+class RouteCallRecorder(dict):
+    """Replace route functions with async fakes and record their calls.
+
+    ``patch(target, name, response)`` swaps ``target.name`` for a fake that
+    appends the keyword arguments of each call to ``recorder[name]``.  The fake
+    returns ``response``, or ``response(**kwargs)`` when it is callable (sync or
+    async); values that are not a ``ResponseGetData`` are wrapped in a
+    successful one.
+    """
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        super().__init__()
+        self._monkeypatch = monkeypatch
+
+    def patch(self, target: Any, name: str, response: Any = None) -> list[dict]:
+        calls = self.setdefault(name, [])
+
+        async def fake_route(**kwargs):
+            calls.append(kwargs)
+
+            result = response(**kwargs) if callable(response) else response
+            if inspect.isawaitable(result):
+                result = await result
+
+            if isinstance(result, ResponseGetData):
+                return result
+            return ResponseGetData(status=200, response=result, is_success=True)
+
+        self._monkeypatch.setattr(target, name, fake_route)
+        return calls
+
+
 class RouteTestHarness:
     """
     Comprehensive testing harness for route functions.
@@ -81,6 +114,7 @@ class RouteTestHarness:
         mock_auth = MagicMock(spec=DomoAuth)
         mock_auth.domo_instance = kwargs.get("domo_instance", self.base_instance)
         mock_auth.auth_header = {"Authorization": "Bearer test-token"}
+        mock_auth.token = "test-token"
 
         if auth_type == "developer":
             mock_auth.client_id = "test-client-id"
@@ -91,6 +125,14 @@ class RouteTestHarness:
 
         return mock_auth
 
+    def create_mock_auth(
+        self, domo_instance: Optional[str] = None, auth_type: str = "full"
+    ) -> DomoAuth:
+        """Create a mock authentication object for another Domo instance."""
+        return self._create_mock_auth(
+            auth_type=auth_type, domo_instance=domo_instance or self.base_instance
+        )
+
     def create_response_get_data(
         self,
         status: int = 200,
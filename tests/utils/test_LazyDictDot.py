@@ -0,0 +1,129 @@
+"""Test the lazy DictDot view used by entity hydration paths.
+
+Run the hydration benchmark with ``pytest -m performance -s``.
+"""
+
+import asyncio
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+
+from domolibrary2.classes.DomoPage import DomoPage
+from domolibrary2.utils.DictDot import DictDot, LazyDictDot
+
+
+def make_adminsummary_page(page_id: int, n_cards: int = 25) -> dict:
+    """Page object shaped like ``/api/content/v1/pages/adminsummary`` results."""
+    owners = [
+        {"id": owner_id, "type": "USER", "displayName": f"User {owner_id}"}
+        for owner_id in range(3)
+    ]
+    return {
+        "pageId": page_id,
+        "pageTitle": f"Page {page_id}",
+        "parentPageId": page_id // 10 or None,
+        "topPageId": 1,
+        "locked": False,
+        "collections": [
+            {"id": index, "title": f"Collection {index}"} for index in range(4)
+        ],
+        "page": {"owners": owners, "pageLayoutV4": {"content": [], "standard": {}}},
+        "cards": [
+            {
+                "id": page_id * 1000 + index,
+                "title": f"Card {index}",
+                "type": "kpi",
+                "owners": owners,
+                "datasources": [{"dataSourceId": f"ds-{index}", "dataSourceName": "x"}],
+                "metadata": {"chartType": "badge_vert_bar", "calculatedFields": []},
+            }
+            for index in range(n_cards)
+        ],
+        "children": [{"pageId": page_id * 10 + index} for index in range(3)],
+    }
+
+
+def test_lazy_dictdot_reads_like_dictdot():
+    obj = make_adminsummary_page(7)
+    dd, lazy = DictDot(obj), LazyDictDot(obj)
+
+    assert isinstance(lazy, DictDot)
+    assert lazy.pageTitle == dd.pageTitle == "Page 7"
+    assert lazy.page.owners[1].displayName == dd.page.owners[1].displayName
+    assert lazy.cards[3].metadata.chartType == "badge_vert_bar"
+    assert lazy.missing is dd.missing is None
+    assert lazy.page.missing is None
+    assert lazy == dd
+    assert lazy.get("missing", 1) == 1
+
+    # nested values are wrapped once, on first access
+    lazy = LazyDictDot(obj)
+    assert "cards" not in vars(lazy)
+    assert lazy.cards is lazy.cards
+
+
+def test_lazy_dictdot_wraps_without_copying():
+    obj = {"title": "a", "owner": {"id": 1}}
+    lazy = LazyDictDot(obj)
+
+    assert lazy.to_dict() is obj
+    assert lazy.owner.to_dict() is obj["owner"]
+
+    lazy.title = "b"
+    lazy.owner.id = 2
+    assert obj == {"title": "b", "owner": {"id": 2}}
+
+    clone = copy.deepcopy(lazy)
+    assert clone == lazy and clone.to_dict() is not obj
+
+
+def test_adminsummary_hydration_uses_lazy_view():
+    obj = make_adminsummary_page(42)
+    # owners and cards are fetched by id; keep the test offline
+    obj.pop("cards")
+    obj["page"]["owners"] = []
+
+    page = asyncio.run(DomoPage._from_adminsummary(page_obj=obj, auth=None))
+
+    assert (page.id, page.title, page.parent_page_id, page.top_page_id) == (
+        42,
+        "Page 42",
+        4,
+        1,
+    )
+    assert page.raw is obj
+    assert isinstance(page.collections[0], LazyDictDot)
+    assert page.collections[2].title == "Collection 2"
+
+
+@pytest.mark.performance
+def test_hydration_benchmark():
+    page_ls = [make_adminsummary_page(page_id) for page_id in range(1, 2_001)]
+
+    def hydrate(wrapper):
+        start_time = time.perf_counter()
+        for obj in page_ls:
+            dd = wrapper(obj)
+            # the fields DomoPage._from_adminsummary reads
+            (
+                dd.id or dd.pageId,
+                dd.parentPageId,
+                dd.topPageId,
+                dd.title or dd.pageTitle,
+            )
+            (dd.collections, dd.locked, dd.page and dd.page.owners, dd.cards)
+        return time.perf_counter() - start_time
+
+    eager_seconds = hydrate(DictDot)
+    lazy_seconds = hydrate(LazyDictDot)
+
+    print(
+        f"2k adminsummary pages: DictDot {eager_seconds * 1000:.1f} ms, "
+        f"LazyDictDot {lazy_seconds * 1000:.1f} ms"
+    )
+    assert lazy_seconds * 5 < eager_seconds
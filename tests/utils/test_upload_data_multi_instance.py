@@ -0,0 +1,111 @@
+"""Test multi-instance fan-out into a consolidated dataset."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pandas as pd
+
+from domolibrary2.client import response as rgd
+from domolibrary2.utils.upload_data import upload_data_multi_instance
+
+
+class FakeData:
+    def __init__(self):
+        self.uploads = []
+        self.index_calls = 0
+
+    async def upload_data(self, upload_df, partition_key, session, **kwargs):
+        self.uploads.append((partition_key, len(upload_df), session))
+        return rgd.ResponseGetData(status=200, response="ok", is_success=True)
+
+    async def index(self, session=None, **kwargs):
+        self.index_calls += 1
+
+
+class FakeDataset:
+    id = "consol-ds"
+    name = "consol"
+
+    def __init__(self, auth):
+        self.auth = auth
+        self.Data = FakeData()
+
+
+def test_fan_out_caps_streams_and_reports_failures(make_mock_auth):
+    def make_auth(domo_instance, name=None):
+        auth = make_mock_auth(domo_instance)
+        auth.name = name or domo_instance
+        return auth
+
+    in_flight = {"total": 0, "max_total": 0}
+    sessions = {}
+
+    async def data_fn(auth, session, debug_api=False):
+        sessions.setdefault(auth.domo_instance, set()).add(session)
+
+        in_flight["total"] += 1
+        in_flight["max_total"] = max(in_flight["max_total"], in_flight["total"])
+
+        await asyncio.sleep(0.01)
+
+        in_flight["total"] -= 1
+
+        if auth.name == "broken":
+            raise RuntimeError("extract failed")
+        if auth.name == "empty":
+            return pd.DataFrame()
+        return pd.DataFrame({"instance": [auth.domo_instance] * 3})
+
+    instance_auths = [make_auth(f"inst-{index}") for index in range(8)] + [
+        make_auth("shared", name="shared-a"),
+        make_auth("shared", name="shared-b"),
+        make_auth("shared", name="shared-c"),
+        make_auth("bad", name="broken"),
+        make_auth("none", name="empty"),
+        make_auth("consol", name="consol-source"),
+    ]
+
+    consol_ds = FakeDataset(make_auth("consol"))
+    completed = []
+
+    result = asyncio.run(
+        upload_data_multi_instance(
+            data_fn=data_fn,
+            instance_auths=instance_auths,
+            consol_ds=consol_ds,
+            partition_key_fn=lambda auth: auth.name,
+            max_concurrency=4,
+            max_concurrency_per_instance=1,
+            is_index=True,
+            on_result=completed.append,
+        )
+    )
+
+    assert in_flight["max_total"] <= 4
+    assert len(sessions["shared"]) == 1  # one pooled session per instance
+
+    statuses = {r.partition_key: r.status for r in result.results}
+    assert statuses["broken"] == "failed"
+    assert statuses["empty"] == "empty"
+    assert [r.partition_key for r in result.failed] == ["broken"]
+    assert isinstance(result.failed[0].error, RuntimeError)
+
+    uploaded = sorted(partition_key for partition_key, _, _ in consol_ds.Data.uploads)
+    assert uploaded == sorted(
+        [f"inst-{index}" for index in range(8)]
+        + ["shared-a", "shared-b", "shared-c", "consol-source"]
+    )
+    upload_sessions = {session for _, _, session in consol_ds.Data.uploads}
+    assert len(upload_sessions) == 1
+    # consol_ds's instance is also a source; its extracts get their own pool
+    assert not sessions["consol"] & upload_sessions
+    assert result.rows == 36
+    assert consol_ds.Data.index_calls == 1
+    assert len(completed) == len(instance_auths)
+
+    df = result.to_dataframe()
+    assert list(df.columns[:3]) == ["domo_instance", "partition_key", "status"]
+    assert (df.loc[df.status == "success", "extract_seconds"] > 0).all()